@@ -0,0 +1,248 @@
+"""Load test of the flight_planning injection API of mock_uss instances.
+
+Each virtual user emulates an operator repeatedly planning, modifying,
+activating and closing flights via the flight_planning automated testing
+interface of a mock_uss instance providing the `flight_planning` service (e.g.,
+`scdsc`).  Every request causes mock_uss to lock the flight, query the DSS,
+check for conflicts, share its operational intent, and notify subscribers, so
+running many users against a few instances exposes contention in mock_uss's
+flight locking and shared database under realistic concurrency.
+
+Flights are produced by a seeded ScenarioGenerator (see scd_scenarios.py), so
+flights are concentrated in hotspots and a configurable fraction of them
+deliberately conflicts with recent flights.
+
+Each request is named after its planning phase, and throughput, latency, and
+planning results per phase are printed when the test stops.
+"""
+
+import argparse
+import dataclasses
+import datetime
+import itertools
+import uuid
+from collections import Counter
+
+import client
+import locust
+import operation_report
+from scd_scenarios import DensityMap, IntentPlan, ScenarioGenerator
+from uas_standards.interuss.automated_testing.flight_planning.v1.constants import (
+    Scope,
+)
+
+FLIGHT_PLANS_PATH = "/flight_planning/v1/flight_plans"
+
+_generator: ScenarioGenerator | None = None
+_instance_index = itertools.count()
+_results: Counter[tuple[str, str]] = Counter()
+"""Number of responses with each (phase, planning_result)."""
+
+
+@locust.events.init_command_line_parser.add_listener
+def init_parser(parser: argparse.ArgumentParser):
+    """Setup config params, populated by locust.conf."""
+
+    parser.add_argument(
+        "--mock-uss-urls",
+        type=str,
+        help="Comma-separated base URLs of the mock_uss instances to plan flights with (defaults to host)",
+        default="",
+    )
+    parser.add_argument(
+        "--density-map",
+        type=str,
+        help="Hotspots in which flights are planned, as lat,lng,radius_m,weight separated by semicolons",
+        required=True,
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed determining the sequence of planned flights",
+        default=0,
+    )
+    parser.add_argument(
+        "--max-flight-distance",
+        type=int,
+        help="Maximum distance (meters) to cover for an individual flight",
+        default=2000,
+    )
+    parser.add_argument(
+        "--overlap-ratio",
+        type=float,
+        help="Fraction of flights deliberately conflicting with a recent flight",
+        default=0.2,
+    )
+    parser.add_argument(
+        "--activated-ratio",
+        type=float,
+        help="Fraction of flights activated after being planned",
+        default=0.7,
+    )
+    parser.add_argument(
+        "--nonconforming-ratio",
+        type=float,
+        help="Fraction of activated flights subsequently reported as off-nominal",
+        default=0.1,
+    )
+    parser.add_argument(
+        "--modifications",
+        type=int,
+        help="Number of times each flight is modified before being activated",
+        default=1,
+    )
+    parser.add_argument(
+        "--flight-duration",
+        type=int,
+        help="Maximum duration (seconds) of each flight",
+        default=600,
+    )
+
+
+@locust.events.test_start.add_listener
+def make_generator(environment, **kwargs):
+    global _generator
+    options = environment.parsed_options
+    # Each worker of a distributed test produces its own (reproducible) sequence
+    worker_index = getattr(environment.runner, "worker_index", 0)
+    _generator = ScenarioGenerator(
+        density_map=DensityMap.parse(options.density_map),
+        seed=options.seed + worker_index,
+        max_flight_distance=options.max_flight_distance,
+        overlap_ratio=options.overlap_ratio,
+        activated_ratio=options.activated_ratio,
+        nonconforming_ratio=options.nonconforming_ratio,
+        duration=datetime.timedelta(seconds=options.flight_duration),
+    )
+    _results.clear()
+
+
+def _upsert_body(
+    plan: IntentPlan, created_at: datetime.datetime, usage_state: str, uas_state: str
+) -> dict:
+    return {
+        "flight_plan": {
+            "basic_information": {
+                "usage_state": usage_state,
+                "uas_state": uas_state,
+                "area": [v.to_flight_planning_api() for v in plan.volumes(created_at)],
+            }
+        },
+        "execution_style": "IfAllowed",
+        "request_id": str(uuid.uuid4()),
+    }
+
+
+class FlightPlanner(client.USS):
+    wait_time = locust.between(0.01, 0.5)
+    scopes = [Scope.Plan]
+
+    def on_start(self):
+        # Spread users evenly across the mock_uss instances
+        urls = [
+            self.base_url(url.strip())
+            for url in self.environment.parsed_options.mock_uss_urls.split(",")
+            if url.strip()
+        ] or [self.base_url()]
+        self.mock_uss_url = urls[next(_instance_index) % len(urls)]
+        self.start_flight()
+
+    @locust.task
+    def advance(self):
+        """Perform the next phase of the current flight, starting a new flight if needed."""
+        if not self.steps:
+            self.start_flight()
+        step = self.steps.pop(0)
+        if step == "close":
+            self.close()
+        else:
+            self.upsert(step)
+
+    def start_flight(self):
+        assert _generator is not None, "Generator is created when the test starts"
+        self.plan: IntentPlan = _generator.next_intent()
+        self.created_at = datetime.datetime.now(datetime.UTC)
+        self.planned = False
+        modifications = self.environment.parsed_options.modifications
+        self.steps: list[str] = ["plan"] + ["modify"] * modifications
+        if "Activated" in self.plan.states:
+            self.steps.append("activate")
+        if "Nonconforming" in self.plan.states:
+            self.steps.append("off_nominal")
+        self.steps.append("close")
+
+    def upsert(self, phase: str):
+        usage_state, uas_state = "Planned", "Nominal"
+        if phase == "modify":
+            # Raise the ceiling of the flight a little more with each modification
+            self.plan = dataclasses.replace(
+                self.plan, altitude_upper=self.plan.altitude_upper + 5
+            )
+        elif phase == "activate":
+            usage_state = "InUse"
+        elif phase == "off_nominal":
+            usage_state, uas_state = "InUse", "OffNominal"
+
+        with self.client.put(
+            f"{self.mock_uss_url}{FLIGHT_PLANS_PATH}/{self.plan.intent_id}",
+            json=_upsert_body(self.plan, self.created_at, usage_state, uas_state),
+            name=f"[{phase}] {FLIGHT_PLANS_PATH}/[id]",
+            catch_response=True,
+        ) as resp:
+            if resp.status_code != 200:
+                _results[(phase, f"HTTP {resp.status_code}")] += 1
+                self.abandon()
+                return
+            try:
+                result = resp.json()
+                planning_result = result["planning_result"]
+                flight_plan_status = result["flight_plan_status"]
+            except (ValueError, KeyError) as e:
+                resp.failure(f"Invalid upsert response: {e}")
+                _results[(phase, "Invalid response")] += 1
+                self.abandon()
+                return
+            _results[(phase, planning_result)] += 1
+            self.planned = flight_plan_status not in ("NotPlanned", "Closed")
+            if planning_result == "Completed":
+                return
+            if planning_result != "Rejected":
+                resp.failure(
+                    f"Planning result {planning_result}: {result.get('notes', '')}"
+                )
+            # Rejections due to conflicts with other flights are expected
+            self.abandon()
+
+    def abandon(self):
+        """Skip the remaining phases of the current flight, closing it if it was planned."""
+        self.steps = ["close"] if self.planned else []
+
+    def close(self):
+        with self.client.delete(
+            f"{self.mock_uss_url}{FLIGHT_PLANS_PATH}/{self.plan.intent_id}",
+            name=f"[close] {FLIGHT_PLANS_PATH}/[id]",
+            catch_response=True,
+        ) as resp:
+            if resp.status_code != 200:
+                _results[("close", f"HTTP {resp.status_code}")] += 1
+            else:
+                try:
+                    _results[("close", resp.json()["planning_result"])] += 1
+                except (ValueError, KeyError) as e:
+                    resp.failure(f"Invalid delete response: {e}")
+        self.planned = False
+
+    def on_stop(self):
+        if self.planned:
+            self.close()
+
+
+@locust.events.test_stop.add_listener
+def report_phases(environment, **kwargs):
+    """Summarize throughput, response times, and planning results per phase."""
+    lines = [operation_report.make_operation_report(environment)]
+    if _results:
+        lines.append("Planning results per phase:")
+        for (phase, result), count in sorted(_results.items()):
+            lines.append(f"  {phase:<15} {result:<20} {count:>8}")
+    print("\n".join(lines))
@@ -0,0 +1,346 @@
+"""Load test of mock_uss remote ID Service Provider and Display Provider endpoints.
+
+RIDServiceProvider users inject test flights into a mock_uss ridsp instance
+via the RID injection API, then query that instance's /uss/flights endpoint
+with random views over the injected area.  RIDDisplayProvider users query a
+mock_uss riddp instance's observation API with random views over the same
+area, so they observe the flights injected by RIDServiceProvider users.
+
+When the test stops, the latency distribution of each endpoint is compared to
+the corresponding F3411 percentile requirements.
+"""
+
+import argparse
+import datetime
+import random
+import time
+import uuid
+
+import client
+import geo_utils
+import load_results
+import locust
+from uas_standards.astm.f3411.v19.constants import Scope as f3411v19_scope
+from uas_standards.astm.f3411.v22a.constants import Scope as f3411v22a_scope
+
+from monitoring.monitorlib.rid import RIDVersion
+from monitoring.monitorlib.rid_automated_testing.injection_api import (
+    SCOPE_RID_QUALIFIER_INJECT,
+)
+
+SP_FLIGHTS = "/uss/flights"
+DP_DISPLAY_DATA_INIT = "/riddp/observation/display_data (initial)"
+DP_DISPLAY_DATA = "/riddp/observation/display_data"
+DP_DETAILS = "/riddp/observation/display_data/[flight_id]"
+
+
+@locust.events.init_command_line_parser.add_listener
+def init_parser(parser: argparse.ArgumentParser):
+    """Setup config params, populated by locust.conf."""
+
+    parser.add_argument(
+        "--ridsp-url",
+        type=str,
+        help="Base URL of the mock_uss instance providing the ridsp service (defaults to host)",
+        default="",
+    )
+    parser.add_argument(
+        "--riddp-url",
+        type=str,
+        help="Base URL of the mock_uss instance providing the riddp service (defaults to host)",
+        default="",
+    )
+    parser.add_argument(
+        "--rid-version",
+        type=str,
+        choices=[v.value for v in RIDVersion],
+        help="Version of F3411 used by the mock_uss instances",
+        default=RIDVersion.f3411_22a.value,
+    )
+    parser.add_argument(
+        "--area-lat",
+        type=float,
+        help="Latitude of the center of the area in which to create flights",
+        required=True,
+    )
+    parser.add_argument(
+        "--area-lng",
+        type=float,
+        help="Longitude of the center of the area in which to create flights",
+        required=True,
+    )
+    parser.add_argument(
+        "--area-radius",
+        type=int,
+        help="Radius (in meters) of the area in which to create flights",
+        required=True,
+    )
+    parser.add_argument(
+        "--max-flight-distance",
+        type=int,
+        help="Maximum distance to cover for an individual flight",
+        default=2000,
+    )
+    parser.add_argument(
+        "--flights-per-test",
+        type=int,
+        help="Number of flights injected by each RIDServiceProvider user",
+        default=5,
+    )
+    parser.add_argument(
+        "--flight-duration",
+        type=int,
+        help="Duration (in seconds) of each injected flight; flights are injected again once they end",
+        default=600,
+    )
+
+
+def _format_time(time: datetime.datetime) -> str:
+    return time.astimezone(datetime.UTC).isoformat()
+
+
+def _format_view(view: tuple[float, float, float, float]) -> str:
+    return ",".join(f"{v:.6f}" for v in view)
+
+
+def _create_random_test_flight(options: argparse.Namespace, flight_index: int):
+    duration = options.flight_duration
+    points, track, distance = geo_utils.create_random_flight_track(
+        options.area_lat,
+        options.area_lng,
+        options.area_radius,
+        options.max_flight_distance,
+        duration + 1,
+    )
+    speed = distance / duration
+    altitude = random.randint(50, 120)
+    start_time = datetime.datetime.now(datetime.UTC)
+    flight_id = uuid.uuid4().hex
+
+    return {
+        "injection_id": str(uuid.uuid4()),
+        "aircraft_type": "Helicopter",
+        "telemetry": [
+            {
+                "timestamp": _format_time(start_time + datetime.timedelta(seconds=t)),
+                "timestamp_accuracy": 0.0,
+                "operational_status": "Airborne",
+                "position": {
+                    "lat": p.y,
+                    "lng": p.x,
+                    "alt": altitude,
+                    "accuracy_h": "HAUnknown",
+                    "accuracy_v": "VAUnknown",
+                    "extrapolated": False,
+                },
+                "height": {"distance": altitude, "reference": "TakeoffLocation"},
+                "track": track,
+                "speed": speed,
+                "speed_accuracy": "SA3mps",
+                "vertical_speed": 0.0,
+            }
+            for t, p in enumerate(points)
+        ],
+        "details_responses": [
+            {
+                "effective_after": _format_time(start_time),
+                "details": {
+                    "id": flight_id,
+                    "operator_id": f"OP-{flight_id[0:8]}",
+                    "operation_description": f"Load test flight {flight_index}",
+                    "serial_number": f"LOAD{flight_id[0:12].upper()}",
+                    "registration_number": f"FIN{flight_id[0:8].upper()}",
+                },
+            }
+        ],
+    }
+
+
+class RIDServiceProvider(client.USS):
+    wait_time = locust.between(0.1, 1)
+    scopes = [
+        SCOPE_RID_QUALIFIER_INJECT,
+        f3411v19_scope.Read,
+        f3411v22a_scope.DisplayProvider,
+    ]
+
+    def on_start(self):
+        options = self.environment.parsed_options
+        self.ridsp_url = self.base_url(options.ridsp_url)
+        self.rid_version = RIDVersion(options.rid_version)
+        self.test_id = None
+        self.test_version = None
+        self.test_end = 0.0
+        self.inject_flights()
+
+    def inject_flights(self):
+        options = self.environment.parsed_options
+        if self.test_id:
+            self.delete_flights()
+        test_id = str(uuid.uuid4())
+        resp = self.client.put(
+            f"{self.ridsp_url}/ridsp/injection/tests/{test_id}",
+            json={
+                "requested_flights": [
+                    _create_random_test_flight(options, i)
+                    for i in range(options.flights_per_test)
+                ]
+            },
+            name="/ridsp/injection/tests/[test_id]",
+        )
+        if resp.status_code == 200:
+            self.test_id = test_id
+            self.test_version = resp.json()["version"]
+            self.test_end = time.monotonic() + options.flight_duration
+
+    def delete_flights(self):
+        self.client.delete(
+            f"{self.ridsp_url}/ridsp/injection/tests/{self.test_id}/{self.test_version}",
+            name="/ridsp/injection/tests/[test_id]/[version]",
+        )
+        self.test_id = None
+        self.test_version = None
+
+    @locust.task
+    def search_flights(self):
+        if time.monotonic() > self.test_end:
+            self.inject_flights()
+            return
+        options = self.environment.parsed_options
+        view = geo_utils.create_random_view(
+            options.area_lat,
+            options.area_lng,
+            options.area_radius,
+            self.rid_version.max_diagonal_km * 1000,
+        )
+        # See mock_uss/ridsp/routes_ridsp_v19.py and routes_ridsp_v22a.py
+        mock_path = (
+            "/mock/ridsp/v2"
+            if self.rid_version == RIDVersion.f3411_22a
+            else "/mock/ridsp"
+        )
+        self.client.get(
+            self.rid_version.flights_url_of(f"{self.ridsp_url}{mock_path}"),
+            params={"view": _format_view(view), "recent_positions_duration": 60},
+            name=SP_FLIGHTS,
+        )
+
+    def on_stop(self):
+        if self.test_id:
+            self.delete_flights()
+
+
+class RIDDisplayProvider(client.USS):
+    wait_time = locust.between(0.5, 1.5)
+    scopes = [f3411v19_scope.Read]
+
+    def on_start(self):
+        options = self.environment.parsed_options
+        self.riddp_url = self.base_url(options.riddp_url)
+        self.rid_version = RIDVersion(options.rid_version)
+        self.view: tuple[float, float, float, float] | None = None
+        self.flight_ids = []
+
+    def get_display_data(self, view: tuple[float, float, float, float], name: str):
+        resp = self.client.get(
+            f"{self.riddp_url}/riddp/observation/display_data",
+            params={"view": _format_view(view)},
+            name=name,
+        )
+        if resp.status_code == 200:
+            self.flight_ids = [f["id"] for f in resp.json().get("flights", [])]
+
+    @locust.task(1)
+    def display_new_area(self):
+        options = self.environment.parsed_options
+        # Alternate between views showing individual flights and views showing clusters
+        max_diagonal_km = random.choice(
+            [
+                self.rid_version.max_details_diagonal_km,
+                self.rid_version.max_diagonal_km,
+            ]
+        )
+        self.view = geo_utils.create_random_view(
+            options.area_lat,
+            options.area_lng,
+            options.area_radius,
+            max_diagonal_km * 1000,
+        )
+        self.get_display_data(self.view, DP_DISPLAY_DATA_INIT)
+
+    @locust.task(10)
+    def refresh_display(self):
+        if self.view is None:
+            self.display_new_area()
+            return
+        self.get_display_data(self.view, DP_DISPLAY_DATA)
+
+    @locust.task(2)
+    def display_flight_details(self):
+        if not self.flight_ids:
+            return
+        self.client.get(
+            f"{self.riddp_url}/riddp/observation/display_data/{random.choice(self.flight_ids)}",
+            name=DP_DETAILS,
+        )
+
+
+def latency_thresholds(rid_version: RIDVersion) -> dict[str, tuple[float, float]]:
+    """F3411 95th and 99th percentile response time requirements (seconds) for each load-tested endpoint."""
+    return {
+        SP_FLIGHTS: (
+            rid_version.sp_data_resp_percentile95_s,
+            rid_version.sp_data_resp_percentile99_s,
+        ),
+        DP_DISPLAY_DATA_INIT: (
+            rid_version.dp_init_resp_percentile95_s,
+            rid_version.dp_init_resp_percentile99_s,
+        ),
+        DP_DISPLAY_DATA: (
+            rid_version.dp_data_resp_percentile95_s,
+            rid_version.dp_data_resp_percentile99_s,
+        ),
+        DP_DETAILS: (
+            rid_version.dp_details_resp_percentile95_s,
+            rid_version.dp_details_resp_percentile99_s,
+        ),
+    }
+
+
+def default_slos(options: argparse.Namespace) -> list[load_results.SLO]:
+    """Assert the F3411 response time requirements unless other objectives are specified."""
+    slos = []
+    for name, (p95_limit, p99_limit) in latency_thresholds(
+        RIDVersion(options.rid_version)
+    ).items():
+        slos.append(
+            load_results.SLO(request=name, percentile=95, max_seconds=p95_limit)
+        )
+        slos.append(
+            load_results.SLO(request=name, percentile=99, max_seconds=p99_limit)
+        )
+    return slos
+
+
+load_results.set_default_slos(default_slos)
+
+
+@locust.events.test_stop.add_listener
+def report_latencies(environment, **kwargs):
+    """Compare observed latency percentiles to the F3411 requirements."""
+    rid_version = RIDVersion(environment.parsed_options.rid_version)
+    lines = [
+        f"{'Endpoint':<45} {'Requests':>8} {'p50':>7} {'p95':>7} {'p99':>7}  F3411 p95/p99"
+    ]
+    for name, (p95_limit, p99_limit) in latency_thresholds(rid_version).items():
+        stats = environment.stats.get(name, "GET")
+        if not stats.num_requests:
+            continue
+        p50, p95, p99 = (
+            stats.get_response_time_percentile(p) / 1000 for p in (0.5, 0.95, 0.99)
+        )
+        verdict = "ok" if p95 <= p95_limit and p99 <= p99_limit else "EXCEEDED"
+        lines.append(
+            f"{name:<45} {stats.num_requests:>8} {p50:>6.2f}s {p95:>6.2f}s {p99:>6.2f}s  {p95_limit}s/{p99_limit}s {verdict}"
+        )
+    print(f"Response times vs {rid_version.value} requirements:\n" + "\n".join(lines))
@@ -0,0 +1,257 @@
+"""High-contention strategic coordination load test of a DSS.
+
+Each virtual USS repeatedly plans operational intents produced by a shared,
+seeded ScenarioGenerator (see scd_scenarios.py): it creates subscriptions
+covering the intent, queries the intent's area to obtain the OVNs it must
+provide as a key, creates the operational intent reference, transitions it
+through its planned states, and finally deletes it along with the
+subscriptions.  Flights are concentrated in hotspots and a configurable
+fraction of them deliberately overlaps recent flights, so the DSS's conflict
+detection and subscription notification paths are exercised heavily.
+
+Each request is named after its operation type, and a latency summary per
+operation type is printed when the test stops.
+"""
+
+import argparse
+import datetime
+
+import client
+import locust
+import operation_report
+from scd_scenarios import DensityMap, IntentPlan, ScenarioGenerator
+
+from monitoring.monitorlib.geotemporal import Volume4DCollection
+
+OIR_PATH = "/dss/v1/operational_intent_references"
+SUBSCRIPTION_PATH = "/dss/v1/subscriptions"
+
+_generator: ScenarioGenerator | None = None
+_fan_out: list[int] = []
+"""Number of subscribers to notify returned by the DSS for each successful operational intent change."""
+
+
+@locust.events.init_command_line_parser.add_listener
+def init_parser(parser: argparse.ArgumentParser):
+    """Setup config params, populated by locust.conf."""
+
+    parser.add_argument(
+        "--uss-base-url",
+        type=str,
+        help="Base URL of the USS managing the operational intents and subscriptions",
+        required=True,
+    )
+    parser.add_argument(
+        "--density-map",
+        type=str,
+        help="Hotspots in which flights are created, as lat,lng,radius_m,weight separated by semicolons",
+        required=True,
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed determining the sequence of generated operational intents",
+        default=0,
+    )
+    parser.add_argument(
+        "--max-flight-distance",
+        type=int,
+        help="Maximum distance (meters) to cover for an individual flight",
+        default=2000,
+    )
+    parser.add_argument(
+        "--overlap-ratio",
+        type=float,
+        help="Fraction of operational intents deliberately overlapping a recent operational intent",
+        default=0.2,
+    )
+    parser.add_argument(
+        "--activated-ratio",
+        type=float,
+        help="Fraction of operational intents transitioning from Accepted to Activated",
+        default=0.7,
+    )
+    parser.add_argument(
+        "--nonconforming-ratio",
+        type=float,
+        help="Fraction of Activated operational intents subsequently becoming Nonconforming",
+        default=0.1,
+    )
+    parser.add_argument(
+        "--subscriptions-per-oir",
+        type=int,
+        help="Number of additional subscriptions created to cover each operational intent",
+        default=2,
+    )
+    parser.add_argument(
+        "--flight-duration",
+        type=int,
+        help="Maximum duration (seconds) of each operational intent",
+        default=600,
+    )
+
+
+@locust.events.test_start.add_listener
+def make_generator(environment, **kwargs):
+    global _generator
+    options = environment.parsed_options
+    # Each worker of a distributed test produces its own (reproducible) sequence
+    worker_index = getattr(environment.runner, "worker_index", 0)
+    _generator = ScenarioGenerator(
+        density_map=DensityMap.parse(options.density_map),
+        seed=options.seed + worker_index,
+        max_flight_distance=options.max_flight_distance,
+        overlap_ratio=options.overlap_ratio,
+        activated_ratio=options.activated_ratio,
+        nonconforming_ratio=options.nonconforming_ratio,
+        subscriptions_per_oir=options.subscriptions_per_oir,
+        duration=datetime.timedelta(seconds=options.flight_duration),
+    )
+    _fan_out.clear()
+
+
+class SCDContention(client.USS):
+    wait_time = locust.between(0.01, 0.5)
+
+    def on_start(self):
+        self.uss_base_url = self.environment.parsed_options.uss_base_url
+        self.ovn: str | None = None
+        self.subscription_id: str | None = None
+        self.subscription_versions: dict[str, str] = {}
+        self.start_plan()
+
+    @locust.task
+    def advance(self):
+        """Perform the next step of the current operational intent plan, starting a new plan if needed."""
+        if not self.steps:
+            self.start_plan()
+        step = self.steps.pop(0)
+        if step == "subscribe":
+            self.create_subscriptions()
+        elif step == "delete":
+            self.delete_all()
+        else:
+            self.put_oir(step)
+
+    def start_plan(self):
+        assert _generator is not None, "Generator is created when the test starts"
+        self.plan: IntentPlan = _generator.next_intent()
+        self.volumes: Volume4DCollection = self.plan.volumes(
+            datetime.datetime.now(datetime.UTC)
+        )
+        self.ovn = None
+        self.steps: list[str] = ["subscribe"] + self.plan.states + ["delete"]
+
+    def create_subscriptions(self):
+        extents = self.volumes.bounding_volume.to_f3548v21()
+        for subscription_id in self.plan.subscription_ids:
+            resp = self.client.put(
+                f"{SUBSCRIPTION_PATH}/{subscription_id}",
+                json={
+                    "extents": extents,
+                    "uss_base_url": self.uss_base_url,
+                    "notify_for_operational_intents": True,
+                    "notify_for_constraints": False,
+                },
+                name="[create_subscription] /dss/v1/subscriptions/[id]",
+            )
+            if resp.status_code == 200:
+                self.subscription_versions[subscription_id] = resp.json()[
+                    "subscription"
+                ]["version"]
+
+    def query_key(self) -> list[str]:
+        """Query the intent's area for OVNs that must be provided as the key when placing the intent."""
+        resp = self.client.post(
+            f"{OIR_PATH}/query",
+            json={"area_of_interest": self.volumes.bounding_volume.to_f3548v21()},
+            name="[query_oirs] /dss/v1/operational_intent_references/query",
+        )
+        if resp.status_code != 200:
+            return []
+        return [
+            oir["ovn"]
+            for oir in resp.json().get("operational_intent_references", [])
+            if oir.get("ovn") and oir["id"] != self.plan.intent_id
+        ]
+
+    def put_oir(self, state: str):
+        key = self.query_key()
+        body = {
+            "extents": self.volumes.to_f3548v21(),
+            "key": key,
+            "state": state,
+            "uss_base_url": self.uss_base_url,
+        }
+        if self.ovn is None:
+            operation = f"create_oir:{state}"
+            path = f"{OIR_PATH}/{self.plan.intent_id}"
+            name_path = f"{OIR_PATH}/[id]"
+            body["new_subscription"] = {"uss_base_url": self.uss_base_url}
+        else:
+            operation = f"update_oir:{state}"
+            path = f"{OIR_PATH}/{self.plan.intent_id}/{self.ovn}"
+            name_path = f"{OIR_PATH}/[id]/[ovn]"
+            body["subscription_id"] = self.subscription_id
+
+        for attempt in ("", " (retry)"):
+            with self.client.put(
+                path,
+                json=body,
+                name=f"[{operation}{attempt}] {name_path}",
+                catch_response=True,
+            ) as resp:
+                if resp.status_code in (200, 201):
+                    result = resp.json()
+                    self.ovn = result["operational_intent_reference"]["ovn"]
+                    self.subscription_id = result["operational_intent_reference"][
+                        "subscription_id"
+                    ]
+                    _fan_out.append(len(result.get("subscribers", [])))
+                    return
+                if resp.status_code != 409:
+                    break
+                # The airspace changed between the query and this request; this
+                # contention is expected, so retry with any newly-known OVNs
+                resp.success()
+                try:
+                    missing = resp.json().get("missing_operational_intents", [])
+                except ValueError:
+                    missing = []
+                body["key"] = key + [oir["ovn"] for oir in missing if oir.get("ovn")]
+        # Give up on this plan if the intent could not be placed
+        self.steps = ["delete"] if self.ovn else []
+        if not self.steps:
+            self.delete_subscriptions()
+
+    def delete_all(self):
+        if self.ovn:
+            self.client.delete(
+                f"{OIR_PATH}/{self.plan.intent_id}/{self.ovn}",
+                name="[delete_oir] /dss/v1/operational_intent_references/[id]/[ovn]",
+            )
+            self.ovn = None
+        self.delete_subscriptions()
+
+    def delete_subscriptions(self):
+        for subscription_id, version in self.subscription_versions.items():
+            self.client.delete(
+                f"{SUBSCRIPTION_PATH}/{subscription_id}/{version}",
+                name="[delete_subscription] /dss/v1/subscriptions/[id]/[version]",
+            )
+        self.subscription_versions = {}
+
+    def on_stop(self):
+        if self.plan is not None:
+            self.delete_all()
+
+
+@locust.events.test_stop.add_listener
+def report_operation_latencies(environment, **kwargs):
+    """Summarize response times per operation type."""
+    lines = [operation_report.make_operation_report(environment)]
+    if _fan_out:
+        lines.append(
+            f"Subscribers per operational intent change: mean {sum(_fan_out) / len(_fan_out):.1f}, max {max(_fan_out)}"
+        )
+    print("\n".join(lines))
@@ -2,6 +2,7 @@
 
 import os
 
+import load_results  # noqa: F401 (adds results export and SLO options to every load test)
 import requests
 from locust import HttpUser
 from uas_standards.astm.f3411.v19.constants import Scope as f3411_scope
@@ -16,6 +17,14 @@ class USS(HttpUser):
     isa_dict: dict[str, str] = {}
     sub_dict: dict[str, str] = {}
 
+    # This is a load tester its acceptable to have all the scopes required to operate anything.
+    # We are not testing if the scope is incorrect. We are testing if it can handle the load.
+    scopes: list[str] = [
+        f3411_scope.Read,
+        f3411_scope.Write,
+        f3548_scope.StrategicCoordination,
+    ]
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         auth_spec = os.environ.get("AUTH_SPEC")
@@ -25,13 +34,7 @@ class USS(HttpUser):
                 "Missing AUTH_SPEC environment variable, please check README"
             )
 
-        # This is a load tester its acceptable to have all the scopes required to operate anything.
-        # We are not testing if the scope is incorrect. We are testing if it can handle the load.
-        scopes = [
-            f3411_scope.Read,
-            f3411_scope.Write,
-            f3548_scope.StrategicCoordination,
-        ]
+        scopes = self.scopes
         oauth_adapter = auth.make_auth_adapter(auth_spec)
 
         def _auth(
@@ -41,3 +44,12 @@ class USS(HttpUser):
             return prepared_request
 
         self.client.auth = _auth
+
+    def base_url(self, url: str | None = None) -> str:
+        """Base URL (without trailing slash) of the system under test: url if specified, otherwise the locust host."""
+        url = url or self.host
+        if not url:
+            raise ValueError(
+                "The URL of the system under test must be specified with --host or a load test option"
+            )
+        return url.rstrip("/")
@@ -54,11 +54,13 @@ def _create_rectangles_on_path(
 def _random_point_within_circle(
     center: shapely.Point,
     radius: float,
+    rng: random.Random | None = None,
 ) -> shapely.Point:
+    rng = rng or random.Random()
     # Take sqrt of random to ensure uniform distribution of points throughout
     # circular area:
-    random_radius = radius * math.sqrt(random.random())
-    random_angle = 2 * math.pi * random.random()
+    random_radius = radius * math.sqrt(rng.random())
+    random_angle = 2 * math.pi * rng.random()
 
     x = random_radius * math.cos(random_angle) + center.x
     y = random_radius * math.sin(random_angle) + center.y
@@ -73,10 +75,19 @@ def _meters_to_angle(distance: float) -> float:
 
 
 def create_random_flight_path(
-    lat: float, lng: float, radius: int, max_flight_distance_meters: float
+    lat: float,
+    lng: float,
+    radius: int,
+    max_flight_distance_meters: float,
+    rng: random.Random | None = None,
 ) -> shapely.geometry.MultiPolygon:
-    bearing_deg = random.random() * 360
-    distance_meters = random.random() * max_flight_distance_meters
+    """Create a path of rectangles along a random bearing starting at a random point within the specified circle.
+
+    Provide rng to make the path reproducible.
+    """
+    rng = rng or random.Random()
+    bearing_deg = rng.random() * 360
+    distance_meters = rng.random() * max_flight_distance_meters
 
     # Roughly scale all distance measurements to deg lat/lng:
     radius_angle = _meters_to_angle(radius)
@@ -86,7 +97,7 @@ def create_random_flight_path(
 
     # Create a random start point within the circle of given radius and center:
     center = shapely.geometry.Point(lng, lat)
-    start_point = _random_point_within_circle(center, radius_angle)
+    start_point = _random_point_within_circle(center, radius_angle, rng)
 
     return _create_rectangles_on_path(
         start_point,
@@ -95,3 +106,65 @@ def create_random_flight_path(
         rect_width,
         rect_height,
     )
+
+
+def create_random_flight_track(
+    lat: float,
+    lng: float,
+    radius: int,
+    max_flight_distance_meters: float,
+    n_points: int,
+) -> tuple[list[shapely.geometry.Point], float, float]:
+    """Create a straight flight track starting at a random point within the specified circle.
+
+    Returns:
+        * Evenly-spaced points (x=lng, y=lat) along the track
+        * Track direction, in degrees clockwise from true North
+        * Track length in meters
+    """
+    bearing_deg = random.random() * 360
+    distance_meters = random.random() * max_flight_distance_meters
+
+    center = shapely.geometry.Point(lng, lat)
+    start_point = _random_point_within_circle(center, _meters_to_angle(radius))
+    end_point = shapely.affinity.translate(
+        start_point,
+        _meters_to_angle(distance_meters) * math.cos(math.radians(bearing_deg)),
+        _meters_to_angle(distance_meters) * math.sin(math.radians(bearing_deg)),
+    )
+    track = shapely.geometry.LineString([start_point, end_point])
+    points = [
+        track.interpolate(i / max(n_points - 1, 1), normalized=True)
+        for i in range(n_points)
+    ]
+
+    # bearing_deg is counterclockwise from East in the cartesian plane
+    return points, (90 - bearing_deg) % 360, distance_meters
+
+
+def create_random_view(
+    lat: float, lng: float, radius: int, max_diagonal_meters: float
+) -> tuple[float, float, float, float]:
+    """Create a square view of random size centered at a random point within the specified circle.
+
+    Returns: lat_lo, lng_lo, lat_hi, lng_hi of the view
+    """
+    center = _random_point_within_circle(
+        shapely.geometry.Point(lng, lat), _meters_to_angle(radius)
+    )
+    half_side = _meters_to_angle(random.random() * max_diagonal_meters) / (
+        2 * math.sqrt(2)
+    )
+    return (
+        center.y - half_side,
+        center.x - half_side,
+        center.y + half_side,
+        center.x + half_side,
+    )
+
+
+def translate_meters(geometry, dx_meters: float, dy_meters: float):
+    """Translate a shapely geometry (x=lng, y=lat) by roughly the specified distances East and North."""
+    return shapely.affinity.translate(
+        geometry, _meters_to_angle(dx_meters), _meters_to_angle(dy_meters)
+    )
@@ -0,0 +1,348 @@
+"""Machine-readable load test results, SLO assertions, and comparison to a baseline.
+
+Importing this module adds the following command line options to a load test:
+
+* `--results-file`: export the response time distribution of each endpoint to
+  JSON (or CSV, when the file name ends with `.csv`) when the test stops
+* `--slo-file`: YAML or JSON file defining response time and failure rate
+  objectives (see SLOFile); load tests may provide default objectives with
+  set_default_slos
+* `--baseline-file`: JSON results of a previous run to which this run is
+  compared
+* `--regression-tolerance`: fractional degradation relative to the baseline
+  beyond which a change is considered a regression
+
+When any objective is not met or any regression is detected, the locust process
+exits with a nonzero exit code so that it can gate a CI job.
+"""
+
+import argparse
+import csv
+import datetime
+import json
+from collections.abc import Callable
+
+import locust
+import yaml
+from implicitdict import ImplicitDict, Optional, StringBasedDateTime
+from locust.env import Environment
+from locust.runners import WorkerRunner
+from locust.stats import StatsEntry, calculate_response_time_percentile
+from operation_report import operation_of
+
+PERCENTILES = [50, 75, 90, 95, 99, 99.9, 99.99]
+"""Response time percentiles exported for each endpoint."""
+
+
+class EndpointResults(ImplicitDict):
+    method: str
+    """HTTP method of the requests."""
+
+    name: str
+    """Name of the requests, as reported by locust."""
+
+    num_requests: int
+    """Number of requests made."""
+
+    num_failures: int
+    """Number of requests that failed."""
+
+    requests_per_second: float
+    """Average throughput over the test."""
+
+    percentiles_s: dict[str, float]
+    """Response time (seconds) at each percentile in PERCENTILES, keyed by percentile."""
+
+    histogram_ms: dict[str, int]
+    """Number of requests for each response time bucket (milliseconds, rounded as locust does to limit the number of
+    buckets while keeping at least 2 significant digits)."""
+
+    @property
+    def failure_ratio(self) -> float:
+        return self.num_failures / self.num_requests if self.num_requests else 0
+
+    def percentile_s(self, percentile: float) -> float:
+        """Response time (seconds) at the specified percentile, computed from the histogram."""
+        response_times = {int(ms): n for ms, n in self.histogram_ms.items()}
+        return (
+            calculate_response_time_percentile(
+                response_times, sum(response_times.values()), percentile / 100
+            )
+            / 1000
+        )
+
+    @staticmethod
+    def from_stats(stats: StatsEntry) -> "EndpointResults":
+        return EndpointResults(
+            method=stats.method,
+            name=stats.name,
+            num_requests=stats.num_requests,
+            num_failures=stats.num_failures,
+            requests_per_second=stats.total_rps,
+            percentiles_s={
+                str(p): stats.get_response_time_percentile(p / 100) / 1000
+                for p in PERCENTILES
+            },
+            histogram_ms={str(ms): n for ms, n in sorted(stats.response_times.items())},
+        )
+
+
+class LoadTestResults(ImplicitDict):
+    generated_at: StringBasedDateTime
+    """Time at which these results were exported."""
+
+    duration_s: float
+    """Duration of the test."""
+
+    endpoints: list[EndpointResults]
+    """Results for each endpoint (method and request name) exercised during the test."""
+
+    def find(self, method: str, name: str) -> EndpointResults | None:
+        for endpoint in self.endpoints:
+            if endpoint.method == method and endpoint.name == name:
+                return endpoint
+        return None
+
+
+class SLO(ImplicitDict):
+    """Objective for the requests with the specified name, or of the specified operation type."""
+
+    request: Optional[str]
+    """Name of the requests to which this objective applies, as reported by locust."""
+
+    operation: Optional[str]
+    """Operation type of the requests (named `[<operation>] <path>`) to which this objective applies."""
+
+    percentile: Optional[float]
+    """Percentile (e.g., 95) of the response time that must not exceed max_seconds."""
+
+    max_seconds: Optional[float]
+    """Maximum response time at the specified percentile."""
+
+    max_failure_ratio: Optional[float]
+    """Maximum fraction of the requests that may fail."""
+
+    def validate(self) -> None:
+        """Raise ValueError if this objective cannot be evaluated."""
+        if not self.get("request", None) and not self.get("operation", None):
+            raise ValueError(
+                f"Objective {json.dumps(self)} must specify a request or an operation"
+            )
+        if (
+            self.get("max_seconds", None) is not None
+            and self.get("percentile", None) is None
+        ):
+            raise ValueError(
+                f"Objective {json.dumps(self)} specifies max_seconds and must therefore specify a percentile"
+            )
+
+    def applies_to(self, endpoint: EndpointResults) -> bool:
+        if "request" in self and self.request:
+            return endpoint.name == self.request
+        if "operation" in self and self.operation:
+            return operation_of(endpoint.name) == self.operation
+        return False
+
+
+class SLOFile(ImplicitDict):
+    """Content of the file specified with --slo-file."""
+
+    slos: list[SLO]
+
+
+_default_slos: Callable[[argparse.Namespace], list[SLO]] | None = None
+_violations: list[str] = []
+
+
+def set_default_slos(provider: Callable[[argparse.Namespace], list[SLO]]) -> None:
+    """Specify the objectives to assert when --slo-file is not specified, as a function of the parsed options."""
+    global _default_slos
+    _default_slos = provider
+
+
+@locust.events.init_command_line_parser.add_listener
+def init_parser(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--results-file",
+        type=str,
+        help="File to which results are written when the test stops (CSV if the file name ends with .csv, JSON otherwise)",
+        default="",
+    )
+    parser.add_argument(
+        "--slo-file",
+        type=str,
+        help="YAML or JSON file defining the response time and failure rate objectives to assert",
+        default="",
+    )
+    parser.add_argument(
+        "--baseline-file",
+        type=str,
+        help="JSON results file of a previous run to compare this run to",
+        default="",
+    )
+    parser.add_argument(
+        "--regression-tolerance",
+        type=float,
+        help="Fractional increase in response time percentiles or failures (or decrease in throughput) relative to the baseline considered a regression",
+        default=0.2,
+    )
+
+
+def collect_results(environment: Environment) -> LoadTestResults:
+    stats = environment.stats
+    return LoadTestResults(
+        generated_at=StringBasedDateTime(datetime.datetime.now(datetime.UTC)),
+        duration_s=stats.last_request_timestamp - stats.start_time
+        if stats.last_request_timestamp
+        else 0,
+        endpoints=[
+            EndpointResults.from_stats(entry)
+            for (name, method), entry in sorted(stats.entries.items())
+            if entry.num_requests
+        ],
+    )
+
+
+def write_results(results: LoadTestResults, path: str) -> None:
+    with open(path, "w", newline="") as f:
+        if not path.endswith(".csv"):
+            json.dump(results, f, indent=2)
+            return
+        writer = csv.writer(f)
+        writer.writerow(
+            ["Method", "Name", "Requests", "Failures", "Requests/s"]
+            + [f"p{p}" for p in PERCENTILES]
+        )
+        for endpoint in results.endpoints:
+            writer.writerow(
+                [
+                    endpoint.method,
+                    endpoint.name,
+                    endpoint.num_requests,
+                    endpoint.num_failures,
+                    f"{endpoint.requests_per_second:.3f}",
+                ]
+                + [f"{endpoint.percentiles_s[str(p)]:.3f}" for p in PERCENTILES]
+            )
+
+
+def load_slos(options: argparse.Namespace) -> list[SLO]:
+    """Load the objectives to assert.
+
+    Raises:
+        ValueError if any objective is invalid.
+    """
+    if options.slo_file:
+        with open(options.slo_file) as f:
+            slos = ImplicitDict.parse(yaml.safe_load(f), SLOFile).slos
+    elif _default_slos is not None:
+        slos = _default_slos(options)
+    else:
+        slos = []
+    for slo in slos:
+        slo.validate()
+    return slos
+
+
+def check_slos(results: LoadTestResults, slos: list[SLO]) -> list[str]:
+    """Evaluate objectives against results, returning a description of each objective not met."""
+    violations = []
+    for slo in slos:
+        for endpoint in results.endpoints:
+            if not slo.applies_to(endpoint):
+                continue
+            max_seconds = slo.get("max_seconds", None)
+            percentile = slo.get("percentile", None)
+            if max_seconds is not None and percentile is not None:
+                observed = endpoint.percentile_s(percentile)
+                if observed > max_seconds:
+                    violations.append(
+                        f"{endpoint.method} {endpoint.name}: p{percentile:g} of {observed:.3f}s exceeds objective of {max_seconds}s"
+                    )
+            if "max_failure_ratio" in slo and slo.max_failure_ratio is not None:
+                if endpoint.failure_ratio > slo.max_failure_ratio:
+                    violations.append(
+                        f"{endpoint.method} {endpoint.name}: {endpoint.failure_ratio:.1%} of requests failed, exceeding objective of {slo.max_failure_ratio:.1%}"
+                    )
+    return violations
+
+
+def compare_to_baseline(
+    results: LoadTestResults, baseline: LoadTestResults, tolerance: float
+) -> list[str]:
+    """Compare results to a baseline, returning a description of each regression."""
+    regressions = []
+    for endpoint in results.endpoints:
+        before = baseline.find(endpoint.method, endpoint.name)
+        if before is None:
+            continue
+        prefix = f"{endpoint.method} {endpoint.name}"
+        for p in ("95", "99"):
+            now_s = endpoint.percentiles_s[p]
+            before_s = before.percentiles_s[p]
+            if now_s > before_s * (1 + tolerance):
+                regressions.append(
+                    f"{prefix}: p{p} increased from {before_s:.3f}s to {now_s:.3f}s"
+                )
+        if endpoint.requests_per_second < before.requests_per_second * (1 - tolerance):
+            regressions.append(
+                f"{prefix}: throughput decreased from {before.requests_per_second:.2f} to {endpoint.requests_per_second:.2f} requests/s"
+            )
+        if endpoint.failure_ratio > before.failure_ratio * (1 + tolerance):
+            regressions.append(
+                f"{prefix}: failures increased from {before.failure_ratio:.1%} to {endpoint.failure_ratio:.1%}"
+            )
+    return regressions
+
+
+@locust.events.init.add_listener
+def validate_slos(environment: Environment, **kwargs):
+    """Reject invalid objectives before the test starts rather than when it stops."""
+    if environment.parsed_options is not None and not isinstance(
+        environment.runner, WorkerRunner
+    ):
+        load_slos(environment.parsed_options)
+
+
+@locust.events.test_stop.add_listener
+def evaluate_results(environment: Environment, **kwargs):
+    """Export results, then assert objectives and compare to the baseline."""
+    if isinstance(environment.runner, WorkerRunner):
+        return  # Results are aggregated and evaluated by the master
+    options = environment.parsed_options
+    if options is None:
+        return  # Not run from the locust command line
+    results = collect_results(environment)
+    if options.results_file:
+        write_results(results, options.results_file)
+        print(f"Load test results written to {options.results_file}")
+
+    _violations.clear()
+    slos = load_slos(options)
+    if slos:
+        violations = check_slos(results, slos)
+        print(
+            f"All {len(slos)} objectives met"
+            if not violations
+            else "Objectives not met:\n" + "\n".join(f"  {v}" for v in violations)
+        )
+        _violations.extend(violations)
+    if options.baseline_file:
+        with open(options.baseline_file) as f:
+            baseline = ImplicitDict.parse(json.load(f), LoadTestResults)
+        regressions = compare_to_baseline(
+            results, baseline, options.regression_tolerance
+        )
+        print(
+            f"No regressions relative to {options.baseline_file}"
+            if not regressions
+            else f"Regressions relative to {options.baseline_file}:\n"
+            + "\n".join(f"  {r}" for r in regressions)
+        )
+        _violations.extend(regressions)
+
+
+@locust.events.quitting.add_listener
+def set_exit_code(environment: Environment, **kwargs):
+    if _violations:
+        environment.process_exit_code = 1
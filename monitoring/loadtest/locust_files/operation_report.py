@@ -0,0 +1,33 @@
+"""Summaries of locust statistics for requests named after their operation type.
+
+Load tests using these summaries name each request `[<operation>] <path>`, so
+that requests of the same kind are aggregated regardless of the endpoint they
+target.
+"""
+
+from locust.env import Environment
+
+
+def operation_of(request_name: str) -> str | None:
+    """Operation type of a request named `[<operation>] <path>`, or None for other requests."""
+    if not request_name.startswith("[") or "]" not in request_name:
+        return None
+    return request_name[1 : request_name.index("]")]
+
+
+def make_operation_report(environment: Environment) -> str:
+    """Tabulate throughput and response time percentiles for each operation type."""
+    lines = [
+        f"{'Operation':<40} {'Requests':>8} {'Failures':>8} {'req/s':>7} {'p50':>7} {'p95':>7} {'p99':>7}"
+    ]
+    for (name, method), stats in sorted(environment.stats.entries.items()):
+        operation = operation_of(name)
+        if operation is None or not stats.num_requests:
+            continue
+        p50, p95, p99 = (
+            stats.get_response_time_percentile(p) / 1000 for p in (0.5, 0.95, 0.99)
+        )
+        lines.append(
+            f"{operation:<40} {stats.num_requests:>8} {stats.num_failures:>8} {stats.total_rps:>7.2f} {p50:>6.2f}s {p95:>6.2f}s {p99:>6.2f}s"
+        )
+    return "Response times per operation type:\n" + "\n".join(lines)
@@ -0,0 +1,237 @@
+"""Reproducible generation of strategic coordination load scenarios with controlled contention."""
+
+import datetime
+import random
+import uuid
+from collections import deque
+from dataclasses import dataclass
+
+import geo_utils
+import shapely
+
+from monitoring.monitorlib.geo import Polygon
+from monitoring.monitorlib.geotemporal import Volume4D, Volume4DCollection
+
+OVERLAP_JITTER_METERS = 3
+"""Maximum offset, along each axis, between an overlapping intent and the intent it overlaps.
+
+geo_utils flight paths are made of 10-meter-wide rectangles, so the offset must
+be small enough for the footprints to still intersect."""
+
+
+@dataclass
+class Hotspot:
+    """Area in which flights are concentrated."""
+
+    lat: float
+    """Latitude (degrees) of the center of the hotspot."""
+
+    lng: float
+    """Longitude (degrees) of the center of the hotspot."""
+
+    radius: int
+    """Radius (meters) of the hotspot."""
+
+    weight: float
+    """Relative likelihood that a flight starts within this hotspot."""
+
+
+class DensityMap:
+    """Distribution of flight starting points among hotspots."""
+
+    def __init__(self, hotspots: list[Hotspot]):
+        if not hotspots:
+            raise ValueError("A density map must contain at least one hotspot")
+        self.hotspots = hotspots
+
+    @staticmethod
+    def parse(spec: str) -> "DensityMap":
+        """Parse a density map from `lat,lng,radius,weight` hotspots separated by semicolons.
+
+        For example: `46.97,7.47,2000,3;46.95,7.44,500,1`
+        """
+        hotspots = []
+        for hotspot_spec in spec.split(";"):
+            if not hotspot_spec.strip():
+                continue
+            values = hotspot_spec.split(",")
+            if len(values) != 4:
+                raise ValueError(
+                    f"Hotspot '{hotspot_spec}' is not in the form lat,lng,radius,weight"
+                )
+            hotspots.append(
+                Hotspot(
+                    lat=float(values[0]),
+                    lng=float(values[1]),
+                    radius=int(values[2]),
+                    weight=float(values[3]),
+                )
+            )
+        return DensityMap(hotspots)
+
+    def choose(self, rng: random.Random) -> Hotspot:
+        return rng.choices(self.hotspots, weights=[h.weight for h in self.hotspots])[0]
+
+
+@dataclass
+class IntentPlan:
+    """Everything a virtual USS will do with one operational intent reference."""
+
+    index: int
+    """Position of this intent in the generator's sequence."""
+
+    intent_id: str
+    """ID of the operational intent reference."""
+
+    footprints: list[shapely.Polygon]
+    """Horizontal footprint (x=lng, y=lat) of each volume of the intent."""
+
+    altitude_lower: float
+    """Lower altitude bound of the intent (meters WGS84)."""
+
+    altitude_upper: float
+    """Upper altitude bound of the intent (meters WGS84)."""
+
+    start_delay: datetime.timedelta
+    """Time between creation of the intent and the start of its volumes."""
+
+    duration: datetime.timedelta
+    """Duration of the intent's volumes."""
+
+    states: list[str]
+    """Successive states in which the intent reference is placed, starting with its creation."""
+
+    subscription_ids: list[str]
+    """IDs of the additional subscriptions covering the intent, created before the intent."""
+
+    overlaps: int | None
+    """Index of the intent this intent was deliberately placed to overlap, if any."""
+
+    def volumes(self, now: datetime.datetime) -> Volume4DCollection:
+        """4D volumes of the intent when it is created at the specified time."""
+        t0 = now + self.start_delay
+        t1 = t0 + self.duration
+        return Volume4DCollection(
+            [
+                Volume4D.from_values(
+                    t0,
+                    t1,
+                    self.altitude_lower,
+                    self.altitude_upper,
+                    polygon=Polygon.from_coords(
+                        [(lat, lng) for lng, lat in footprint.exterior.coords[:-1]]
+                    ),
+                )
+                for footprint in self.footprints
+            ]
+        )
+
+
+class ScenarioGenerator:
+    """Generates a reproducible sequence of operational intent plans.
+
+    The same seed and parameters always produce the same sequence of plans
+    (IDs, geometry, state transitions, and subscriptions); only the absolute
+    times of the volumes depend on when the plans are executed.
+    """
+
+    def __init__(
+        self,
+        density_map: DensityMap,
+        seed: int,
+        max_flight_distance: float,
+        overlap_ratio: float = 0.2,
+        activated_ratio: float = 0.7,
+        nonconforming_ratio: float = 0.1,
+        subscriptions_per_oir: int = 0,
+        duration: datetime.timedelta = datetime.timedelta(minutes=10),
+        altitude_range: tuple[float, float] = (50, 400),
+        recent_window: int = 50,
+    ):
+        """
+        Args:
+            density_map: Distribution of flights among hotspots.
+            seed: Seed determining the sequence of plans.
+            max_flight_distance: Maximum distance (meters) covered by an individual flight.
+            overlap_ratio: Fraction of intents deliberately placed to overlap a recently-generated intent in space and time.
+            activated_ratio: Fraction of intents transitioning from Accepted to Activated.
+            nonconforming_ratio: Fraction of Activated intents subsequently becoming Nonconforming.
+            subscriptions_per_oir: Number of additional subscriptions created to cover each intent.
+            duration: Maximum duration of each intent; actual durations are between half this value and this value.
+            altitude_range: Minimum and maximum altitudes (meters WGS84) of intents.
+            recent_window: Number of most recent intents eligible to be overlapped.
+        """
+        self._density_map = density_map
+        self._rng = random.Random(seed)
+        self._max_flight_distance = max_flight_distance
+        self._overlap_ratio = overlap_ratio
+        self._activated_ratio = activated_ratio
+        self._nonconforming_ratio = nonconforming_ratio
+        self._subscriptions_per_oir = subscriptions_per_oir
+        self._duration = duration
+        self._altitude_range = altitude_range
+        self._recent: deque[IntentPlan] = deque(maxlen=recent_window)
+        self._count = 0
+
+    def _make_id(self) -> str:
+        return str(uuid.UUID(int=self._rng.getrandbits(128), version=4))
+
+    def _make_states(self) -> list[str]:
+        states = ["Accepted"]
+        if self._rng.random() < self._activated_ratio:
+            states.append("Activated")
+            if self._rng.random() < self._nonconforming_ratio:
+                states.append("Nonconforming")
+        return states
+
+    def next_intent(self) -> IntentPlan:
+        rng = self._rng
+        index = self._count
+        self._count += 1
+
+        if self._recent and rng.random() < self._overlap_ratio:
+            # Place this intent on top of a recent intent, slightly offset
+            target = rng.choice(self._recent)
+            dx, dy = (rng.uniform(-1, 1) * OVERLAP_JITTER_METERS for _ in range(2))
+            footprints = [
+                geo_utils.translate_meters(f, dx, dy) for f in target.footprints
+            ]
+            altitude_lower = target.altitude_lower
+            altitude_upper = target.altitude_upper
+            start_delay = target.start_delay
+            duration = target.duration
+            overlaps = target.index
+        else:
+            hotspot = self._density_map.choose(rng)
+            footprints = list(
+                geo_utils.create_random_flight_path(
+                    hotspot.lat,
+                    hotspot.lng,
+                    hotspot.radius,
+                    self._max_flight_distance,
+                    rng,
+                ).geoms
+            )
+            alt_min, alt_max = self._altitude_range
+            altitude_lower = rng.uniform(alt_min, alt_max - 10)
+            altitude_upper = rng.uniform(altitude_lower + 10, alt_max)
+            start_delay = datetime.timedelta(seconds=rng.randint(0, 60))
+            duration = self._duration * rng.uniform(0.5, 1)
+            overlaps = None
+
+        plan = IntentPlan(
+            index=index,
+            intent_id=self._make_id(),
+            footprints=footprints,
+            altitude_lower=altitude_lower,
+            altitude_upper=altitude_upper,
+            start_delay=start_delay,
+            duration=duration,
+            states=self._make_states(),
+            subscription_ids=[
+                self._make_id() for _ in range(self._subscriptions_per_oir)
+            ],
+            overlaps=overlaps,
+        )
+        self._recent.append(plan)
+        return plan
@@ -0,0 +1,65 @@
+"""Tests that mock_uss determines the current time from the configured clock."""
+
+from datetime import timedelta
+
+import pytest
+from implicitdict import ImplicitDict, StringBasedDateTime
+from uas_standards.astm.f3411.v19.constants import Scope
+
+from monitoring.mock_uss.app import SERVICE_RIDSP, webapp
+from monitoring.mock_uss.config import KEY_SERVICES
+from monitoring.monitorlib import clock
+from monitoring.monitorlib.auth import NoAuth
+from monitoring.monitorlib.rid_automated_testing import injection_api
+
+if SERVICE_RIDSP not in webapp.config[KEY_SERVICES]:
+    pytest.skip("ridsp service is not enabled", allow_module_level=True)
+
+from monitoring.mock_uss.ridsp.database import db  # noqa E402
+
+
+@pytest.fixture()
+def client():
+    webapp.config.update({"TESTING": True})
+    return webapp.test_client()
+
+
+def _auth_options(scope: str) -> dict:
+    token = NoAuth().issue_token("localhost", [scope])
+    return {"headers": {"Authorization": f"Bearer {token}"}}
+
+
+@pytest.fixture()
+def offset_clock(monkeypatch):
+    monkeypatch.setattr(
+        clock,
+        "_clock",
+        clock.Clock(ImplicitDict.parse({"offset": "1d"}, clock.ClockConfiguration)),
+    )
+
+
+def test_ridsp_flights_v19(client, offset_clock):
+    response = client.get(
+        "/mock/ridsp/v1/uss/flights",
+        query_string={"view": "46.97,7.47,46.98,7.48"},
+        **_auth_options(Scope.Read),
+    )
+    assert response.status_code == 200
+    timestamp = StringBasedDateTime(response.json["timestamp"]).datetime
+    assert abs(timestamp - clock.now()) < timedelta(minutes=1)
+
+
+def test_ridsp_user_notifications(client, offset_clock):
+    after = clock.now() - timedelta(minutes=1)
+    with db.transact() as tx:
+        tx.value.notifications.record_notification("Clock test notification")
+
+    response = client.get(
+        "/ridsp/injection/user_notifications",
+        query_string={"after": after.isoformat()},
+        **_auth_options(injection_api.SCOPE_RID_QUALIFIER_INJECT),
+    )
+    assert response.status_code == 200
+    assert "Clock test notification" in [
+        n["message"] for n in response.json["user_notifications"]
+    ]
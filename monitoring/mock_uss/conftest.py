@@ -0,0 +1,7 @@
+from monitoring.mock_uss.app import SERVICE_RIDDP, webapp
+from monitoring.mock_uss.config import KEY_SERVICES
+
+# Service packages require their configuration upon import, so their tests can only be collected when they are enabled
+collect_ignore = []
+if SERVICE_RIDDP not in webapp.config[KEY_SERVICES]:
+    collect_ignore.append("riddp")
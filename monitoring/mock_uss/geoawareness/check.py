@@ -9,7 +9,10 @@ from uas_standards.interuss.automated_testing.geo_awareness.v1.api import (
 
 from monitoring.mock_uss.geoawareness import database
 from monitoring.mock_uss.geoawareness.database import SourceRecord, db
-from monitoring.mock_uss.geoawareness.ed269 import evaluate_source
+from monitoring.mock_uss.geoawareness.ed269 import (
+    evaluate_source,
+    prune_source_indices,
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -29,6 +32,7 @@ def combine_results(
 
 def check_geozones(req: GeozonesCheckRequest) -> list[GeozonesCheckResultGeozone]:
     sources: dict[str, SourceRecord] = database.get_sources(db)
+    prune_source_indices(sources.keys())
 
     results: list[GeozonesCheckResultGeozone] = [
         GeozonesCheckResultGeozone.Absent
@@ -53,7 +57,7 @@ def check_geozones(req: GeozonesCheckRequest) -> list[GeozonesCheckResultGeozone
             if fmt == GeozoneHttpsSourceFormat.ED_269:
                 logger.debug(f" {j + 1}. ED269 source {source_id} ready.")
                 result = combine_results(
-                    result, evaluate_source(source, check.filterSets)
+                    result, evaluate_source(source_id, source, check.filterSets)
                 )
             else:
                 logger.debug(
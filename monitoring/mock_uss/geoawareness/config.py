@@ -0,0 +1,12 @@
+import os
+import tempfile
+
+from monitoring.mock_uss.app import import_environment_variable
+
+KEY_GEOZONE_STORE_FOLDER = "MOCK_USS_GEOZONE_STORE_FOLDER"
+"""Environment variable containing path of folder in which to store the features of loaded geozone sources."""
+
+import_environment_variable(
+    KEY_GEOZONE_STORE_FOLDER,
+    default=os.path.join(tempfile.gettempdir(), "mock_uss_geozones"),
+)
@@ -1,12 +1,13 @@
 import json
+import uuid
 
 from implicitdict import ImplicitDict, Optional
-from uas_standards.eurocae_ed269 import ED269Schema
 from uas_standards.interuss.automated_testing.geo_awareness.v1.api import (
     CreateGeozoneSourceRequest,
     GeozoneSourceResponseResult,
 )
 
+from monitoring.mock_uss.geoawareness.feature_store import ED269FeatureStore
 from monitoring.monitorlib.multiprocessing import SynchronizedValue
 
 
@@ -18,7 +19,10 @@ class SourceRecord(ImplicitDict):
     definition: CreateGeozoneSourceRequest
     state: GeozoneSourceResponseResult
     message: Optional[str]
-    geozone_ed269: Optional[ED269Schema]
+    geozone_ed269_store: Optional[ED269FeatureStore]
+    """Reference to the ED-269 features of the source, stored outside the database"""
+    geozone_ed269_version: Optional[str]
+    """Identifier of the current content of geozone_ed269_store, changing whenever it is updated"""
 
 
 class Database(ImplicitDict):
@@ -67,11 +71,12 @@ def update_source_state(
     return result
 
 
-def update_source_geozone_ed269(
-    geo_db: SynchronizedValue[Database], source_id: str, geozone: ED269Schema
+def update_source_geozone_ed269_store(
+    geo_db: SynchronizedValue[Database], source_id: str, store: ED269FeatureStore
 ):
     with geo_db.transact() as tx:
-        tx.value.sources[source_id]["geozone_ed269"] = geozone
+        tx.value.sources[source_id]["geozone_ed269_store"] = store
+        tx.value.sources[source_id]["geozone_ed269_version"] = str(uuid.uuid4())
         result = tx.value.sources[source_id]
     return result
 
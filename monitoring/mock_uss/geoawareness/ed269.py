@@ -1,9 +1,12 @@
 import ast
 import json
 import logging
-from datetime import datetime
+import math
+from collections.abc import Iterable
 
+import numpy as np
 import s2sphere
+import shapely
 from implicitdict import StringBasedDateTime
 from s2sphere import LatLng
 from shapely.geometry import Point, Polygon
@@ -22,7 +25,7 @@ from uas_standards.interuss.automated_testing.geo_awareness.v1.api import (
 )
 
 from monitoring.mock_uss.geoawareness.database import SourceRecord
-from monitoring.monitorlib.geo import flatten
+from monitoring.monitorlib.geo import flatten, unflatten_many
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -47,112 +50,7 @@ def convert_distance(
     )
 
 
-def evaluate_position(feature: UASZoneVersion, position: Position | None) -> bool:
-    logger.debug(f"      _evaluate_position: position:{position} feature:{feature}")
-    if position is None:
-        logger.debug("        * position is None => True")
-        return True
-
-    # TODO: Implement height check in AGL and AMSL
-
-    for g in feature.geometry:
-        if g.horizontalProjection.type == HorizontalProjectionType.Circle:
-            center = g.horizontalProjection.center  # Lng / Lat
-            ref = LatLng.from_degrees(center[1], center[0])
-            radius = convert_distance(
-                g.horizontalProjection.radius, g.uomDimensions, UomDimensions.M
-            )
-
-            circle_2d = Point(0, 0).buffer(radius)
-            position_2d = Point(
-                flatten(ref, LatLng.from_degrees(position.latitude, position.longitude))
-            )
-            if position_2d.within(circle_2d):
-                logger.debug("        * position is within circle => True")
-                return True
-        else:
-            for coord in g.horizontalProjection.coordinates:  # Lng / Lat
-                ref = s2sphere.LatLng.from_degrees(
-                    coord[0][1], coord[0][0]
-                )  # TODO: Use barycenter as reference instead of first point.
-
-                polygon_2d = Polygon(
-                    [
-                        flatten(ref, s2sphere.LatLng.from_degrees(p[1], p[0]))
-                        for p in coord  # Lng / Lat
-                    ]
-                )
-                position_2d = Point(
-                    flatten(
-                        ref, LatLng.from_degrees(position.latitude, position.longitude)
-                    )
-                )
-
-                if position_2d.within(polygon_2d):
-                    logger.debug("      * position is within polygon => True")
-                    return True
-
-    logger.debug("      * position outside geometry => False")
-    return False
-
-
-def _is_in_date_range(
-    start: StringBasedDateTime,
-    end: StringBasedDateTime,
-    after: StringBasedDateTime | None,
-    before: StringBasedDateTime | None,
-) -> bool:
-    if after is None and before is None:
-        return True
-
-    elif after is not None and before is not None:
-        if start.datetime < before.datetime and end.datetime > after.datetime:
-            return True
-    else:
-        if after is not None and end.datetime > after.datetime:
-            return True
-
-        if before is not None and start.datetime < before.datetime:
-            return True
-
-    return False
-
-
-def evaluate_timing(
-    feature: UASZoneVersion,
-    after: StringBasedDateTime | None = None,
-    before: StringBasedDateTime | None = None,
-) -> bool:
-    logger.debug(
-        f"     _evaluate_timing: after:{after} before:{before} feature:{feature}"
-    )
-
-    for a in feature.applicability:
-        if a.permanent == YESNO.YES:
-            logger.debug("     * Permanent applicability => True")
-            return True
-
-        start = a.get("startDateTime", StringBasedDateTime(datetime.min))
-        end = a.get("endDateTime", StringBasedDateTime(datetime.max))
-
-        in_range = _is_in_date_range(start, end, after, before)
-        if not in_range:
-            continue
-
-        schedule = a.get("schedule", None)
-        if schedule is None:
-            logger.debug("     * Date in range without schedule => True")
-            return True
-        else:
-            # TODO Implement schedule checks
-            logger.warning(
-                f"      * Date in range => {in_range} (Schedule not taken into account)"
-            )
-            return True
-    return False
-
-
-def _adjust_uspace_class(uspace_class: str | list[str]) -> list[str]:
+def _adjust_uspace_class(uspace_class: str | list[str] | None) -> list[str] | None:
     # TODO: Revisit when new version of ED-269 will be published.
     #  uSpaceClass field is currently defined in ED269 standard as a string.
     #  The current assumption is that uSpaceClass will be a string or some sort of an array of values.
@@ -179,18 +77,10 @@ def _adjust_uspace_class(uspace_class: str | list[str]) -> list[str]:
     return uspace_class
 
 
-def evaluate_non_spacetime(feature: UASZoneVersion, ed269: ED269Filters | None) -> bool:
-    """Returns True if the feature matches all provided filters"""
-    logger.debug(f"     _evaluate_ed269: ed269:{ed269} feature:{feature}")
-
-    if ed269 is None:
-        return True
-
+def _evaluate_non_spacetime_attributes(
+    uspace_class: list[str] | None, restriction: str | None, ed269: ED269Filters
+) -> bool:
     uspace_class_filter = ed269.get("uSpaceClass", None)
-    uspace_class: list[str] | None = _adjust_uspace_class(
-        feature.get("uSpaceClass", None)
-    )
-
     if uspace_class_filter is not None:
         if uspace_class is None:
             return False
@@ -198,7 +88,6 @@ def evaluate_non_spacetime(feature: UASZoneVersion, ed269: ED269Filters | None)
             return False
 
     acceptable_restrictions_filter = ed269.get("acceptableRestrictions", None)
-    restriction = feature.get("restriction", None)
     if (
         acceptable_restrictions_filter is not None
         and restriction not in acceptable_restrictions_filter
@@ -209,55 +98,285 @@ def evaluate_non_spacetime(feature: UASZoneVersion, ed269: ED269Filters | None)
     return True
 
 
-def evaluate_feature(feature: UASZoneVersion, filter_set: GeozonesFilterSet) -> bool:
-    # Evaluate position
-    position_match = evaluate_position(feature, filter_set.get("position", None))
-    if not position_match:
-        logger.debug(f"    {feature.identifier}: Position not matched - Absent")
-        return False
+def _projected_geometries(
+    feature: UASZoneVersion,
+) -> list[tuple[s2sphere.LatLng, Polygon]]:
+    """Project each horizontal footprint of a feature onto a local plane.
 
-    # Evaluate timing
-    timing_match = evaluate_timing(
-        feature, filter_set.get("after", None), filter_set.get("before", None)
-    )
-    if not timing_match:
-        logger.debug(f"    {feature.identifier}: Timing not matched - Absent")
-        return False
+    Circles are projected around their center and polygons around their first vertex.
 
-    # Evaluate non-spacetime fields
-    non_spacetime_match = evaluate_non_spacetime(feature, filter_set.get("ed269", None))
-    if not non_spacetime_match:
-        logger.debug(f"    {feature.identifier}: ED269 not matched - Absent")
-        return False
+    Returns: List of (reference point, footprint in meters relative to reference point).
 
-    logger.info(f"  {feature.identifier}: Present")
-    return True
+    Raises:
+        ValueError if a horizontal projection is missing the fields of its type.
+    """
+    result = []
+    for g in feature.geometry:
+        projection = g.horizontalProjection
+        if projection.type == HorizontalProjectionType.Circle:
+            if (
+                "center" not in projection
+                or projection.center is None
+                or "radius" not in projection
+                or projection.radius is None
+            ):
+                raise ValueError(
+                    f"Circle horizontal projection of {feature.identifier} is missing its center or radius"
+                )
+            center = projection.center  # Lng / Lat
+            ref = LatLng.from_degrees(center[1], center[0])
+            radius = convert_distance(
+                projection.radius, g.uomDimensions, UomDimensions.M
+            )
+            circle = Point(0, 0).buffer(radius)
+            assert isinstance(circle, Polygon)
+            result.append((ref, circle))
+        else:
+            if "coordinates" not in projection or projection.coordinates is None:
+                raise ValueError(
+                    f"Polygon horizontal projection of {feature.identifier} is missing its coordinates"
+                )
+            for coord in projection.coordinates:  # Lng / Lat
+                ref = s2sphere.LatLng.from_degrees(coord[0][1], coord[0][0])
+                result.append(
+                    (
+                        ref,
+                        Polygon(
+                            [
+                                flatten(ref, s2sphere.LatLng.from_degrees(p[1], p[0]))
+                                for p in coord  # Lng / Lat
+                            ]
+                        ),
+                    )
+                )
+    return result
 
 
-def evaluate_features(
-    features: list[UASZoneVersion], filter_set: GeozonesFilterSet
-) -> GeozonesCheckResultGeozone:
-    logger.debug(f"  Evalutating {len(features)} features:")
+def _timestamp(t: StringBasedDateTime | None, default: float) -> float:
+    return default if t is None else t.datetime.timestamp()
 
-    for i, feature in enumerate(features):
-        if evaluate_feature(feature, filter_set):
-            return GeozonesCheckResultGeozone.Present
 
-    logger.info(" => No match - Absent")
-    return GeozonesCheckResultGeozone.Absent
+class ED269Index:
+    """Spatiotemporal index of the features of an ED-269 geozone source.
+
+    Footprints are indexed in an STRtree by their latitude/longitude geometries and
+    applicability periods are indexed as intervals so that only candidate features
+    need to be evaluated exactly for a given filter set.  Only the attributes needed
+    for evaluation are retained, so features may be streamed into the index.
+    """
 
+    identifiers: list[str]
+    """Identifier of each indexed feature"""
 
-def evaluate_source(source: SourceRecord, filter_sets: list[GeozonesFilterSet]):
+    uspace_classes: list[list[str] | None]
+    """Normalized uSpaceClass of each indexed feature"""
+
+    restrictions: list[str | None]
+    """Restriction of each indexed feature"""
+
+    authority_names: list[set[str]]
+    """Names of the zone authorities of each indexed feature"""
+
+    _refs: list[s2sphere.LatLng]
+    """Reference point of each projected footprint"""
+
+    _footprints: np.ndarray
+    """Projected (prepared) footprint geometries"""
+
+    _footprint_features: np.ndarray
+    """Index of the feature owning each footprint"""
+
+    _tree: shapely.STRtree
+    """Index of footprints in latitude/longitude coordinates (x=lng, y=lat)"""
+
+    _period_starts: np.ndarray
+    """Start timestamp of each applicability period, sorted ascending"""
+
+    _period_ends: np.ndarray
+    """End timestamp of each applicability period, in the same order as _period_starts"""
+
+    _period_features: np.ndarray
+    """Index of the feature owning each applicability period, in the same order as _period_starts"""
+
+    def __init__(self, features: Iterable[UASZoneVersion]):
+        self.identifiers = []
+        self.uspace_classes = []
+        self.restrictions = []
+        self.authority_names = []
+
+        refs = []
+        footprints = []
+        footprint_features = []
+        geographic_footprints = []
+        starts = []
+        ends = []
+        period_features = []
+        for i, feature in enumerate(features):
+            self.identifiers.append(feature.identifier)
+            self.uspace_classes.append(
+                _adjust_uspace_class(feature.get("uSpaceClass", None))
+            )
+            self.restrictions.append(feature.get("restriction", None))
+            self.authority_names.append(
+                {name for a in feature.zoneAuthority if (name := a.get("name", None))}
+            )
+
+            for ref, footprint in _projected_geometries(feature):
+                xy = np.asarray(footprint.exterior.coords)
+                lats, lngs = unflatten_many(ref, xy[:, 0], xy[:, 1])
+                refs.append(ref)
+                footprints.append(footprint)
+                footprint_features.append(i)
+                geographic_footprints.append(
+                    shapely.Polygon(np.column_stack([lngs, lats]))
+                )
+
+            for a in feature.applicability:
+                if a.permanent == YESNO.YES:
+                    starts.append(-math.inf)
+                    ends.append(math.inf)
+                else:
+                    starts.append(_timestamp(a.get("startDateTime"), -math.inf))
+                    ends.append(_timestamp(a.get("endDateTime"), math.inf))
+                period_features.append(i)
+
+        self._refs = refs
+        self._footprints = np.array(footprints, dtype=object)
+        shapely.prepare(self._footprints)
+        self._footprint_features = np.array(footprint_features, dtype=int)
+        self._tree = shapely.STRtree(geographic_footprints)
+
+        order = np.argsort(np.array(starts, dtype=float), kind="stable")
+        self._period_starts = np.array(starts, dtype=float)[order]
+        self._period_ends = np.array(ends, dtype=float)[order]
+        self._period_features = np.array(period_features, dtype=int)[order]
+
+    def _features_at(self, position: Position | None) -> np.ndarray:
+        """Indices of features with a footprint containing the position."""
+        if position is None:
+            return np.arange(len(self.identifiers))
+        lat, lng = position.latitude, position.longitude
+        if lat is None or lng is None:
+            raise ValueError("Position must specify both latitude and longitude")
+        p = LatLng.from_degrees(lat, lng)
+        candidates = self._tree.query(Point(lng, lat))
+        points = [Point(flatten(self._refs[c], p)) for c in candidates]
+        matches = candidates[shapely.contains(self._footprints[candidates], points)]
+        return np.unique(self._footprint_features[matches])
+
+    def _features_during(
+        self, after: StringBasedDateTime | None, before: StringBasedDateTime | None
+    ) -> np.ndarray:
+        """Indices of features applicable at some time between after and before."""
+        return np.flatnonzero(
+            self.applicable_mask(
+                _timestamp(after, -math.inf), _timestamp(before, math.inf)
+            )
+        )
+
+    def applicable_mask(self, after: float, before: float) -> np.ndarray:
+        """Mask of features applicable at some time between after and before (timestamps)."""
+        n = np.searchsorted(self._period_starts, before, side="left")
+        mask = np.zeros(len(self.identifiers), dtype=bool)
+        mask[self._period_features[:n][self._period_ends[:n] > after]] = True
+        return mask
+
+    def select(
+        self, areas: list[shapely.Geometry], periods: list[tuple[float, float]]
+    ) -> list[np.ndarray]:
+        """Select features intersecting each of a batch of areas in space and time.
+
+        Args:
+            areas: Horizontal areas in latitude/longitude coordinates (x=lng, y=lat).
+            periods: (after, before) timestamps between which features must be
+                applicable for each area.
+
+        Returns: For each area, indices of the features with a footprint
+            intersecting that area and applicable during the corresponding period.
+        """
+        if not areas:
+            return []
+        area_indices, footprints = self._tree.query(
+            np.array(areas, dtype=object), predicate="intersects"
+        )
+        order = np.argsort(area_indices, kind="stable")
+        features = self._footprint_features[footprints[order]]
+        bounds = np.searchsorted(area_indices[order], np.arange(len(areas) + 1))
+
+        result = []
+        for a, (after, before) in enumerate(periods):
+            candidates = np.unique(features[bounds[a] : bounds[a + 1]])
+            result.append(candidates[self.applicable_mask(after, before)[candidates]])
+        return result
+
+    def evaluate(self, filter_set: GeozonesFilterSet) -> GeozonesCheckResultGeozone:
+        candidates = np.intersect1d(
+            self._features_at(filter_set.get("position", None)),
+            self._features_during(
+                filter_set.get("after", None), filter_set.get("before", None)
+            ),
+            assume_unique=True,
+        )
+        logger.debug(
+            f"  {len(candidates)} of {len(self.identifiers)} features match position and timing"
+        )
+
+        ed269 = filter_set.get("ed269", None)
+        for i in candidates:
+            if ed269 is None or _evaluate_non_spacetime_attributes(
+                self.uspace_classes[i], self.restrictions[i], ed269
+            ):
+                logger.info(f"  {self.identifiers[i]}: Present")
+                return GeozonesCheckResultGeozone.Present
+
+        logger.info(" => No match - Absent")
+        return GeozonesCheckResultGeozone.Absent
+
+
+_indices: dict[str, tuple[str, ED269Index]] = {}
+"""Process-local cache of source ID -> (geozone_ed269_version, index of that version)"""
+
+
+def index_source(source_id: str, source: SourceRecord) -> ED269Index:
+    """Build the index for the current ED-269 data of a source, replacing any cached index."""
+    store = source.get("geozone_ed269_store", None)
+    if store is None:
+        raise ValueError(f"Source {source_id} has no ED-269 data loaded")
+    index = ED269Index(store.features())
+    _indices[source_id] = (source.get("geozone_ed269_version", ""), index)
+    return index
+
+
+def get_source_index(source_id: str, source: SourceRecord) -> ED269Index:
+    """Retrieve the index for the current ED-269 data of a source, building it if necessary."""
+    cached = _indices.get(source_id, None)
+    if cached is not None and cached[0] == source.get("geozone_ed269_version", ""):
+        return cached[1]
+    return index_source(source_id, source)
+
+
+def prune_source_indices(source_ids: Iterable[str]) -> None:
+    """Discard cached indices for sources other than those specified."""
+    for source_id in set(_indices) - set(source_ids):
+        del _indices[source_id]
+
+
+def evaluate_source(
+    source_id: str, source: SourceRecord, filter_sets: list[GeozonesFilterSet]
+):
     if not (
-        source.state == GeozoneSourceResponseResult.Ready and "geozone_ed269" in source
+        source.state == GeozoneSourceResponseResult.Ready
+        and "geozone_ed269_store" in source
     ):
-        raise ValueError("Source not loaded correctly. geozone_ed269 field missing.")
+        raise ValueError(
+            "Source not loaded correctly. geozone_ed269_store field missing."
+        )
 
     if len(filter_sets) == 0:
         return GeozonesCheckResultGeozone.Present
 
-    features = source["geozone_ed269"]["features"]
+    index = get_source_index(source_id, source)
     for f in filter_sets:
-        if evaluate_features(features, f) == GeozonesCheckResultGeozone.Present:
+        if index.evaluate(f) == GeozonesCheckResultGeozone.Present:
             return GeozonesCheckResultGeozone.Present
     return GeozonesCheckResultGeozone.Absent
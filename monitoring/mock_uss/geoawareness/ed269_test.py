@@ -1,10 +1,15 @@
+import random
+from datetime import UTC, datetime, timedelta
+
 import pytest
 from implicitdict import StringBasedDateTime
 from s2sphere import LatLng
+from shapely.geometry import Point, Polygon
 from uas_standards.eurocae_ed269 import (
     YESNO,
     ApplicableTimePeriod,
     CircleOrPolygonType,
+    HorizontalProjectionType,
     UASZoneAirspaceVolume,
     UASZoneVersion,
     UomDimensions,
@@ -12,16 +17,138 @@ from uas_standards.eurocae_ed269 import (
 )
 from uas_standards.interuss.automated_testing.geo_awareness.v1.api import (
     ED269Filters,
+    GeozonesCheckResultGeozone,
+    GeozonesFilterSet,
     Position,
 )
 
 from monitoring.mock_uss.geoawareness.ed269 import (
+    ED269Index,
+    _evaluate_non_spacetime_attributes,
     convert_distance,
-    evaluate_non_spacetime,
-    evaluate_position,
-    evaluate_timing,
 )
-from monitoring.monitorlib.geo import unflatten
+from monitoring.monitorlib.geo import flatten, unflatten
+
+
+def _reference_evaluate_position(
+    feature: UASZoneVersion, position: Position | None
+) -> bool:
+    """Whether the position is within the feature, evaluated by building each footprint of the feature (as mock_uss
+    did before features were indexed)."""
+    if position is None:
+        return True
+
+    for g in feature.geometry:
+        projection = g.horizontalProjection
+        if projection.type == HorizontalProjectionType.Circle:
+            center = projection.center  # Lng / Lat
+            assert center is not None and projection.radius is not None
+            ref = LatLng.from_degrees(center[1], center[0])
+            radius = convert_distance(
+                projection.radius, g.uomDimensions, UomDimensions.M
+            )
+
+            circle_2d = Point(0, 0).buffer(radius)
+            position_2d = Point(
+                flatten(ref, LatLng.from_degrees(position.latitude, position.longitude))
+            )
+            if position_2d.within(circle_2d):
+                return True
+        else:
+            assert projection.coordinates is not None
+            for coord in projection.coordinates:  # Lng / Lat
+                ref = LatLng.from_degrees(coord[0][1], coord[0][0])
+                polygon_2d = Polygon(
+                    [
+                        flatten(ref, LatLng.from_degrees(p[1], p[0]))
+                        for p in coord  # Lng / Lat
+                    ]
+                )
+                position_2d = Point(
+                    flatten(
+                        ref, LatLng.from_degrees(position.latitude, position.longitude)
+                    )
+                )
+                if position_2d.within(polygon_2d):
+                    return True
+
+    return False
+
+
+def _reference_is_in_date_range(
+    start: StringBasedDateTime,
+    end: StringBasedDateTime,
+    after: StringBasedDateTime | None,
+    before: StringBasedDateTime | None,
+) -> bool:
+    if after is None and before is None:
+        return True
+    elif after is not None and before is not None:
+        return start.datetime < before.datetime and end.datetime > after.datetime
+    else:
+        return (after is not None and end.datetime > after.datetime) or (
+            before is not None and start.datetime < before.datetime
+        )
+
+
+def _reference_evaluate_timing(
+    feature: UASZoneVersion,
+    after: StringBasedDateTime | None,
+    before: StringBasedDateTime | None,
+) -> bool:
+    """Whether the feature is applicable between after and before, evaluated period by period (as mock_uss did
+    before features were indexed)."""
+    for a in feature.applicability:
+        if a.permanent == YESNO.YES:
+            return True
+        start = a.get("startDateTime", StringBasedDateTime(datetime.min))
+        end = a.get("endDateTime", StringBasedDateTime(datetime.max))
+        if _reference_is_in_date_range(start, end, after, before):
+            # Schedules are not taken into account
+            return True
+    return False
+
+
+def _reference_evaluate_feature(
+    feature: UASZoneVersion, filter_set: GeozonesFilterSet
+) -> bool:
+    return (
+        _reference_evaluate_position(feature, filter_set.get("position", None))
+        and _reference_evaluate_timing(
+            feature, filter_set.get("after", None), filter_set.get("before", None)
+        )
+        and _evaluate_non_spacetime(feature, filter_set.get("ed269", None))
+    )
+
+
+def _evaluate_position(feature: UASZoneVersion, position: Position | None) -> bool:
+    """Whether the indexed feature contains the position, checked against the reference evaluation."""
+    result = len(ED269Index([feature])._features_at(position)) > 0
+    assert result == _reference_evaluate_position(feature, position)
+    return result
+
+
+def _evaluate_timing(
+    feature: UASZoneVersion,
+    after: StringBasedDateTime | None = None,
+    before: StringBasedDateTime | None = None,
+) -> bool:
+    """Whether the indexed feature is applicable between after and before, checked against the reference evaluation."""
+    result = len(ED269Index([feature])._features_during(after, before)) > 0
+    assert result == _reference_evaluate_timing(feature, after, before)
+    return result
+
+
+def _evaluate_non_spacetime(
+    feature: UASZoneVersion, ed269: ED269Filters | None
+) -> bool:
+    """Whether the indexed feature matches the non-spacetime filters."""
+    if ed269 is None:
+        return True
+    index = ED269Index([feature])
+    return _evaluate_non_spacetime_attributes(
+        index.uspace_classes[0], index.restrictions[0], ed269
+    )
 
 
 def test_convert_units():
@@ -114,7 +241,7 @@ def test_evaluate_position_circle():
 
     # Point inside the circle
     assert (
-        evaluate_position(
+        _evaluate_position(
             UASZoneVersion(geometry=[circle1], **other_fields),
             Position(
                 uomDimensions=UomDimensions.M,
@@ -130,7 +257,7 @@ def test_evaluate_position_circle():
     # Point outside the circle
     p = unflatten(LatLng.from_degrees(46.204391, 6.143158), (3000, 3000))
     assert (
-        evaluate_position(
+        _evaluate_position(
             UASZoneVersion(geometry=[circle1], **other_fields),
             Position(
                 uomDimensions=UomDimensions.M,
@@ -157,7 +284,7 @@ def test_evaluate_position_polygon():
     # Point inside the polygon
     p = LatLng.from_degrees(46.204391, 6.143158)
     assert (
-        evaluate_position(
+        _evaluate_position(
             UASZoneVersion(geometry=[polygon1], **other_fields),
             Position(
                 uomDimensions=UomDimensions.M,
@@ -173,7 +300,7 @@ def test_evaluate_position_polygon():
     # Point outside the polygon
     p = LatLng.from_degrees(46.188236800723985, 6.143868308377478)
     assert (
-        evaluate_position(
+        _evaluate_position(
             UASZoneVersion(geometry=[polygon1], **other_fields),
             Position(
                 uomDimensions=UomDimensions.M,
@@ -200,7 +327,7 @@ def test_evaluate_position_multigeometry():
     # Point inside the polygon
     p = LatLng.from_degrees(46.204391, 6.143158)
     assert (
-        evaluate_position(
+        _evaluate_position(
             UASZoneVersion(geometry=[polygon1, circle1], **other_fields),
             Position(
                 uomDimensions=UomDimensions.M,
@@ -216,7 +343,7 @@ def test_evaluate_position_multigeometry():
     # Point inside the circle
     p = LatLng.from_degrees(46.204391, 6.143158)
     assert (
-        evaluate_position(
+        _evaluate_position(
             UASZoneVersion(geometry=[polygon1, circle1], **other_fields),
             Position(
                 uomDimensions=UomDimensions.M,
@@ -232,7 +359,7 @@ def test_evaluate_position_multigeometry():
     # Point outside the polygon and outside the circle
     p = LatLng.from_degrees(46.38236800723985, 6.453868308377478)
     assert (
-        evaluate_position(
+        _evaluate_position(
             UASZoneVersion(geometry=[polygon1, circle1], **other_fields),
             Position(
                 uomDimensions=UomDimensions.M,
@@ -257,7 +384,7 @@ def test_evaluate_timing():
 
     # Permanent
     assert (
-        evaluate_timing(
+        _evaluate_timing(
             feature=UASZoneVersion(
                 applicability=[ApplicableTimePeriod(permanent=YESNO.YES)],
                 identifier="Permanent",
@@ -301,7 +428,7 @@ def test_evaluate_timing():
 
     for i, t in enumerate(test_ranges):
         assert (
-            evaluate_timing(
+            _evaluate_timing(
                 feature=UASZoneVersion(
                     identifier=f"TMP{i}",
                     applicability=[
@@ -319,7 +446,7 @@ def test_evaluate_timing():
 
     # Multiple applicability
     assert (
-        evaluate_timing(
+        _evaluate_timing(
             feature=UASZoneVersion(
                 applicability=[
                     ApplicableTimePeriod(
@@ -351,7 +478,7 @@ def test_evaluate_non_spacetime():
 
     # uSpaceClass match
     assert (
-        evaluate_non_spacetime(
+        _evaluate_non_spacetime(
             UASZoneVersion(uSpaceClass="C1", restriction="PROHIBITED", **other_fields),
             ED269Filters(uSpaceClass="C1"),
         )
@@ -360,7 +487,7 @@ def test_evaluate_non_spacetime():
 
     # uSpaceClass mismatch
     assert (
-        evaluate_non_spacetime(
+        _evaluate_non_spacetime(
             UASZoneVersion(uSpaceClass="C1", restriction="PROHIBITED", **other_fields),
             ED269Filters(uSpaceClass="C2"),
         )
@@ -369,7 +496,7 @@ def test_evaluate_non_spacetime():
 
     # uSpaceClass as array
     assert (
-        evaluate_non_spacetime(
+        _evaluate_non_spacetime(
             UASZoneVersion(
                 uSpaceClass=["C1", "C2"], restriction="PROHIBITED", **other_fields
             ),
@@ -380,7 +507,7 @@ def test_evaluate_non_spacetime():
 
     # uSpaceClass as JSON array in a string
     assert (
-        evaluate_non_spacetime(
+        _evaluate_non_spacetime(
             UASZoneVersion(
                 uSpaceClass='["C1", "C2"]', restriction="PROHIBITED", **other_fields
             ),
@@ -391,7 +518,7 @@ def test_evaluate_non_spacetime():
 
     # uSpaceClass as Python array in a string
     assert (
-        evaluate_non_spacetime(
+        _evaluate_non_spacetime(
             UASZoneVersion(
                 uSpaceClass="['C1', 'C2']", restriction="PROHIBITED", **other_fields
             ),
@@ -402,7 +529,7 @@ def test_evaluate_non_spacetime():
 
     # No filter
     assert (
-        evaluate_non_spacetime(
+        _evaluate_non_spacetime(
             UASZoneVersion(uSpaceClass="C1", restriction="PROHIBITED", **other_fields),
             ED269Filters(),
         )
@@ -411,7 +538,7 @@ def test_evaluate_non_spacetime():
 
     # No filter and no uSpaceClass
     assert (
-        evaluate_non_spacetime(
+        _evaluate_non_spacetime(
             UASZoneVersion(restriction="PROHIBITED", **other_fields), ED269Filters()
         )
         is True
@@ -419,7 +546,7 @@ def test_evaluate_non_spacetime():
 
     # Missing value
     assert (
-        evaluate_non_spacetime(
+        _evaluate_non_spacetime(
             UASZoneVersion(restriction="PROHIBITED", **other_fields),
             ED269Filters(uSpaceClass="C1"),
         )
@@ -428,7 +555,7 @@ def test_evaluate_non_spacetime():
 
     # Single match with single acceptable restriction
     assert (
-        evaluate_non_spacetime(
+        _evaluate_non_spacetime(
             UASZoneVersion(uSpaceClass="C1", restriction="PROHIBITED", **other_fields),
             ED269Filters(acceptableRestrictions=["PROHIBITED"]),
         )
@@ -437,7 +564,7 @@ def test_evaluate_non_spacetime():
 
     # Single match in multiple acceptable restrictions
     assert (
-        evaluate_non_spacetime(
+        _evaluate_non_spacetime(
             UASZoneVersion(uSpaceClass="C1", restriction="PROHIBITED", **other_fields),
             ED269Filters(acceptableRestrictions=["REQ_AUTHORISATION", "PROHIBITED"]),
         )
@@ -446,9 +573,103 @@ def test_evaluate_non_spacetime():
 
     # Unacceptable restriction only
     assert (
-        evaluate_non_spacetime(
+        _evaluate_non_spacetime(
             UASZoneVersion(uSpaceClass="C1", restriction="PROHIBITED", **other_fields),
             ED269Filters(acceptableRestrictions=["REQ_AUTHORISATION"]),
         )
         is False
     )
+
+
+def test_index_matches_linear_evaluation():
+    rng = random.Random(12)
+    t0 = datetime(2024, 1, 1, tzinfo=UTC)
+    features = []
+    for i in range(50):
+        center = LatLng.from_degrees(
+            46.2 + rng.uniform(-0.2, 0.2), 6.14 + rng.uniform(-0.2, 0.2)
+        )
+        if rng.random() < 0.5:
+            geometry = UASZoneAirspaceVolume(
+                uomDimensions=rng.choice([UomDimensions.M, UomDimensions.FT]),
+                lowerLimit=0,
+                lowerVerticalReference=VerticalReferenceType.AGL,
+                upperLimit=200,
+                upperVerticalReference=VerticalReferenceType.AGL,
+                horizontalProjection=CircleOrPolygonType(
+                    type="Circle",
+                    center=[center.lng().degrees, center.lat().degrees],
+                    radius=rng.uniform(100, 5000),
+                ),
+            )
+        else:
+            size = rng.uniform(100, 5000)
+            corners = [
+                unflatten(center, (dx, dy))
+                for dx, dy in [(0, 0), (size, 0), (size, size), (0, size), (0, 0)]
+            ]
+            geometry = UASZoneAirspaceVolume(
+                uomDimensions=UomDimensions.M,
+                lowerLimit=0,
+                lowerVerticalReference=VerticalReferenceType.AGL,
+                upperLimit=200,
+                upperVerticalReference=VerticalReferenceType.AGL,
+                horizontalProjection=CircleOrPolygonType(
+                    type="Polygon",
+                    coordinates=[[[p.lng().degrees, p.lat().degrees] for p in corners]],
+                ),
+            )
+        if rng.random() < 0.3:
+            applicability = ApplicableTimePeriod(permanent=YESNO.YES)
+        else:
+            start = t0 + timedelta(days=rng.uniform(0, 30))
+            applicability = ApplicableTimePeriod(
+                permanent=YESNO.NO,
+                startDateTime=StringBasedDateTime(start),
+                endDateTime=StringBasedDateTime(
+                    start + timedelta(days=rng.uniform(0, 5))
+                ),
+            )
+        features.append(
+            UASZoneVersion(
+                identifier=f"Z{i}",
+                country="CHE",
+                type="COMMON",
+                zoneAuthority=[],
+                restriction=rng.choice(["PROHIBITED", "REQ_AUTHORISATION"]),
+                uSpaceClass=rng.choice(["EUROCONTROL", "CORUS"]),
+                geometry=[geometry],
+                applicability=[applicability],
+            )
+        )
+
+    index = ED269Index(features)
+    for _ in range(200):
+        filter_set = GeozonesFilterSet()
+        if rng.random() < 0.8:
+            filter_set.position = Position(
+                uomDimensions=UomDimensions.M,
+                verticalReferenceType=VerticalReferenceType.AGL,
+                height=100,
+                latitude=46.2 + rng.uniform(-0.25, 0.25),
+                longitude=6.14 + rng.uniform(-0.25, 0.25),
+            )
+        if rng.random() < 0.5:
+            filter_set.after = StringBasedDateTime(
+                t0 + timedelta(days=rng.uniform(-5, 35))
+            )
+        if rng.random() < 0.5:
+            filter_set.before = StringBasedDateTime(
+                t0 + timedelta(days=rng.uniform(-5, 35))
+            )
+        if rng.random() < 0.5:
+            filter_set.ed269 = ED269Filters(
+                uSpaceClass=rng.choice(["EUROCONTROL", "CORUS"])
+            )
+
+        expected = (
+            GeozonesCheckResultGeozone.Present
+            if any(_reference_evaluate_feature(f, filter_set) for f in features)
+            else GeozonesCheckResultGeozone.Absent
+        )
+        assert index.evaluate(filter_set) == expected
@@ -0,0 +1,207 @@
+import codecs
+import json
+import os
+import shutil
+import uuid
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from implicitdict import ImplicitDict, Optional
+from uas_standards.eurocae_ed269 import UASZoneVersion
+
+FEATURES_FILE = "features.jsonl"
+"""Name of the JSON Lines file, within a store folder, containing one ED-269 feature per line"""
+
+_WHITESPACE = " \t\n\r"
+
+_MAX_TRUNCATED_TOKEN_LENGTH = len("-Infinity")
+"""Maximum number of characters of a JSON token that can fail to decode merely because it is incomplete"""
+
+
+def _may_be_incomplete(e: json.JSONDecodeError, buffer_length: int) -> bool:
+    """Whether a JSON decoding error may be resolved by reading more of the document.
+
+    Errors located well before the end of the available content indicate a
+    malformed document, which is reported without reading the rest of it.
+    """
+    return (
+        e.msg.startswith("Unterminated string")
+        or e.pos >= buffer_length - _MAX_TRUNCATED_TOKEN_LENGTH
+    )
+
+
+class ED269FeatureStore(ImplicitDict):
+    """Reference to the features of an ED-269 geozone source stored on disk.
+
+    Only this reference (rather than the features themselves) is kept in the
+    shared geoawareness database.
+    """
+
+    path: str
+    """Folder containing the stored features"""
+
+    feature_count: int
+    """Number of features in the store"""
+
+    title: Optional[str]
+    """Title of the ED-269 document"""
+
+    description: Optional[str]
+    """Description of the ED-269 document"""
+
+    def features(self) -> Iterator[UASZoneVersion]:
+        """Read the stored features one at a time, in their original order."""
+        with open(os.path.join(self.path, FEATURES_FILE), "rb") as f:
+            for line in f:
+                yield ImplicitDict.parse(json.loads(line), UASZoneVersion)
+
+    def delete(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+class _IncrementalJSONReader:
+    """Reads JSON tokens and values from a stream of chunks, buffering as little as possible."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._exhausted = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk of the stream to the buffer; return False if the stream is exhausted."""
+        if self._exhausted:
+            return False
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._exhausted = True
+        return False
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while (
+                self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, c: str) -> None:
+        """Consume the next non-whitespace character, which must be c."""
+        actual = self.peek()
+        if actual != c:
+            raise ValueError(f"Expected '{c}' in JSON document but found '{actual}'")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Consume and return the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                result, end = self._json.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if _may_be_incomplete(e, len(self._buffer)) and self._fill():
+                    continue
+                raise
+            if end == len(self._buffer) and self._fill():
+                # A scalar value (e.g., a number) may continue in the next chunk
+                continue
+            self._pos = end
+            return result
+
+    def at_end(self) -> bool:
+        try:
+            self.peek()
+            return False
+        except ValueError:
+            return True
+
+
+def iter_ed269_features(
+    chunks: Iterable[bytes], metadata: dict[str, Any]
+) -> Iterator[dict]:
+    """Incrementally parse an ED-269 JSON document.
+
+    Args:
+        chunks: Raw content of the ED-269 document, in order.
+        metadata: Populated with the top-level fields of the document other than
+            `features` as they are encountered.
+
+    Returns: Raw (unvalidated) features of the document, in order.
+    """
+    reader = _IncrementalJSONReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+    else:
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise ValueError(f"Expected JSON object key but found {key}")
+            reader.expect(":")
+            if key == "features":
+                reader.expect("[")
+                if reader.peek() == "]":
+                    reader.expect("]")
+                else:
+                    while True:
+                        yield reader.value()
+                        if reader.peek() == "]":
+                            reader.expect("]")
+                            break
+                        reader.expect(",")
+            else:
+                metadata[key] = reader.value()
+            if reader.peek() == "}":
+                reader.expect("}")
+                break
+            reader.expect(",")
+    if not reader.at_end():
+        raise ValueError("Unexpected content after end of ED-269 document")
+
+
+def write_ed269_feature_store(
+    folder: str, chunks: Iterable[bytes]
+) -> ED269FeatureStore:
+    """Parse an ED-269 document from a stream and store its features on disk.
+
+    Args:
+        folder: Folder in which to create the store.
+        chunks: Raw content of the ED-269 document, in order.
+
+    Returns: Reference to the newly-created store.
+
+    Raises:
+        ValueError if the document is not valid ED-269 JSON.
+    """
+    path = os.path.join(folder, str(uuid.uuid4()))
+    os.makedirs(path)
+    metadata: dict[str, Any] = {}
+    feature_count = 0
+    try:
+        with open(os.path.join(path, FEATURES_FILE), "wb") as f:
+            for raw_feature in iter_ed269_features(chunks, metadata):
+                feature = ImplicitDict.parse(raw_feature, UASZoneVersion)
+                f.write(json.dumps(feature, separators=(",", ":")).encode("utf-8"))
+                f.write(b"\n")
+                feature_count += 1
+    except Exception:
+        shutil.rmtree(path, ignore_errors=True)
+        raise
+
+    store = ED269FeatureStore(path=path, feature_count=feature_count)
+    for key in ("title", "description"):
+        if metadata.get(key, None) is not None:
+            store[key] = metadata[key]
+    return store
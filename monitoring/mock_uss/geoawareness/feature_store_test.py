@@ -0,0 +1,82 @@
+import json
+import os
+
+import pytest
+from uas_standards.eurocae_ed269 import ED269Schema
+
+from monitoring.mock_uss.geoawareness.feature_store import (
+    iter_ed269_features,
+    write_ed269_feature_store,
+)
+
+TEST_DATASET_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "../../uss_qualifier/scenarios/uspace/geo_awareness/design/CHE/geo-awareness-che-1.json",
+)
+
+
+def _chunks(content: bytes, size: int) -> list[bytes]:
+    return [content[i : i + size] for i in range(0, len(content), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096, 1000000])
+def test_write_ed269_feature_store(tmp_path, chunk_size: int):
+    with open(TEST_DATASET_PATH, "rb") as f:
+        content = f.read()
+    expected = ED269Schema.from_dict(json.loads(content))
+
+    store = write_ed269_feature_store(str(tmp_path), _chunks(content, chunk_size))
+
+    assert store.feature_count == len(expected.features)
+    assert store.title == expected.title
+    assert store.description == expected.description
+    assert list(store.features()) == expected.features
+
+    store.delete()
+    assert not os.path.exists(store.path)
+
+
+def test_iter_ed269_features_multibyte_and_scalars():
+    content = json.dumps(
+        {"features": [{"name": "Zürich", "n": 12345}, {}], "title": "Genève"},
+        ensure_ascii=False,
+    ).encode("utf-8")
+    metadata = {}
+    features = list(iter_ed269_features(_chunks(content, 1), metadata))
+    assert features == [{"name": "Zürich", "n": 12345}, {}]
+    assert metadata == {"title": "Genève"}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"[]",
+        b'{"features": [{}',
+        b'{"features": [{}] "title": "x"}',
+        b'{"features": []} trailing',
+    ],
+)
+def test_iter_ed269_features_invalid(content: bytes):
+    with pytest.raises(ValueError):
+        list(iter_ed269_features(_chunks(content, 3), {}))
+
+
+def test_write_ed269_feature_store_invalid_feature(tmp_path):
+    with pytest.raises(ValueError):
+        write_ed269_feature_store(str(tmp_path), [b'{"features": [{"foo": 1}]}'])
+    assert not os.listdir(tmp_path)
+
+
+def test_iter_ed269_features_malformed_fails_fast():
+    consumed = 0
+
+    def chunks():
+        nonlocal consumed
+        for chunk in [b'{"features": [{"a": 1 x}, '] + [b'{"b": 2}, '] * 1000:
+            consumed += 1
+            yield chunk
+
+    with pytest.raises(ValueError):
+        list(iter_ed269_features(chunks(), {}))
+    assert consumed < 3
@@ -0,0 +1,305 @@
+import logging
+import math
+from dataclasses import dataclass
+
+import numpy as np
+import s2sphere
+import shapely
+from implicitdict import StringBasedDateTime
+from uas_standards.eurocae_ed269 import Restriction
+from uas_standards.interuss.automated_testing.geo_awareness.v1.api import (
+    GeozoneHttpsSourceFormat,
+    GeozoneSourceResponseResult,
+)
+from uas_standards.interuss.automated_testing.geospatial_map.v1.api import (
+    GeospatialFeatureFilterSet,
+    GeospatialFeatureFilterSetResultingOperationalImpact,
+    GeospatialMapCheck,
+    GeospatialMapCheckResult,
+    GeospatialMapCheckResultFeaturesSelectionOutcome,
+    RadiusUnits,
+    Volume3D,
+)
+
+from monitoring.mock_uss.geoawareness.database import SourceRecord
+from monitoring.mock_uss.geoawareness.ed269 import (
+    ED269Index,
+    get_source_index,
+    prune_source_indices,
+)
+from monitoring.monitorlib.geo import unflatten_many
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+OPERATIONAL_IMPACTS: dict[
+    str, set[GeospatialFeatureFilterSetResultingOperationalImpact]
+] = {
+    Restriction.PROHIBITED: {
+        GeospatialFeatureFilterSetResultingOperationalImpact.Block,
+        GeospatialFeatureFilterSetResultingOperationalImpact.BlockOrAdvise,
+    },
+    Restriction.REQ_AUTHORISATION: {
+        GeospatialFeatureFilterSetResultingOperationalImpact.Block,
+        GeospatialFeatureFilterSetResultingOperationalImpact.BlockOrAdvise,
+    },
+    Restriction.CONDITIONAL: {
+        GeospatialFeatureFilterSetResultingOperationalImpact.Advise,
+        GeospatialFeatureFilterSetResultingOperationalImpact.BlockOrAdvise,
+    },
+    Restriction.NO_RESTRICTION: {
+        GeospatialFeatureFilterSetResultingOperationalImpact.Advise,
+        GeospatialFeatureFilterSetResultingOperationalImpact.BlockOrAdvise,
+    },
+}
+"""Operational impacts a feature with each ED-269 restriction has on a flight planned within it.
+
+A flight without the required authorisation is assumed to be declined in a
+REQ_AUTHORISATION zone, and the conditions or information of CONDITIONAL and
+NO_RESTRICTION zones are assumed to be provided to the operator as advisories.
+"""
+
+
+class UnsupportedFilterError(ValueError):
+    pass
+
+
+@dataclass
+class _AreaQuery:
+    """Horizontal area and period in which features must be present to satisfy part of a filter set."""
+
+    filter_set: int
+    """Index of the filter set (among all filter sets of the request) to which this query belongs."""
+
+    constraint: int
+    """Index of the constraint of the filter set to which this query belongs.
+
+    A feature satisfies a constraint when it satisfies any of the constraint's
+    queries, and it must satisfy all constraints of the filter set.
+    """
+
+    area: shapely.Geometry
+    """Horizontal area (x=lng, y=lat)."""
+
+    after: float
+    """Timestamp at or after which the feature must be applicable."""
+
+    before: float
+    """Timestamp at or before which the feature must be applicable."""
+
+
+def _timestamp(t: StringBasedDateTime | None, default: float) -> float:
+    return default if t is None else t.datetime.timestamp()
+
+
+def _outline(volume: Volume3D) -> shapely.Geometry:
+    """Horizontal outline of a volume in latitude/longitude coordinates (x=lng, y=lat)."""
+    if "outline_polygon" in volume and volume.outline_polygon:
+        return shapely.Polygon(
+            [(v.lng, v.lat) for v in volume.outline_polygon.vertices]
+        )
+    if "outline_circle" in volume and volume.outline_circle:
+        center = volume.outline_circle.center
+        radius = volume.outline_circle.radius
+        if center is None or radius is None:
+            raise UnsupportedFilterError(
+                "Circles without a center or radius are not supported"
+            )
+        if radius.units != RadiusUnits.M:
+            raise UnsupportedFilterError(
+                f"Unsupported circle radius units: {radius.units}"
+            )
+        ref = s2sphere.LatLng.from_degrees(center.lat, center.lng)
+        xy = np.asarray(shapely.Point(0, 0).buffer(radius.value).exterior.coords)
+        lats, lngs = unflatten_many(ref, xy[:, 0], xy[:, 1])
+        return shapely.Polygon(np.column_stack([lngs, lats]))
+    raise UnsupportedFilterError(
+        "Volumes without a horizontal outline are not supported"
+    )
+
+
+def _area_queries(
+    filter_set_index: int, filter_set: GeospatialFeatureFilterSet
+) -> list[_AreaQuery]:
+    """Spatiotemporal queries that must be satisfied by a feature selected by a filter set.
+
+    A filter set without a position or volumes has no area queries.
+    """
+    after = _timestamp(filter_set.get("after", None), -math.inf)
+    before = _timestamp(filter_set.get("before", None), math.inf)
+    queries = []
+    constraint = 0
+
+    # TODO: Take altitudes into account
+    position = filter_set.get("position", None)
+    if position is not None:
+        queries.append(
+            _AreaQuery(
+                filter_set=filter_set_index,
+                constraint=constraint,
+                area=shapely.Point(position.location.lng, position.location.lat),
+                after=after,
+                before=before,
+            )
+        )
+        constraint += 1
+
+    for volume in filter_set.get("volumes4d", None) or []:
+        time_start = volume.get("time_start", None)
+        time_end = volume.get("time_end", None)
+        queries.append(
+            _AreaQuery(
+                filter_set=filter_set_index,
+                constraint=constraint,
+                area=_outline(volume.volume),
+                after=max(
+                    after,
+                    _timestamp(time_start.value if time_start else None, -math.inf),
+                ),
+                before=min(
+                    before, _timestamp(time_end.value if time_end else None, math.inf)
+                ),
+            )
+        )
+
+    return queries
+
+
+def _attributes_match(
+    source_id: str, index: ED269Index, i: int, filter_set: GeospatialFeatureFilterSet
+) -> bool:
+    """Determine whether the non-spacetime attributes of feature i of a source satisfy a filter set."""
+    restriction_source = filter_set.get("restriction_source", None)
+    if (
+        restriction_source
+        and restriction_source != source_id
+        and restriction_source not in index.authority_names[i]
+    ):
+        return False
+
+    impact = filter_set.get("resulting_operational_impact", None)
+    if impact:
+        restriction = index.restrictions[i]
+        if restriction is None or impact not in OPERATIONAL_IMPACTS.get(
+            restriction, set()
+        ):
+            return False
+
+    ed269 = filter_set.get("ed269", None)
+    if ed269:
+        uspace_class = ed269.get("u_space_class", None)
+        if uspace_class and uspace_class not in (index.uspace_classes[i] or []):
+            return False
+        acceptable_restrictions = ed269.get("acceptable_restrictions", None)
+        if (
+            acceptable_restrictions
+            and index.restrictions[i] not in acceptable_restrictions
+        ):
+            return False
+
+    # TODO: Determine relevance of features to operation_rule_set; ED-269 features currently apply to all rule sets
+    return True
+
+
+def evaluate_checks(
+    sources: dict[str, SourceRecord], checks: list[GeospatialMapCheck]
+) -> list[GeospatialMapCheckResult]:
+    """Evaluate all checks of a geospatial map query against the Ready sources.
+
+    The spatiotemporal queries of all filter sets of all checks are looked up
+    together in each source's index, and only the resulting candidate features
+    are evaluated against the remaining criteria.
+    """
+    filter_sets: list[GeospatialFeatureFilterSet] = []
+    filter_set_checks: list[int] = []
+    unsupported: dict[int, str] = {}
+    queries: list[_AreaQuery] = []
+    for c, check in enumerate(checks):
+        for filter_set in check.get("filter_sets", None) or [
+            GeospatialFeatureFilterSet()
+        ]:
+            try:
+                filter_set_queries = _area_queries(len(filter_sets), filter_set)
+            except UnsupportedFilterError as e:
+                unsupported[c] = str(e)
+                continue
+            queries.extend(filter_set_queries)
+            filter_sets.append(filter_set)
+            filter_set_checks.append(c)
+    n_constraints = [0] * len(filter_sets)
+    for q in queries:
+        n_constraints[q.filter_set] = max(n_constraints[q.filter_set], q.constraint + 1)
+
+    prune_source_indices(sources.keys())
+    selected = [False] * len(filter_sets)
+    for source_id, source in sources.items():
+        if source.state != GeozoneSourceResponseResult.Ready:
+            logger.debug(f"Source {source_id} is not ready ({source.state}). Skip.")
+            continue
+        fmt = (
+            source.definition.https_source.format
+            if source.definition.https_source
+            else None
+        )
+        if fmt != GeozoneHttpsSourceFormat.ED_269:
+            logger.debug(f"Source {source_id} not in supported format {fmt}. Skip.")
+            continue
+
+        index = get_source_index(source_id, source)
+        selections = index.select(
+            [q.area for q in queries], [(q.after, q.before) for q in queries]
+        )
+        by_constraint: list[list[np.ndarray]] = [
+            [np.zeros(0, dtype=int)] * n for n in n_constraints
+        ]
+        for q, features in zip(queries, selections):
+            by_constraint[q.filter_set][q.constraint] = np.union1d(
+                by_constraint[q.filter_set][q.constraint], features
+            )
+
+        for f, filter_set in enumerate(filter_sets):
+            if selected[f]:
+                continue
+            if n_constraints[f]:
+                candidates = by_constraint[f][0]
+                for features in by_constraint[f][1:]:
+                    candidates = np.intersect1d(
+                        candidates, features, assume_unique=True
+                    )
+            else:
+                candidates = np.flatnonzero(
+                    index.applicable_mask(
+                        _timestamp(filter_set.get("after", None), -math.inf),
+                        _timestamp(filter_set.get("before", None), math.inf),
+                    )
+                )
+            for i in candidates.tolist():
+                if _attributes_match(source_id, index, i, filter_set):
+                    logger.info(
+                        f"  {index.identifiers[i]} from source {source_id} selected by filter set {f}"
+                    )
+                    selected[f] = True
+                    break
+
+    results = []
+    for c in range(len(checks)):
+        if c in unsupported:
+            results.append(
+                GeospatialMapCheckResult(
+                    features_selection_outcome=GeospatialMapCheckResultFeaturesSelectionOutcome.UnsupportedFilter,
+                    message=unsupported[c],
+                )
+            )
+        elif any(selected[f] for f, fc in enumerate(filter_set_checks) if fc == c):
+            results.append(
+                GeospatialMapCheckResult(
+                    features_selection_outcome=GeospatialMapCheckResultFeaturesSelectionOutcome.Present
+                )
+            )
+        else:
+            results.append(
+                GeospatialMapCheckResult(
+                    features_selection_outcome=GeospatialMapCheckResultFeaturesSelectionOutcome.Absent
+                )
+            )
+    return results
@@ -0,0 +1,254 @@
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from implicitdict import ImplicitDict, StringBasedDateTime
+from s2sphere import LatLng
+from uas_standards.eurocae_ed269 import (
+    YESNO,
+    ApplicableTimePeriod,
+    CircleOrPolygonType,
+    ED269Schema,
+    UASZoneAirspaceVolume,
+    UASZoneAuthority,
+    UASZoneVersion,
+    UomDimensions,
+    VerticalReferenceType,
+)
+from uas_standards.interuss.automated_testing.geo_awareness.v1.api import (
+    CreateGeozoneSourceRequest,
+    GeozoneSourceResponseResult,
+)
+from uas_standards.interuss.automated_testing.geospatial_map.v1.api import (
+    GeospatialMapCheck,
+    GeospatialMapCheckResultFeaturesSelectionOutcome,
+)
+
+from monitoring.mock_uss.geoawareness.database import SourceRecord
+from monitoring.mock_uss.geoawareness.feature_store import write_ed269_feature_store
+from monitoring.mock_uss.geoawareness.geospatial_map import evaluate_checks
+from monitoring.monitorlib.geo import unflatten
+
+CENTER = LatLng.from_degrees(46.9749, 7.4774)
+NOW = datetime.now(UTC)
+
+Present = GeospatialMapCheckResultFeaturesSelectionOutcome.Present
+Absent = GeospatialMapCheckResultFeaturesSelectionOutcome.Absent
+UnsupportedFilter = GeospatialMapCheckResultFeaturesSelectionOutcome.UnsupportedFilter
+
+
+def _feature(
+    identifier: str,
+    offset: tuple[float, float],
+    radius: float,
+    restriction: str,
+    authority: str,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> UASZoneVersion:
+    center = unflatten(CENTER, offset)
+    if start is None or end is None:
+        applicability = ApplicableTimePeriod(permanent=YESNO.YES)
+    else:
+        applicability = ApplicableTimePeriod(
+            permanent=YESNO.NO,
+            startDateTime=StringBasedDateTime(start),
+            endDateTime=StringBasedDateTime(end),
+        )
+    return UASZoneVersion(
+        identifier=identifier,
+        country="CHE",
+        type="COMMON",
+        restriction=restriction,
+        zoneAuthority=[UASZoneAuthority(name=authority)],
+        applicability=[applicability],
+        geometry=[
+            UASZoneAirspaceVolume(
+                uomDimensions=UomDimensions.M,
+                lowerLimit=0,
+                lowerVerticalReference=VerticalReferenceType.AGL,
+                upperLimit=120,
+                upperVerticalReference=VerticalReferenceType.AGL,
+                horizontalProjection=CircleOrPolygonType(
+                    type="Circle",
+                    center=[center.lng().degrees, center.lat().degrees],
+                    radius=radius,
+                ),
+            )
+        ],
+    )
+
+
+def _source(folder: str, features: list[UASZoneVersion]) -> SourceRecord:
+    content = json.dumps(ED269Schema(features=features)).encode("utf-8")
+    return SourceRecord(
+        definition=ImplicitDict.parse(
+            {"https_source": {"url": "https://example.com", "format": "ED-269"}},
+            CreateGeozoneSourceRequest,
+        ),
+        state=GeozoneSourceResponseResult.Ready,
+        geozone_ed269_store=write_ed269_feature_store(folder, [content]),
+        geozone_ed269_version="1",
+    )
+
+
+def _circle_volume(
+    offset: tuple[float, float],
+    radius: float,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> dict:
+    center = unflatten(CENTER, offset)
+    volume: dict[str, Any] = {
+        "volume": {
+            "outline_circle": {
+                "center": {"lat": center.lat().degrees, "lng": center.lng().degrees},
+                "radius": {"value": radius, "units": "M"},
+            }
+        }
+    }
+    if start is not None:
+        volume["time_start"] = {"value": StringBasedDateTime(start)}
+    if end is not None:
+        volume["time_end"] = {"value": StringBasedDateTime(end)}
+    return volume
+
+
+def _check(*filter_sets: dict) -> GeospatialMapCheck:
+    return ImplicitDict.parse({"filter_sets": list(filter_sets)}, GeospatialMapCheck)
+
+
+@pytest.fixture(scope="module")
+def sources(tmp_path_factory) -> dict[str, SourceRecord]:
+    folder = str(tmp_path_factory.mktemp("geozones"))
+    return {
+        "source1": _source(
+            folder,
+            [
+                # Prohibited zone at the center
+                _feature("P", (0, 0), 500, "PROHIBITED", "ThisRegulator"),
+                # Conditional zone 5 km east, only applicable tomorrow
+                _feature(
+                    "C",
+                    (5000, 0),
+                    500,
+                    "CONDITIONAL",
+                    "OtherRegulator",
+                    NOW + timedelta(days=1),
+                    NOW + timedelta(days=2),
+                ),
+            ],
+        )
+    }
+
+
+def _outcomes(
+    sources: dict[str, SourceRecord], *checks: GeospatialMapCheck
+) -> list[GeospatialMapCheckResultFeaturesSelectionOutcome | None]:
+    return [
+        r.features_selection_outcome for r in evaluate_checks(sources, list(checks))
+    ]
+
+
+def test_volumes_and_impacts(sources):
+    assert _outcomes(
+        sources,
+        # Volume overlapping the edge of the prohibited zone
+        _check(
+            {
+                "volumes4d": [_circle_volume((600, 0), 200)],
+                "resulting_operational_impact": "Block",
+            }
+        ),
+        # Same volume, but looking for advisories
+        _check(
+            {
+                "volumes4d": [_circle_volume((600, 0), 200)],
+                "resulting_operational_impact": "Advise",
+            }
+        ),
+        # Volume between the two zones
+        _check({"volumes4d": [_circle_volume((2500, 0), 500)]}),
+        # Any of several volumes
+        _check(
+            {
+                "volumes4d": [
+                    _circle_volume((2500, 0), 500),
+                    _circle_volume((-300, 0), 100),
+                ]
+            }
+        ),
+    ) == [Present, Absent, Absent, Present]
+
+
+def test_times(sources):
+    tomorrow = NOW + timedelta(days=1, hours=1)
+    assert _outcomes(
+        sources,
+        # Conditional zone is not applicable now
+        _check(
+            {
+                "volumes4d": [
+                    _circle_volume((5000, 0), 100, NOW, NOW + timedelta(hours=1))
+                ]
+            }
+        ),
+        # Conditional zone is applicable tomorrow
+        _check(
+            {
+                "volumes4d": [
+                    _circle_volume(
+                        (5000, 0), 100, tomorrow, tomorrow + timedelta(hours=1)
+                    )
+                ],
+                "resulting_operational_impact": "Advise",
+            }
+        ),
+        # Filter set time bounds apply to volumes without times
+        _check(
+            {
+                "volumes4d": [_circle_volume((5000, 0), 100)],
+                "before": StringBasedDateTime(NOW + timedelta(hours=1)),
+            }
+        ),
+    ) == [Absent, Present, Absent]
+
+
+def test_position_and_attributes(sources):
+    center = {"lat": CENTER.lat().degrees, "lng": CENTER.lng().degrees}
+    assert _outcomes(
+        sources,
+        _check({"position": {"location": center}}),
+        _check(
+            {"position": {"location": center}, "restriction_source": "ThisRegulator"}
+        ),
+        _check(
+            {"position": {"location": center}, "restriction_source": "OtherRegulator"}
+        ),
+        _check({"position": {"location": center}, "restriction_source": "source1"}),
+        _check(
+            {
+                "position": {"location": center},
+                "ed269": {"acceptable_restrictions": ["CONDITIONAL"]},
+            }
+        ),
+        # Position and volumes must both be satisfied
+        _check(
+            {
+                "position": {"location": center},
+                "volumes4d": [_circle_volume((5000, 0), 100)],
+            }
+        ),
+        # Any filter set may be satisfied
+        _check(
+            {"restriction_source": "Nobody"},
+            {"resulting_operational_impact": "BlockOrAdvise"},
+        ),
+    ) == [Present, Present, Absent, Present, Absent, Absent, Present]
+
+
+def test_unsupported_volume(sources):
+    assert _outcomes(sources, _check({"volumes4d": [{"volume": {}}]})) == [
+        UnsupportedFilter
+    ]
@@ -1,6 +1,5 @@
 import flask
 import requests
-from uas_standards.eurocae_ed269 import ED269Schema
 from uas_standards.interuss.automated_testing.geo_awareness.v1.api import (
     CreateGeozoneSourceRequest,
     GeozoneHttpsSourceFormat,
@@ -8,11 +7,30 @@ from uas_standards.interuss.automated_testing.geo_awareness.v1.api import (
     GeozoneSourceResponseResult,
 )
 
-from monitoring.mock_uss.geoawareness import database
+from monitoring.mock_uss.app import webapp
+from monitoring.mock_uss.geoawareness import database, ed269
+from monitoring.mock_uss.geoawareness.config import KEY_GEOZONE_STORE_FOLDER
 from monitoring.mock_uss.geoawareness.database import (
     ExistingRecordException,
+    SourceRecord,
     db,
 )
+from monitoring.mock_uss.geoawareness.feature_store import write_ed269_feature_store
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+"""Number of bytes of a geozone source to download and parse at a time"""
+
+DOWNLOAD_TIMEOUT = (3.1, 60)
+"""Maximum time (seconds) to wait to connect to a geozone source's server, and to wait for each chunk of its content"""
+
+_LOAD_ERRORS = (
+    requests.RequestException,
+    ValueError,
+    TypeError,
+    KeyError,
+    AttributeError,
+)
+"""Errors indicating that a geozone source could not be downloaded or that its content is invalid"""
 
 
 def get_geozone_source(geozone_source_id: str) -> tuple[flask.Response | str, int]:
@@ -27,33 +45,43 @@ def get_geozone_source(geozone_source_id: str) -> tuple[flask.Response | str, in
     )
 
 
-def create_geozone_source(
-    id, source_definition: CreateGeozoneSourceRequest
-) -> tuple[flask.Response | str, int]:
-    """This handler creates and activates a geozone source"""
+def load_source(id: str, source_definition: CreateGeozoneSourceRequest) -> SourceRecord:
+    """Create a source and load its data, recording the outcome in the source's state.
 
-    try:
-        source = database.insert_source(
-            db, id, source_definition, GeozoneSourceResponseResult.Activating
-        )
-    except ExistingRecordException:
-        return f"source {id} already exists in database", 409
+    Raises:
+        ExistingRecordException if a source with this ID already exists.
+    """
+    source = database.insert_source(
+        db, id, source_definition, GeozoneSourceResponseResult.Activating
+    )
 
-    if "https_source" in source.definition:
+    https_source = source.definition.get("https_source", None)
+    if https_source is not None:
+        store = None
         try:
-            raw_data = requests.get(source.definition.https_source.url).json()
-            if source.definition.https_source.format == GeozoneHttpsSourceFormat.ED_269:
-                geozones = ED269Schema.from_dict(raw_data)
-                database.update_source_geozone_ed269(db, id, geozones)
-                source = database.update_source_state(
-                    db, id, GeozoneSourceResponseResult.Ready
-                )
-        except ValueError as e:
+            with requests.get(
+                https_source.url, stream=True, timeout=DOWNLOAD_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                if https_source.format == GeozoneHttpsSourceFormat.ED_269:
+                    store = write_ed269_feature_store(
+                        webapp.config[KEY_GEOZONE_STORE_FOLDER],
+                        response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE),
+                    )
+                    source = database.update_source_geozone_ed269_store(db, id, store)
+                    ed269.index_source(id, source)
+                    source = database.update_source_state(
+                        db, id, GeozoneSourceResponseResult.Ready
+                    )
+        except _LOAD_ERRORS as e:
+            if store is not None:
+                # The stored features are unusable without a valid index
+                store.delete()
             source = database.update_source_state(
                 db,
                 id,
                 GeozoneSourceResponseResult.Error,
-                f"Unable to download and parse {source.definition.https_source.url}: {str(e)}",
+                f"Unable to download and parse {https_source.url}: {str(e)}",
             )
 
     else:
@@ -63,6 +91,31 @@ def create_geozone_source(
             GeozoneSourceResponseResult.Error,
             "Unsupported source definition. https_source only",
         )
+
+    return source
+
+
+def unload_source(id: str) -> SourceRecord | None:
+    """Delete a source and its data, returning the deleted source or None if it did not exist."""
+    deleted_source = database.delete_source(db, id)
+    if deleted_source is not None:
+        store = deleted_source.get("geozone_ed269_store", None)
+        if store is not None:
+            store.delete()
+    return deleted_source
+
+
+def create_geozone_source(
+    id, source_definition: CreateGeozoneSourceRequest
+) -> tuple[flask.Response | str, int]:
+    """This handler creates and activates a geozone source"""
+
+    try:
+        source = load_source(id, source_definition)
+    except ExistingRecordException:
+        return f"source {id} already exists in database", 409
+
+    if "https_source" not in source.definition:
         return flask.jsonify(
             GeozoneSourceResponse(result=source.state, message=source.message)
         ), 400
@@ -75,9 +128,9 @@ def create_geozone_source(
 def delete_geozone_source(geozone_source_id) -> tuple[flask.Response | str, int]:
     """This handler deactivates and deletes a geozone source"""
 
-    deleted_id = database.delete_source(db, geozone_source_id)
+    deleted_source = unload_source(geozone_source_id)
 
-    if deleted_id is None:
+    if deleted_source is None:
         return f"source {geozone_source_id} not found", 404
 
     return (
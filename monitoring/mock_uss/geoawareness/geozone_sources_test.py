@@ -0,0 +1,103 @@
+import os
+import uuid
+
+import pytest
+import requests
+from implicitdict import ImplicitDict
+from uas_standards.interuss.automated_testing.geo_awareness.v1.api import (
+    CreateGeozoneSourceRequest,
+    GeozoneSourceResponseResult,
+)
+
+from monitoring.mock_uss.app import webapp
+from monitoring.mock_uss.geoawareness import geozone_sources
+from monitoring.mock_uss.geoawareness.config import KEY_GEOZONE_STORE_FOLDER
+from monitoring.mock_uss.geoawareness.geozone_sources import (
+    DOWNLOAD_TIMEOUT,
+    load_source,
+    unload_source,
+)
+
+SOURCE_URL = "https://example.com/geozones.json"
+
+
+class _FakeResponse:
+    def __init__(self, chunks: list[bytes | Exception], status_code: int = 200):
+        self._chunks = chunks
+        self.status_code = status_code
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise requests.HTTPError(f"{self.status_code} response")
+
+    def iter_content(self, chunk_size: int):
+        for chunk in self._chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+
+@pytest.fixture()
+def store_folder(tmp_path, monkeypatch):
+    monkeypatch.setitem(webapp.config, KEY_GEOZONE_STORE_FOLDER, str(tmp_path))
+    return tmp_path
+
+
+def _load(monkeypatch, response_or_error) -> tuple[str, ImplicitDict]:
+    requested = {}
+
+    def get(url, **kwargs):
+        requested.update(kwargs, url=url)
+        if isinstance(response_or_error, Exception):
+            raise response_or_error
+        return response_or_error
+
+    monkeypatch.setattr(geozone_sources.requests, "get", get)
+    source_id = str(uuid.uuid4())
+    source = load_source(
+        source_id,
+        ImplicitDict.parse(
+            {"https_source": {"url": SOURCE_URL, "format": "ED-269"}},
+            CreateGeozoneSourceRequest,
+        ),
+    )
+    assert requested["url"] == SOURCE_URL
+    assert requested["timeout"] == DOWNLOAD_TIMEOUT
+    return source_id, source
+
+
+def test_load_source(store_folder, monkeypatch):
+    source_id, source = _load(
+        monkeypatch, _FakeResponse([b'{"title": "Empty", ', b'"features": []}'])
+    )
+    assert source.state == GeozoneSourceResponseResult.Ready
+    assert len(os.listdir(store_folder)) == 1
+
+    unload_source(source_id)
+    assert not os.listdir(store_folder)
+
+
+@pytest.mark.parametrize(
+    "response_or_error",
+    [
+        requests.ConnectTimeout("Connection timed out"),
+        requests.ConnectionError("Connection refused"),
+        _FakeResponse([b"Not found"], status_code=404),
+        _FakeResponse([b'{"features": [', requests.ConnectionError("Read timed out")]),
+        _FakeResponse([b'{"features": [{"identifier": "Z1"}]}']),
+    ],
+)
+def test_load_source_failure(store_folder, monkeypatch, response_or_error):
+    source_id, source = _load(monkeypatch, response_or_error)
+    assert source.state == GeozoneSourceResponseResult.Error
+    assert source.message is not None
+    assert source.message.startswith(f"Unable to download and parse {SOURCE_URL}")
+    assert not os.listdir(store_folder)
+
+    unload_source(source_id)
@@ -1,17 +1,36 @@
 import flask
 from implicitdict import ImplicitDict
+from loguru import logger
+from uas_standards.interuss.automated_testing.geo_awareness.v1.api import (
+    CreateGeozoneSourceRequest,
+)
 from uas_standards.interuss.automated_testing.geospatial_map.v1.api import (
     OPERATIONS,
+    CreateGeospatialDataSourceRequest,
+    GeospatialDataSourceResponse,
+    GeospatialDataSourceStatus,
+    GeospatialDataSourceStatusStatus,
     GeospatialMapCheckResult,
     GeospatialMapCheckResultFeaturesSelectionOutcome,
     GeospatialMapQueryReply,
     GeospatialMapQueryRequest,
+    ListGeospatialDataSourcesResponse,
     OperationID,
+    StatusResponse,
+    StatusResponseStatus,
 )
 from uas_standards.interuss.automated_testing.geospatial_map.v1.constants import Scope
 
 from monitoring.mock_uss.app import webapp
 from monitoring.mock_uss.auth import requires_scope
+from monitoring.mock_uss.geoawareness import database
+from monitoring.mock_uss.geoawareness.database import (
+    ExistingRecordException,
+    SourceRecord,
+    db,
+)
+from monitoring.mock_uss.geoawareness.geospatial_map import evaluate_checks
+from monitoring.mock_uss.geoawareness.geozone_sources import load_source, unload_source
 
 
 def geospatial_map_route(op_id: OperationID):
@@ -20,28 +39,92 @@ def geospatial_map_route(op_id: OperationID):
     return webapp.route("/geospatial_map/v1" + flask_url, methods=[op.verb])
 
 
+def _data_source_status(
+    source_id: str, source: SourceRecord
+) -> GeospatialDataSourceStatus:
+    status = GeospatialDataSourceStatus(
+        id=source_id, status=GeospatialDataSourceStatusStatus(source.state.value)
+    )
+    if source.get("message", None):
+        status.message = source.message
+    return status
+
+
 @geospatial_map_route(OperationID.GetStatus)
 @requires_scope(Scope.DirectAutomatedTest)
 def geospatial_map_status():
-    raise NotImplementedError()
+    return StatusResponse(
+        status=StatusResponseStatus.Ready,
+        api_name="Geospatial Map Provider Automated Testing Interface",
+        api_version="v0.2.2",
+    )
 
 
 @geospatial_map_route(OperationID.PutGeospatialDataSource)
 @requires_scope(Scope.DirectAutomatedTest)
 def geospatial_map_put_data_source(geospatial_data_source_id: str):
-    raise NotImplementedError()
+    try:
+        json = flask.request.json
+        if json is None:
+            raise ValueError("Request did not contain a JSON payload")
+        ImplicitDict.parse(json, CreateGeospatialDataSourceRequest)
+        # The geospatial map and geo-awareness source definitions are wire-compatible
+        definition = ImplicitDict.parse(json, CreateGeozoneSourceRequest)
+    except ValueError as e:
+        msg = f"Create geospatial data source {geospatial_data_source_id} unable to parse JSON: {e}"
+        return msg, 400
+
+    try:
+        source = load_source(geospatial_data_source_id, definition)
+    except ExistingRecordException:
+        return f"Geospatial data source {geospatial_data_source_id} already exists", 409
+
+    return flask.jsonify(
+        GeospatialDataSourceResponse(
+            data_source=_data_source_status(geospatial_data_source_id, source)
+        )
+    ), 200
 
 
 @geospatial_map_route(OperationID.GetGeospatialDataSourceStatus)
 @requires_scope(Scope.DirectAutomatedTest)
 def geospatial_map_get_data_source_status(geospatial_data_source_id: str):
-    raise NotImplementedError()
+    source = database.get_source(db, geospatial_data_source_id)
+    if source is None:
+        return f"Geospatial data source {geospatial_data_source_id} not found", 404
+    return flask.jsonify(
+        GeospatialDataSourceResponse(
+            data_source=_data_source_status(geospatial_data_source_id, source)
+        )
+    ), 200
 
 
 @geospatial_map_route(OperationID.ListGeospatialDataSources)
 @requires_scope(Scope.DirectAutomatedTest)
 def geospatial_map_list_data_sources():
-    raise NotImplementedError()
+    return flask.jsonify(
+        ListGeospatialDataSourcesResponse(
+            data_sources=[
+                _data_source_status(source_id, source)
+                for source_id, source in database.get_sources(db).items()
+            ]
+        )
+    ), 200
+
+
+@geospatial_map_route(OperationID.DeleteGeospatialDataSource)
+@requires_scope(Scope.DirectAutomatedTest)
+def geospatial_map_delete_data_source(geospatial_data_source_id: str):
+    if unload_source(geospatial_data_source_id) is None:
+        return f"Geospatial data source {geospatial_data_source_id} not found", 404
+    return flask.jsonify(
+        GeospatialDataSourceResponse(
+            data_source=GeospatialDataSourceStatus(
+                id=geospatial_data_source_id,
+                status=GeospatialDataSourceStatusStatus.Deactivated,
+            )
+        )
+    ), 200
 
 
 @geospatial_map_route(OperationID.QueryGeospatialMap)
@@ -59,13 +142,21 @@ def geospatial_map_query():
             400,
         )
 
-    results = []
-    for _ in req.checks:
-        # TODO: Actually evaluate check (always returns Present currently)
-        results.append(
+    sources = database.get_sources(db)
+    if not sources:
+        # Without any geospatial data loaded, there is no map to evaluate; keep
+        # reporting every check as Present for test configurations that query
+        # mock_uss without loading geospatial data first.
+        logger.warning(
+            "No geospatial data sources loaded; reporting all geospatial map checks as Present"
+        )
+        results = [
             GeospatialMapCheckResult(
                 features_selection_outcome=GeospatialMapCheckResultFeaturesSelectionOutcome.Present
             )
-        )
+            for _ in req.checks
+        ]
+    else:
+        results = evaluate_checks(sources, req.checks)
 
     return GeospatialMapQueryReply(results=results)
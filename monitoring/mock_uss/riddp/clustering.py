@@ -1,6 +1,7 @@
 import math
 import random
 
+import numpy as np
 import s2sphere
 from implicitdict import ImplicitDict
 from s2sphere import LatLngRect
@@ -37,7 +38,7 @@ class Cluster(ImplicitDict):
     def area(self):
         return self.width() * self.height()
 
-    def randomize(self):
+    def randomize(self, rng: random.Random):
         u_min = min(p.x for p in self.points)
         v_min = min(p.y for p in self.points)
         u_max = max(p.x for p in self.points)
@@ -52,8 +53,8 @@ class Cluster(ImplicitDict):
         # windows with all points.
         # If the size is too small, this will fail, but the cluster is already
         # bad
-        x_offset -= random.uniform(0, self.x_max + x_offset - u_max)
-        y_offset -= random.uniform(0, self.y_max + y_offset - v_max)
+        x_offset -= rng.uniform(0, self.x_max + x_offset - u_max)
+        y_offset -= rng.uniform(0, self.y_max + y_offset - v_max)
 
         # Proof it work:
         #
@@ -124,6 +125,64 @@ class Cluster(ImplicitDict):
         return cluster
 
 
+def grid_size(rid_version: RIDVersion) -> int:
+    """Number of cells along each side of a view such that each cell covers at least the minimum cluster area."""
+    return max(1, math.floor(math.sqrt(100 / rid_version.min_cluster_size_percent)))
+
+
+def _make_rng(view_min: s2sphere.LatLng, view_max: s2sphere.LatLng) -> random.Random:
+    """Make a random number generator seeded by the view extents so a static view yields static clusters."""
+    return random.Random(
+        f"{view_min.lat().degrees:.7f},{view_min.lng().degrees:.7f},{view_max.lat().degrees:.7f},{view_max.lng().degrees:.7f}"
+    )
+
+
+def _subdivide(
+    flights: list[observation_api.Flight],
+    view_min: s2sphere.LatLng,
+    view_max: s2sphere.LatLng,
+    n: int,
+) -> list[Cluster]:
+    """Assign flights to the cells of an n x n grid over the view.
+
+    Returns: One cluster per cell containing at least one flight, covering the
+        extents of that cell, ordered by cell.
+    """
+    lats = np.empty(len(flights))
+    lngs = np.empty(len(flights))
+    for i, f in enumerate(flights):
+        p = f.most_recent_position
+        if p is None:
+            raise ValueError(f"Flight {f.id} to cluster has no most recent position")
+        lats[i] = p.lat
+        lngs[i] = p.lng
+    xs, ys = geo.flatten_many(view_min, lats, lngs)
+    x_max, y_max = geo.flatten(view_min, view_max)
+    cell_width = x_max / n
+    cell_height = y_max / n
+
+    # Flights slightly outside the view are assigned to the nearest edge cell
+    col = np.clip(np.floor(xs / cell_width), 0, n - 1).astype(int)
+    row = np.clip(np.floor(ys / cell_height), 0, n - 1).astype(int)
+    cell = row * n + col
+
+    clusters: list[Cluster] = []
+    order = np.argsort(cell, kind="stable")
+    cells, starts = np.unique(cell[order], return_index=True)
+    for c, members in zip(cells, np.split(order, starts[1:])):
+        r, k = divmod(int(c), n)
+        clusters.append(
+            Cluster(
+                x_min=k * cell_width,
+                x_max=(k + 1) * cell_width,
+                y_min=r * cell_height,
+                y_max=(r + 1) * cell_height,
+                points=[Point(float(xs[i]), float(ys[i])) for i in members],
+            )
+        )
+    return clusters
+
+
 def make_clusters(
     flights: list[observation_api.Flight],
     view_min: s2sphere.LatLng,
@@ -133,33 +192,17 @@ def make_clusters(
     if not flights:
         return []
 
-    # Make the initial cluster
-    points: list[Point] = [
-        Point(
-            *geo.flatten(
-                view_min,
-                s2sphere.LatLng.from_degrees(
-                    flight.most_recent_position.lat, flight.most_recent_position.lng
-                ),
-            )
-        )
-        for flight in flights
-    ]
-    x_max, y_max = geo.flatten(view_min, view_max)
-    clusters: list[Cluster] = [
-        Cluster(x_min=0, y_min=0, x_max=x_max, y_max=y_max, points=points)
-    ]
-
-    # TODO: subdivide cluster into many clusters
+    clusters = _subdivide(flights, view_min, view_max, grid_size(rid_version))
 
     view_area_sqm = geo.area_of_latlngrect(LatLngRect(view_min, view_max))
+    rng = _make_rng(view_min, view_max)
 
     result: list[observation_api.Cluster] = []
     for cluster in clusters:
         cluster = cluster.extend(rid_version, view_area_sqm)
 
         # Offset cluster
-        cluster = cluster.randomize()  # TODO: Set random seed according to view extents so a static view will have static cluster subdivisions
+        cluster = cluster.randomize(rng)
 
         corners = LatLngRect(
             geo.unflatten(view_min, (cluster.x_min, cluster.y_min)),
@@ -0,0 +1,129 @@
+import pytest
+import s2sphere
+from uas_standards.interuss.automated_testing.rid.v1 import (
+    observation as observation_api,
+)
+
+from monitoring.mock_uss.riddp.clustering import (
+    _make_rng,
+    _subdivide,
+    grid_size,
+    make_clusters,
+)
+from monitoring.monitorlib import geo
+from monitoring.monitorlib.rid import RIDVersion
+
+VIEW_MIN = s2sphere.LatLng.from_degrees(46.9, 7.4)
+VIEW_SIZE_M = 3000
+VIEW_MAX = geo.unflatten(VIEW_MIN, (VIEW_SIZE_M, VIEW_SIZE_M))
+
+
+def _flight(id: str, x: float, y: float) -> observation_api.Flight:
+    """Flight at the position x meters east and y meters north of VIEW_MIN."""
+    p = geo.unflatten(VIEW_MIN, (x, y))
+    return observation_api.Flight(
+        id=id,
+        most_recent_position=observation_api.Position(
+            lat=p.lat().degrees, lng=p.lng().degrees
+        ),
+    )
+
+
+def _cluster_bounds(cluster) -> tuple[int, int, int, int]:
+    return (
+        round(cluster.x_min),
+        round(cluster.x_max),
+        round(cluster.y_min),
+        round(cluster.y_max),
+    )
+
+
+def test_subdivide_assigns_flights_to_cells():
+    flights = [
+        _flight("top right", 2500, 2500),
+        _flight("bottom left", 100, 100),
+        _flight("center", 1500, 1500),
+        _flight("bottom left again", 900, 200),
+        _flight("bottom center", 1100, 50),
+    ]
+
+    clusters = _subdivide(flights, VIEW_MIN, VIEW_MAX, 3)
+
+    # One cluster per occupied cell, ordered by row then column
+    assert [_cluster_bounds(c) for c in clusters] == [
+        (0, 1000, 0, 1000),
+        (1000, 2000, 0, 1000),
+        (1000, 2000, 1000, 2000),
+        (2000, 3000, 2000, 3000),
+    ]
+    assert [[(round(p.x), round(p.y)) for p in c.points] for c in clusters] == [
+        [(100, 100), (900, 200)],
+        [(1100, 50)],
+        [(1500, 1500)],
+        [(2500, 2500)],
+    ]
+
+
+def test_subdivide_clips_flights_to_view_edges():
+    flights = [
+        _flight("west", -50, 1500),
+        _flight("south", 1500, -50),
+        _flight("north east", 3050, 3050),
+    ]
+
+    clusters = _subdivide(flights, VIEW_MIN, VIEW_MAX, 3)
+
+    assert [_cluster_bounds(c) for c in clusters] == [
+        (1000, 2000, 0, 1000),
+        (0, 1000, 1000, 2000),
+        (2000, 3000, 2000, 3000),
+    ]
+    assert [len(c.points) for c in clusters] == [1, 1, 1]
+
+
+def test_subdivide_requires_positions():
+    flight = observation_api.Flight(id="no position")
+    with pytest.raises(ValueError):
+        _subdivide([flight], VIEW_MIN, VIEW_MAX, 3)
+
+
+def test_make_rng_is_seeded_by_view():
+    other_max = geo.unflatten(VIEW_MIN, (VIEW_SIZE_M, VIEW_SIZE_M + 100))
+    values = _make_rng(VIEW_MIN, VIEW_MAX).random()
+    assert _make_rng(VIEW_MIN, VIEW_MAX).random() == values
+    assert _make_rng(VIEW_MIN, other_max).random() != values
+
+
+@pytest.mark.parametrize("rid_version", [RIDVersion.f3411_19, RIDVersion.f3411_22a])
+def test_make_clusters(rid_version: RIDVersion):
+    flights = [
+        _flight(f"{i}", x, y)
+        for i, (x, y) in enumerate(
+            [(100, 100), (150, 120), (1600, 900), (2900, 2900), (1400, 2600)]
+        )
+    ]
+
+    clusters = make_clusters(flights, VIEW_MIN, VIEW_MAX, rid_version)
+
+    cells = _subdivide(flights, VIEW_MIN, VIEW_MAX, grid_size(rid_version))
+    assert [c.number_of_flights for c in clusters] == [len(c.points) for c in cells]
+    assert sum(c.number_of_flights for c in clusters) == len(flights)
+
+    # Obfuscated clusters are identical for identical views
+    assert make_clusters(flights, VIEW_MIN, VIEW_MAX, rid_version) == clusters
+    other_max = geo.unflatten(VIEW_MIN, (VIEW_SIZE_M + 100, VIEW_SIZE_M))
+    assert make_clusters(flights, VIEW_MIN, other_max, rid_version) != clusters
+
+    # Each flight remains within some cluster
+    for f in flights:
+        p = f.most_recent_position
+        assert p is not None
+        assert any(
+            c.corners[0].lat <= p.lat <= c.corners[1].lat
+            and c.corners[0].lng <= p.lng <= c.corners[1].lng
+            for c in clusters
+        )
+
+
+def test_make_clusters_no_flights():
+    assert make_clusters([], VIEW_MIN, VIEW_MAX, RIDVersion.f3411_22a) == []
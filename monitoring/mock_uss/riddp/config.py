@@ -3,8 +3,20 @@ from monitoring.monitorlib.rid import RIDVersion
 
 KEY_RID_VERSION = "MOCK_USS_RID_VERSION"
 
+KEY_SP_TIMEOUT = "MOCK_USS_RIDDP_SP_TIMEOUT_SECONDS"
+"""Environment variable containing the maximum time to wait for each Service Provider's flights response.
+
+When not specified, the default connect and read timeouts of monitorlib.fetch apply."""
+
+KEY_SP_FLIGHTS_CACHE_TTL = "MOCK_USS_RIDDP_SP_FLIGHTS_CACHE_TTL_SECONDS"
+"""Environment variable containing how long a Service Provider's flights response may be reused for identical views.
+
+The default matches the minimum UAS location refresh period (1 / NetMinUasLocRefreshFrequencyHz).  Set to 0 to disable caching."""
+
 import_environment_variable(
     KEY_RID_VERSION,
     default=RIDVersion.f3411_19,
     mutator=lambda s: RIDVersion(s),
 )
+import_environment_variable(KEY_SP_TIMEOUT, required=False, mutator=float)
+import_environment_variable(KEY_SP_FLIGHTS_CACHE_TTL, default="1", mutator=float)
@@ -3,6 +3,7 @@ from datetime import timedelta
 
 import arrow
 import flask
+import numpy as np
 import s2sphere
 from loguru import logger
 from uas_standards.astm.f3411.v19.api import ErrorResponse
@@ -29,18 +30,17 @@ from monitoring.monitorlib import geo
 from monitoring.monitorlib.fetch import rid as fetch
 from monitoring.monitorlib.fetch.rid import Flight
 from monitoring.monitorlib.formatting import limit_resolution
-from monitoring.monitorlib.geo import egm96_geoid_offset
 from monitoring.monitorlib.mutate import rid as mutate
 from monitoring.monitorlib.rid import RIDVersion
 
-from . import clustering, database, utm_client
+from . import clustering, database, uss_flights, utm_client
 from .behavior import DisplayProviderBehavior
 from .config import KEY_RID_VERSION
 from .database import db
 
 
 def _make_flight_observation(
-    flight: Flight, view: s2sphere.LatLngRect
+    flight: Flight, view: s2sphere.LatLngRect, geoid_offset: float
 ) -> observation_api.Flight:
     paths: list[list[observation_api.Position]] = []
     current_path: list[observation_api.Position] = []
@@ -74,7 +74,7 @@ def _make_flight_observation(
         paths.append(current_path)
 
     p = flight.most_recent_position
-    msl_alt_m = p.alt - egm96_geoid_offset(s2sphere.LatLng.from_degrees(p.lat, p.lng))
+    msl_alt_m = p.alt - geoid_offset
     msl_alt = MSLAltitude(meters=msl_alt_m, reference_datum=AltitudeReference.EGM96)
     current_state = observation_api.CurrentState(
         timestamp=p.time.isoformat(),
@@ -195,12 +195,16 @@ def riddp_display_data() -> tuple[flask.Response, int]:
     flight_info: dict[str, database.FlightInfo] = {k: v for k, v in tx.flights.items()}
     behavior: DisplayProviderBehavior = tx.behavior
 
-    for flights_url, uss in subscription.flights_urls.items():
-        if uss in behavior.do_not_display_flights_from:
-            continue
-        flights_response = fetch.uss_flights(
-            flights_url, view, True, rid_version, utm_client
-        )
+    flights_urls = {
+        flights_url: uss
+        for flights_url, uss in subscription.flights_urls.items()
+        if uss not in (behavior.do_not_display_flights_from or [])
+    }
+    flights_responses = uss_flights.get_uss_flights(
+        list(flights_urls), view, rid_version
+    )
+    for flights_url, flights_response in flights_responses.items():
+        uss = flights_urls[flights_url]
         if not flights_response.success:
             msg = (
                 f"Error querying {flights_url} from {uss}: {flights_response.errors[0]}"
@@ -230,7 +234,20 @@ def riddp_display_data() -> tuple[flask.Response, int]:
             tx.value.flights[k] = v
 
     # Make and return response
-    flights = [_make_flight_observation(f, view) for f in validated_flights]
+    lats = np.empty(len(validated_flights))
+    lngs = np.empty(len(validated_flights))
+    for i, f in enumerate(validated_flights):
+        p = f.most_recent_position
+        if p is None:
+            # Flights without a current position do not pass validation above
+            raise RuntimeError(f"Validated flight {f.id} has no most recent position")
+        lats[i] = p.lat
+        lngs[i] = p.lng
+    geoid_offsets = geo.egm96_geoid_offsets(lats, lngs)
+    flights = [
+        _make_flight_observation(f, view, float(geoid_offset))
+        for f, geoid_offset in zip(validated_flights, geoid_offsets)
+    ]
     if behavior.always_omit_recent_paths:
         for f in flights:
             f.recent_paths = None
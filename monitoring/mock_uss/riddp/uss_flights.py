@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import arrow
+import s2sphere
+
+from monitoring.mock_uss.app import webapp
+from monitoring.monitorlib.fetch import rid as fetch
+from monitoring.monitorlib.rid import RIDVersion
+
+from . import utm_client
+from .config import KEY_SP_FLIGHTS_CACHE_TTL, KEY_SP_TIMEOUT
+
+VIEW_QUANTIZATION_DECIMALS = 5
+"""Number of decimal places of view coordinates (degrees) considered when identifying identical views"""
+
+_cache: dict[tuple[str, str], tuple[datetime, fetch.FetchedUSSFlights]] = {}
+"""Process-local cache of (flights URL, quantized view) -> (expiration time, successful response)"""
+
+
+def _view_key(view: s2sphere.LatLngRect) -> str:
+    return ",".join(
+        f"{v:.{VIEW_QUANTIZATION_DECIMALS}f}"
+        for v in (
+            view.lat_lo().degrees,
+            view.lng_lo().degrees,
+            view.lat_hi().degrees,
+            view.lng_hi().degrees,
+        )
+    )
+
+
+def get_uss_flights(
+    flights_urls: list[str],
+    view: s2sphere.LatLngRect,
+    rid_version: RIDVersion,
+) -> dict[str, fetch.FetchedUSSFlights]:
+    """Retrieve flights (including recent positions) in the view from each of the specified USS flights URLs.
+
+    USSs are queried concurrently (each with the configured timeout, if any), and successful responses are reused for repeated identical views within the
+    configured cache time-to-live.
+
+    Returns: Response from each flights URL, in the order of flights_urls.
+    """
+    now = arrow.utcnow().datetime
+    for key in [k for k, (expiration, _) in _cache.items() if expiration <= now]:
+        del _cache[key]
+
+    view_key = _view_key(view)
+    responses: dict[str, fetch.FetchedUSSFlights] = {}
+    for flights_url in flights_urls:
+        cached = _cache.get((flights_url, view_key), None)
+        if cached is not None:
+            responses[flights_url] = cached[1]
+
+    to_fetch = [url for url in flights_urls if url not in responses]
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=len(to_fetch)) as executor:
+            futures = {
+                flights_url: executor.submit(
+                    fetch.uss_flights,
+                    flights_url,
+                    view,
+                    True,
+                    rid_version,
+                    utm_client,
+                    timeout_s=webapp.config.get(KEY_SP_TIMEOUT, None),
+                )
+                for flights_url in to_fetch
+            }
+        ttl = timedelta(seconds=webapp.config[KEY_SP_FLIGHTS_CACHE_TTL])
+        expiration = arrow.utcnow().datetime + ttl
+        for flights_url, future in futures.items():
+            response = future.result()
+            responses[flights_url] = response
+            if response.success and ttl > timedelta(0):
+                _cache[(flights_url, view_key)] = (expiration, response)
+
+    return {flights_url: responses[flights_url] for flights_url in flights_urls}
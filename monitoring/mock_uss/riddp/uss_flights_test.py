@@ -0,0 +1,136 @@
+import threading
+from datetime import UTC, datetime, timedelta
+from typing import cast
+
+import arrow
+import pytest
+import s2sphere
+
+from monitoring.mock_uss.app import webapp
+from monitoring.mock_uss.riddp import uss_flights
+from monitoring.mock_uss.riddp.config import KEY_SP_FLIGHTS_CACHE_TTL, KEY_SP_TIMEOUT
+from monitoring.mock_uss.riddp.uss_flights import get_uss_flights
+from monitoring.monitorlib.fetch import rid as fetch
+from monitoring.monitorlib.rid import RIDVersion
+
+URLS = [f"https://uss{i}.example.com/flights" for i in range(3)]
+VIEW = s2sphere.LatLngRect(
+    s2sphere.LatLng.from_degrees(46.9, 7.4),
+    s2sphere.LatLng.from_degrees(46.91, 7.41),
+)
+T0 = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class _FakeFlights:
+    def __init__(self, flights_url: str, success: bool):
+        self.flights_url = flights_url
+        self.success = success
+
+
+class _FakeSP:
+    """Records requests to USS flights URLs and responds successfully unless the URL is in failing_urls."""
+
+    def __init__(self, barrier: threading.Barrier | None = None):
+        self.barrier = barrier
+        self.failing_urls: set[str] = set()
+        self.requested: list[str] = []
+        self._lock = threading.Lock()
+
+    def uss_flights(self, flights_url: str, *args, **kwargs) -> fetch.FetchedUSSFlights:
+        with self._lock:
+            self.requested.append(flights_url)
+        if self.barrier is not None:
+            # Only completes if all requests are in progress at the same time
+            self.barrier.wait()
+        return cast(
+            fetch.FetchedUSSFlights,
+            _FakeFlights(flights_url, flights_url not in self.failing_urls),
+        )
+
+
+@pytest.fixture()
+def now(monkeypatch) -> list[datetime]:
+    current = [T0]
+    monkeypatch.setattr(uss_flights, "_cache", {})
+    monkeypatch.setattr(uss_flights.arrow, "utcnow", lambda: arrow.get(current[0]))
+    monkeypatch.setitem(webapp.config, KEY_SP_FLIGHTS_CACHE_TTL, 1)
+    monkeypatch.setitem(webapp.config, KEY_SP_TIMEOUT, 5)
+    return current
+
+
+def _install(monkeypatch, sp: _FakeSP) -> None:
+    monkeypatch.setattr(uss_flights.fetch, "uss_flights", sp.uss_flights)
+
+
+def _get(urls: list[str]) -> dict[str, fetch.FetchedUSSFlights]:
+    return get_uss_flights(urls, VIEW, RIDVersion.f3411_22a)
+
+
+def test_requests_in_parallel(now, monkeypatch):
+    sp = _FakeSP(threading.Barrier(len(URLS), timeout=5))
+    _install(monkeypatch, sp)
+
+    responses = _get(URLS)
+
+    assert sorted(sp.requested) == URLS
+    assert list(responses) == URLS
+    assert [cast(_FakeFlights, r).flights_url for r in responses.values()] == URLS
+
+
+def test_cache_within_ttl(now, monkeypatch):
+    sp = _FakeSP()
+    _install(monkeypatch, sp)
+
+    first = _get(URLS[0:2])
+    now[0] = T0 + timedelta(seconds=0.5)
+    second = _get(URLS)
+
+    # Only the USS not requested before is queried again
+    assert sorted(sp.requested) == sorted(URLS[0:2]) + [URLS[2]]
+    assert all(second[url] is first[url] for url in URLS[0:2])
+    assert list(second) == URLS
+
+    now[0] = T0 + timedelta(seconds=1)
+    third = _get(URLS[0:1])
+    assert sp.requested.count(URLS[0]) == 2
+    assert third[URLS[0]] is not first[URLS[0]]
+
+
+def test_different_view_not_cached(now, monkeypatch):
+    sp = _FakeSP()
+    _install(monkeypatch, sp)
+
+    _get(URLS[0:1])
+    other_view = s2sphere.LatLngRect(
+        VIEW.lo(), s2sphere.LatLng.from_degrees(46.92, 7.41)
+    )
+    get_uss_flights(URLS[0:1], other_view, RIDVersion.f3411_22a)
+
+    assert sp.requested == [URLS[0], URLS[0]]
+
+
+def test_failures_not_cached(now, monkeypatch):
+    sp = _FakeSP()
+    sp.failing_urls.add(URLS[1])
+    _install(monkeypatch, sp)
+
+    first = _get(URLS)
+    assert not first[URLS[1]].success
+
+    sp.failing_urls.clear()
+    second = _get(URLS)
+
+    assert sp.requested.count(URLS[0]) == 1
+    assert sp.requested.count(URLS[1]) == 2
+    assert second[URLS[1]].success
+
+
+def test_cache_disabled(now, monkeypatch):
+    sp = _FakeSP()
+    _install(monkeypatch, sp)
+    monkeypatch.setitem(webapp.config, KEY_SP_FLIGHTS_CACHE_TTL, 0)
+
+    _get(URLS[0:1])
+    _get(URLS[0:1])
+
+    assert sp.requested == [URLS[0], URLS[0]]
@@ -1,9 +1,11 @@
 import json
+from collections.abc import Iterable
 
 from implicitdict import ImplicitDict, Optional
 
 from monitoring.monitorlib.multiprocessing import SynchronizedValue
 from monitoring.monitorlib.rid_automated_testing import injection_api
+from monitoring.monitorlib.rid_automated_testing.telemetry import TelemetryArrays
 
 from .behavior import ServiceProviderBehavior
 from .user_notifications import ServiceProviderUserNotifications
@@ -38,3 +40,22 @@ db = SynchronizedValue[Database](
     Database(),
     decoder=lambda b: ImplicitDict.parse(json.loads(b.decode("utf-8")), Database),
 )
+
+_telemetry: dict[str, tuple[str, list[TelemetryArrays]]] = {}
+"""Process-local cache of test ID -> (version, columnar telemetry of each flight of that version)"""
+
+
+def get_flights_telemetry(test_id: str, record: TestRecord) -> list[TelemetryArrays]:
+    """Retrieve the columnar telemetry of each flight in a test record, building it if necessary."""
+    cached = _telemetry.get(test_id, None)
+    if cached is not None and cached[0] == record.version:
+        return cached[1]
+    telemetry = [TelemetryArrays.from_states(f.telemetry) for f in record.flights]
+    _telemetry[test_id] = (record.version, telemetry)
+    return telemetry
+
+
+def prune_flights_telemetry(test_ids: Iterable[str]) -> None:
+    """Discard cached telemetry for tests other than those specified."""
+    for test_id in set(_telemetry) - set(test_ids):
+        del _telemetry[test_id]
@@ -17,7 +17,7 @@ from monitoring.mock_uss.auth import requires_scope
 from monitoring.mock_uss.config import KEY_BASE_URL
 from monitoring.mock_uss.riddp.config import KEY_RID_VERSION
 from monitoring.mock_uss.ridsp import utm_client
-from monitoring.monitorlib import geo
+from monitoring.monitorlib import clock, geo
 from monitoring.monitorlib.idempotency import idempotent_request
 from monitoring.monitorlib.mutate import rid as mutate
 from monitoring.monitorlib.rid import RIDVersion
@@ -192,7 +192,7 @@ def ridsp_get_user_notifications() -> tuple[str | flask.Response, int]:
         )
 
     if "before" not in flask.request.args:
-        before = arrow.utcnow()
+        before = arrow.get(clock.now())
     else:
         try:
             before = arrow.get(flask.request.args["before"])
@@ -211,7 +211,7 @@ def ridsp_get_user_notifications() -> tuple[str | flask.Response, int]:
         )
 
     before = min(
-        arrow.utcnow(), before
+        arrow.get(clock.now()), before
     )  # Ensure we don't return notifications from the future
 
     final_list = []
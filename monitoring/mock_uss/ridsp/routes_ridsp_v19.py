@@ -1,7 +1,6 @@
 import datetime
 from datetime import timedelta
 
-import arrow
 import flask
 import s2sphere
 from implicitdict import StringBasedDateTime
@@ -26,12 +25,13 @@ from uas_standards.interuss.automated_testing.rid.v1 import injection
 
 from monitoring.mock_uss.app import webapp
 from monitoring.mock_uss.auth import requires_scope
-from monitoring.monitorlib import geo
+from monitoring.monitorlib import clock, geo
 from monitoring.monitorlib.rid import RIDVersion
 from monitoring.monitorlib.rid_automated_testing.injection_api import TestFlight
+from monitoring.monitorlib.rid_automated_testing.telemetry import TelemetryArrays
 
 from . import behavior
-from .database import db
+from .database import db, get_flights_telemetry, prune_flights_telemetry
 
 
 def _make_state(p: injection.RIDAircraftState) -> RIDAircraftState:
@@ -51,6 +51,7 @@ def _make_details(p: injection.RIDFlightDetails) -> RIDFlightDetails:
 
 def _get_report(
     flight: TestFlight,
+    telemetry: TelemetryArrays,
     t_request: datetime.datetime,
     view: s2sphere.LatLngRect,
     include_recent_positions: bool,
@@ -63,6 +64,7 @@ def _get_report(
         view,
         t_request - timedelta(seconds=NetMaxNearRealTimeDataPeriodSeconds),
         t_request,
+        telemetry,
     )
     if not recent_states:
         # No recent telemetry applicable to view
@@ -130,12 +132,17 @@ def ridsp_flights_v19():
         msg = f"Requested diagonal of {diagonal} km exceeds limit of {NetMaxDisplayAreaDiagonalKm} km"
         return flask.jsonify(ErrorResponse(message=msg)), 413
 
-    now = arrow.utcnow().datetime
+    now = clock.now()
     flights = []
     tx = db.value
+    prune_flights_telemetry(tx.tests.keys())
     for test_id, record in tx.tests.items():
-        for flight in record.flights:
-            reported_flight = _get_report(flight, now, view, include_recent_positions)
+        for flight, telemetry in zip(
+            record.flights, get_flights_telemetry(test_id, record)
+        ):
+            reported_flight = _get_report(
+                flight, telemetry, now, view, include_recent_positions
+            )
             if reported_flight is not None:
                 reported_flight = behavior.adjust_reported_flight(
                     flight, reported_flight, tx.behavior
@@ -152,7 +159,7 @@ def ridsp_flights_v19():
 @rid_v19_operation(OperationID.GetFlightDetails)
 @requires_scope(Scope.Read)
 def ridsp_flight_details_v19(id: str):
-    now = arrow.utcnow().datetime
+    now = clock.now()
     tx = db.value
     for test_id, record in tx.tests.items():
         for flight in record.flights:
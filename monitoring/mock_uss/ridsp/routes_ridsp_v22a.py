@@ -1,7 +1,6 @@
 import datetime
 from datetime import timedelta
 
-import arrow
 import flask
 import s2sphere
 from uas_standards.astm.f3411.v22a.api import (
@@ -29,12 +28,13 @@ from uas_standards.interuss.automated_testing.rid.v1 import injection
 
 from monitoring.mock_uss.app import webapp
 from monitoring.mock_uss.auth import requires_scope
-from monitoring.monitorlib import geo
+from monitoring.monitorlib import clock, geo
 from monitoring.monitorlib.rid import RIDVersion
 from monitoring.monitorlib.rid_automated_testing.injection_api import TestFlight
+from monitoring.monitorlib.rid_automated_testing.telemetry import TelemetryArrays
 from monitoring.monitorlib.rid_v2 import make_time
 
-from .database import db
+from .database import db, get_flights_telemetry, prune_flights_telemetry
 
 
 def _make_position(p: injection.RIDAircraftPosition) -> RIDAircraftPosition:
@@ -104,6 +104,7 @@ def _make_details(p: injection.RIDFlightDetails) -> RIDFlightDetails:
 
 def _get_report(
     flight: TestFlight,
+    telemetry: TelemetryArrays,
     t_request: datetime.datetime,
     view: s2sphere.LatLngRect,
     recent_positions_duration: float,
@@ -116,6 +117,7 @@ def _get_report(
         view,
         t_request - timedelta(seconds=NetMaxNearRealTimeDataPeriodSeconds),
         t_request,
+        telemetry,
     )
     if not recent_states:
         # No recent telemetry applicable to view
@@ -130,7 +132,7 @@ def _get_report(
     )
     if recent_positions_duration > 0:
         recent_positions: list[RIDRecentAircraftPosition] = []
-        now = arrow.utcnow().datetime
+        now = clock.now()
         for recent_state in recent_states:
             if (
                 now - recent_state.timestamp.datetime
@@ -206,12 +208,17 @@ def ridsp_flights_v22a():
         msg = f"Requested diagonal of {diagonal} km exceeds limit of {NetMaxDisplayAreaDiagonalKm} km"
         return flask.jsonify(ErrorResponse(message=msg)), 413
 
-    now = arrow.utcnow().datetime
+    now = clock.now()
     flights = []
     tx = db.value
+    prune_flights_telemetry(tx.tests.keys())
     for test_id, record in tx.tests.items():
-        for flight in record.flights:
-            reported_flight = _get_report(flight, now, view, recent_positions_duration)
+        for flight, telemetry in zip(
+            record.flights, get_flights_telemetry(test_id, record)
+        ):
+            reported_flight = _get_report(
+                flight, telemetry, now, view, recent_positions_duration
+            )
             if reported_flight is not None:
                 # TODO: Implement Service Provider behaviors for F3411-22a
                 # reported_flight = behavior.adjust_reported_flight(
@@ -227,7 +234,7 @@ def ridsp_flights_v22a():
 @rid_v22a_operation(OperationID.GetFlightDetails)
 @requires_scope(Scope.DisplayProvider)
 def ridsp_flight_details_v22a(id: str):
-    now = arrow.utcnow().datetime
+    now = clock.now()
     tx = db.value
     for test_id, record in tx.tests.items():
         for flight in record.flights:
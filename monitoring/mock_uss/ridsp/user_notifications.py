@@ -7,6 +7,7 @@ from uas_standards.interuss.automated_testing.rid.v1.injection import (
     UserNotification,
 )
 
+from monitoring.monitorlib import clock
 from monitoring.monitorlib.rid_automated_testing import injection_api
 from monitoring.monitorlib.rid_automated_testing.injection_api import (
     MANDATORY_POSITION_FIELDS,
@@ -26,7 +27,7 @@ class ServiceProviderUserNotifications(ImplicitDict):
         observed_at: datetime.datetime | None = None,
     ):
         if not observed_at:
-            observed_at = arrow.utcnow().datetime
+            observed_at = clock.now()
 
         observed_at_time = Time(
             value=StringBasedDateTime(observed_at),
@@ -53,7 +54,7 @@ def check_and_generate_missing_fields_notifications(
 
     for flight in injected_flights:
         # Default to now if we don't find anything
-        default_timestamp = arrow.utcnow()
+        default_timestamp = arrow.get(clock.now())
 
         # We try to use the start of the flight as a better default
         f_start, _ = flight.get_span()
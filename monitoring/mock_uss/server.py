@@ -1,18 +1,17 @@
 import os
 import signal
-import time
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from datetime import datetime, timedelta
 from enum import Enum
 from multiprocessing import Process
 
-import arrow
 import flask
 from implicitdict import StringBasedDateTime, StringBasedTimeDelta
 from jinja2 import FileSystemLoader
 from loguru import logger
 
+from ..monitorlib import clock
 from ..monitorlib.errors import stacktrace_string
 from .database import PeriodicTaskStatus, TaskError, db
 
@@ -173,7 +172,7 @@ class MockUSS(flask.Flask):
                 next_check = None
                 with db.transact() as tx:
                     tx.value.most_recent_periodic_check = StringBasedDateTime(
-                        datetime.now(UTC)
+                        clock.now()
                     )
 
                     # Cancel the loop if we're stopping
@@ -193,16 +192,14 @@ class MockUSS(flask.Flask):
                                 "Periodic task '{}' was not defined at application start and therefore cannot be run periodically",
                                 task_name,
                             )
-                            task.last_execution_time = StringBasedDateTime(
-                                arrow.utcnow()
-                            )
+                            task.last_execution_time = StringBasedDateTime(clock.now())
                             continue
                         if task.period is None:
                             # Skip periodic tasks without periods
                             continue
                         if task.last_execution_time is None:
                             # This is the first time this task has been run; pick it immediately
-                            earliest_task = (task_name, arrow.utcnow().datetime, task)
+                            earliest_task = (task_name, clock.now(), task)
                             break
                         t_next = (
                             task.last_execution_time.datetime + task.period.timedelta
@@ -212,12 +209,10 @@ class MockUSS(flask.Flask):
                             earliest_task = (task_name, t_next, task)
                     if earliest_task:
                         task_name, t_execute, task = earliest_task
-                        if t_execute <= arrow.utcnow().datetime:
+                        if t_execute <= clock.now():
                             # We should execute this task immediately
                             tx.value.periodic_tasks[task_name] = PeriodicTaskStatus(
-                                last_execution_time=StringBasedDateTime(
-                                    arrow.utcnow().datetime
-                                ),
+                                last_execution_time=StringBasedDateTime(clock.now()),
                                 period=task.period,
                                 executing=True,
                             )
@@ -242,18 +237,16 @@ class MockUSS(flask.Flask):
                             and periodic_task.period.timedelta.total_seconds() == 0
                         ):
                             periodic_task.last_execution_time = StringBasedDateTime(
-                                arrow.utcnow().datetime
+                                clock.now()
                             )
                 else:
                     # Wait until another task may be ready to execute
                     if next_check:
-                        dt = min(
-                            MAX_PERIODIC_LATENCY, next_check - arrow.utcnow().datetime
-                        )
+                        dt = min(MAX_PERIODIC_LATENCY, next_check - clock.now())
                     else:
                         dt = MAX_PERIODIC_LATENCY
                     if dt.total_seconds() > 0:
-                        time.sleep(dt.total_seconds())
+                        clock.sleep(dt)
         except Exception as e:
             logger.error(
                 f"Shutting down mock_uss due to {type(e).__name__} error while executing '{task_to_execute}' periodic task: {str(e)}\n{stacktrace_string(e)}"
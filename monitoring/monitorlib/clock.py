@@ -0,0 +1,119 @@
+"""Clock shared by the monitoring tools to determine the current time and to wait.
+
+By default, this clock is simply the wall clock.  When every participant in a
+test run is local (e.g., uss_qualifier testing mock_uss instances), the clock
+may instead be offset from the wall clock and/or advance faster than the wall
+clock so that a suite of scenarios spanning an hour of test time can run in a
+few minutes.  Every process participating in such a test run must be
+configured with the same clock so that they all agree on the current time; in
+particular, when the speed is not 1, they must share the same anchor.
+
+The clock of a process is configured from the environment variables below when
+this module is imported, and may be reconfigured with `configure`:
+
+* MONITORING_CLOCK_OFFSET: Offset of the clock relative to the wall clock at the anchor (e.g., "1h" or "-30m").
+* MONITORING_CLOCK_SPEED: Rate at which the clock advances relative to the wall clock (e.g., "10").
+* MONITORING_CLOCK_ANCHOR: Wall clock time at which the clock is offset by exactly MONITORING_CLOCK_OFFSET (e.g., "2024-01-01T00:00:00Z").
+"""
+
+import os
+import time
+from datetime import UTC, datetime, timedelta
+
+from implicitdict import (
+    ImplicitDict,
+    Optional,
+    StringBasedDateTime,
+    StringBasedTimeDelta,
+)
+
+ENV_KEY_OFFSET = "MONITORING_CLOCK_OFFSET"
+ENV_KEY_SPEED = "MONITORING_CLOCK_SPEED"
+ENV_KEY_ANCHOR = "MONITORING_CLOCK_ANCHOR"
+
+
+class ClockConfiguration(ImplicitDict):
+    offset: Optional[StringBasedTimeDelta] = None
+    """Difference between the time of the clock and the wall clock time at the anchor.  Defaults to no offset."""
+
+    speed: float = 1
+    """Rate at which the clock advances relative to the wall clock (e.g., 10 means ten seconds of clock time elapse for each second of wall clock time)."""
+
+    anchor: Optional[StringBasedDateTime] = None
+    """Wall clock time at which the time of the clock is the wall clock time plus the offset.  Defaults to the time at which the clock is configured.
+
+    Processes sharing a clock whose speed is not 1 must be configured with the same anchor."""
+
+
+class Clock:
+    """Clock which may be offset from and/or advance faster than the wall clock."""
+
+    def __init__(self, config: ClockConfiguration | None = None):
+        if config is None:
+            config = ClockConfiguration()
+        self.offset = (
+            config.offset.timedelta
+            if "offset" in config and config.offset
+            else timedelta(0)
+        )
+        self.speed = float(config.speed)
+        if self.speed <= 0:
+            raise ValueError(f"Clock speed must be positive; found {self.speed}")
+        self.anchor = (
+            config.anchor.datetime
+            if "anchor" in config and config.anchor
+            else datetime.now(UTC)
+        )
+
+    @property
+    def is_wall_clock(self) -> bool:
+        return self.speed == 1 and not self.offset
+
+    def now(self) -> datetime:
+        """Current time of this clock, in UTC."""
+        t = datetime.now(UTC)
+        if self.speed == 1:
+            return t + self.offset
+        return self.anchor + self.offset + (t - self.anchor) * self.speed
+
+    def wall_duration(self, duration: timedelta) -> timedelta:
+        """Amount of wall clock time elapsing while `duration` elapses on this clock."""
+        return duration / self.speed
+
+
+def _config_from_environment() -> ClockConfiguration:
+    config = ClockConfiguration()
+    if os.environ.get(ENV_KEY_OFFSET, ""):
+        config.offset = StringBasedTimeDelta(os.environ[ENV_KEY_OFFSET])
+    if os.environ.get(ENV_KEY_SPEED, ""):
+        config.speed = float(os.environ[ENV_KEY_SPEED])
+    if os.environ.get(ENV_KEY_ANCHOR, ""):
+        config.anchor = StringBasedDateTime(os.environ[ENV_KEY_ANCHOR])
+    return config
+
+
+_clock = Clock(_config_from_environment())
+
+
+def configure(config: ClockConfiguration) -> None:
+    """Replace the clock of this process with one having the specified configuration."""
+    global _clock
+    _clock = Clock(config)
+
+
+def get_clock() -> Clock:
+    return _clock
+
+
+def now() -> datetime:
+    """Current time of the clock of this process, in UTC."""
+    return _clock.now()
+
+
+def sleep(duration: float | timedelta) -> None:
+    """Wait until the specified amount of time (seconds if float) has elapsed on the clock of this process."""
+    if not isinstance(duration, timedelta):
+        duration = timedelta(seconds=duration)
+    seconds = _clock.wall_duration(duration).total_seconds()
+    if seconds > 0:
+        time.sleep(seconds)
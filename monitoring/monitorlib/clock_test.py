@@ -0,0 +1,32 @@
+from datetime import UTC, datetime, timedelta
+
+from implicitdict import ImplicitDict
+
+from monitoring.monitorlib.clock import Clock, ClockConfiguration
+
+
+def _clock(config: dict) -> Clock:
+    return Clock(ImplicitDict.parse(config, ClockConfiguration))
+
+
+def test_wall_clock():
+    clock = _clock({})
+    assert clock.is_wall_clock
+    assert abs(clock.now() - datetime.now(UTC)) < timedelta(seconds=1)
+    assert clock.wall_duration(timedelta(seconds=3)) == timedelta(seconds=3)
+
+
+def test_offset_clock():
+    clock = _clock({"offset": "1h"})
+    assert not clock.is_wall_clock
+    assert abs(clock.now() - datetime.now(UTC) - timedelta(hours=1)) < timedelta(
+        seconds=1
+    )
+
+
+def test_fast_clock():
+    anchor = datetime.now(UTC) - timedelta(minutes=1)
+    clock = _clock({"offset": "-1h", "speed": 60, "anchor": anchor.isoformat()})
+    # One minute of wall clock time since the anchor is one hour of clock time, cancelling the offset
+    assert abs(clock.now() - datetime.now(UTC)) < timedelta(seconds=60)
+    assert clock.wall_duration(timedelta(minutes=1)) == timedelta(seconds=1)
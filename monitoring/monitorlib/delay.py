@@ -1,8 +1,9 @@
-import time
 from datetime import timedelta
 
 from loguru import logger
 
+from monitoring.monitorlib import clock
+
 MAX_SILENT_DELAY_S = 0.4
 """Number of seconds to delay above which a reasoning message should be displayed."""
 
@@ -11,7 +12,8 @@ def sleep(duration: float | timedelta, reason: str) -> None:
     """Sleep for the specified amount of time, logging the fact that the delay is occurring (when appropriate).
 
     Args:
-        duration: Amount of time to sleep for; interpreted as seconds if float.
+        duration: Amount of time to sleep for, as measured by the shared clock (see monitorlib.clock); interpreted as
+            seconds if float.
         reason: Reason the delay is happening (to be printed to console/log if appropriate).
     """
     if isinstance(duration, timedelta):
@@ -22,4 +24,4 @@ def sleep(duration: float | timedelta, reason: str) -> None:
 
     if duration > MAX_SILENT_DELAY_S:
         logger.debug(f"Delaying {duration:.1f} seconds because {reason}")
-    time.sleep(duration)
+    clock.sleep(duration)
@@ -7,10 +7,9 @@ import uuid
 from dataclasses import dataclass
 from enum import Enum
 from http.client import RemoteDisconnected
-from typing import Self, TypeVar
+from typing import TYPE_CHECKING, Self, TypeVar
 from urllib.parse import urlparse
 
-import flask
 import jwt
 import requests
 import urllib3
@@ -23,6 +22,10 @@ from monitoring.monitorlib import infrastructure
 from monitoring.monitorlib.errors import stacktrace_string
 from monitoring.monitorlib.rid import RIDVersion
 
+if TYPE_CHECKING:
+    # flask is slow to import and only needed by servers describing their own queries
+    import flask
+
 
 @dataclass
 class Settings:
@@ -100,7 +103,7 @@ class RequestDescription(ImplicitDict):
 yaml.add_representer(RequestDescription, Representer.represent_dict)
 
 
-def describe_flask_request(request: flask.Request) -> RequestDescription:
+def describe_flask_request(request: "flask.Request") -> RequestDescription:
     headers = {k: v for k, v in request.headers}
     kwargs = {
         "method": request.method,
@@ -210,7 +213,7 @@ def describe_failed_aiohttp_response(
     return ResponseDescription(**kwargs)
 
 
-def describe_flask_response(resp: flask.Response, elapsed_s: float):
+def describe_flask_response(resp: "flask.Response", elapsed_s: float):
     headers = {k: v for k, v in resp.headers.items()}
     kwargs = {
         "code": resp.status_code,
@@ -762,7 +765,7 @@ def query_and_describe(
 
 
 def describe_flask_query(
-    req: flask.Request, res: flask.Response, elapsed_s: float
+    req: "flask.Request", res: "flask.Response", elapsed_s: float
 ) -> Query:
     return Query(
         request=describe_flask_request(req),
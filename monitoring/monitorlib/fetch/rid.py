@@ -1175,7 +1175,11 @@ def uss_flights(
     rid_version: RIDVersion,
     session: UTMClientSession,
     participant_id: str | None = None,
+    timeout_s: float | None = None,
 ) -> FetchedUSSFlights:
+    kwargs = {}
+    if timeout_s is not None:
+        kwargs["timeout"] = timeout_s
     if rid_version == RIDVersion.f3411_19:
         query = fetch.query_and_describe(
             session,
@@ -1190,6 +1194,7 @@ def uss_flights(
             scope=v19.constants.Scope.Read,
             query_type=QueryType.F3411v19USSSearchFlights,
             participant_id=participant_id,
+            **kwargs,
         )
         return FetchedUSSFlights(v19_query=query)
     elif rid_version == RIDVersion.f3411_22a:
@@ -1206,6 +1211,7 @@ def uss_flights(
             scope=v22a.constants.Scope.DisplayProvider,
             query_type=QueryType.F3411v22aUSSSearchFlights,
             participant_id=participant_id,
+            **kwargs,
         )
         return FetchedUSSFlights(v22a_query=query)
     else:
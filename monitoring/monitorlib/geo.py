@@ -3,14 +3,13 @@ from __future__ import annotations
 import math
 import os
 from enum import Enum
+from typing import TYPE_CHECKING
 
 import numpy as np
-import pyproj
 import s2sphere
 import shapely.geometry
 from implicitdict import ImplicitDict, Optional
 from s2sphere import LatLng
-from scipy.interpolate import RectBivariateSpline as Spline
 from uas_standards.astm.f3411.v19 import api as f3411v19
 from uas_standards.astm.f3411.v22a import api as f3411v22a
 from uas_standards.astm.f3548.v21 import api as f3548v21
@@ -28,6 +27,11 @@ from monitoring.monitorlib.transformations import (
     Transformation,
 )
 
+if TYPE_CHECKING:
+    # pyproj and scipy are slow to import and only needed for geoid conversions
+    import pyproj
+    from scipy.interpolate import RectBivariateSpline as Spline
+
 EARTH_CIRCUMFERENCE_KM = 40075
 EARTH_CIRCUMFERENCE_M = EARTH_CIRCUMFERENCE_KM * 1000
 EARTH_RADIUS_M = 40075 * 1000 / (2 * math.pi)
@@ -549,6 +553,32 @@ def flatten(reference: s2sphere.LatLng, point: s2sphere.LatLng) -> tuple[float,
     )
 
 
+def flatten_many(
+    reference: s2sphere.LatLng, lats: np.ndarray, lngs: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Locally flatten many lat-lng points to (dx, dy) in meters from reference.
+
+    Equivalent to applying flatten to each point.
+
+    Args:
+        reference: Reference point.
+        lats: Latitudes (degrees) of the points to flatten.
+        lngs: Longitudes (degrees) of the points to flatten.
+
+    Returns: (dx, dy) arrays, each with the same shape as lats.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lngs = np.asarray(lngs, dtype=float)
+    return (
+        (lngs - reference.lng().degrees)
+        * EARTH_CIRCUMFERENCE_KM
+        * math.cos(reference.lat().radians)
+        * 1000
+        / 360,
+        (lats - reference.lat().degrees) * EARTH_CIRCUMFERENCE_KM * 1000 / 360,
+    )
+
+
 def unflatten(
     reference: s2sphere.LatLng, point: tuple[float, float]
 ) -> s2sphere.LatLng:
@@ -562,6 +592,31 @@ def unflatten(
     )
 
 
+def unflatten_many(
+    reference: s2sphere.LatLng, xs: np.ndarray, ys: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Locally unflatten many (dx, dy) points to absolute lat-lng points.
+
+    Equivalent to applying unflatten to each point.
+
+    Args:
+        reference: Reference point.
+        xs: Eastward distances (meters) of the points from reference.
+        ys: Northward distances (meters) of the points from reference.
+
+    Returns: (lats, lngs) arrays (degrees), each with the same shape as xs.
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    return (
+        reference.lat().degrees + ys * 360 / (EARTH_CIRCUMFERENCE_KM * 1000),
+        reference.lng().degrees
+        + xs
+        * 360
+        / (EARTH_CIRCUMFERENCE_KM * 1000 * math.cos(reference.lat().radians)),
+    )
+
+
 def area_of_latlngrect(rect: s2sphere.LatLngRect) -> float:
     """Compute the approximate surface area within a lat-lng rectangle."""
     return EARTH_AREA_M2 * rect.area() / (4 * math.pi)
@@ -661,50 +716,91 @@ def latitude_degrees(distance_meters: float) -> float:
     return 360 * distance_meters / EARTH_CIRCUMFERENCE_M
 
 
+EGM96_GRID_SIZE_DEG = 0.25
+"""Spacing, in degrees latitude and longitude, of the EGM96 geoid grid asset"""
+
+_egm96_grid: np.memmap | None = None
+"""Lazily memory-mapped EGM96 geoid grid (centimeters, latitude 90 to -90)"""
+
 _egm96: Spline | None = None
-"""Cached EGM96 geoid interpolation function with inverted latitude"""
+"""Cached EGM96 geoid interpolation function (centimeters) with inverted latitude"""
 
+_egm2008_transformer: pyproj.Transformer | None = None
+"""Cached transformer from WGS84 ellipsoid heights to EGM2008 heights"""
 
-def egm96_geoid_offset(p: s2sphere.LatLng) -> float:
-    """Estimate the EGM96 geoid height above the WGS84 ellipsoid.
 
-    Args:
-        p: Point where offset should be estimated.
+def _get_egm96_grid() -> np.memmap:
+    global _egm96_grid
+    if _egm96_grid is None:
+        n_lats = round(180 / EGM96_GRID_SIZE_DEG) + 1
+        n_lngs = round(360 / EGM96_GRID_SIZE_DEG)
+        grid_path = os.path.join(os.path.dirname(__file__), "assets/WW15MGH.DAC")
+        _egm96_grid = np.memmap(grid_path, ">i2", mode="r", shape=(n_lats, n_lngs))
+    return _egm96_grid
 
-    Returns: Meters above WGS84 ellipsoid of the EGM96 geoid at p.
-    """
+
+def _get_egm96_spline() -> Spline:
     global _egm96
     if _egm96 is None:
-        grid_size = 0.25  # degrees
+        from scipy.interpolate import RectBivariateSpline as Spline
+
+        grid = _get_egm96_grid()
         # Latitude data is [90, -90] degrees
-        lats = np.arange(-90, 90 + grid_size / 2, grid_size)
+        lats = np.linspace(-90, 90, grid.shape[0])
         # Longitude data is [0, 360) degrees
-        lngs = np.arange(0, 360, grid_size)
-        grid_path = os.path.join(os.path.dirname(__file__), "assets/WW15MGH.DAC")
-        grid = np.fromfile(grid_path, ">i2").reshape(lats.size, lngs.size) / 100
+        lngs = np.arange(grid.shape[1]) * EGM96_GRID_SIZE_DEG
+        # Fit the grid as stored (centimeters) rather than materializing a scaled
+        # copy of it; interpolated values are converted to meters when evaluated
         _egm96 = Spline(lats, lngs, grid)
-    lng = math.fmod(p.lng().degrees, 360)
-    while lng < 0:
-        lng += 360
-    lat = p.lat().degrees
-    if lat < -90 or lat > 90:
-        raise ValueError(f"Cannot compute EGM96 geoid offset at latitude {lat} degrees")
+    return _egm96
+
+
+def egm96_geoid_offsets(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """Estimate the EGM96 geoid height above the WGS84 ellipsoid for many points.
+
+    Args:
+        lats: Latitudes (degrees) of the points where offsets should be estimated.
+        lngs: Longitudes (degrees) of the points where offsets should be estimated;
+            must have the same shape as lats.
+
+    Returns: Meters above WGS84 ellipsoid of the EGM96 geoid at each point, with
+        the same shape as lats.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lngs = np.mod(np.asarray(lngs, dtype=float), 360)
+    if lats.shape != lngs.shape:
+        raise ValueError(
+            f"Latitudes (shape {lats.shape}) and longitudes (shape {lngs.shape}) must have the same shape"
+        )
+    out_of_range = (lats < -90) | (lats > 90)
+    if np.any(out_of_range):
+        raise ValueError(
+            f"Cannot compute EGM96 geoid offset at latitude {lats[out_of_range].flat[0]} degrees"
+        )
 
     # Negative latitude because the grid file lists offsets from 90 to -90
     # degrees latitude, but Splines must have increasing X so latitudes must be
     # listed -90 to 90.  Since latitude data are symmetric, we can simply
     # convert "-90 to 90" to "90 to -90" by inverting the requested latitude.
-    return _egm96.ev(-lat, lng)
+    return _get_egm96_spline().ev(-lats, lngs) / 100
 
 
-def egm2008_geoid_offset(p: s2sphere.LatLng) -> float:
-    """Estimate the EGM2008 geoid height above the WGS84 ellipsoid.
+def egm96_geoid_offset(p: s2sphere.LatLng) -> float:
+    """Estimate the EGM96 geoid height above the WGS84 ellipsoid.
 
     Args:
         p: Point where offset should be estimated.
 
-    Returns: Meters above WGS84 ellipsoid of the EGM2008 geoid at p.
+    Returns: Meters above WGS84 ellipsoid of the EGM96 geoid at p.
     """
+    return float(
+        egm96_geoid_offsets(np.array([p.lat().degrees]), np.array([p.lng().degrees]))[0]
+    )
+
+
+def _get_egm2008_transformer() -> pyproj.Transformer:
+    global _egm2008_transformer
+    import pyproj
 
     if not pyproj.network.is_network_enabled():  # pyright:ignore[reportAttributeAccessIssue]
         raise Exception("""
@@ -713,15 +809,50 @@ To enable EGM2008 conversions, you must allow pyproj to download files to do the
 Please ensure this comply with your policies, and avoid multiple downloads by mounting the directoy '/root/.local/share/proj/' to a docker volume.
 """)
 
-    transformer = pyproj.Transformer.from_crs(
-        "EPSG:4979",  # WGS 84 -- 3D
-        "EPSG:4326+3855",  # WGS 84 (2D) + EGM2008 height (vertical)
-        always_xy=True,
-    )
+    if _egm2008_transformer is None:
+        _egm2008_transformer = pyproj.Transformer.from_crs(
+            "EPSG:4979",  # WGS 84 -- 3D
+            "EPSG:4326+3855",  # WGS 84 (2D) + EGM2008 height (vertical)
+            always_xy=True,
+        )
+    return _egm2008_transformer
+
+
+def egm2008_geoid_offsets(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """Estimate the EGM2008 geoid height above the WGS84 ellipsoid for many points.
+
+    Args:
+        lats: Latitudes (degrees) of the points where offsets should be estimated.
+        lngs: Longitudes (degrees) of the points where offsets should be estimated;
+            must have the same shape as lats.
 
-    _, _, ortho_height = transformer.transform(p.lng().degrees, p.lat().degrees, 0)
+    Returns: Meters above WGS84 ellipsoid of the EGM2008 geoid at each point, with
+        the same shape as lats.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lngs = np.asarray(lngs, dtype=float)
+    if lats.shape != lngs.shape:
+        raise ValueError(
+            f"Latitudes (shape {lats.shape}) and longitudes (shape {lngs.shape}) must have the same shape"
+        )
+    transformer = _get_egm2008_transformer()
+    _, _, ortho_heights = transformer.transform(lngs, lats, np.zeros_like(lats))
+    return -np.asarray(ortho_heights)
 
-    return -ortho_height
+
+def egm2008_geoid_offset(p: s2sphere.LatLng) -> float:
+    """Estimate the EGM2008 geoid height above the WGS84 ellipsoid.
+
+    Args:
+        p: Point where offset should be estimated.
+
+    Returns: Meters above WGS84 ellipsoid of the EGM2008 geoid at p.
+    """
+    return float(
+        egm2008_geoid_offsets(np.array([p.lat().degrees]), np.array([p.lng().degrees]))[
+            0
+        ]
+    )
 
 
 def center_of_mass(in_points: list[LatLng]) -> LatLng:
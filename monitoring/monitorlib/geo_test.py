@@ -1,8 +1,15 @@
+import numpy as np
 from s2sphere import LatLng
 
 from monitoring.monitorlib.geo import (
+    egm96_geoid_offset,
+    egm96_geoid_offsets,
+    flatten,
+    flatten_many,
     generate_area_in_vicinity,
     generate_slight_overlap_area,
+    unflatten,
+    unflatten_many,
 )
 
 MAX_DIFFERENCE = 0.001
@@ -64,3 +71,39 @@ def test_generate_area_in_vicinity():
         generate_area_in_vicinity(_points([(-1, -1), (0, -1), (0, 0), (-1, 0)]), 2),
         _points([(-2.0, -2.0), (-2.0, -2.5), (-2.5, -2.5), (-2.5, -2.0)]),
     )
+
+
+def test_egm96_geoid_offsets():
+    lats = np.array([46.948, -33.9, 0, 89.9, -90])
+    lngs = np.array([7.447, -151.2, 180, 359.5, 12])
+    offsets = egm96_geoid_offsets(lats, lngs)
+    assert offsets.shape == lats.shape
+    for lat, lng, offset in zip(lats, lngs, offsets):
+        assert abs(egm96_geoid_offset(LatLng.from_degrees(lat, lng)) - offset) < 1e-9
+
+    # Bern, per https://geographiclib.sourceforge.io/cgi-bin/GeoidEval
+    assert abs(offsets[0] - 48.74) < 0.1
+
+    assert egm96_geoid_offsets(np.array([]), np.array([])).size == 0
+
+
+def test_flatten_many():
+    ref = LatLng.from_degrees(46.2, 6.1)
+    lats = np.array([46.2, 46.25, 45.9, 46.2])
+    lngs = np.array([6.1, 6.3, 5.8, 6.09])
+    xs, ys = flatten_many(ref, lats, lngs)
+    for lat, lng, x, y in zip(lats, lngs, xs, ys):
+        ex, ey = flatten(ref, LatLng.from_degrees(lat, lng))
+        assert abs(ex - x) < 1e-6
+        assert abs(ey - y) < 1e-6
+
+
+def test_unflatten_many():
+    ref = LatLng.from_degrees(46.2, 6.1)
+    xs = np.array([0, 1500.0, -20000.0, 3.5])
+    ys = np.array([0, -700.0, 12000.0, 0])
+    lats, lngs = unflatten_many(ref, xs, ys)
+    for x, y, lat, lng in zip(xs, ys, lats, lngs):
+        expected = unflatten(ref, (x, y))
+        assert abs(expected.lat().degrees - lat) < 1e-9
+        assert abs(expected.lng().degrees - lng) < 1e-9
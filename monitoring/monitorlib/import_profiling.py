@@ -0,0 +1,153 @@
+"""Report on the time spent importing modules when starting a Python entry point.
+
+This is a summary of the output of `python -X importtime`; for example:
+
+    python -m monitoring.monitorlib.import_profiling monitoring.uss_qualifier.main
+
+mock_uss must be configured via environment variables before its app can be
+imported; for example:
+
+    MOCK_USS_SERVICES=versioning MOCK_USS_PUBLIC_KEY=... \\
+        python -m monitoring.monitorlib.import_profiling monitoring.mock_uss.app
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+
+IMPORT_TIME_PREFIX = "import time:"
+
+
+@dataclass
+class ModuleImportTime:
+    """Time spent importing a single module, as reported by `python -X importtime`."""
+
+    module: str
+    """Full name of the imported module."""
+
+    self_us: int
+    """Microseconds spent importing this module, excluding its imports."""
+
+    cumulative_us: int
+    """Microseconds spent importing this module, including its imports."""
+
+    depth: int
+    """Nesting level of this import; 0 for modules imported directly by the entry point."""
+
+    @property
+    def package(self) -> str:
+        """Top-level package containing this module."""
+        return self.module.split(".")[0]
+
+
+def parse_import_times(stderr: str) -> list[ModuleImportTime]:
+    """Parse the `-X importtime` lines of a Python process's stderr, ignoring any other lines."""
+    result = []
+    for line in stderr.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        cols = line[len(IMPORT_TIME_PREFIX) :].split("|")
+        if len(cols) != 3 or not cols[0].strip().isdigit():
+            continue  # Header line
+        name = cols[2].rstrip()
+        stripped = name.lstrip()
+        result.append(
+            ModuleImportTime(
+                module=stripped,
+                self_us=int(cols[0]),
+                cumulative_us=int(cols[1]),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return result
+
+
+def profile_imports(module: str) -> list[ModuleImportTime]:
+    """Import the specified module in a fresh Python process and report the time spent importing each module."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"Could not import {module} (exit code {proc.returncode}):\n{proc.stderr[-2000:]}"
+        )
+    return parse_import_times(proc.stderr)
+
+
+def total_us(import_times: list[ModuleImportTime]) -> int:
+    """Total time spent on imports in a profile."""
+    return sum(t.cumulative_us for t in import_times if t.depth == 0)
+
+
+def package_times(import_times: list[ModuleImportTime]) -> dict[str, int]:
+    """Total self time (microseconds) spent importing the modules of each top-level package, slowest first."""
+    result: dict[str, int] = {}
+    for t in import_times:
+        result[t.package] = result.get(t.package, 0) + t.self_us
+    return dict(sorted(result.items(), key=lambda kv: kv[1], reverse=True))
+
+
+def _ms(us: float) -> str:
+    return f"{us / 1000:8.1f} ms"
+
+
+def make_report(module: str, profiles: list[list[ModuleImportTime]], top: int) -> str:
+    """Summarize one or more import profiles of the same module.
+
+    The run with the median total import time is used for the breakdowns.
+    """
+    totals = [total_us(p) for p in profiles]
+    median_run = sorted(range(len(profiles)), key=lambda i: totals[i])[
+        len(profiles) // 2
+    ]
+    profile = profiles[median_run]
+
+    lines = [
+        f"Startup imports for {module} ({len(profiles)} run{'s' if len(profiles) > 1 else ''})",
+        f"  Total:  {_ms(statistics.median(totals))} median, {_ms(min(totals))} min, {_ms(max(totals))} max",
+        f"  Modules imported: {len(profile)}",
+        "",
+        "Slowest top-level packages (self time of all their modules):",
+    ]
+    for package, us in list(package_times(profile).items())[0:top]:
+        lines.append(f"  {_ms(us)}  {package}")
+    lines.append("")
+    lines.append("Slowest modules (including their imports):")
+    for t in sorted(profile, key=lambda t: t.cumulative_us, reverse=True)[0:top]:
+        lines.append(f"  {_ms(t.cumulative_us)}  {t.module}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Report on the time spent importing modules when starting a Python entry point"
+    )
+    parser.add_argument(
+        "module",
+        help="Full name of the module to import; e.g., monitoring.uss_qualifier.main",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="Number of fresh processes in which to import the module",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=15,
+        help="Number of slowest packages and modules to list",
+    )
+    args = parser.parse_args()
+
+    profiles = [profile_imports(args.module) for _ in range(args.runs)]
+    print(make_report(args.module, profiles, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+from monitoring.monitorlib.import_profiling import (
+    make_report,
+    package_times,
+    parse_import_times,
+    profile_imports,
+    total_us,
+)
+
+SAMPLE_STDERR = """import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     b.inner
+import time:       200 |        300 |   b
+import time:        50 |        350 | a
+ INFO     | unrelated log line
+import time:        20 |         20 | c
+"""
+
+
+def test_parse_import_times():
+    times = parse_import_times(SAMPLE_STDERR)
+    assert [(t.module, t.depth) for t in times] == [
+        ("b.inner", 2),
+        ("b", 1),
+        ("a", 0),
+        ("c", 0),
+    ]
+    assert times[0].self_us == 100
+    assert times[2].cumulative_us == 350
+    assert total_us(times) == 370
+    assert package_times(times) == {"b": 300, "a": 50, "c": 20}
+    assert "Total:" in make_report("a", [times], top=2)
+
+
+def test_profile_imports():
+    times = profile_imports("json")
+    assert "json" in {t.module for t in times}
+    assert total_us(times) > 0
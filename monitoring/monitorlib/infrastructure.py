@@ -1,12 +1,12 @@
 import asyncio
 import datetime
 import functools
+import threading
 import urllib.parse
 from enum import Enum
 
 import jwt
 import requests
-from aiohttp import ClientSession
 
 ALL_SCOPES = [
     "dss.write.identification_service_areas",
@@ -31,6 +31,8 @@ class AuthAdapter:
 
     def __init__(self):
         self._tokens = {}
+        self._tokens_lock = threading.Lock()
+        """Guards _tokens, which may be used by several threads (e.g., concurrent reads from DSS instances)"""
 
     def issue_token(self, intended_audience: str, scopes: list[str]) -> str:
         """Subclasses must return a bearer token for the given audience."""
@@ -47,17 +49,19 @@ class AuthAdapter:
             return {}
 
         scope_string = " ".join(scopes)
-        if intended_audience not in self._tokens:
-            self._tokens[intended_audience] = {}
-        if scope_string not in self._tokens[intended_audience]:
-            token = self.issue_token(intended_audience, scopes)
-        else:
-            token = self._tokens[intended_audience][scope_string]
-        payload = jwt.decode(token, options={"verify_signature": False})
-        expires = EPOCH + datetime.timedelta(seconds=payload["exp"])
-        if datetime.datetime.now(datetime.UTC) > expires - TOKEN_REFRESH_MARGIN:
-            token = self.issue_token(intended_audience, scopes)
-        self._tokens[intended_audience][scope_string] = token
+        # Tokens are issued while holding the lock so that threads needing the same token concurrently only issue it once
+        with self._tokens_lock:
+            if intended_audience not in self._tokens:
+                self._tokens[intended_audience] = {}
+            if scope_string not in self._tokens[intended_audience]:
+                token = self.issue_token(intended_audience, scopes)
+            else:
+                token = self._tokens[intended_audience][scope_string]
+            payload = jwt.decode(token, options={"verify_signature": False})
+            expires = EPOCH + datetime.timedelta(seconds=payload["exp"])
+            if datetime.datetime.now(datetime.UTC) > expires - TOKEN_REFRESH_MARGIN:
+                token = self.issue_token(intended_audience, scopes)
+            self._tokens[intended_audience][scope_string] = token
         return {"Authorization": "Bearer " + token}
 
     def add_headers(self, request: requests.PreparedRequest, scopes: list[str]):
@@ -67,11 +71,16 @@ class AuthAdapter:
 
     def get_sub(self) -> str | None:
         """Retrieve `sub` claim from one of the existing tokens"""
-        for _, tokens_by_scope in self._tokens.items():
-            for token in tokens_by_scope.values():
-                payload = jwt.decode(token, options={"verify_signature": False})
-                if "sub" in payload:
-                    return payload["sub"]
+        with self._tokens_lock:
+            tokens = [
+                token
+                for tokens_by_scope in self._tokens.values()
+                for token in tokens_by_scope.values()
+            ]
+        for token in tokens:
+            payload = jwt.decode(token, options={"verify_signature": False})
+            if "sub" in payload:
+                return payload["sub"]
         return None
 
 
@@ -170,6 +179,9 @@ class AsyncUTMTestSession:
         self.timeout_seconds = timeout_seconds or CLIENT_TIMEOUT
 
     async def build_session(self):
+        # aiohttp is slow to import and only needed by async sessions
+        from aiohttp import ClientSession
+
         self._client = ClientSession()
 
     def close(self):
@@ -0,0 +1,32 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from monitoring.monitorlib.auth import NoAuth
+
+
+class _SlowNoAuth(NoAuth):
+    def __init__(self):
+        super().__init__()
+        self.issued = 0
+
+    def issue_token(self, intended_audience: str, scopes: list[str]) -> str:
+        self.issued += 1
+        time.sleep(0.05)  # Give other threads the opportunity to request the same token
+        return super().issue_token(intended_audience, scopes)
+
+
+def test_get_headers_concurrently():
+    adapter = _SlowNoAuth()
+    barrier = threading.Barrier(8, timeout=5)
+
+    def get_headers(_) -> dict[str, str]:
+        barrier.wait()
+        return adapter.get_headers("https://dss.example.com/path", ["scope1"])
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        headers = list(executor.map(get_headers, range(8)))
+
+    assert adapter.issued == 1
+    assert all(h == headers[0] for h in headers)
+    assert adapter.get_sub() == "uss_noauth"
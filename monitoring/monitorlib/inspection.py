@@ -16,9 +16,28 @@ def import_submodules(module) -> None:
         importlib.import_module(module_name)
 
 
+def _import_child_module(module, component: str) -> None:
+    """Attempt to import the child module `component` of `module`, ignoring the case where no such child exists."""
+    child_name = f"{module.__name__}.{component}"
+    try:
+        importlib.import_module(child_name)
+    except ModuleNotFoundError as e:
+        if e.name != child_name:
+            # The child module exists but one of its own imports could not be found
+            raise
+
+
 def get_module_object_by_name(parent_module, object_name: str):
+    """Locate an object by its dotted name relative to a parent module.
+
+    Child modules of packages along the path are imported on demand, so only the modules
+    actually needed to locate the object are loaded.
+    """
     module_object = parent_module
     for component in object_name.split("."):
+        if not hasattr(module_object, component) and hasattr(module_object, "__path__"):
+            # module_object is a package that may contain component as a child module
+            _import_child_module(module_object, component)
         if not hasattr(module_object, component):
             raise ValueError(
                 f"Could not find component {component} defined in {module_object.__name__} while trying to locate {object_name}"
@@ -27,6 +46,21 @@ def get_module_object_by_name(parent_module, object_name: str):
     return module_object
 
 
+def get_type_by_name(parent_module, object_name: str, search_module):
+    """Locate a type by its dotted name relative to a parent module, loading as few modules as possible.
+
+    Objects are first located by importing only the modules along their dotted
+    name.  If that fails (e.g., because the object is only made available as a
+    side effect of importing a sibling module), all descendants of
+    `search_module` are imported and the lookup is attempted again.
+    """
+    try:
+        return get_module_object_by_name(parent_module, object_name)
+    except ValueError:
+        import_submodules(search_module)
+        return get_module_object_by_name(parent_module, object_name)
+
+
 def fullname(class_type: type) -> str:
     module = class_type.__module__
     if module == "builtins":
@@ -13,6 +13,7 @@ from uas_standards.interuss.automated_testing.rid.v1.injection import (
 
 from monitoring.monitorlib import geo
 from monitoring.monitorlib.rid import RIDVersion
+from monitoring.monitorlib.rid_automated_testing.telemetry import TelemetryArrays
 
 SCOPE_RID_QUALIFIER_INJECT = "rid.inject_test_data"
 
@@ -183,39 +184,23 @@ class TestFlight(injection.TestFlight):
         )
 
     def select_relevant_states(
-        self, view: s2sphere.LatLngRect, t0: datetime.datetime, t1: datetime.datetime
+        self,
+        view: s2sphere.LatLngRect,
+        t0: datetime.datetime,
+        t1: datetime.datetime,
+        telemetry: TelemetryArrays | None = None,
     ) -> list[RIDAircraftState]:
-        recent_states: list[RIDAircraftState] = []
-        previously_outside = False
-        previously_inside = False
-        previous_telemetry = None
-        for telemetry in self.telemetry:
-            if (
-                not telemetry.timestamp
-                or telemetry.timestamp.datetime < t0
-                or telemetry.timestamp.datetime > t1
-            ):
-                # Telemetry not relevant based on time
-                continue
-            if not telemetry.position:
-                continue
-            pt = s2sphere.LatLng.from_degrees(
-                telemetry.position.lat, telemetry.position.lng
-            )
-            inside_now = view.contains(pt)
-            if inside_now:
-                if previously_outside and previous_telemetry:
-                    recent_states.append(previous_telemetry)
-                recent_states.append(telemetry)
-                previously_inside = True
-                previously_outside = False
-            else:
-                if previously_inside:
-                    recent_states.append(telemetry)
-                previously_outside = True
-                previously_inside = False
-            previous_telemetry = telemetry
-        return recent_states
+        """Select the states of this flight relevant to an observer of the specified area between t0 and t1.
+
+        Args:
+            view: Area being observed.
+            t0: Start of the observation period.
+            t1: End of the observation period.
+            telemetry: Columnar representation of this flight's telemetry, when already available.
+        """
+        if telemetry is None:
+            telemetry = TelemetryArrays.from_states(self.telemetry)
+        return [self.telemetry[i] for i in telemetry.select_relevant(view, t0, t1)]
 
     def get_rect(self) -> s2sphere.LatLngRect | None:
         return geo.bounding_rect(
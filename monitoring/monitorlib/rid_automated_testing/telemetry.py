@@ -0,0 +1,331 @@
+import json
+import math
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import numpy as np
+import s2sphere
+from implicitdict import ImplicitDict, StringBasedDateTime
+from uas_standards.interuss.automated_testing.rid.v1.injection import (
+    RIDAircraftPosition,
+    RIDAircraftState,
+)
+
+NO_TIMESTAMP = np.iinfo(np.int64).min
+"""Value of TelemetryArrays.timestamps_us for states without a timestamp."""
+
+_STATE_COLUMNS = {
+    "speed": "speeds",
+    "track": "tracks",
+    "vertical_speed": "vertical_speeds",
+}
+"""Numeric fields of RIDAircraftState stored in columns, and the name of each column."""
+
+_POSITION_COLUMNS = {"lat": "lats", "lng": "lngs", "alt": "alts"}
+"""Numeric fields of RIDAircraftPosition stored in columns, and the name of each column."""
+
+
+def _is_number(v) -> bool:
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def _to_us(t: datetime) -> int:
+    dt = t - datetime(1970, 1, 1, tzinfo=UTC)
+    return (dt.days * 86400 + dt.seconds) * 1000000 + dt.microseconds
+
+
+def _from_us(us: int) -> datetime:
+    return datetime(1970, 1, 1, tzinfo=UTC) + timedelta(microseconds=int(us))
+
+
+def _copy(v):
+    """Copy a parsed value so that states do not share mutable contents."""
+    if isinstance(v, ImplicitDict):
+        fields: dict[str, Any] = {k: _copy(x) for k, x in dict.items(v)}
+        return type(v)(**fields)
+    if isinstance(v, dict):
+        return {k: _copy(x) for k, x in v.items()}
+    if isinstance(v, list):
+        return [_copy(x) for x in v]
+    return v
+
+
+class TelemetryArrays:
+    """Columnar representation of a sequence of injected RID aircraft states.
+
+    The timestamp, position and motion of each state are stored in NumPy arrays
+    (NaN where a value is absent) so that long, high-rate flights take little
+    memory and may be sliced by time and area without visiting each state.  All
+    other fields of a state are kept, deduplicated, in a sparse side table, so
+    the original states may be recovered with `to_states`.
+    """
+
+    timestamps_us: np.ndarray
+    """Timestamp of each state, in microseconds since the Unix epoch (NO_TIMESTAMP when absent)."""
+
+    lats: np.ndarray
+    """Latitude of each state, in degrees."""
+
+    lngs: np.ndarray
+    """Longitude of each state, in degrees."""
+
+    alts: np.ndarray
+    """Geodetic altitude of each state, in meters."""
+
+    speeds: np.ndarray
+    """Ground speed of each state, in meters per second."""
+
+    tracks: np.ndarray
+    """Track of each state, in degrees."""
+
+    vertical_speeds: np.ndarray
+    """Vertical speed of each state, in meters per second."""
+
+    _extra_ids: np.ndarray
+    """Index into _extras of the fields of each state that are not stored in columns (-1 when there are none)."""
+
+    _extras: list[dict]
+    """Distinct sets of fields that are not stored in columns."""
+
+    _chronological: bool
+    """True if timestamps_us is non-decreasing and has no missing values, allowing time windows to be found by bisection."""
+
+    def __init__(
+        self,
+        timestamps_us: np.ndarray,
+        columns: dict[str, np.ndarray],
+        extra_ids: np.ndarray,
+        extras: list[dict],
+    ):
+        self.timestamps_us = timestamps_us
+        for name in list(_STATE_COLUMNS.values()) + list(_POSITION_COLUMNS.values()):
+            setattr(self, name, columns[name])
+        self._extra_ids = extra_ids
+        self._extras = extras
+        self._chronological = bool(
+            not np.any(timestamps_us == NO_TIMESTAMP)
+            and np.all(np.diff(timestamps_us) >= 0)
+        )
+
+    @staticmethod
+    def from_states(states: list[RIDAircraftState]) -> "TelemetryArrays":
+        n = len(states)
+        timestamps_us = np.full(n, NO_TIMESTAMP, dtype=np.int64)
+        columns = {
+            name: np.full(n, np.nan)
+            for name in list(_STATE_COLUMNS.values()) + list(_POSITION_COLUMNS.values())
+        }
+        extra_ids = np.full(n, -1, dtype=np.int32)
+        extras: list[dict] = []
+        extra_index: dict[str, int] = {}
+
+        for i, state in enumerate(states):
+            extra = {}
+            for k, v in state.items():
+                if k == "timestamp" and v is not None:
+                    t = (
+                        v
+                        if isinstance(v, StringBasedDateTime)
+                        else StringBasedDateTime(v)
+                    ).datetime
+                    timestamps_us[i] = _to_us(t)
+                    if _from_us(timestamps_us[i]) != t:
+                        # Sub-microsecond precision would be lost
+                        extra[k] = v
+                elif k in _STATE_COLUMNS and _is_number(v):
+                    columns[_STATE_COLUMNS[k]][i] = v
+                elif k == "position" and v is not None:
+                    position = {}
+                    for pk, pv in v.items():
+                        if pk in _POSITION_COLUMNS and _is_number(pv):
+                            columns[_POSITION_COLUMNS[pk]][i] = pv
+                        else:
+                            position[pk] = pv
+                    extra[k] = position
+                else:
+                    extra[k] = v
+            if extra:
+                key = json.dumps(extra, sort_keys=True)
+                if key not in extra_index:
+                    extra_index[key] = len(extras)
+                    extras.append(extra)
+                extra_ids[i] = extra_index[key]
+
+        return TelemetryArrays(timestamps_us, columns, extra_ids, extras)
+
+    @staticmethod
+    def from_columns(
+        timestamps: list[datetime] | np.ndarray,
+        lats: np.ndarray,
+        lngs: np.ndarray,
+        alts: np.ndarray,
+        speeds: np.ndarray,
+        tracks: np.ndarray,
+        vertical_speeds: float | np.ndarray,
+        extra: dict | None = None,
+    ) -> "TelemetryArrays":
+        """Build telemetry for generated states, e.g. from a simulation.
+
+        Args:
+            timestamps: Timestamp of each state, as datetimes or microseconds since the Unix epoch.
+            lats: Latitude of each state, in degrees.
+            lngs: Longitude of each state, in degrees.
+            alts: Geodetic altitude of each state, in meters.
+            speeds: Ground speed of each state, in meters per second.
+            tracks: Track of each state, in degrees.
+            vertical_speeds: Vertical speed of each state (or of all states), in meters per second.
+            extra: Fields (other than those above) shared by all states.  Position fields are specified under
+                "position".
+        """
+        if len(timestamps) and isinstance(timestamps[0], datetime):
+            timestamps_us = np.array([_to_us(t) for t in timestamps], dtype=np.int64)
+        else:
+            timestamps_us = np.asarray(timestamps, dtype=np.int64)
+        n = len(timestamps_us)
+        columns = {}
+        for name, values in (
+            ("lats", lats),
+            ("lngs", lngs),
+            ("alts", alts),
+            ("speeds", speeds),
+            ("tracks", tracks),
+            ("vertical_speeds", vertical_speeds),
+        ):
+            columns[name] = np.broadcast_to(np.asarray(values, dtype=float), n).copy()
+        if extra:
+            return TelemetryArrays(
+                timestamps_us, columns, np.zeros(n, dtype=np.int32), [extra]
+            )
+        return TelemetryArrays(timestamps_us, columns, np.full(n, -1, np.int32), [])
+
+    def __len__(self) -> int:
+        return len(self.timestamps_us)
+
+    def state(self, i: int) -> RIDAircraftState:
+        """Reconstruct the original state at index i."""
+        return self.subset(np.array([i])).to_states()[0]
+
+    def to_states(self) -> list[RIDAircraftState]:
+        """Reconstruct the original states.
+
+        Reconstructed states are equal in value to the original states, though timestamps are formatted canonically
+        and numeric values in columns are floats.
+        """
+        # Parse each distinct set of extra fields once and copy the result into each state, rather than parsing each
+        # state (which dominates the time to produce long, high-rate flights).
+        templates = [
+            ImplicitDict.parse(extra, RIDAircraftState) for extra in self._extras
+        ]
+        state_columns = [
+            (k, getattr(self, name).tolist()) for k, name in _STATE_COLUMNS.items()
+        ]
+        position_columns = [
+            (k, getattr(self, name).tolist()) for k, name in _POSITION_COLUMNS.items()
+        ]
+        states = []
+        for i, (timestamp_us, extra_id) in enumerate(
+            zip(self.timestamps_us.tolist(), self._extra_ids.tolist())
+        ):
+            result = {}
+            position: dict | None = None
+            if timestamp_us != NO_TIMESTAMP:
+                result["timestamp"] = StringBasedDateTime(_from_us(timestamp_us))
+            if extra_id >= 0:
+                for k, v in dict.items(templates[extra_id]):
+                    if k == "position":
+                        position = _copy(v)
+                    else:
+                        result[k] = _copy(v)
+            for k, values in state_columns:
+                if not math.isnan(values[i]):
+                    result[k] = values[i]
+            for k, values in position_columns:
+                if not math.isnan(values[i]):
+                    if position is None:
+                        position = RIDAircraftPosition()
+                    position[k] = values[i]
+            if position is not None:
+                result["position"] = position
+            states.append(RIDAircraftState(**result))
+        return states
+
+    def subset(self, indices: np.ndarray) -> "TelemetryArrays":
+        """Telemetry consisting of only the states at the specified indices (or boolean mask)."""
+        columns = {
+            name: getattr(self, name)[indices]
+            for name in list(_STATE_COLUMNS.values()) + list(_POSITION_COLUMNS.values())
+        }
+        return TelemetryArrays(
+            self.timestamps_us[indices],
+            columns,
+            self._extra_ids[indices],
+            self._extras,
+        )
+
+    def get_span(self) -> tuple[datetime | None, datetime | None]:
+        """Earliest and latest timestamps of the states, or None if no state has a timestamp."""
+        present = self.timestamps_us[self.timestamps_us != NO_TIMESTAMP]
+        if len(present) == 0:
+            return None, None
+        return _from_us(present.min()), _from_us(present.max())
+
+    def in_time_range(self, t0: datetime, t1: datetime) -> np.ndarray:
+        """Indices of states with timestamps between t0 and t1 (inclusive), in order."""
+        us0 = _to_us(t0)
+        us1 = _to_us(t1)
+        if self._chronological:
+            i0 = int(np.searchsorted(self.timestamps_us, us0, side="left"))
+            i1 = int(np.searchsorted(self.timestamps_us, us1, side="right"))
+            return np.arange(i0, max(i0, i1))
+        return np.flatnonzero(
+            (self.timestamps_us != NO_TIMESTAMP)
+            & (self.timestamps_us >= us0)
+            & (self.timestamps_us <= us1)
+        )
+
+    def in_rect(self, view: s2sphere.LatLngRect) -> np.ndarray:
+        """Mask indicating which states have a position within the specified area."""
+        lat = view.lat()
+        lng = view.lng()
+        inside = (self.lats >= np.degrees(lat.lo())) & (
+            self.lats <= np.degrees(lat.hi())
+        )
+        lng_lo = np.degrees(lng.lo())
+        lng_hi = np.degrees(lng.hi())
+        if lng.is_inverted():
+            # Area crosses the antimeridian
+            return inside & ((self.lngs >= lng_lo) | (self.lngs <= lng_hi))
+        return inside & (self.lngs >= lng_lo) & (self.lngs <= lng_hi)
+
+    def select_relevant(
+        self, view: s2sphere.LatLngRect, t0: datetime, t1: datetime
+    ) -> np.ndarray:
+        """Indices of the states relevant to an observer of the specified area between t0 and t1, in order.
+
+        These are the states in the time range that are within the area, plus the states immediately before entering
+        and immediately after exiting the area (so that the observer can see the aircraft travel into and out of the
+        area).
+        """
+        candidates = self.in_time_range(t0, t1)
+        has_position = ~np.isnan(self.lats[candidates]) & ~np.isnan(
+            self.lngs[candidates]
+        )
+        candidates = candidates[has_position]
+        if len(candidates) == 0:
+            return candidates
+        inside = self.in_rect(view)[candidates]
+        previous_inside = np.concatenate(([False], inside[:-1]))
+        next_inside = np.concatenate((inside[1:], [False]))
+        return candidates[inside | previous_inside | next_inside]
+
+    def get_rect(self) -> s2sphere.LatLngRect | None:
+        """Bounding rectangle of the positions of all states, or None if no state has a position."""
+        has_position = ~np.isnan(self.lats) & ~np.isnan(self.lngs)
+        if not np.any(has_position):
+            return None
+        lats = self.lats[has_position]
+        lngs = self.lngs[has_position]
+        return s2sphere.LatLngRect.from_point_pair(
+            s2sphere.LatLng.from_degrees(float(lats.min()), float(lngs.min())),
+            s2sphere.LatLng.from_degrees(float(lats.max()), float(lngs.max())),
+        )
@@ -0,0 +1,130 @@
+import random
+from datetime import UTC, datetime, timedelta
+
+import s2sphere
+from implicitdict import ImplicitDict
+from uas_standards.interuss.automated_testing.rid.v1.injection import (
+    RIDAircraftState,
+)
+
+from monitoring.monitorlib.rid_automated_testing.telemetry import TelemetryArrays
+
+T0 = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _state(i: int, lat: float, lng: float, **kwargs) -> RIDAircraftState:
+    return ImplicitDict.parse(
+        {
+            "timestamp": (T0 + timedelta(seconds=i)).isoformat(),
+            "timestamp_accuracy": 0.1,
+            "operational_status": "Airborne",
+            "position": {
+                "lat": lat,
+                "lng": lng,
+                "alt": 100.5,
+                "accuracy_h": "HAUnknown",
+            },
+            "track": 90,
+            "speed": 5.5,
+            "speed_accuracy": "SA3mps",
+            "vertical_speed": 0.0,
+            **kwargs,
+        },
+        RIDAircraftState,
+    )
+
+
+def _select_relevant_states_reference(
+    states: list[RIDAircraftState],
+    view: s2sphere.LatLngRect,
+    t0: datetime,
+    t1: datetime,
+) -> list[int]:
+    """State-by-state selection of the states relevant to an observer of view between t0 and t1."""
+    result = []
+    previous = None
+    for i, state in enumerate(states):
+        assert state.timestamp is not None and state.position is not None
+        if not t0 <= state.timestamp.datetime <= t1:
+            continue
+        inside = view.contains(
+            s2sphere.LatLng.from_degrees(state.position.lat, state.position.lng)
+        )
+        if previous is not None:
+            if inside and not previous[1] and previous[0] not in result:
+                result.append(previous[0])
+            if inside or previous[1]:
+                result.append(i)
+        elif inside:
+            result.append(i)
+        previous = (i, inside)
+    return result
+
+
+def test_round_trip():
+    states = [
+        _state(0, 46.9, 7.4),
+        _state(1, 46.9, 7.5, height={"distance": 10, "reference": "TakeoffLocation"}),
+        _state(2, 46.9, 7.6, timestamp="2024-01-01T00:00:02.123456Z"),
+        ImplicitDict.parse({"track": 1}, RIDAircraftState),
+    ]
+
+    telemetry = TelemetryArrays.from_states(states)
+    assert len(telemetry) == 4
+    # Fields outside of columns are shared between states where identical
+    assert len(telemetry._extras) == 2
+
+    round_tripped = telemetry.to_states()
+    for original, result in zip(states, round_tripped):
+        assert set(result) == set(original)
+        for k, v in original.items():
+            if k == "timestamp":
+                assert result.timestamp is not None and original.timestamp is not None
+                assert result.timestamp.datetime == original.timestamp.datetime
+            else:
+                assert result[k] == v
+    assert telemetry.get_span() == (T0, T0 + timedelta(seconds=2, microseconds=123456))
+
+
+def test_select_relevant():
+    rng = random.Random(0)
+    lat = 46.9
+    lng = 7.4
+    states = []
+    for i in range(500):
+        lat += rng.uniform(-0.001, 0.001)
+        lng += rng.uniform(-0.001, 0.001)
+        states.append(_state(i, lat, lng))
+    telemetry = TelemetryArrays.from_states(states)
+    rect = telemetry.get_rect()
+    assert rect is not None
+    assert rect.lat_lo().degrees == min(s.position.lat for s in states)
+    assert rect.lng_hi().degrees == max(s.position.lng for s in states)
+
+    for _ in range(20):
+        center = states[rng.randrange(len(states))].position
+        view = s2sphere.LatLngRect.from_point_pair(
+            s2sphere.LatLng.from_degrees(center.lat - 0.003, center.lng - 0.003),
+            s2sphere.LatLng.from_degrees(center.lat + 0.003, center.lng + 0.003),
+        )
+        t0 = T0 + timedelta(seconds=rng.randrange(500))
+        t1 = t0 + timedelta(seconds=rng.randrange(100))
+        assert list(
+            telemetry.select_relevant(view, t0, t1)
+        ) == _select_relevant_states_reference(states, view, t0, t1)
+
+
+def test_unordered_and_antimeridian():
+    states = [_state(2, 0, 179.9), _state(0, 0, -179.9), _state(1, 0, 170)]
+    telemetry = TelemetryArrays.from_states(states)
+    assert list(telemetry.in_time_range(T0, T0 + timedelta(seconds=1))) == [1, 2]
+
+    view = s2sphere.LatLngRect.from_point_pair(
+        s2sphere.LatLng.from_degrees(-1, 179), s2sphere.LatLng.from_degrees(1, -179)
+    )
+    assert list(telemetry.in_rect(view)) == [True, True, False]
+
+    subset = telemetry.subset(telemetry.in_rect(view))
+    positions = [s.position for s in subset.to_states()]
+    assert len(positions) == 2
+    assert [p.lng for p in positions if p is not None] == [179.9, -179.9]
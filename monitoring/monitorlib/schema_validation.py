@@ -1,14 +1,20 @@
+from __future__ import annotations
+
 import os.path
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import jsonschema.validators
 import yaml
 from bc_jsonpath_ng.parser import parse
 from implicitdict import ImplicitDict
 from implicitdict.jsonschema import SchemaVars, make_json_schema
 
+if TYPE_CHECKING:
+    # jsonschema is slow to import and only needed when actually validating
+    import jsonschema
+
 
 class F3411_19(str, Enum):
     OpenAPIPath = "interfaces/rid/v1/remoteid/augmented.yaml"
@@ -120,6 +126,8 @@ def validate(
 
     Returns: List of ValidationErrors (or empty list when validation passes).
     """
+    import jsonschema.validators
+
     base_path = os.path.split(openapi_path)[0]
     if not os.path.isabs(base_path):
         repo_root = os.path.realpath(os.path.join(os.path.split(__file__)[0], "../.."))
@@ -179,6 +187,8 @@ def _make_implicitdict_schema(t: type[ImplicitDict]) -> dict:
 def validate_implicitdict_object(
     obj: dict, t: type[ImplicitDict]
 ) -> list[ValidationError]:
+    import jsonschema
+
     schema = _make_implicitdict_schema(t)
     jsonschema.Draft202012Validator.check_schema(schema)
     validator = jsonschema.Draft202012Validator(schema)
@@ -10,9 +10,9 @@ from implicitdict import (
     StringBasedDateTime,
     StringBasedTimeDelta,
 )
-from pvlib.solarposition import get_solarposition
 from uas_standards.astm.f3548.v21 import api as f3548v21
 
+from monitoring.monitorlib import clock
 from monitoring.monitorlib.geo import LatLngPoint
 
 
@@ -116,7 +116,7 @@ class TestTimeContext(dict[TimeDuringTest, Time]):
         """Set TimeOfEvaluation in this context to the current time.
 
         This should be performed once before resolving a TestTime."""
-        self[TimeDuringTest.TimeOfEvaluation] = Time(arrow.utcnow().datetime)
+        self[TimeDuringTest.TimeOfEvaluation] = Time(clock.now())
         return self
 
     @staticmethod
@@ -279,4 +279,7 @@ def _sun_elevation(t: datetime, lat_deg: float, lng_deg: float) -> float:
 
     Returns: Degrees above the horizon of the center of the sun.
     """
+    # pvlib (and its pandas dependency) is slow to import and rarely needed
+    from pvlib.solarposition import get_solarposition
+
     return get_solarposition(t, lat_deg, lng_deg).elevation.values[0]  # pyright:ignore[reportAttributeAccessIssue]
@@ -8,10 +8,7 @@ from typing import Any, TypeVar
 from implicitdict import ImplicitDict
 
 from monitoring import uss_qualifier as uss_qualifier_module
-from monitoring.monitorlib.inspection import (
-    get_module_object_by_name,
-    import_submodules,
-)
+from monitoring.monitorlib.inspection import get_type_by_name
 from monitoring.uss_qualifier.action_generators.definitions import (
     ActionGeneratorDefinition,
     ActionGeneratorSpecificationType,
@@ -113,10 +110,10 @@ def action_generator_type_from_name(
 ) -> type[ActionGenerator]:
     from monitoring.uss_qualifier import action_generators as action_generators_module
 
-    import_submodules(action_generators_module)
-    action_generator_type = get_module_object_by_name(
+    action_generator_type = get_type_by_name(
         parent_module=uss_qualifier_module,
         object_name=action_generator_type_name,
+        search_module=action_generators_module,
     )
     if not issubclass(action_generator_type, ActionGenerator):
         raise NotImplementedError(
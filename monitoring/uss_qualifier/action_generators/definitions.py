@@ -1,6 +1,6 @@
 from typing import TypeVar
 
-from implicitdict import ImplicitDict
+from implicitdict import ImplicitDict, Optional
 
 from monitoring.uss_qualifier.resources.definitions import ResourceID
 
@@ -13,6 +13,27 @@ ActionGeneratorSpecificationType = TypeVar(
 )
 
 
+class ParallelExecutionSpecification(ImplicitDict):
+    max_concurrent_actions: int
+    """Maximum number of generated actions to run at the same time.  Must be at least 1."""
+
+    exclusive_resources: list[ResourceID] = []
+    """IDs of resources (as known by the action generator) that may only be used by one generated action at a time.
+
+    A generated action is not started while another generated action provided with the same instance of any of these
+    resources (e.g., the same flight planner or planning area) is still running.  Generated actions that do not share
+    any of these resources may run at the same time, so they must be independent of each other (e.g., involve different
+    participants in different airspace).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.max_concurrent_actions < 1:
+            raise ValueError(
+                f"max_concurrent_actions must be at least 1 in ParallelExecutionSpecification (was {self.max_concurrent_actions})"
+            )
+
+
 class ActionGeneratorDefinition(ImplicitDict):
     generator_type: GeneratorTypeName
     """Type of action generator"""
@@ -29,3 +50,18 @@ class ActionGeneratorDefinition(ImplicitDict):
 
     If the parent resource ID is suffixed with ? then the resource will not be required (and will not be populated for the child action when not present in the parent)
     """
+
+    parallel_execution: Optional[ParallelExecutionSpecification]
+    """If specified, generated actions are run concurrently according to this specification rather than one after another.
+
+    Actions are generated as they are needed, and generated actions are started in the order they are generated.
+    Their reports are recorded in that same order regardless of the order in which they finish.  When a generated action
+    has a critical problem or fails with `on_failure: Abort`, no further generated actions are started, but the actions
+    already running are allowed to finish.
+
+    While they run, a generated action and its descendants do not see the other actions generated by this action
+    generator (or their descendants): they are not counted by `nth_instance` selection conditions evaluated for the
+    generated action or its descendants, and their test scenario reports are not available to it.  This makes the
+    selection of actions independent of the order in which concurrent actions progress.  All generated actions are
+    visible to the actions following this action generator.
+    """
@@ -0,0 +1,89 @@
+import os
+import stat
+import tempfile
+
+from loguru import logger
+
+CACHE_FOLDER_ENV = "USS_QUALIFIER_CACHE_FOLDER"
+"""Environment variable specifying the folder in which uss_qualifier persists cached content between runs.
+
+If not specified, defaults to uss_qualifier in the user's cache folder
+($XDG_CACHE_HOME or ~/.cache).  If set to an empty string, nothing is cached
+on disk.
+"""
+
+
+def cache_folder(category: str) -> str | None:
+    """Get the folder in which content of the specified category should be cached.
+
+    Returns: Path to the folder, or None if on-disk caching is disabled.
+    """
+    root = os.environ.get(CACHE_FOLDER_ENV, None)
+    if root is None:
+        root = os.path.join(
+            os.environ.get("XDG_CACHE_HOME", None)
+            or os.path.join(os.path.expanduser("~"), ".cache"),
+            "uss_qualifier",
+        )
+    if not root:
+        return None
+    return os.path.join(root, category)
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Whether a file or folder is owned by the current user and may not be written by anyone else."""
+    return (
+        hasattr(os, "getuid")
+        and st.st_uid == os.getuid()
+        and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def load_cached(category: str, key: str, private: bool = False) -> bytes | None:
+    """Load content previously stored with store_cached, or None if not available.
+
+    Args:
+        category: Category of content specified to store_cached.
+        key: Key of content specified to store_cached.
+        private: If true, only load content from a folder and file that are owned by the current user and may not be
+            written by anyone else.  This must be set for content that is unsafe to load from an untrusted source
+            (e.g., pickles), as the cache folder may be shared with other users.
+    """
+    folder = cache_folder(category)
+    if folder is None:
+        return None
+    try:
+        with open(os.path.join(folder, key), "rb") as f:
+            if private and not (
+                _is_private(os.stat(folder)) and _is_private(os.fstat(f.fileno()))
+            ):
+                logger.warning(
+                    f"Ignoring {key} in {category} cache in {folder} because it may have been written by another user"
+                )
+                return None
+            return f.read()
+    except OSError:
+        return None
+
+
+def store_cached(category: str, key: str, content: bytes) -> None:
+    """Store content in the on-disk cache, if enabled.
+
+    Failures to write to the cache are logged but otherwise ignored.
+    """
+    folder = cache_folder(category)
+    if folder is None:
+        return
+    try:
+        os.makedirs(folder, mode=0o700, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never observe partial content
+        fd, temp_path = tempfile.mkstemp(dir=folder, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, os.path.join(folder, key))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    except OSError as e:
+        logger.debug(f"Could not write {key} to {category} cache in {folder}: {e}")
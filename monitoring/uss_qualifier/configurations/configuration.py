@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from implicitdict import ImplicitDict, Optional
 
+from monitoring.monitorlib.clock import ClockConfiguration
 from monitoring.monitorlib.dicts import JSONAddress
 from monitoring.uss_qualifier.action_generators.definitions import GeneratorTypeName
 from monitoring.uss_qualifier.reports.validation.definitions import (
@@ -135,6 +136,9 @@ class ExecutionConfiguration(ImplicitDict):
     scenarios_filter: str | None
     """Filter test scenarios by class name using a regex. When empty, all scenarios are executed. Useful for targeted debugging. Overridden by --filter"""
 
+    clock: Optional[ClockConfiguration] = None
+    """If specified, use this clock (rather than the clock configured by the MONITORING_CLOCK_* environment variables) to determine the current time and to wait.  Every mock_uss instance under test must be configured with the same clock."""
+
 
 class TestConfiguration(ImplicitDict):
     action: TestSuiteActionDeclaration
@@ -187,6 +191,9 @@ class SequenceViewConfiguration(ImplicitDict):
     render_kml: bool = True
     """When True, visualize geographic data for each scenario as a KML file."""
 
+    render_processes: Optional[int] = None
+    """Number of processes in which to generate scenario pages (and KML files) in parallel.  Defaults to the number of CPUs available to uss_qualifier, but never more than the number of scenarios; specify 1 to generate all pages in the current process."""
+
 
 class ReportHTMLConfiguration(ImplicitDict):
     redact_access_tokens: bool = True
@@ -216,6 +223,11 @@ class RawReportConfiguration(ImplicitDict):
     """To pretty-print JSON content, specify an indent level (generally 2), or omit or set to None to write compactly."""
 
 
+class StreamedReportConfiguration(ImplicitDict):
+    redact_access_tokens: bool = True
+    """When True, look for instances of "Authorization" keys in the report with values starting "Bearer " and redact the signature from those access tokens"""
+
+
 class GloballyExpandedReportConfiguration(ImplicitDict):
     redact_access_tokens: bool = True
     """When True, look for instances of "Authorization" keys in the report with values starting "Bearer " and redact the signature from those access tokens"""
@@ -225,6 +237,9 @@ class ArtifactsConfiguration(ImplicitDict):
     raw_report: Optional[RawReportConfiguration] = None
     """Configuration for raw report generation"""
 
+    streamed_report: Optional[StreamedReportConfiguration] = None
+    """If specified, configuration describing how the report should be written incrementally (to report.jsonl) during the test run, as each test suite action finishes.  The results of completed actions are preserved even if the test run does not finish, and the streamed report can be read without loading the entire report into memory."""
+
     report_html: Optional[ReportHTMLConfiguration] = None
     """If specified, configuration describing how an HTML version of the raw report should be generated"""
 
@@ -1,5 +1,40 @@
+import hashlib
+import pickle
+
+import marko
 import marko.element
 
+from monitoring.uss_qualifier.cache import load_cached, store_cached
+
+MARKDOWN_CACHE = "markdown"
+"""Cache category for parsed Markdown documents"""
+
+_parsed_markdown: dict[str, bytes] = {}
+"""Pickled Markdown Documents, by hash of source content"""
+
+
+def parse_markdown_file(path: str) -> marko.block.Document:
+    """Parse the Markdown file at the specified path.
+
+    Parsed documents are cached (in memory and on disk) by hash of their
+    content, so a document is only actually parsed the first time its content
+    is encountered.  On-disk entries are only loaded if no other user could
+    have written them.
+
+    Returns: Newly-constructed Document which may be freely modified by the caller.
+    """
+    with open(path) as f:
+        content = f.read()
+    key = hashlib.sha256(f"marko {marko.__version__}\n{content}".encode()).hexdigest()
+    if key not in _parsed_markdown:
+        # Pickles may execute arbitrary code when loaded, so only load those that no other user could have written
+        parsed = load_cached(MARKDOWN_CACHE, key, private=True)
+        if parsed is None:
+            parsed = pickle.dumps(marko.parse(content))
+            store_cached(MARKDOWN_CACHE, key, parsed)
+        _parsed_markdown[key] = parsed
+    return pickle.loads(_parsed_markdown[key])
+
 
 def text_of(value: marko.element.Element) -> str:
     """Gets the plain text contained within a Markdown element"""
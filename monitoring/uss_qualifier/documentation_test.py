@@ -0,0 +1,78 @@
+import os
+import pickle
+import uuid
+
+import marko
+
+from monitoring.uss_qualifier import documentation
+from monitoring.uss_qualifier.cache import CACHE_FOLDER_ENV
+from monitoring.uss_qualifier.documentation import (
+    MARKDOWN_CACHE,
+    parse_markdown_file,
+    text_of,
+)
+
+
+def _fail_to_parse(content: str) -> marko.block.Document:
+    raise AssertionError(
+        "Markdown content was parsed again instead of loaded from cache"
+    )
+
+
+def test_parse_markdown_file(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_FOLDER_ENV, str(tmp_path / "cache"))
+    md_file = tmp_path / "doc.md"
+    md_file.write_text(f"# Heading {uuid.uuid4()}\n\nSome **text**\n")
+
+    doc1 = parse_markdown_file(str(md_file))
+    assert text_of(doc1.children[0]) == text_of(
+        marko.parse(md_file.read_text()).children[0]
+    )
+    assert len(os.listdir(tmp_path / "cache" / MARKDOWN_CACHE)) == 1
+
+    # Each call returns an independent Document
+    children1 = list(doc1.children)
+    doc2 = parse_markdown_file(str(md_file))
+    assert len(doc2.children) == len(children1) == 3
+    assert all(c2 is not c1 for c1, c2 in zip(children1, doc2.children))
+
+    # A new process (simulated by clearing the in-memory cache) uses the on-disk cache
+    monkeypatch.setattr(documentation, "_parsed_markdown", {})
+    monkeypatch.setattr(marko, "parse", _fail_to_parse)
+    doc3 = parse_markdown_file(str(md_file))
+    assert text_of(doc3.children[2]) == "Some text"
+
+
+def test_parse_markdown_file_content_change(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_FOLDER_ENV, "")
+    md_file = tmp_path / "doc.md"
+    md_file.write_text("# First\n")
+    assert text_of(parse_markdown_file(str(md_file)).children[0]) == "First"
+    md_file.write_text("# Second\n")
+    assert text_of(parse_markdown_file(str(md_file)).children[0]) == "Second"
+
+
+def test_untrusted_cached_markdown_is_not_loaded(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_FOLDER_ENV, str(tmp_path / "cache"))
+    md_file = tmp_path / "doc.md"
+    md_file.write_text(f"# Heading {uuid.uuid4()}\n")
+    parse_markdown_file(str(md_file))
+    folder = tmp_path / "cache" / MARKDOWN_CACHE
+    (entry,) = folder.iterdir()
+
+    def load_planted(entry_mode: int, folder_mode: int) -> marko.block.Document:
+        # Replace the cache entry with one that would be loaded as an empty document
+        entry.write_bytes(pickle.dumps(marko.parse("")))
+        entry.chmod(entry_mode)
+        folder.chmod(folder_mode)
+        monkeypatch.setattr(documentation, "_parsed_markdown", {})
+        try:
+            return parse_markdown_file(str(md_file))
+        finally:
+            folder.chmod(0o700)
+
+    # Entries in a file or folder other users could have written are never unpickled
+    assert load_planted(0o606, 0o700).children
+    assert load_planted(0o620, 0o700).children
+    assert load_planted(0o600, 0o770).children
+    assert not load_planted(0o600, 0o700).children
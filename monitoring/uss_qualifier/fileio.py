@@ -1,14 +1,20 @@
 import base64
+import hashlib
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
 
 import _jsonnet
 import bc_jsonpath_ng
 import requests
 import yaml
+from implicitdict import ImplicitDict, Optional
 from loguru import logger
 
+from monitoring.uss_qualifier.cache import load_cached, store_cached
+
 FILE_PREFIX = "file://"
 HTTP_PREFIX = "http://"
 HTTPS_PREFIX = "https://"
@@ -32,6 +38,38 @@ Allowed extensions:
 
 _package_root = os.path.dirname(__file__)
 
+OFFLINE_ENV = "USS_QUALIFIER_OFFLINE"
+"""Environment variable which, when set to true, causes web content to be loaded only from the on-disk cache rather than retrieved from the web"""
+
+WEB_CACHE_INDEX = "web_index"
+"""Cache category for _WebCacheEntry records, by hash of URL"""
+
+WEB_CACHE_CONTENT = "web_content"
+"""Cache category for web content, by hash of content"""
+
+WEB_REQUEST_TIMEOUT_SECONDS = (3.1, 30)
+"""(Connect, read) timeouts when retrieving web content"""
+
+PREFETCH_THREADS = 8
+"""Maximum number of web references to retrieve concurrently"""
+
+_web_content: dict[str, str] = {}
+"""Content retrieved from the web by this process, by URL"""
+
+
+class _WebCacheEntry(ImplicitDict):
+    url: str
+    """URL from which the content was retrieved"""
+
+    content_hash: str
+    """SHA-256 hash of the retrieved content, which is the key of the content in the WEB_CACHE_CONTENT cache"""
+
+    etag: Optional[str]
+    """ETag header of the response containing the content, if any"""
+
+    last_modified: Optional[str]
+    """Last-Modified header of the response containing the content, if any"""
+
 
 def resolve_filename(data_file: FileReference) -> str:
     if data_file.startswith(FILE_PREFIX):
@@ -74,7 +112,7 @@ def get_package_name(local_file_path: str) -> FileReference:
     return ".".join(os.path.normpath(rel_path).split(os.path.sep))
 
 
-def _get_web_content(url: str) -> str:
+def _web_request_headers(url: str) -> dict[str, str]:
     headers = {}
 
     # Check if this is a request to a private GitHub repo
@@ -115,9 +153,80 @@ def _get_web_content(url: str) -> str:
                     f"Basic {base64.b64encode(token.encode()).decode()}"
                 )
 
-    resp = requests.get(url, headers=headers)
-    resp.raise_for_status()
-    return resp.content.decode("utf-8")
+    return headers
+
+
+def _sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _load_cached_web_content(url: str) -> tuple[_WebCacheEntry | None, str | None]:
+    raw_entry = load_cached(WEB_CACHE_INDEX, _sha256(url.encode()))
+    if raw_entry is None:
+        return None, None
+    try:
+        entry = ImplicitDict.parse(json.loads(raw_entry), _WebCacheEntry)
+    except ValueError:
+        return None, None
+    if entry.url != url:
+        return None, None
+    content = load_cached(WEB_CACHE_CONTENT, entry.content_hash)
+    if content is None or _sha256(content) != entry.content_hash:
+        return entry, None
+    return entry, content.decode("utf-8")
+
+
+def _store_cached_web_content(url: str, resp: requests.Response) -> None:
+    content_hash = _sha256(resp.content)
+    store_cached(WEB_CACHE_CONTENT, content_hash, resp.content)
+    entry = _WebCacheEntry(url=url, content_hash=content_hash)
+    if "ETag" in resp.headers:
+        entry.etag = resp.headers["ETag"]
+    if "Last-Modified" in resp.headers:
+        entry.last_modified = resp.headers["Last-Modified"]
+    store_cached(WEB_CACHE_INDEX, _sha256(url.encode()), json.dumps(entry).encode())
+
+
+def _get_web_content(url: str) -> str:
+    if url in _web_content:
+        return _web_content[url]
+
+    entry, cached_content = _load_cached_web_content(url)
+    if os.environ.get(OFFLINE_ENV, "").lower() in ("1", "true", "yes"):
+        if cached_content is None:
+            raise ValueError(
+                f"{url} is not available in the local cache and {OFFLINE_ENV} prevents retrieving it from the web"
+            )
+        content = cached_content
+    else:
+        headers = _web_request_headers(url)
+        if entry is not None and cached_content is not None:
+            # Only retrieve the content again if it has changed
+            if "etag" in entry and entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if "last_modified" in entry and entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        try:
+            resp = requests.get(
+                url, headers=headers, timeout=WEB_REQUEST_TIMEOUT_SECONDS
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if cached_content is None:
+                raise
+            logger.warning(
+                f"Using previously-cached content for {url} because it could not be retrieved: {e}"
+            )
+            content = cached_content
+        else:
+            if resp.status_code == 304 and cached_content is not None:
+                content = cached_content
+            else:
+                resp.raise_for_status()
+                content = resp.content.decode("utf-8")
+                _store_cached_web_content(url, resp)
+
+    _web_content[url] = content
+    return content
 
 
 def _load_content_from_file_name(file_name: str) -> str:
@@ -185,14 +294,12 @@ def _jsonnet_import_callback(
         return file_name, json.dumps(dict_content).encode()
 
 
-def _load_dict_with_references_from_file_name(
-    file_name: str, context_file_name: str, cache: dict[str, dict] | None = None
-) -> tuple[dict, str]:
-    if cache is None:
-        cache = {}
+def _is_web_reference(file_name: str) -> bool:
+    return file_name.startswith(HTTP_PREFIX) or file_name.startswith(HTTPS_PREFIX)
 
-    base_file_name, anchor = _split_anchor(file_name)
 
+def _resolve_reference(base_file_name: str, context_file_name: str) -> str:
+    """Determine the absolute file name or URL of a reference (without anchor) appearing in the specified file."""
     if base_file_name.startswith(FILE_PREFIX):
         base_file_name = base_file_name[len(FILE_PREFIX) :]
     if (
@@ -209,8 +316,11 @@ def _load_dict_with_references_from_file_name(
             or base_file_name.lower().endswith(".jsonnet")
         ):
             # This is a relative file path; it should be relative to the context
-            root_path = os.path.dirname(context_file_name)
-            base_file_name = os.path.join(root_path, base_file_name)
+            if _is_web_reference(context_file_name):
+                base_file_name = urljoin(context_file_name, base_file_name)
+            else:
+                root_path = os.path.dirname(context_file_name)
+                base_file_name = os.path.join(root_path, base_file_name)
         else:
             # This is a package-based file path
             base_file_name = resolve_filename(base_file_name)
@@ -219,6 +329,44 @@ def _load_dict_with_references_from_file_name(
         HTTPS_PREFIX
     ):
         base_file_name = os.path.abspath(base_file_name)
+    return base_file_name
+
+
+def _prefetch_references(content: dict, context_file_name: str) -> None:
+    """Concurrently retrieve all web content referenced in content, in advance of resolving those references."""
+    urls = set()
+    for ref in _find_refs(content).values():
+        if ref.startswith("#"):
+            continue
+        try:
+            file_name = _resolve_reference(_split_anchor(ref)[0], context_file_name)
+        except NotImplementedError:
+            # This error will be raised when the reference is actually resolved
+            continue
+        if _is_web_reference(file_name) and file_name not in _web_content:
+            urls.add(file_name)
+    if len(urls) < 2:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(len(urls), PREFETCH_THREADS)) as executor:
+        futures = {url: executor.submit(_get_web_content, url) for url in urls}
+        for url, future in futures.items():
+            try:
+                future.result()
+            except (requests.RequestException, ValueError) as e:
+                # This error will be raised when the reference is actually resolved
+                logger.debug(f"Could not prefetch {url}: {e}")
+
+
+def _load_dict_with_references_from_file_name(
+    file_name: str, context_file_name: str, cache: dict[str, dict] | None = None
+) -> tuple[dict, str]:
+    if cache is None:
+        cache = {}
+
+    base_file_name, anchor = _split_anchor(file_name)
+
+    base_file_name = _resolve_reference(base_file_name, context_file_name)
 
     if base_file_name in cache:
         dict_content = cache[base_file_name]
@@ -243,6 +391,7 @@ def _load_dict_with_references_from_file_name(
                 f'Unable to parse data for "{base_file_name}" because its extension-based data format is not supported'
             )
 
+        _prefetch_references(dict_content, base_file_name)
         allof_paths = _identify_allofs(dict_content)
         ref_paths = _identify_refs(dict_content)
         _replace_refs(dict_content, base_file_name, ref_paths, allof_paths, cache)
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import cast
+
+import pytest
+
+from monitoring.uss_qualifier import fileio
+from monitoring.uss_qualifier.cache import CACHE_FOLDER_ENV
+from monitoring.uss_qualifier.fileio import (
+    OFFLINE_ENV,
+    load_content,
+    load_dict_with_references,
+)
+
+
+class _Server(ThreadingHTTPServer):
+    files: dict[str, bytes]
+    requests: list[tuple[str, int]]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = cast(_Server, self.server)
+        # Requests are recorded before responding so that they are visible to the client as soon as it gets a response
+        if self.path not in server.files:
+            server.requests.append((self.path, 404))
+            self.send_response(404)
+            self.end_headers()
+            return
+        content = server.files[self.path]
+        etag = f'"{hashlib.sha256(content).hexdigest()}"'
+        if self.headers.get("If-None-Match", None) == etag:
+            server.requests.append((self.path, 304))
+            self.send_response(304)
+            self.end_headers()
+            return
+        server.requests.append((self.path, 200))
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_FOLDER_ENV, str(tmp_path / "cache"))
+    monkeypatch.delenv(OFFLINE_ENV, raising=False)
+    monkeypatch.setattr(fileio, "_web_content", {})
+    httpd = _Server(("127.0.0.1", 0), _Handler)
+    httpd.files = {}
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server: _Server, path: str) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_web_content_revalidation(server, monkeypatch):
+    server.files["/a.json"] = b'{"a": 1}'
+    url = _url(server, "/a.json")
+
+    assert load_content(url) == '{"a": 1}'
+    assert load_content(url) == '{"a": 1}'
+    assert server.requests == [("/a.json", 200)]
+
+    # New process (simulated by clearing in-memory content) revalidates cached content
+    monkeypatch.setattr(fileio, "_web_content", {})
+    assert load_content(url) == '{"a": 1}'
+    assert server.requests[-1] == ("/a.json", 304)
+
+    # Changed content is retrieved again
+    monkeypatch.setattr(fileio, "_web_content", {})
+    server.files["/a.json"] = b'{"a": 2}'
+    assert load_content(url) == '{"a": 2}'
+    assert server.requests[-1] == ("/a.json", 200)
+
+
+def test_web_content_offline(server, monkeypatch):
+    server.files["/a.json"] = b'{"a": 1}'
+    url = _url(server, "/a.json")
+    load_content(url)
+    n_requests = len(server.requests)
+
+    monkeypatch.setattr(fileio, "_web_content", {})
+    monkeypatch.setenv(OFFLINE_ENV, "true")
+    assert load_content(url) == '{"a": 1}'
+    assert len(server.requests) == n_requests
+
+    with pytest.raises(ValueError):
+        load_content(_url(server, "/b.json"))
+
+
+def test_load_dict_with_web_references(server):
+    server.files["/root.json"] = json.dumps(
+        {
+            "b": {"$ref": "./b.json"},
+            "c": {"$ref": _url(server, "/c.json") + "#/inner"},
+            "d": {"$ref": "./c.json#/other"},
+        }
+    ).encode()
+    server.files["/b.json"] = b'{"value": "b"}'
+    server.files["/c.json"] = b'{"inner": {"value": "c"}, "other": {"value": "d"}}'
+
+    content = load_dict_with_references(_url(server, "/root.json"))
+
+    assert content == {
+        "b": {"value": "b"},
+        "c": {"value": "c"},
+        "d": {"value": "d"},
+    }
+    assert sorted(server.requests) == [
+        ("/b.json", 200),
+        ("/c.json", 200),
+        ("/root.json", 200),
+    ]
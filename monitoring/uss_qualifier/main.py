@@ -9,6 +9,7 @@ import yaml
 from implicitdict import ImplicitDict, Optional
 from loguru import logger
 
+from monitoring.monitorlib import clock
 from monitoring.monitorlib.dicts import get_element_or_default, remove_elements
 from monitoring.monitorlib.versioning import get_code_version, get_commit_hash
 from monitoring.uss_qualifier.configurations.configuration import (
@@ -23,6 +24,10 @@ from monitoring.uss_qualifier.reports.artifacts import (
     generate_artifacts,
 )
 from monitoring.uss_qualifier.reports.report import TestRunReport
+from monitoring.uss_qualifier.reports.report_stream import (
+    STREAMED_REPORT_FILE,
+    StreamedReportWriter,
+)
 from monitoring.uss_qualifier.reports.validation.report_validation import (
     validate_report,
 )
@@ -117,12 +122,21 @@ class TestDefinitionDescription(ImplicitDict):
 def execute_test_run(
     whole_config: USSQualifierConfiguration,
     description: TestDefinitionDescription,
+    report_writer: StreamedReportWriter | None = None,
 ):
     config = whole_config.v1.test_run
 
     if not config:
         raise ValueError("v1.test_run not defined in configuration")
 
+    if (
+        "execution" in config
+        and config.execution
+        and "clock" in config.execution
+        and config.execution.clock
+    ):
+        clock.configure(config.execution.clock)
+
     logger.info("Instantiating resources")
     stop_when_not_created = (
         "execution" in config
@@ -137,7 +151,9 @@ def execute_test_run(
     )
 
     logger.info("Instantiating top-level test suite action")
-    context = ExecutionContext(config.execution if "execution" in config else None)
+    context = ExecutionContext(
+        config.execution if "execution" in config else None, report_writer
+    )
     action = TestSuiteAction(config.action, resources)
     logger.info("Running top-level test suite action")
     report = action.run(context)
@@ -162,6 +178,7 @@ def raise_for_unredacted_information(config: USSQualifierConfiguration) -> None:
     required_values = {
         "v1.artifacts.globally_expanded_report.redact_access_tokens": True,
         "v1.artifacts.raw_report.redact_access_tokens": True,
+        "v1.artifacts.streamed_report.redact_access_tokens": True,
         "v1.artifacts.report_html.redact_access_tokens": True,
         "v1.artifacts.sequence_view.redact_access_tokens": True,
     }
@@ -231,6 +248,11 @@ def run_config(
         commit_hash=get_commit_hash(),
     )
     description.sign(whole_config)
+    if (
+        description.baseline_signature is None
+        or description.environment_signature is None
+    ):
+        raise RuntimeError("Test definition description was not signed")
     logger.info(
         "Test definition description:\n"
         + f"Codebase version: {description.codebase_version}\n"
@@ -254,7 +276,24 @@ def run_config(
         )
 
     logger.info("Executing test run")
-    report = execute_test_run(whole_config, description)
+    if config.artifacts and config.artifacts.streamed_report and output_path:
+        os.makedirs(output_path, exist_ok=True)
+        path = os.path.join(output_path, STREAMED_REPORT_FILE)
+        logger.info(f"Streaming report to {path}")
+        with StreamedReportWriter(
+            path, config.artifacts.streamed_report.redact_access_tokens
+        ) as report_writer:
+            report_writer.begin(
+                description.codebase_version,
+                description.commit_hash,
+                description.baseline_signature,
+                description.environment_signature,
+                whole_config,
+            )
+            report = execute_test_run(whole_config, description, report_writer)
+            report_writer.end(runtime_metadata)
+    else:
+        report = execute_test_run(whole_config, description)
 
     if runtime_metadata is not None:
         report.runtime_metadata = runtime_metadata
@@ -13,12 +13,16 @@ from monitoring.uss_qualifier.configurations.configuration import (
     USSQualifierConfiguration,
     USSQualifierConfigurationV1,
 )
-from monitoring.uss_qualifier.fileio import load_dict_with_references
+from monitoring.uss_qualifier.fileio import FILE_PREFIX, load_dict_with_references
 from monitoring.uss_qualifier.reports.artifacts import (
     default_output_path,
     generate_artifacts,
 )
 from monitoring.uss_qualifier.reports.report import TestRunReport
+from monitoring.uss_qualifier.reports.report_stream import (
+    StreamedReport,
+    is_streamed_report,
+)
 
 
 def parseArgs() -> argparse.Namespace:
@@ -34,7 +38,7 @@ def parseArgs() -> argparse.Namespace:
 
     parser.add_argument(
         "--report",
-        help="File name of the report to read; Several comma-separated file names matching the configurations may be specified",
+        help="File name of the report to read (either a raw report.json or a streamed report.jsonl); Several comma-separated file names matching the configurations may be specified",
         required=True,
     )
 
@@ -70,8 +74,11 @@ def main() -> int:
             f"========== Generating artifacts for configuration {config_name} and report {report_path} =========="
         )
 
-        report_src = load_dict_with_references(report_path)
-        report = ImplicitDict.parse(report_src, TestRunReport)
+        if is_streamed_report(report_path):
+            report = StreamedReport(report_path.removeprefix(FILE_PREFIX)).report()
+        else:
+            report_src = load_dict_with_references(report_path)
+            report = ImplicitDict.parse(report_src, TestRunReport)
 
         if config_name != config_in_report:
             config_src = load_dict_with_references(config_name)
@@ -79,6 +86,8 @@ def main() -> int:
         else:
             whole_config = report.configuration
 
+        if whole_config.v1 is None:
+            raise ValueError(f"Configuration {config_name} is not in v1 format")
         config: USSQualifierConfigurationV1 = whole_config.v1
         if config.artifacts:
             if args.output_path:
@@ -1,23 +1,17 @@
 import json
 import os
 
-from implicitdict import ImplicitDict
 from loguru import logger
 
 from monitoring.uss_qualifier.configurations.configuration import ArtifactsConfiguration
-from monitoring.uss_qualifier.reports.documents import make_report_html
-from monitoring.uss_qualifier.reports.globally_expanded.generate import (
-    generate_globally_expanded_report,
-)
-from monitoring.uss_qualifier.reports.report import TestRunReport, redact_access_tokens
-from monitoring.uss_qualifier.reports.sequence_view.generate import (
-    generate_sequence_view,
-)
-from monitoring.uss_qualifier.reports.templates import render_templates
-from monitoring.uss_qualifier.reports.tested_requirements.generate import (
-    generate_tested_requirements,
+from monitoring.uss_qualifier.reports.report import (
+    TestRunReport,
+    redacted_access_tokens,
 )
 
+# Note: artifact generators are imported only when the corresponding artifact is
+# requested as some of them (and their dependencies) are slow to import.
+
 
 def default_output_path(config_name: str) -> str:
     if config_name.lower().endswith(".yaml") or config_name.lower().endswith(".json"):
@@ -35,6 +29,12 @@ def generate_artifacts(
     output_path: str,
     disallow_unredacted: bool,
 ):
+    """Generate the configured artifacts for a report.
+
+    The redacted report provided to artifact generators shares all content
+    without access tokens with the original report, so artifact generators
+    must treat the report they are given as read-only.
+    """
     logger.debug(f"Writing artifacts to {os.path.abspath(output_path)}")
     os.makedirs(output_path, exist_ok=True)
 
@@ -47,8 +47,7 @@ def generate_artifacts(
         return result
 
     logger.info("Redacting access tokens from report")
-    redacted_report = ImplicitDict.parse(json.loads(json.dumps(report)), TestRunReport)
-    redact_access_tokens(redacted_report)
+    redacted_report = redacted_access_tokens(report)
 
     if artifacts.raw_report:
         # Raw report
@@ -64,6 +63,8 @@ def generate_artifacts(
 
     if artifacts.report_html:
         # HTML rendering of raw report
+        from monitoring.uss_qualifier.reports.documents import make_report_html
+
         path = os.path.join(output_path, "report.html")
         logger.info(f"Writing HTML report to {path}")
         report_to_write = (
@@ -74,6 +75,8 @@ def generate_artifacts(
 
     if artifacts.templated_reports:
         # Templated reports
+        from monitoring.uss_qualifier.reports.templates import render_templates
+
         render_templates(
             output_path,
             artifacts.templated_reports,
@@ -82,6 +85,10 @@ def generate_artifacts(
 
     if artifacts.tested_requirements:
         # Tested requirements view
+        from monitoring.uss_qualifier.reports.tested_requirements.generate import (
+            generate_tested_requirements,
+        )
+
         for tested_reqs_config in artifacts.tested_requirements:
             path = os.path.join(output_path, tested_reqs_config.report_name)
             logger.info(f"Writing tested requirements view to {path}")
@@ -89,6 +96,10 @@ def generate_artifacts(
 
     if artifacts.sequence_view:
         # Sequence view
+        from monitoring.uss_qualifier.reports.sequence_view.generate import (
+            generate_sequence_view,
+        )
+
         path = os.path.join(output_path, "sequence")
         logger.info(f"Writing sequence view to {path}")
         report_to_write = (
@@ -98,6 +109,10 @@ def generate_artifacts(
 
     if artifacts.globally_expanded_report:
         # Globally-expanded report
+        from monitoring.uss_qualifier.reports.globally_expanded.generate import (
+            generate_globally_expanded_report,
+        )
+
         path = os.path.join(output_path, "globally_expanded")
         logger.info(f"Writing globally-expanded report to {path}")
         report_to_write = (
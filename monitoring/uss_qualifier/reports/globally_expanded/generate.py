@@ -12,7 +12,7 @@ from monitoring.uss_qualifier.common_data_definitions import Severity
 from monitoring.uss_qualifier.configurations.configuration import (
     GloballyExpandedReportConfiguration,
 )
-from monitoring.uss_qualifier.documentation import text_of
+from monitoring.uss_qualifier.documentation import parse_markdown_file, text_of
 from monitoring.uss_qualifier.reports.report import TestRunReport
 from monitoring.uss_qualifier.reports.sequence_view.generate import (
     compute_action_node,
@@ -201,8 +201,7 @@ def _generate_skipped_scenario_section(node: ActionNode) -> _Section:
 
 def _generate_scenario_section(scenario: TestedScenario) -> _Section:
     doc_summary = get_documentation_by_name(scenario.type)
-    with open(doc_summary.local_path) as f:
-        doc = marko.parse(f.read())
+    doc = parse_markdown_file(doc_summary.local_path)
 
     _modify_scenario_documentation(
         doc, os.path.abspath(doc_summary.local_path), scenario
@@ -339,8 +338,7 @@ def _strip_link(element: marko.element.Element) -> None:
 def _get_test_step_fragment(
     absolute_path: str, parent_level: int
 ) -> marko.block.Document:
-    with open(absolute_path) as f:
-        doc = marko.parse(f.read())
+    doc = parse_markdown_file(absolute_path)
 
     _remove_top_heading(doc)
     _indent_headings(doc.children, parent_level - 1)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 from collections.abc import Callable, Iterator
 from datetime import UTC, datetime
 from typing import Any
@@ -758,18 +759,26 @@ class TestRunReport(ImplicitDict):
     """Metadata for the test run specified at runtime."""
 
 
+def _is_access_token(k: str, v: Any) -> bool:
+    return (
+        k.lower() == "authorization"
+        and isinstance(v, str)
+        and v.lower().startswith("bearer ")
+    )
+
+
+def _redact_access_token(v: str) -> str:
+    token_parts = v[len("bearer ") :].split(".")
+    token_parts[-1] = "REDACTED"
+    return v[0 : len("bearer ")] + ".".join(token_parts)
+
+
 def redact_access_tokens(report: dict[str, Any] | list) -> None:
     if isinstance(report, dict):
         changes = {}
         for k, v in report.items():
-            if (
-                k.lower() == "authorization"
-                and isinstance(v, str)
-                and v.lower().startswith("bearer ")
-            ):
-                token_parts = v[len("bearer ") :].split(".")
-                token_parts[-1] = "REDACTED"
-                changes[k] = v[0 : len("bearer ")] + ".".join(token_parts)
+            if _is_access_token(k, v):
+                changes[k] = _redact_access_token(v)
             elif isinstance(v, dict) or isinstance(v, list):
                 redact_access_tokens(v)
         for k, v in changes.items():
@@ -780,3 +789,41 @@ def redact_access_tokens(report: dict[str, Any] | list) -> None:
                 redact_access_tokens(item)
     else:
         raise ValueError(f"{type(report).__name__} is not a dict or list")
+
+
+def redacted_access_tokens[T: dict[str, Any] | list](report: T) -> T:
+    """Get a copy of report with access tokens redacted as by redact_access_tokens, leaving report unchanged.
+
+    Only the dicts and lists containing (at any depth) an access token are copied; all other content is shared with
+    report, so the copy of a large report requires little additional memory.  Consequently, neither report nor the copy
+    should be modified afterward.  If report contains no access tokens, report itself is returned.
+    """
+    if isinstance(report, dict):
+        changes = {}
+        for k, v in report.items():
+            if _is_access_token(k, v):
+                redacted = _redact_access_token(v)
+                if redacted != v:
+                    changes[k] = redacted
+            elif isinstance(v, dict) or isinstance(v, list):
+                redacted = redacted_access_tokens(v)
+                if redacted is not v:
+                    changes[k] = redacted
+        if not changes:
+            return report
+        result = copy.copy(report)
+        for k, v in changes.items():
+            result[k] = v
+        return result
+    elif isinstance(report, list):
+        result = None
+        for i, item in enumerate(report):
+            if isinstance(item, dict) or isinstance(item, list):
+                redacted = redacted_access_tokens(item)
+                if redacted is not item:
+                    if result is None:
+                        result = copy.copy(report)
+                    result[i] = redacted
+        return report if result is None else result
+    else:
+        raise ValueError(f"{type(report).__name__} is not a dict or list")
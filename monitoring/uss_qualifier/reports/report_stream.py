@@ -0,0 +1,306 @@
+import json
+import os
+from collections.abc import Iterator
+from typing import Any, BinaryIO, TextIO
+
+from implicitdict import ImplicitDict
+
+from monitoring.uss_qualifier.configurations.configuration import (
+    USSQualifierConfiguration,
+)
+from monitoring.uss_qualifier.reports.report import (
+    TestRunReport,
+    TestScenarioReport,
+    TestSuiteActionReport,
+    redacted_access_tokens,
+)
+
+STREAMED_REPORT_FILE = "report.jsonl"
+"""Name of the streamed report file written to the output path of a test run"""
+
+# A streamed report is a JSON Lines file where each line is a JSON object with
+# exactly one of the following keys:
+#   * "test_run": The fields of the TestRunReport other than `report` and
+#     `runtime_metadata`.  Always the first line.
+#   * "action": A TestSuiteActionReport whose test suite or action generator
+#     (if any) has had its `actions` removed, accompanied by a "children" key
+#     indicating how many child actions that test suite or action generator
+#     had.  Actions are written in the order they finish, so a parent's child
+#     actions always immediately precede it (recursively).
+#   * "end": Written after the top-level action finishes, optionally containing
+#     `runtime_metadata` for the TestRunReport.
+_TEST_RUN = "test_run"
+_ACTION = "action"
+_CHILDREN = "children"
+_END = "end"
+_COMPOSITE_ACTION_TYPES = ("test_suite", "action_generator")
+_ACTION_TYPES = _COMPOSITE_ACTION_TYPES + ("test_scenario", "skipped_action")
+
+
+class StreamedReportWriter:
+    """Writes a TestRunReport incrementally as each of its test suite actions finishes.
+
+    Every record is flushed as soon as it is written, so the results of all
+    actions completed before a crash are preserved.
+    """
+
+    def __init__(self, path: str, redact: bool):
+        self._path = path
+        self._redact = redact
+        self._file: TextIO | None = None
+
+    def __enter__(self) -> "StreamedReportWriter":
+        self._file = open(self._path, "w")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, record: dict[str, Any]) -> None:
+        if self._file is None:
+            raise RuntimeError(
+                f"Streamed report {self._path} must be opened before it can be written"
+            )
+        if self._redact:
+            record = redacted_access_tokens(record)
+        self._file.write(json.dumps(record, separators=(",", ":")))
+        self._file.write("\n")
+        self._file.flush()
+
+    def begin(
+        self,
+        codebase_version: str,
+        commit_hash: str,
+        baseline_signature: str,
+        environment_signature: str,
+        configuration: USSQualifierConfiguration,
+    ) -> None:
+        self._write(
+            {
+                _TEST_RUN: {
+                    "codebase_version": codebase_version,
+                    "commit_hash": commit_hash,
+                    "baseline_signature": baseline_signature,
+                    "environment_signature": environment_signature,
+                    "configuration": configuration,
+                }
+            }
+        )
+
+    def write_action(self, report: TestSuiteActionReport) -> None:
+        """Record a finished action.
+
+        All child actions of the finished action must already have been written.
+        """
+        action = {}
+        children = 0
+        for k, v in report.items():
+            if k in _COMPOSITE_ACTION_TYPES and v:
+                action[k] = {kk: vv for kk, vv in v.items() if kk != "actions"}
+                children = len(v.actions)
+            else:
+                action[k] = v
+        self._write({_ACTION: action, _CHILDREN: children})
+
+    def write_action_tree(self, report: TestSuiteActionReport) -> None:
+        """Record a finished action after recording all of its descendant actions."""
+        for k in _COMPOSITE_ACTION_TYPES:
+            if k in report and report[k]:
+                for child in report[k].actions:
+                    self.write_action_tree(child)
+        self.write_action(report)
+
+    def end(self, runtime_metadata: dict | None = None) -> None:
+        end = {}
+        if runtime_metadata is not None:
+            end["runtime_metadata"] = runtime_metadata
+        self._write({_END: end})
+
+
+def write_streamed_report(report: TestRunReport, path: str, redact: bool) -> None:
+    """Write a complete TestRunReport to a streamed report file."""
+
+    with StreamedReportWriter(path, redact) as writer:
+        writer.begin(
+            report.codebase_version,
+            report.commit_hash,
+            report.baseline_signature,
+            report.environment_signature,
+            report.configuration,
+        )
+        writer.write_action_tree(report.report)
+        writer.end(
+            report.runtime_metadata
+            if "runtime_metadata" in report and report.runtime_metadata
+            else None
+        )
+
+
+class StreamedAction:
+    """Location of an action in a streamed report, from which its report may be loaded on demand."""
+
+    def __init__(
+        self,
+        reader: "StreamedReport",
+        offset: int,
+        action_type: str,
+        children: list["StreamedAction"],
+    ):
+        self._reader = reader
+        self.offset = offset
+        """Position of this action's record in the streamed report file"""
+        self.action_type = action_type
+        """Type of this action (test_suite, test_scenario, action_generator, or skipped_action)"""
+        self.children = children
+        """Child actions of this action, if it is a test suite or action generator"""
+        self.first_offset = children[0].first_offset if children else offset
+        """Position of the first record of this action's descendants (or of this action's record, if it has none).
+
+        As actions are written in the order they finish, the records of this action and all of its descendants are
+        exactly the records from first_offset up to and including this action's record."""
+
+    def load(self) -> TestSuiteActionReport:
+        """Read the complete report for this action (including all descendants) from the file."""
+        with open(self._reader._path, "rb") as f:
+            return self._reader._load_action(f, self)
+
+
+class StreamedReport:
+    """Reader of a streamed report which loads the reports of individual actions only when requested.
+
+    Opening a streamed report reads through the whole file once, but only one
+    record at a time, retaining just the location of each action.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._test_run: dict = {}
+        self._end: dict | None = None
+        self._scenarios: list[StreamedAction] = []
+        self._pending: list[StreamedAction] = []
+
+        with open(path, "rb") as f:
+            offset = 0
+            for line in f:
+                line_offset = offset
+                offset += len(line)
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    if not line.endswith(b"\n"):
+                        # Final record was only partially written (e.g., crash)
+                        break
+                    raise ValueError(
+                        f"Invalid record at byte {line_offset} of streamed report {path}"
+                    )
+                self._index_record(record, line_offset)
+
+        if not self._test_run:
+            raise ValueError(f"Streamed report {path} is missing its test run record")
+
+    def _index_record(self, record: dict, offset: int) -> None:
+        if _TEST_RUN in record:
+            self._test_run = record[_TEST_RUN]
+        elif _ACTION in record:
+            action = record[_ACTION]
+            action_type = next((k for k in _ACTION_TYPES if action.get(k, None)), None)
+            if action_type is None:
+                raise ValueError(
+                    f"Action at byte {offset} of streamed report {self._path} does not have any of {', '.join(_ACTION_TYPES)}"
+                )
+            n_children = record.get(_CHILDREN, 0)
+            if n_children > len(self._pending):
+                raise ValueError(
+                    f"Action at byte {offset} of streamed report {self._path} has {n_children} children, but only {len(self._pending)} unclaimed actions precede it"
+                )
+            if n_children:
+                children = self._pending[-n_children:]
+                del self._pending[-n_children:]
+            else:
+                children = []
+            streamed_action = StreamedAction(self, offset, action_type, children)
+            self._pending.append(streamed_action)
+            if action_type == "test_scenario":
+                self._scenarios.append(streamed_action)
+        elif _END in record:
+            self._end = record[_END]
+        else:
+            raise ValueError(
+                f"Unrecognized record at byte {offset} of streamed report {self._path}"
+            )
+
+    def _load_action(
+        self, f: BinaryIO, action: StreamedAction
+    ) -> TestSuiteActionReport:
+        """Read the complete report for an action from the streamed report file open as f, in a single pass over the
+        records of the action and its descendants."""
+        f.seek(action.first_offset)
+        offset = action.first_offset
+        loaded: list[dict] = []
+        """Records of the actions read so far that have not yet been claimed by their parent."""
+        while offset <= action.offset:
+            line = f.readline()
+            record = json.loads(line)
+            offset += len(line)
+            content = record[_ACTION]
+            first_child = len(loaded) - record.get(_CHILDREN, 0)
+            for action_type in _COMPOSITE_ACTION_TYPES:
+                if content.get(action_type):
+                    content[action_type]["actions"] = loaded[first_child:]
+                    del loaded[first_child:]
+                    break
+            loaded.append(content)
+        if len(loaded) != 1:
+            raise ValueError(
+                f"Action at byte {action.offset} of streamed report {self._path} does not claim all {len(loaded)} actions preceding it"
+            )
+        return ImplicitDict.parse(loaded[0], TestSuiteActionReport)
+
+    @property
+    def complete(self) -> bool:
+        """True if the test run finished writing this report."""
+        return self._end is not None and len(self._pending) == 1
+
+    @property
+    def configuration(self) -> USSQualifierConfiguration:
+        return ImplicitDict.parse(
+            self._test_run["configuration"], USSQualifierConfiguration
+        )
+
+    @property
+    def completed_actions(self) -> list[StreamedAction]:
+        """Finished actions not contained in any other finished action.
+
+        For a complete report, this is only the top-level action.
+        """
+        return list(self._pending)
+
+    def scenario_reports(self) -> Iterator[TestScenarioReport]:
+        """Load the reports of all finished test scenarios, one at a time, in the order they finished."""
+        with open(self._path, "rb") as f:
+            for scenario in self._scenarios:
+                report = self._load_action(f, scenario)
+                if "test_scenario" in report and report.test_scenario:
+                    yield report.test_scenario
+
+    def report(self) -> TestRunReport:
+        """Load the entire TestRunReport.
+
+        Raises:
+            ValueError if the test run did not finish writing this report.
+        """
+        if not self.complete or self._end is None:
+            raise ValueError(
+                f"Streamed report {self._path} is incomplete; only {len(self._scenarios)} test scenarios were completed"
+            )
+        report = dict(self._test_run)
+        report["report"] = self._pending[0].load()
+        if "runtime_metadata" in self._end:
+            report["runtime_metadata"] = self._end["runtime_metadata"]
+        return ImplicitDict.parse(report, TestRunReport)
+
+
+def is_streamed_report(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() == ".jsonl"
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import os
+import time
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 from implicitdict import ImplicitDict
+from jinja2 import Template
 from loguru import logger
 
 from monitoring.monitorlib.errors import stacktrace_string
@@ -37,6 +41,7 @@ from monitoring.uss_qualifier.reports.sequence_view.summary_types import (
     OverviewRow,
     SkippedAction,
     SuiteCell,
+    TestedScenario,
 )
 from monitoring.uss_qualifier.reports.tested_requirements.generate import (
     compute_test_run_information,
@@ -221,46 +226,101 @@ def _enumerate_all_participants(node: ActionNode) -> list[ParticipantID]:
         return list(result)
 
 
+def _scenario_nodes(node: ActionNode) -> Iterator[ActionNode]:
+    if node.node_type == ActionNodeType.Scenario:
+        yield node
+    else:
+        for child in node.children:
+            yield from _scenario_nodes(child)
+
+
+_scenario_template: Template | None = None
+"""Compiled scenario page template for this process"""
+
+
+def _init_scenario_page_renderer() -> Template:
+    global _scenario_template
+    if _scenario_template is None:
+        _scenario_template = jinja_env.get_template("sequence_view/scenario.html")
+    return _scenario_template
+
+
+def _generate_scenario_page(
+    scenario: TestedScenario, render_kml: bool, output_path: str
+) -> float:
+    """Write the page (and KML, if requested) for one scenario.
+
+    Returns: Number of seconds spent generating the scenario's page and KML.
+    """
+    t0 = time.monotonic()
+    template = _init_scenario_page_renderer()
+    all_participants = list(scenario.participants)
+    all_participants.sort()
+    if UNATTRIBUTED_PARTICIPANT in all_participants:
+        all_participants.remove(UNATTRIBUTED_PARTICIPANT)
+        all_participants.append(UNATTRIBUTED_PARTICIPANT)
+    scenario_file = os.path.join(output_path, f"s{scenario.scenario_index}.html")
+    kml_file = f"./s{scenario.scenario_index}.kml"
+    with open(scenario_file, "w") as f:
+        f.write(
+            template.render(
+                test_scenario=scenario,
+                all_participants=all_participants,
+                kml_file=kml_file if render_kml else None,
+                EpochType=EpochType,
+                EventType=EventType,
+                UNATTRIBUTED_PARTICIPANT=UNATTRIBUTED_PARTICIPANT,
+                len=len,
+                str=str,
+                Severity=Severity,
+            )
+        )
+    if render_kml:
+        try:
+            kml_file = os.path.join(output_path, f"s{scenario.scenario_index}.kml")
+            with open(kml_file, "w") as f:
+                f.write(make_scenario_kml(scenario))
+        except (ValueError, KeyError, NotImplementedError) as e:
+            logger.error(f"Error generating {kml_file}:\n" + stacktrace_string(e))
+    return time.monotonic() - t0
+
+
 def _generate_scenario_pages(
     node: ActionNode, config: SequenceViewConfiguration, output_path: str
 ) -> None:
-    if node.node_type == ActionNodeType.Scenario:
-        all_participants = list(node.scenario.participants)
-        all_participants.sort()
-        if UNATTRIBUTED_PARTICIPANT in all_participants:
-            all_participants.remove(UNATTRIBUTED_PARTICIPANT)
-            all_participants.append(UNATTRIBUTED_PARTICIPANT)
-        scenario_file = os.path.join(
-            output_path, f"s{node.scenario.scenario_index}.html"
-        )
-        kml_file = f"./s{node.scenario.scenario_index}.kml"
-        template = jinja_env.get_template("sequence_view/scenario.html")
-        with open(scenario_file, "w") as f:
-            f.write(
-                template.render(
-                    test_scenario=node.scenario,
-                    all_participants=all_participants,
-                    kml_file=kml_file if config.render_kml else None,
-                    EpochType=EpochType,
-                    EventType=EventType,
-                    UNATTRIBUTED_PARTICIPANT=UNATTRIBUTED_PARTICIPANT,
-                    len=len,
-                    str=str,
-                    Severity=Severity,
+    scenarios = [n.scenario for n in _scenario_nodes(node) if n.scenario is not None]
+    if "render_processes" in config and config.render_processes is not None:
+        processes = min(config.render_processes, len(scenarios))
+    else:
+        # Do not start more processes than there are CPUs available to this process or scenarios to render
+        processes = min(os.process_cpu_count() or 1, len(scenarios))
+
+    t0 = time.monotonic()
+    render_kml = config.render_kml
+    if processes <= 1:
+        durations = [
+            _generate_scenario_page(scenario, render_kml, output_path)
+            for scenario in scenarios
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=processes, initializer=_init_scenario_page_renderer
+        ) as executor:
+            durations = list(
+                executor.map(
+                    _generate_scenario_page,
+                    scenarios,
+                    repeat(render_kml),
+                    repeat(output_path),
                 )
             )
-        if config.render_kml:
-            try:
-                kml_file = os.path.join(
-                    output_path, f"s{node.scenario.scenario_index}.kml"
-                )
-                with open(kml_file, "w") as f:
-                    f.write(make_scenario_kml(node.scenario))
-            except (ValueError, KeyError, NotImplementedError) as e:
-                logger.error(f"Error generating {kml_file}:\n" + stacktrace_string(e))
-    else:
-        for child in node.children:
-            _generate_scenario_pages(child, config, output_path)
+    for scenario, duration in zip(scenarios, durations):
+        logger.debug(
+            f"Generated sequence view page for scenario s{scenario.scenario_index} ({scenario.name}) in {duration:.2f}s"
+        )
+    logger.info(
+        f"Generated {len(scenarios)} sequence view scenario pages in {time.monotonic() - t0:.1f}s using {max(processes, 1)} process(es)"
+    )
 
 
 def make_resources_config(config: TestConfiguration) -> dict:
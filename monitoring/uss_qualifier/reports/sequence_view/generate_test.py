@@ -0,0 +1,109 @@
+import os
+
+from implicitdict import ImplicitDict
+
+from monitoring.uss_qualifier.configurations.configuration import (
+    SequenceViewConfiguration,
+)
+from monitoring.uss_qualifier.reports.report import (
+    TestScenarioReport as _TestScenarioReport,
+)
+from monitoring.uss_qualifier.reports.sequence_view.events import (
+    compute_tested_scenario,
+)
+from monitoring.uss_qualifier.reports.sequence_view.generate import (
+    _generate_scenario_pages,
+)
+from monitoring.uss_qualifier.reports.sequence_view.summary_types import (
+    ActionNode,
+    ActionNodeType,
+    Indexer,
+)
+
+
+def _scenario_report(name: str) -> _TestScenarioReport:
+    return ImplicitDict.parse(
+        {
+            "name": name,
+            "scenario_type": "scenarios.dev.NoOp",
+            "documentation_url": "",
+            "start_time": "2024-01-01T00:00:00Z",
+            "end_time": "2024-01-01T00:01:00Z",
+            "successful": False,
+            "cases": [
+                {
+                    "name": "Case",
+                    "documentation_url": "",
+                    "start_time": "2024-01-01T00:00:00Z",
+                    "steps": [
+                        {
+                            "name": "Step",
+                            "documentation_url": "",
+                            "start_time": "2024-01-01T00:00:10Z",
+                            "passed_checks": [
+                                {
+                                    "name": "Passed check",
+                                    "timestamp": "2024-01-01T00:00:20Z",
+                                    "requirements": [],
+                                    "participants": ["uss1"],
+                                }
+                            ],
+                            "failed_checks": [
+                                {
+                                    "name": "Failed check",
+                                    "documentation_url": "",
+                                    "timestamp": "2024-01-01T00:00:30Z",
+                                    "summary": f"{name} failed",
+                                    "details": "Details",
+                                    "requirements": [],
+                                    "severity": "High",
+                                    "participants": ["uss2"],
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ],
+        },
+        _TestScenarioReport,
+    )
+
+
+def _render(node: ActionNode, render_processes: int, output_path: str) -> dict:
+    os.makedirs(output_path)
+    _generate_scenario_pages(
+        node,
+        SequenceViewConfiguration(render_kml=False, render_processes=render_processes),
+        output_path,
+    )
+    pages = {}
+    for file_name in os.listdir(output_path):
+        with open(os.path.join(output_path, file_name)) as f:
+            pages[file_name] = f.read()
+    return pages
+
+
+def test_parallel_rendering_matches_serial(tmp_path):
+    indexer = Indexer()
+    node = ActionNode(
+        name="Suite",
+        node_type=ActionNodeType.Suite,
+        children=[
+            ActionNode(
+                name=f"Scenario {i}",
+                node_type=ActionNodeType.Scenario,
+                children=[],
+                scenario=compute_tested_scenario(
+                    _scenario_report(f"Scenario {i}"), indexer
+                ),
+            )
+            for i in range(4)
+        ],
+    )
+
+    serial = _render(node, 1, os.path.join(tmp_path, "serial"))
+    parallel = _render(node, 2, os.path.join(tmp_path, "parallel"))
+
+    assert sorted(parallel) == [f"s{i}.html" for i in range(1, 5)]
+    assert parallel == serial
+    assert "Scenario 3 failed" in parallel["s4.html"]
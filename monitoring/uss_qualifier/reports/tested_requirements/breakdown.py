@@ -1,4 +1,5 @@
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
+from typing import cast
 
 from implicitdict import ImplicitDict
 
@@ -42,10 +43,112 @@ from monitoring.uss_qualifier.suites.definitions import (
 )
 
 
+class TestedChecksIndex:
+    """Checks of a report, indexed by participant and requirement.
+
+    The report (and the test suite declarations of its configuration) are
+    walked only once, so breakdowns for many different sets of participants
+    can be built efficiently from the same index.
+    """
+
+    def __init__(self, report: TestRunReport):
+        self._report = report
+        self._checks: list[
+            tuple[
+                TestScenarioReport,
+                TestCaseReport | None,
+                TestStepReport,
+                PassedCheck | FailedCheck,
+            ]
+        ] = []
+        self._by_participant: dict[
+            ParticipantID, dict[RequirementID, list[tuple[int, int]]]
+        ] = {}
+        self._declared_scenarios: list[TestScenarioTypeName] | None = None
+        self._index_action_report(report.report)
+
+    def _index_action_report(self, action: TestSuiteActionReport) -> None:
+        if "test_scenario" in action and action.test_scenario:
+            self._index_scenario_report(action.test_scenario)
+        elif "test_suite" in action and action.test_suite:
+            for subaction in action.test_suite.actions:
+                self._index_action_report(subaction)
+        elif "action_generator" in action and action.action_generator:
+            for subaction in action.action_generator.actions:
+                self._index_action_report(subaction)
+        else:
+            pass  # Skipped action
+
+    def _index_scenario_report(self, scenario_report: TestScenarioReport) -> None:
+        steps: list[tuple[TestCaseReport | None, TestStepReport]] = []
+        for case in scenario_report.cases:
+            for step in case.steps:
+                steps.append((case, step))
+        if "cleanup" in scenario_report and scenario_report.cleanup:
+            steps.append((None, scenario_report.cleanup))
+
+        for case, step in steps:
+            for check in step.passed_checks + step.failed_checks:
+                check_index = len(self._checks)
+                self._checks.append((scenario_report, case, step, check))
+                for participant_id in set(check.participants):
+                    by_req = self._by_participant.setdefault(participant_id, {})
+                    for req_index, req_id in enumerate(check.requirements):
+                        by_req.setdefault(req_id, []).append((check_index, req_index))
+
+    def checks_for(
+        self,
+        participant_ids: Iterable[ParticipantID],
+        req_set: set[RequirementID] | None,
+    ) -> Iterator[
+        tuple[
+            TestScenarioReport,
+            TestCaseReport | None,
+            TestStepReport,
+            PassedCheck | FailedCheck,
+            RequirementID,
+        ]
+    ]:
+        """Iterate over checks involving any of the specified participants, in report order.
+
+        Args:
+            participant_ids: Participants at least one of which must be involved in the check.
+            req_set: If specified, only requirements in this set are included.
+
+        Returns: Each matching combination of check and requirement as
+            (scenario report, case report or None for cleanup, step report, check, requirement).
+        """
+        locations: set[tuple[int, int]] = set()
+        for participant_id in participant_ids:
+            by_req = self._by_participant.get(participant_id, {})
+            if req_set is None:
+                for req_locations in by_req.values():
+                    locations.update(req_locations)
+            else:
+                for req_id in req_set:
+                    locations.update(by_req.get(req_id, []))
+        for check_index, req_index in sorted(locations):
+            scenario_report, case, step, check = self._checks[check_index]
+            yield scenario_report, case, step, check, check.requirements[req_index]
+
+    @property
+    def declared_scenarios(self) -> list[TestScenarioTypeName]:
+        """Types of all scenarios that may be run according to the test run configuration, in declaration order."""
+        if self._declared_scenarios is None:
+            self._declared_scenarios = []
+            config = self._report.configuration.v1
+            if config is not None and config.test_run is not None:
+                _list_declared_scenarios(
+                    config.test_run.action, self._declared_scenarios
+                )
+        return self._declared_scenarios
+
+
 def make_breakdown(
     report: TestRunReport,
     participant_reqs: set[RequirementID] | None,
     participant_ids: Iterable[ParticipantID],
+    index: TestedChecksIndex | None = None,
 ) -> TestedBreakdown:
     """Break down a report into requirements tested for the specified participants.
 
@@ -53,186 +156,179 @@ def make_breakdown(
         report: Report to break down.
         participant_reqs: Set of requirements to report for these participants.  If None, defaults to everything.
         participant_ids: IDs of participants for which the breakdown is being computed.
+        index: Index of report's checks.  Should be provided when computing multiple breakdowns of the same report.
 
     Returns: TestedBreakdown for participants for report.
     """
+    if index is None:
+        index = TestedChecksIndex(report)
     participant_breakdown = TestedBreakdown(packages=[])
-    _populate_breakdown_with_action_report(
-        participant_breakdown, report.report, participant_ids, participant_reqs
-    )
-    _populate_breakdown_with_action_declaration(
-        participant_breakdown, report.configuration.v1.test_run.action, participant_reqs
+    builder = _BreakdownBuilder(participant_breakdown)
+    _populate_breakdown_with_checks(
+        builder, index.checks_for(participant_ids, participant_reqs)
     )
+    for scenario_type_name in index.declared_scenarios:
+        _populate_breakdown_with_scenario(builder, scenario_type_name, participant_reqs)
     if participant_reqs is not None:
-        _populate_breakdown_with_req_set(participant_breakdown, participant_reqs)
+        _populate_breakdown_with_req_set(builder, participant_reqs)
     sort_breakdown(participant_breakdown)
     return participant_breakdown
 
 
+class _BreakdownBuilder:
+    """Finds or adds the elements of a TestedBreakdown by key in constant time."""
+
+    def __init__(self, breakdown: TestedBreakdown):
+        self.breakdown = breakdown
+        self._elements: dict[tuple[int, str], ImplicitDict] = {}
+
+    def _find_or_add[T: ImplicitDict](
+        self, siblings: list[T], key: str, make: Callable[[], T]
+    ) -> T:
+        element_key = (id(siblings), key)
+        element = self._elements.get(element_key, None)
+        if element is None:
+            element = make()
+            siblings.append(element)
+            self._elements[element_key] = element
+        # Elements are only ever registered under the id of the list they were added to
+        return cast(T, element)
+
+    def requirement(
+        self, req_id: RequirementID, package_name: str | None = None
+    ) -> TestedRequirement:
+        """Find or add the requirement (and its package) in the breakdown.
+
+        Args:
+            req_id: Requirement to find or add.
+            package_name: Name of the package if it needs to be added.  Defaults to package ID.
+        """
+        package_id = req_id.package()
+        tested_package = self._find_or_add(
+            self.breakdown.packages,
+            package_id,
+            lambda: TestedPackage(
+                id=package_id,
+                url=repo_url_of(package_id.md_file_path()),
+                name=package_name or package_id,
+                requirements=[],
+            ),
+        )
+        short_req_id = req_id.split(".")[-1]
+        return self._find_or_add(
+            tested_package.requirements,
+            short_req_id,
+            lambda: TestedRequirement(id=short_req_id, scenarios=[]),
+        )
+
+    def scenario(
+        self,
+        tested_requirement: TestedRequirement,
+        scenario_type_name: TestScenarioTypeName,
+        name: str,
+        url: str,
+    ) -> TestedScenario:
+        return self._find_or_add(
+            tested_requirement.scenarios,
+            scenario_type_name,
+            lambda: TestedScenario(
+                type=scenario_type_name, name=name, url=url, cases=[]
+            ),
+        )
+
+    def case(self, tested_scenario: TestedScenario, name: str, url: str) -> TestedCase:
+        return self._find_or_add(
+            tested_scenario.cases,
+            name,
+            lambda: TestedCase(name=name, url=url, steps=[]),
+        )
+
+    def step(self, tested_case: TestedCase, name: str, url: str) -> TestedStep:
+        return self._find_or_add(
+            tested_case.steps,
+            name,
+            lambda: TestedStep(name=name, url=url, checks=[]),
+        )
+
+    def check(
+        self, tested_step: TestedStep, name: str, url: str, has_todo: bool
+    ) -> TestedCheck:
+        return self._find_or_add(
+            tested_step.checks,
+            name,
+            lambda: TestedCheck(name=name, url=url, has_todo=has_todo),
+        )
+
+
+def _package_name(req_id: RequirementID) -> str:
+    # TODO: Improve name of package by using title of page
+    return "<br>.".join(req_id.package().split("."))
+
+
 def _populate_breakdown_with_req_set(
-    breakdown: TestedBreakdown, req_set: set[RequirementID]
+    builder: _BreakdownBuilder, req_set: set[RequirementID]
 ) -> None:
     for req_id in req_set:
-        package_id = req_id.package()
-        matches = [p for p in breakdown.packages if p.id == package_id]
-        if matches:
-            tested_package = matches[0]
-        else:
-            url = repo_url_of(package_id.md_file_path())
-            tested_package = TestedPackage(
-                id=package_id, url=url, name=package_id, requirements=[]
-            )
-            breakdown.packages.append(tested_package)
-
-        short_req_id = req_id.split(".")[-1]
-        matches = [r for r in tested_package.requirements if r.id == short_req_id]
-        if matches:
-            tested_requirement = matches[0]
-        else:
-            tested_requirement = TestedRequirement(id=short_req_id, scenarios=[])
-            tested_package.requirements.append(tested_requirement)
+        builder.requirement(req_id)
 
 
-def _populate_breakdown_with_action_report(
-    breakdown: TestedBreakdown,
-    action: TestSuiteActionReport,
-    participant_ids: Iterable[ParticipantID],
-    req_set: set[RequirementID] | None,
+def _populate_breakdown_with_checks(
+    builder: _BreakdownBuilder,
+    checks: Iterable[
+        tuple[
+            TestScenarioReport,
+            TestCaseReport | None,
+            TestStepReport,
+            PassedCheck | FailedCheck,
+            RequirementID,
+        ]
+    ],
 ) -> None:
-    test_suite, test_scenario, action_generator = action.get_applicable_report()
-    if test_scenario:
-        return _populate_breakdown_with_scenario_report(
-            breakdown, action.test_scenario, participant_ids, req_set
+    for scenario_report, case, step, check, req_id in checks:
+        tested_requirement = builder.requirement(req_id, _package_name(req_id))
+        tested_scenario = builder.scenario(
+            tested_requirement,
+            scenario_report.scenario_type,
+            scenario_report.name,
+            scenario_report.documentation_url,
         )
-    elif test_suite:
-        for subaction in action.test_suite.actions:
-            _populate_breakdown_with_action_report(
-                breakdown, subaction, participant_ids, req_set
+        if case:
+            tested_case = builder.case(
+                tested_scenario, case.name, case.documentation_url
             )
-    elif action_generator:
-        for subaction in action.action_generator.actions:
-            _populate_breakdown_with_action_report(
-                breakdown, subaction, participant_ids, req_set
+        else:
+            tested_case = builder.case(
+                tested_scenario, "Cleanup", step.documentation_url
             )
-    else:
-        pass  # Skipped action
+        tested_step = builder.step(tested_case, step.name, step.documentation_url)
+        # TODO: Consider populating has_todo with documentation instead
+        tested_check = builder.check(
+            tested_step,
+            check.name,
+            check.documentation_url if isinstance(check, FailedCheck) else "",
+            False,
+        )
+        if isinstance(check, PassedCheck):
+            tested_check.successes += 1
+        elif isinstance(check, FailedCheck):
+            if check.severity == Severity.Low:
+                tested_check.findings += 1
+            else:
+                tested_check.failures += 1
+        else:
+            raise ValueError("Check is neither PassedCheck nor FailedCheck")
 
 
-def _populate_breakdown_with_scenario_report(
-    breakdown: TestedBreakdown,
-    scenario_report: TestScenarioReport,
-    participant_ids: Iterable[ParticipantID],
-    req_set: set[RequirementID] | None,
-) -> None:
-    scenario_type_name = scenario_report.scenario_type
-    steps: list[tuple[TestCaseReport | None, TestStepReport]] = []
-    for case in scenario_report.cases:
-        for step in case.steps:
-            steps.append((case, step))
-    if "cleanup" in scenario_report and scenario_report.cleanup:
-        steps.append((None, scenario_report.cleanup))
-
-    for case, step in steps:
-        for check in step.passed_checks + step.failed_checks:
-            if not any(pid in check.participants for pid in participant_ids):
-                continue
-            for req_id in check.requirements:
-                if req_set is not None and req_id not in req_set:
-                    continue
-                package_id = req_id.package()
-                package_name = "<br>.".join(package_id.split("."))
-                matches = [p for p in breakdown.packages if p.id == package_id]
-                if matches:
-                    tested_package = matches[0]
-                else:
-                    # TODO: Improve name of package by using title of page
-                    url = repo_url_of(package_id.md_file_path())
-                    tested_package = TestedPackage(
-                        id=package_id, url=url, name=package_name, requirements=[]
-                    )
-                    breakdown.packages.append(tested_package)
-
-                short_req_id = req_id.split(".")[-1]
-                matches = [
-                    r for r in tested_package.requirements if r.id == short_req_id
-                ]
-                if matches:
-                    tested_requirement = matches[0]
-                else:
-                    tested_requirement = TestedRequirement(
-                        id=short_req_id, scenarios=[]
-                    )
-                    tested_package.requirements.append(tested_requirement)
-
-                matches = [
-                    s
-                    for s in tested_requirement.scenarios
-                    if s.type == scenario_type_name
-                ]
-                if matches:
-                    tested_scenario = matches[0]
-                else:
-                    tested_scenario = TestedScenario(
-                        type=scenario_type_name,
-                        name=scenario_report.name,
-                        url=scenario_report.documentation_url,
-                        cases=[],
-                    )
-                    tested_requirement.scenarios.append(tested_scenario)
-
-                if case:
-                    case_name = case.name
-                    case_url = case.documentation_url
-                else:
-                    case_name = "Cleanup"
-                    case_url = step.documentation_url
-                matches = [c for c in tested_scenario.cases if c.name == case_name]
-                if matches:
-                    tested_case = matches[0]
-                else:
-                    tested_case = TestedCase(name=case_name, url=case_url, steps=[])
-                    tested_scenario.cases.append(tested_case)
-
-                matches = [s for s in tested_case.steps if s.name == step.name]
-                if matches:
-                    tested_step = matches[0]
-                else:
-                    tested_step = TestedStep(
-                        name=step.name, url=step.documentation_url, checks=[]
-                    )
-                    tested_case.steps.append(tested_step)
-
-                matches = [c for c in tested_step.checks if c.name == check.name]
-                if matches:
-                    tested_check = matches[0]
-                else:
-                    tested_check = TestedCheck(
-                        name=check.name, url="", has_todo=False
-                    )  # TODO: Consider populating has_todo with documentation instead
-                    if isinstance(check, FailedCheck):
-                        tested_check.url = check.documentation_url
-                    tested_step.checks.append(tested_check)
-                if isinstance(check, PassedCheck):
-                    tested_check.successes += 1
-                elif isinstance(check, FailedCheck):
-                    if check.severity == Severity.Low:
-                        tested_check.findings += 1
-                    else:
-                        tested_check.failures += 1
-                else:
-                    raise ValueError("Check is neither PassedCheck nor FailedCheck")
-
-
-def _populate_breakdown_with_action_declaration(
-    breakdown: TestedBreakdown,
+def _list_declared_scenarios(
     action: TestSuiteActionDeclaration | PotentialGeneratedAction,
-    req_set: set[RequirementID] | None,
+    scenario_types: list[TestScenarioTypeName],
 ) -> None:
     action_type = action.get_action_type()
     if action_type == ActionType.TestScenario:
-        _populate_breakdown_with_scenario(
-            breakdown, action.test_scenario.scenario_type, req_set
-        )
+        if not action.test_scenario:
+            raise ValueError("Test scenario action missing scenario declaration")
+        if action.test_scenario.scenario_type not in scenario_types:
+            scenario_types.append(action.test_scenario.scenario_type)
     elif action_type == ActionType.TestSuite:
         if "suite_type" in action.test_suite and action.test_suite.suite_type:
             suite_def: TestSuiteDefinition = ImplicitDict.parse(
@@ -240,13 +336,13 @@ def _populate_breakdown_with_action_declaration(
                 TestSuiteDefinition,
             )
             for a in suite_def.actions:
-                _populate_breakdown_with_action_declaration(breakdown, a, req_set)
+                _list_declared_scenarios(a, scenario_types)
         elif (
             "suite_definition" in action.test_suite
             and action.test_suite.suite_definition
         ):
             for a in action.test_suite.suite_definition.actions:
-                _populate_breakdown_with_action_declaration(breakdown, a, req_set)
+                _list_declared_scenarios(a, scenario_types)
         else:
             raise ValueError("Test suite action missing suite type or definition")
     elif action_type == ActionType.ActionGenerator:
@@ -254,13 +350,13 @@ def _populate_breakdown_with_action_declaration(
             action.action_generator
         )
         for a in potential_actions:
-            _populate_breakdown_with_action_declaration(breakdown, a, req_set)
+            _list_declared_scenarios(a, scenario_types)
     else:
         raise NotImplementedError(f"Unsupported test suite action type: {action_type}")
 
 
 def _populate_breakdown_with_scenario(
-    breakdown: TestedBreakdown,
+    builder: _BreakdownBuilder,
     scenario_type_name: TestScenarioTypeName,
     req_set: set[RequirementID] | None,
 ) -> None:
@@ -272,70 +368,21 @@ def _populate_breakdown_with_scenario(
                 for req_id in check.applicable_requirements:
                     if req_set is not None and req_id not in req_set:
                         continue
-                    package_id = req_id.package()
-                    package_name = "<br>.".join(package_id.split("."))
-                    matches = [p for p in breakdown.packages if p.id == package_id]
-                    if matches:
-                        tested_package = matches[0]
-                    else:
-                        # TODO: Improve name of package by using title of page
-                        url = repo_url_of(package_id.md_file_path())
-                        tested_package = TestedPackage(
-                            id=package_id, url=url, name=package_name, requirements=[]
-                        )
-                        breakdown.packages.append(tested_package)
-
-                    short_req_id = req_id.split(".")[-1]
-                    matches = [
-                        r for r in tested_package.requirements if r.id == short_req_id
-                    ]
-                    if matches:
-                        tested_requirement = matches[0]
-                    else:
-                        tested_requirement = TestedRequirement(
-                            id=short_req_id, scenarios=[]
-                        )
-                        tested_package.requirements.append(tested_requirement)
-
-                    matches = [
-                        s
-                        for s in tested_requirement.scenarios
-                        if s.type == scenario_type_name
-                    ]
-                    if matches:
-                        tested_scenario = matches[0]
-                    else:
-                        tested_scenario = TestedScenario(
-                            type=scenario_type_name,
-                            name=scenario_doc.name,
-                            url=scenario_doc.url,
-                            cases=[],
-                        )
-                        tested_requirement.scenarios.append(tested_scenario)
-
-                    matches = [c for c in tested_scenario.cases if c.name == case.name]
-                    if matches:
-                        tested_case = matches[0]
-                    else:
-                        tested_case = TestedCase(name=case.name, url=case.url, steps=[])
-                        tested_scenario.cases.append(tested_case)
-
-                    matches = [s for s in tested_case.steps if s.name == step.name]
-                    if matches:
-                        tested_step = matches[0]
-                    else:
-                        tested_step = TestedStep(
-                            name=step.name, url=step.url, checks=[]
-                        )
-                        tested_case.steps.append(tested_step)
-
-                    matches = [c for c in tested_step.checks if c.name == check.name]
-                    if matches:
-                        tested_check = matches[0]
-                    else:
-                        tested_check = TestedCheck(
-                            name=check.name, url=check.url, has_todo=check.has_todo
-                        )
-                        tested_step.checks.append(tested_check)
-                    if not tested_check.url:
+                    tested_requirement = builder.requirement(
+                        req_id, _package_name(req_id)
+                    )
+                    tested_scenario = builder.scenario(
+                        tested_requirement,
+                        scenario_type_name,
+                        scenario_doc.name,
+                        scenario_doc.url or "",
+                    )
+                    tested_case = builder.case(
+                        tested_scenario, case.name, case.url or ""
+                    )
+                    tested_step = builder.step(tested_case, step.name, step.url or "")
+                    tested_check = builder.check(
+                        tested_step, check.name, check.url or "", check.has_todo
+                    )
+                    if not tested_check.url and check.url:
                         tested_check.url = check.url
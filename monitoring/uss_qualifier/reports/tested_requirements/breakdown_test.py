@@ -0,0 +1,353 @@
+import json
+from collections.abc import Callable, Iterable
+
+from implicitdict import ImplicitDict
+
+from monitoring.monitorlib.versioning import repo_url_of
+from monitoring.uss_qualifier.common_data_definitions import Severity
+from monitoring.uss_qualifier.configurations.configuration import ParticipantID
+from monitoring.uss_qualifier.reports.report import FailedCheck, PassedCheck
+from monitoring.uss_qualifier.reports.report import TestCaseReport as _TestCaseReport
+from monitoring.uss_qualifier.reports.report import TestRunReport as _TestRunReport
+from monitoring.uss_qualifier.reports.report import (
+    TestScenarioReport as _TestScenarioReport,
+)
+from monitoring.uss_qualifier.reports.report import TestStepReport as _TestStepReport
+from monitoring.uss_qualifier.reports.tested_requirements.breakdown import (
+    TestedChecksIndex as _TestedChecksIndex,
+)
+from monitoring.uss_qualifier.reports.tested_requirements.breakdown import (
+    make_breakdown,
+)
+from monitoring.uss_qualifier.reports.tested_requirements.data_types import (
+    TestedBreakdown as _TestedBreakdown,
+)
+from monitoring.uss_qualifier.reports.tested_requirements.data_types import (
+    TestedCase as _TestedCase,
+)
+from monitoring.uss_qualifier.reports.tested_requirements.data_types import (
+    TestedCheck as _TestedCheck,
+)
+from monitoring.uss_qualifier.reports.tested_requirements.data_types import (
+    TestedPackage as _TestedPackage,
+)
+from monitoring.uss_qualifier.reports.tested_requirements.data_types import (
+    TestedRequirement as _TestedRequirement,
+)
+from monitoring.uss_qualifier.reports.tested_requirements.data_types import (
+    TestedScenario as _TestedScenario,
+)
+from monitoring.uss_qualifier.reports.tested_requirements.data_types import (
+    TestedStep as _TestedStep,
+)
+from monitoring.uss_qualifier.reports.tested_requirements.sorting import sort_breakdown
+from monitoring.uss_qualifier.requirements.definitions import RequirementID
+from monitoring.uss_qualifier.scenarios.documentation.parsing import get_documentation
+from monitoring.uss_qualifier.scenarios.scenario import get_scenario_type_by_name
+
+TIMESTAMP = "2024-01-01T00:00:00Z"
+
+RUN_SCENARIOS = [
+    "scenarios.astm.utm.FlightIntentValidation",
+    "scenarios.astm.netrid.v22a.NominalBehavior",
+    "scenarios.astm.utm.FlightIntentValidation",
+]
+"""Scenarios run in the report (FlightIntentValidation twice)."""
+
+DECLARED_SCENARIOS = [
+    "scenarios.astm.utm.FlightIntentValidation",
+    "scenarios.astm.netrid.v22a.NominalBehavior",
+    "scenarios.astm.utm.ConflictHigherPriority",
+    "scenarios.dev.NoOp",
+]
+"""Scenarios declared in the configuration of the report (ConflictHigherPriority and NoOp are not run)."""
+
+PARTICIPANTS = [["uss1"], ["uss2"], ["uss1", "uss2"], ["uss1", "uss1"]]
+
+
+def _make_report() -> _TestRunReport:
+    """Make a report of the scenarios above in which the checks documented for each scenario are performed, with
+    varying participants and outcomes."""
+    n = 0
+    actions = []
+    for s, scenario_type_name in enumerate(RUN_SCENARIOS):
+        doc = get_documentation(get_scenario_type_by_name(scenario_type_name))
+        steps: list[tuple[str, _TestStepReport]] = []
+        for case in doc.cases:
+            for step in case.steps:
+                passed_checks = []
+                failed_checks = []
+                for check in step.checks:
+                    n += 1
+                    participants = PARTICIPANTS[(n + s) % len(PARTICIPANTS)]
+                    if n % 3 == 0:
+                        passed_checks.append(
+                            PassedCheck(
+                                name=check.name,
+                                timestamp=TIMESTAMP,
+                                requirements=check.applicable_requirements,
+                                participants=participants,
+                            )
+                        )
+                    else:
+                        failed_checks.append(
+                            FailedCheck(
+                                name=check.name,
+                                documentation_url=check.url or "",
+                                timestamp=TIMESTAMP,
+                                summary="Summary",
+                                details="Details",
+                                requirements=check.applicable_requirements,
+                                severity=Severity.Low if n % 3 == 1 else Severity.High,
+                                participants=participants,
+                            )
+                        )
+                steps.append(
+                    (
+                        case.name,
+                        _TestStepReport(
+                            name=step.name,
+                            documentation_url=step.url or "",
+                            start_time=TIMESTAMP,
+                            failed_checks=failed_checks,
+                            passed_checks=passed_checks,
+                        ),
+                    )
+                )
+        cases = []
+        for case in doc.cases:
+            cases.append(
+                _TestCaseReport(
+                    name=case.name,
+                    documentation_url=case.url or "",
+                    start_time=TIMESTAMP,
+                    steps=[step for case_name, step in steps if case_name == case.name],
+                )
+            )
+        scenario_report = {
+            "name": doc.name,
+            "scenario_type": scenario_type_name,
+            "documentation_url": doc.url,
+            "start_time": TIMESTAMP,
+            "successful": False,
+            "cases": cases,
+        }
+        if s == 0:
+            # Perform the checks of the first step again during cleanup
+            scenario_report["cleanup"] = steps[0][1]
+        actions.append({"test_scenario": scenario_report})
+
+    return ImplicitDict.parse(
+        {
+            "codebase_version": "v0.0.0",
+            "commit_hash": "0" * 40,
+            "baseline_signature": "",
+            "environment_signature": "",
+            "configuration": {
+                "v1": {
+                    "test_run": {
+                        "resources": {"resource_declarations": {}},
+                        "action": {
+                            "test_suite": {
+                                "suite_definition": {
+                                    "name": "Breakdown test",
+                                    "resources": {},
+                                    "actions": [
+                                        {"test_scenario": {"scenario_type": t}}
+                                        for t in DECLARED_SCENARIOS
+                                    ],
+                                },
+                            }
+                        },
+                    }
+                }
+            },
+            "report": {
+                "test_suite": {
+                    "name": "Breakdown test",
+                    "documentation_url": "",
+                    "suite_type": "",
+                    "start_time": TIMESTAMP,
+                    "actions": actions,
+                    "capability_evaluations": [],
+                    "successful": False,
+                }
+            },
+        },
+        _TestRunReport,
+    )
+
+
+def _scenario_reports(report: _TestRunReport) -> list[_TestScenarioReport]:
+    assert report.report.test_suite is not None
+    reports = []
+    for action in report.report.test_suite.actions:
+        assert action.test_scenario is not None
+        reports.append(action.test_scenario)
+    return reports
+
+
+def _get_or_add[T](
+    siblings: list[T], matches: Callable[[T], bool], make: Callable[[], T]
+) -> T:
+    for element in siblings:
+        if matches(element):
+            return element
+    element = make()
+    siblings.append(element)
+    return element
+
+
+def _reference_breakdown(
+    report: _TestRunReport,
+    req_set: set[RequirementID] | None,
+    participant_ids: list[ParticipantID],
+) -> _TestedBreakdown:
+    """Break down report like make_breakdown did before checks were indexed, by walking the report and searching the
+    breakdown linearly for each check."""
+    breakdown = _TestedBreakdown(packages=[])
+
+    def requirement(req_id: RequirementID, package_name: str) -> _TestedRequirement:
+        package_id = req_id.package()
+        tested_package = _get_or_add(
+            breakdown.packages,
+            lambda p: p.id == package_id,
+            lambda: _TestedPackage(
+                id=package_id,
+                url=repo_url_of(package_id.md_file_path()),
+                name=package_name,
+                requirements=[],
+            ),
+        )
+        short_req_id = req_id.split(".")[-1]
+        return _get_or_add(
+            tested_package.requirements,
+            lambda r: r.id == short_req_id,
+            lambda: _TestedRequirement(id=short_req_id, scenarios=[]),
+        )
+
+    def descend(
+        tested_requirement: _TestedRequirement,
+        scenario: tuple[str, str, str],
+        case: tuple[str, str],
+        step: tuple[str, str],
+        check: tuple[str, str, bool],
+    ) -> _TestedCheck:
+        tested_scenario = _get_or_add(
+            tested_requirement.scenarios,
+            lambda s: s.type == scenario[0],
+            lambda: _TestedScenario(
+                type=scenario[0], name=scenario[1], url=scenario[2], cases=[]
+            ),
+        )
+        tested_case = _get_or_add(
+            tested_scenario.cases,
+            lambda c: c.name == case[0],
+            lambda: _TestedCase(name=case[0], url=case[1], steps=[]),
+        )
+        tested_step = _get_or_add(
+            tested_case.steps,
+            lambda s: s.name == step[0],
+            lambda: _TestedStep(name=step[0], url=step[1], checks=[]),
+        )
+        return _get_or_add(
+            tested_step.checks,
+            lambda c: c.name == check[0],
+            lambda: _TestedCheck(name=check[0], url=check[1], has_todo=check[2]),
+        )
+
+    # Checks performed in the report
+    for scenario_report in _scenario_reports(report):
+        steps: list[tuple[_TestCaseReport | None, _TestStepReport]] = [
+            (case, step) for case in scenario_report.cases for step in case.steps
+        ]
+        if "cleanup" in scenario_report and scenario_report.cleanup:
+            steps.append((None, scenario_report.cleanup))
+        for case, step in steps:
+            for check in step.passed_checks + step.failed_checks:
+                if not any(pid in check.participants for pid in participant_ids):
+                    continue
+                for req_id in check.requirements:
+                    if req_set is not None and req_id not in req_set:
+                        continue
+                    tested_check = descend(
+                        requirement(req_id, "<br>.".join(req_id.package().split("."))),
+                        (
+                            scenario_report.scenario_type,
+                            scenario_report.name,
+                            scenario_report.documentation_url,
+                        ),
+                        (case.name, case.documentation_url)
+                        if case
+                        else ("Cleanup", step.documentation_url),
+                        (step.name, step.documentation_url),
+                        (
+                            check.name,
+                            check.documentation_url
+                            if isinstance(check, FailedCheck)
+                            else "",
+                            False,
+                        ),
+                    )
+                    if isinstance(check, PassedCheck):
+                        tested_check.successes += 1
+                    elif check.severity == Severity.Low:
+                        tested_check.findings += 1
+                    else:
+                        tested_check.failures += 1
+
+    # Checks documented for declared scenarios
+    for scenario_type_name in dict.fromkeys(DECLARED_SCENARIOS):
+        doc = get_documentation(get_scenario_type_by_name(scenario_type_name))
+        for case in doc.cases:
+            for step in case.steps:
+                for check in step.checks:
+                    for req_id in check.applicable_requirements:
+                        if req_set is not None and req_id not in req_set:
+                            continue
+                        tested_check = descend(
+                            requirement(
+                                req_id, "<br>.".join(req_id.package().split("."))
+                            ),
+                            (scenario_type_name, doc.name, doc.url or ""),
+                            (case.name, case.url or ""),
+                            (step.name, step.url or ""),
+                            (check.name, check.url or "", check.has_todo),
+                        )
+                        if not tested_check.url and check.url:
+                            tested_check.url = check.url
+
+    # Requirements in the requirement set
+    if req_set is not None:
+        for req_id in req_set:
+            requirement(req_id, req_id.package())
+
+    sort_breakdown(breakdown)
+    return breakdown
+
+
+def _req_sets(report: _TestRunReport) -> Iterable[set[RequirementID] | None]:
+    yield None
+    req_ids = sorted(
+        {
+            req_id
+            for scenario_report in _scenario_reports(report)
+            for case in scenario_report.cases
+            for step in case.steps
+            for check in step.passed_checks + step.failed_checks
+            for req_id in check.requirements
+        }
+    )
+    # Every other requirement checked in the report, and a requirement never checked
+    yield set(req_ids[::2]) | {RequirementID("astm.f3548.v21.NotARequirement")}
+
+
+def test_breakdown_matches_reference():
+    report = _make_report()
+    index = _TestedChecksIndex(report)
+    for req_set in _req_sets(report):
+        for participant_ids in (["uss1"], ["uss2"], ["uss1", "uss2"], ["uss3"]):
+            expected = _reference_breakdown(report, req_set, participant_ids)
+            assert expected.packages
+            actual = make_breakdown(report, req_set, participant_ids, index)
+            assert json.dumps(actual) == json.dumps(expected)
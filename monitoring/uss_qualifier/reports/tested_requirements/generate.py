@@ -12,6 +12,7 @@ from monitoring.uss_qualifier.configurations.configuration import (
 from monitoring.uss_qualifier.reports import jinja_env
 from monitoring.uss_qualifier.reports.report import TestRunReport
 from monitoring.uss_qualifier.reports.tested_requirements.breakdown import (
+    TestedChecksIndex,
     make_breakdown,
 )
 from monitoring.uss_qualifier.reports.tested_requirements.data_types import (
@@ -107,6 +108,7 @@ def generate_tested_requirements(
     template = jinja_env.get_template(
         "tested_requirements/participant_tested_requirements.html"
     )
+    checks_index = TestedChecksIndex(report)
     for participant_id, req_set in participant_req_collections.items():
         if (
             "aggregate_participants" in config
@@ -116,7 +118,9 @@ def generate_tested_requirements(
             matching_participants = config.aggregate_participants[participant_id]
         else:
             matching_participants = [participant_id]
-        participant_breakdown = make_breakdown(report, req_set, matching_participants)
+        participant_breakdown = make_breakdown(
+            report, req_set, matching_participants, checks_index
+        )
         overall_status = compute_overall_status(participant_breakdown)
         system_version = get_system_version(
             find_participant_system_versions(report.report, matching_participants)
@@ -5,7 +5,7 @@ import marko.element
 import marko.inline
 from implicitdict import ImplicitDict
 
-from monitoring.uss_qualifier.documentation import text_of
+from monitoring.uss_qualifier.documentation import parse_markdown_file, text_of
 from monitoring.uss_qualifier.requirements.definitions import (
     PackageID,
     RequirementCollection,
@@ -46,8 +46,7 @@ def _load_requirement(requirement_id: RequirementID) -> None:
         raise ValueError(
             f'Could not load requirement "{requirement_id}" because the file "{md_filename}" does not exist'
         )
-    with open(md_filename) as f:
-        doc = marko.parse(f.read())
+    doc = parse_markdown_file(md_filename)
     _verify_requirements(doc, requirement_id.package())
     if requirement_id not in _verified_requirements:
         raise ValueError(
@@ -120,8 +119,7 @@ def _load_requirement_set(requirement_set_id: RequirementSetID) -> RequirementSe
         raise ValueError(
             f'Could not load requirement set "{requirement_set_id}" because the file "{md_filename}" does not exist'
         )
-    with open(md_filename) as f:
-        doc = marko.parse(f.read())
+    doc = parse_markdown_file(md_filename)
 
     # Extract the file-level name from the first top-level header
     if (
@@ -1,8 +1,15 @@
 import copy
+import functools
+import hashlib
+import importlib.metadata
+import inspect
+import io
 import json
+import pickle
 import uuid
-from datetime import timedelta
-from typing import Self
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any, Self
 
 import arrow
 from implicitdict import ImplicitDict, Optional, StringBasedDateTime
@@ -11,11 +18,21 @@ from uas_standards.interuss.automated_testing.rid.v1.injection import (
     TestFlightDetails,
 )
 
+from monitoring.monitorlib import clock
+from monitoring.monitorlib.kml import parsing as kml_parsing
+from monitoring.monitorlib.rid_automated_testing import telemetry
 from monitoring.monitorlib.rid_automated_testing.injection_api import TestFlight
+from monitoring.uss_qualifier.cache import load_cached, store_cached
 from monitoring.uss_qualifier.resources.files import load_content, load_dict
 from monitoring.uss_qualifier.resources.netrid.flight_data import (
     FlightDataSpecification,
     FlightRecordCollection,
+    FullFlightRecord,
+)
+from monitoring.uss_qualifier.resources.netrid.simulation import (
+    adjacent_circular_flights_simulator,
+    kml_flights,
+    operator_flight_details,
 )
 from monitoring.uss_qualifier.resources.netrid.simulation.adjacent_circular_flights_simulator import (
     generate_aircraft_states,
@@ -25,6 +42,142 @@ from monitoring.uss_qualifier.resources.netrid.simulation.kml_flights import (
 )
 from monitoring.uss_qualifier.resources.resource import Resource
 
+FLIGHT_DATA_CACHE = "flight_data"
+"""Cache category for pickled FlightRecordCollections loaded or generated from FlightDataSpecifications.
+
+Collections are pickled rather than stored in a compact memory-mapped format (such as the columns of TelemetryArrays)
+because FlightDataResource users need every state materialized as a RIDAircraftState: building those objects
+dominates load time whichever format they are read from, and unpickling (with timestamps restored unparsed) builds
+them fastest.  Pickles are only loaded from private cache entries (see load_cached).
+"""
+
+_flight_collections: dict[str, bytes] = {}
+"""Pickled FlightRecordCollections, by cache key"""
+
+_GENERATOR_MODULES = [
+    adjacent_circular_flights_simulator,
+    kml_flights,
+    kml_parsing,
+    operator_flight_details,
+    telemetry,
+]
+"""Modules whose code determines the content of generated flight data"""
+
+_GENERATOR_DISTRIBUTIONS = [
+    "implicitdict",
+    "numpy",
+    "pyproj",
+    "s2sphere",
+    "shapely",
+    "uas_standards",
+]
+"""Packages whose versions determine the content (or pickled representation) of generated flight data"""
+
+
+@functools.cache
+def _generator_version() -> str:
+    """Hash of everything other than the FlightDataSpecification that determines the content of a flight collection."""
+    h = hashlib.sha256()
+    # This module determines the pickled representation of flight collections
+    for path in [__file__] + [inspect.getfile(module) for module in _GENERATOR_MODULES]:
+        with open(path, "rb") as f:
+            h.update(f.read())
+    for distribution in _GENERATOR_DISTRIBUTIONS:
+        h.update(
+            f"{distribution} {importlib.metadata.version(distribution)}\n".encode()
+        )
+    return h.hexdigest()
+
+
+def _restore_date_time(value: str, t: datetime) -> StringBasedDateTime:
+    """Equivalent to StringBasedDateTime(value) without parsing value again, which dominates the time to unpickle."""
+    result = str.__new__(StringBasedDateTime, value)
+    result.datetime = t
+    return result
+
+
+def _restore_implicit_dict[T: ImplicitDict](
+    implicit_dict_type: type[T], values: dict
+) -> T:
+    # ImplicitDict subclasses must be constructed for their fields to be accessible as attributes
+    return implicit_dict_type(values)
+
+
+class _FlightCollectionPickler(pickle.Pickler):
+    def reducer_override(self, obj: object, /) -> Any:
+        if isinstance(obj, StringBasedDateTime):
+            return _restore_date_time, (str(obj), obj.datetime)
+        if isinstance(obj, ImplicitDict):
+            return _restore_implicit_dict, (type(obj), dict(obj))
+        return NotImplemented
+
+
+def _pickle_flight_collection(flight_collection: FlightRecordCollection) -> bytes:
+    f = io.BytesIO()
+    _FlightCollectionPickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump(
+        flight_collection
+    )
+    return f.getvalue()
+
+
+def _load_flight_collection(
+    specification: FlightDataSpecification,
+) -> FlightRecordCollection:
+    """Load or generate the flight collection described by the specification.
+
+    Flight collections are cached (in memory and on disk) by hash of their
+    source content, so the same flight data is only actually loaded or
+    generated the first time it is encountered, even across runs.  On-disk
+    entries are only loaded if no other user could have written them.  Flight
+    data generated without a random seed is different every time and is
+    therefore not cached.
+
+    Returns: Newly-constructed FlightRecordCollection which may be freely modified by the caller.
+    """
+    if "record_source" in specification and specification.record_source is not None:
+        source_type = "record_source"
+        record = load_dict(specification.record_source)
+        source = json.dumps(record, sort_keys=True)
+        generate = functools.partial(ImplicitDict.parse, record, FlightRecordCollection)
+    elif (
+        "adjacent_circular_flights_simulation_source" in specification
+        and specification.adjacent_circular_flights_simulation_source is not None
+    ):
+        source_type = "adjacent_circular_flights_simulation_source"
+        config = specification.adjacent_circular_flights_simulation_source
+        source = json.dumps(config, sort_keys=True)
+        generate = functools.partial(generate_aircraft_states, config)
+        if config.random_seed is None:
+            return generate()
+    elif "kml_source" in specification and specification.kml_source is not None:
+        source_type = "kml_source"
+        kml_content = load_content(specification.kml_source.kml_file)
+        reference_time = specification.kml_source.reference_time.datetime
+        random_seed = specification.kml_source.random_seed
+        source = f"{reference_time.isoformat()}\n{random_seed}\n{kml_content}"
+        generate = functools.partial(
+            get_flight_records, kml_content, reference_time, random_seed
+        )
+        if random_seed is None:
+            return generate()
+    else:
+        raise ValueError(
+            "A source of flight data was not identified in the specification for a FlightDataSpecification:\n"
+            + json.dumps(specification, indent=2)
+        )
+
+    key = hashlib.sha256(
+        f"{_generator_version()}\n{source_type}\n{source}".encode()
+    ).hexdigest()
+    if key not in _flight_collections:
+        # Pickles may execute arbitrary code when loaded, so only load those that no other user could have written
+        pickled = load_cached(FLIGHT_DATA_CACHE, key, private=True)
+        if pickled is None:
+            pickled = _pickle_flight_collection(generate())
+            store_cached(FLIGHT_DATA_CACHE, key, pickled)
+        _flight_collections[key] = pickled
+    return pickle.loads(_flight_collections[key])
+
 
 class FlightDataResource(Resource[FlightDataSpecification]):
     _flight_start_delay: timedelta
@@ -35,33 +188,13 @@ class FlightDataResource(Resource[FlightDataSpecification]):
 
     def __init__(self, specification: FlightDataSpecification, resource_origin: str):
         super().__init__(specification, resource_origin)
-        if "record_source" in specification:
-            self.flight_collection = ImplicitDict.parse(
-                load_dict(specification.record_source),
-                FlightRecordCollection,
-            )
-        elif "adjacent_circular_flights_simulation_source" in specification:
-            self.flight_collection = generate_aircraft_states(
-                specification.adjacent_circular_flights_simulation_source
-            )
-        elif "kml_source" in specification:
-            kml_content = load_content(specification.kml_source.kml_file)
-            self.flight_collection = get_flight_records(
-                kml_content,
-                specification.kml_source.reference_time.datetime,
-                specification.kml_source.random_seed,
-            )
-        else:
-            raise ValueError(
-                "A source of flight data was not identified in the specification for a FlightDataSpecification:\n"
-                + json.dumps(specification, indent=2)
-            )
+        self.flight_collection = _load_flight_collection(specification)
         self._flight_start_delay = specification.flight_start_delay.timedelta
 
         self._validate_flights()
 
     def get_test_flights(self) -> list[TestFlight]:
-        t0 = arrow.utcnow() + self._flight_start_delay
+        t0 = arrow.get(clock.now()) + self._flight_start_delay
 
         test_flights: list[TestFlight] = []
 
@@ -121,16 +254,17 @@ class FlightDataResource(Resource[FlightDataSpecification]):
 
         Intended to be used for simulating the disconnection of a networked UAS.
         """
-        self_copy = copy.deepcopy(self)
-        for flight in self_copy.flight_collection.flights:
+
+        def states_within_duration(flight: FullFlightRecord) -> list[RIDAircraftState]:
             latest_allowed_end = flight.reference_time.datetime + duration
             # Keep only the states within the allowed duration
-            flight.states = [
+            return [
                 state
                 for state in flight.states
                 if state.timestamp.datetime <= latest_allowed_end
             ]
-        return self_copy
+
+        return self._copy_with_states(states_within_duration)
 
     def truncate_flights_field(self, field_name: str) -> Self:
         """
@@ -142,7 +276,7 @@ class FlightDataResource(Resource[FlightDataSpecification]):
 
         Intended to be used for simulating missing field scenario.
         """
-        self_copy = copy.deepcopy(self)
+        self_copy = copy.copy(self)
         self_copy._field_to_clean = field_name  # Cleanup is done in get_test_flights
 
         return self_copy
@@ -155,7 +289,7 @@ class FlightDataResource(Resource[FlightDataSpecification]):
 
         Intended to be used for having the boundaries of the flight's span available before injection.
         """
-        self_copy = copy.deepcopy(self)
+        self_copy = copy.copy(self)
 
         flights = self_copy.get_test_flights()
 
@@ -176,9 +310,22 @@ class FlightDataResource(Resource[FlightDataSpecification]):
 
         Intended to be used for simulating slow updates from a networked UAS.
         """
-        self_copy = copy.deepcopy(self)
-        for flight in self_copy.flight_collection.flights:
-            flight.states = flight.states[::n]
+        return self._copy_with_states(lambda flight: flight.states[::n])
+
+    def _copy_with_states(
+        self, select_states: Callable[[FullFlightRecord], list[RIDAircraftState]]
+    ) -> Self:
+        """Copy this resource, replacing the states of each flight with the states selected from that flight.
+
+        States are shared with the original instance rather than copied; they are not modified by this resource.
+        """
+        self_copy = copy.copy(self)
+        self_copy.flight_collection = FlightRecordCollection(
+            flights=[
+                FullFlightRecord(flight, states=select_states(flight))
+                for flight in self.flight_collection.flights
+            ]
+        )
         return self_copy
 
     def _validate_flights(self):
@@ -1,13 +1,19 @@
+import os
+import pickle
+
 import pytest
 
+from monitoring.uss_qualifier.cache import CACHE_FOLDER_ENV
 from monitoring.uss_qualifier.resources.files import ExternalFile
+from monitoring.uss_qualifier.resources.netrid import flight_data_resources
 
 from .flight_data import (
     AdjacentCircularFlightsSimulatorConfiguration,
     FlightDataKMLFileConfiguration,
     FlightDataSpecification,
+    FlightRecordCollection,
 )
-from .flight_data_resources import FlightDataResource
+from .flight_data_resources import FLIGHT_DATA_CACHE, FlightDataResource
 
 
 def test_unknown_type():
@@ -70,3 +76,72 @@ def test_adjacent_circular_flights_simuation_source():
         adjacent_circular_flights_simulation_source=AdjacentCircularFlightsSimulatorConfiguration()
     )
     FlightDataResource(specs, "test")
+
+
+def _fail_to_generate(*args, **kwargs):
+    raise AssertionError("Flight data was generated again instead of loaded from cache")
+
+
+def test_cached_flight_data(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_FOLDER_ENV, str(tmp_path / "cache"))
+    monkeypatch.setattr(flight_data_resources, "_flight_collections", {})
+    specs = FlightDataSpecification(
+        kml_source=FlightDataKMLFileConfiguration(
+            kml_file=ExternalFile(path="file://./test_data/che/rid/zurich.kml")
+        )
+    )
+
+    generated = FlightDataResource(specs, "test")
+    assert len(os.listdir(tmp_path / "cache" / FLIGHT_DATA_CACHE)) == 1
+
+    # A new process (simulated by clearing the in-memory cache) uses the on-disk cache
+    monkeypatch.setattr(flight_data_resources, "_flight_collections", {})
+    monkeypatch.setattr(flight_data_resources, "get_flight_records", _fail_to_generate)
+    loaded = FlightDataResource(specs, "test")
+    assert loaded.flight_collection == generated.flight_collection
+    state = loaded.flight_collection.flights[0].states[0]
+    generated_state = generated.flight_collection.flights[0].states[0]
+    assert state.timestamp is not None and generated_state.timestamp is not None
+    assert state.timestamp.datetime == generated_state.timestamp.datetime
+
+    # Each resource has independent flight data, and transformations do not affect the original
+    truncated = loaded.drop_every_n_state(2)
+    loaded.flight_collection.flights[0].states.clear()
+    assert generated.flight_collection.flights[0].states
+    assert (
+        len(truncated.flight_collection.flights[1].states)
+        == (len(generated.flight_collection.flights[1].states) + 1) // 2
+    )
+    assert len(loaded.flight_collection.flights[1].states) == len(
+        generated.flight_collection.flights[1].states
+    )
+
+
+def test_untrusted_cached_flight_data_is_not_loaded(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_FOLDER_ENV, str(tmp_path / "cache"))
+    specs = FlightDataSpecification(
+        kml_source=FlightDataKMLFileConfiguration(
+            kml_file=ExternalFile(path="file://./test_data/che/rid/zurich.kml")
+        )
+    )
+    monkeypatch.setattr(flight_data_resources, "_flight_collections", {})
+    FlightDataResource(specs, "test")
+    folder = tmp_path / "cache" / FLIGHT_DATA_CACHE
+    (entry,) = folder.iterdir()
+
+    def load_planted(entry_mode: int, folder_mode: int) -> FlightDataResource:
+        # Replace the cache entry with one that would be loaded as a collection without flights
+        entry.write_bytes(pickle.dumps(FlightRecordCollection(flights=[])))
+        entry.chmod(entry_mode)
+        folder.chmod(folder_mode)
+        monkeypatch.setattr(flight_data_resources, "_flight_collections", {})
+        try:
+            return FlightDataResource(specs, "test")
+        finally:
+            folder.chmod(0o700)
+
+    # Entries in a file or folder other users could have written are never unpickled
+    assert load_planted(0o606, 0o700).flight_collection.flights
+    assert load_planted(0o620, 0o700).flight_collection.flights
+    assert load_planted(0o600, 0o770).flight_collection.flights
+    assert not load_planted(0o600, 0o700).flight_collection.flights
@@ -1,13 +1,15 @@
 import random
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 
 import arrow
+import numpy as np
 import shapely.geometry
 from implicitdict import ImplicitDict
 from pyproj import Geod, Proj, Transformer
 from shapely.geometry import Point, Polygon
 from uas_standards.interuss.automated_testing.rid.v1 import injection
 
+from monitoring.monitorlib.rid_automated_testing.telemetry import TelemetryArrays
 from monitoring.uss_qualifier.resources.netrid.flight_data import (
     AdjacentCircularFlightsSimulatorConfiguration,
     FlightRecordCollection,
@@ -207,30 +209,24 @@ class AdjacentCircularFlightsSimulator:
             altitude = (
                 altitude_of_ground_level_wgs_84 + self.altitude_agl
             )  # meters WGS 84
-            flight_points_with_altitude = []
-            x, y = buffered_path.exterior.coords.xy
-
-            for coord in range(0, len(x)):
-                cur_coord = coord
-                next_coord = coord + 1
-                next_coord = 0 if next_coord == len(x) else next_coord
-                adjacent_points = [
-                    Point(x[cur_coord], y[cur_coord]),
-                    Point(x[next_coord], y[next_coord]),
-                ]
-                flight_speed, bearing = self.generate_flight_speed_bearing(
-                    adjacent_points=adjacent_points, delta_time_secs=1
+            x, y = (np.asarray(c) for c in buffered_path.exterior.coords.xy)
+            # Each point is traversed to the next point on the circular track in one second
+            fwd_azimuths, _, distances_mts = self.geod.inv(
+                x, y, np.roll(x, -1), np.roll(y, -1)
+            )
+            bearings = np.where(fwd_azimuths < 0, 360 + fwd_azimuths, fwd_azimuths)
+            flight_points_with_altitude = [
+                FlightPoint(
+                    lat=lat,
+                    lng=lng,
+                    alt=altitude,
+                    speed=float(f"{distance:.2f}"),
+                    bearing=bearing,
                 )
-
-                flight_points_with_altitude.append(
-                    FlightPoint(
-                        lat=y[coord],
-                        lng=x[coord],
-                        alt=altitude,
-                        speed=flight_speed,
-                        bearing=bearing,
-                    )
+                for lat, lng, distance, bearing in zip(
+                    y.tolist(), x.tolist(), distances_mts.tolist(), bearings.tolist()
                 )
+            ]
 
             all_grid_cell_tracks.append(
                 GridCellFlight(bounds=grid_cell, track=flight_points_with_altitude)
@@ -264,85 +260,61 @@ class AdjacentCircularFlightsSimulator:
 
 
         """
-        all_flight_telemetry: list[list[injection.RIDAircraftState]] = []
-        flight_track_details = {}  # Develop a index of flight length and their index
-        # Store where on the track the current index is, since the tracks are circular, once the end of the track is reached, the index is reset to 0 to indicate beginning of the track again.
-        flight_current_index = {}
-        # Get the number of flights
-        num_flights = len(self.grid_cells_flight_tracks)
+        # Each second, every aircraft moves to the next point on its circular track.  The last point of a track is the
+        # same as its first point, so no state is reported for the second during which an aircraft returns there.
         time_increment_seconds = 1  # the number of seconds it takes to go from one point to next on the track
         now = self.reference_time
-        now_isoformat = now.isoformat()
-        for i in range(num_flights):
-            flight_positions_len = len(self.grid_cells_flight_tracks[i].track)
-
-            # in a circular flight pattern increment direction
-            angle_increment = 360 / flight_positions_len
-
-            # the resolution of track is 1 degree minimum
-            angle_increment = 1.0 if angle_increment == 0.0 else angle_increment
-
-            if i not in flight_track_details:
-                flight_track_details[i] = {}
-            flight_track_details[i]["track_length"] = flight_positions_len
-            flight_current_index[i] = 0
-            all_flight_telemetry.append([])
-
-        timestamp = now
-        for j in range(duration):
-            timestamp = timestamp.shift(seconds=time_increment_seconds)
-
-            for k in range(num_flights):
-                timestamp_isoformat = timestamp.shift(
-                    seconds=k * self.flight_start_shift_time
-                ).isoformat()
-                list_end = (
-                    flight_track_details[k]["track_length"] - flight_current_index[k]
-                )
-
-                if list_end != 1:
-                    flight_point = self.grid_cells_flight_tracks[k].track[
-                        flight_current_index[k]
-                    ]
-                    aircraft_position = injection.RIDAircraftPosition(
-                        lat=flight_point.lat,
-                        lng=flight_point.lng,
-                        alt=flight_point.alt,
-                        accuracy_h=injection.HorizontalAccuracy.HAUnknown,
-                        accuracy_v=injection.VerticalAccuracy.VAUnknown,
-                        extrapolated=False,
-                    )
-                    aircraft_height = injection.RIDHeight(
-                        distance=self.altitude_agl, reference="TakeoffLocation"
-                    )
-
-                    rid_aircraft_state = injection.RIDAircraftState(
-                        timestamp=timestamp_isoformat,
-                        operational_status="Airborne",
-                        position=aircraft_position,
-                        height=aircraft_height,
-                        track=flight_point.bearing,
-                        speed=flight_point.speed,
-                        timestamp_accuracy=0.0,
-                        speed_accuracy="SA3mps",
-                        vertical_speed=0.0,
-                    )
-
-                    all_flight_telemetry[k].append(rid_aircraft_state)
-
-                    flight_current_index[k] += 1
-                else:
-                    flight_current_index[k] = 0
+        now_us = (now.datetime - datetime(1970, 1, 1, tzinfo=UTC)) // timedelta(
+            microseconds=1
+        )
+        steps = np.arange(duration)
+        extra = {
+            "operational_status": "Airborne",
+            "position": {
+                "accuracy_h": injection.HorizontalAccuracy.HAUnknown,
+                "accuracy_v": injection.VerticalAccuracy.VAUnknown,
+                "extrapolated": False,
+            },
+            "height": {"distance": self.altitude_agl, "reference": "TakeoffLocation"},
+            "timestamp_accuracy": 0.0,
+            "speed_accuracy": "SA3mps",
+        }
 
         flights = []
-        for m in range(num_flights):
-            flight = FullFlightRecord(
-                reference_time=now_isoformat,
-                states=all_flight_telemetry[m],
-                flight_details=self.generate_flight_details(id=str(m)),
-                aircraft_type="Helicopter",
+        for k, grid_cell_flight in enumerate(self.grid_cells_flight_tracks):
+            track = grid_cell_flight.track
+            track_indices = steps % len(track)
+            reported = track_indices != len(track) - 1
+            track_indices = track_indices[reported]
+            timestamps_us = (
+                now_us
+                + (
+                    (steps[reported] + 1) * time_increment_seconds
+                    + k * self.flight_start_shift_time
+                )
+                * 1000000
+            )
+            points = np.array(
+                [(p.lat, p.lng, p.alt, p.speed, p.bearing) for p in track]
+            )[track_indices]
+            telemetry = TelemetryArrays.from_columns(
+                timestamps_us,
+                lats=points[:, 0],
+                lngs=points[:, 1],
+                alts=points[:, 2],
+                speeds=points[:, 3],
+                tracks=points[:, 4],
+                vertical_speeds=0.0,
+                extra=extra,
+            )
+            flights.append(
+                FullFlightRecord(
+                    reference_time=now.isoformat(),
+                    states=telemetry.to_states(),
+                    flight_details=self.generate_flight_details(id=str(k)),
+                    aircraft_type="Helicopter",
+                )
             )
-            flights.append(flight)
         self.flights = flights
 
 
@@ -0,0 +1,130 @@
+from implicitdict import StringBasedDateTime
+from shapely.geometry import Point
+from uas_standards.interuss.automated_testing.rid.v1 import injection
+
+from monitoring.uss_qualifier.resources.netrid.flight_data import (
+    AdjacentCircularFlightsSimulatorConfiguration,
+)
+from monitoring.uss_qualifier.resources.netrid.simulation.adjacent_circular_flights_simulator import (
+    AdjacentCircularFlightsSimulator,
+)
+from monitoring.uss_qualifier.resources.netrid.simulation.utils import FlightPoint
+
+DURATION = 150
+"""Duration of the generated flights, in seconds (long enough for each aircraft to go around its track twice)."""
+
+
+def _make_simulator() -> AdjacentCircularFlightsSimulator:
+    config = AdjacentCircularFlightsSimulatorConfiguration(
+        random_seed=42, flight_start_shift=5
+    )
+    simulator = AdjacentCircularFlightsSimulator(config)
+    simulator.generate_flight_grid_and_path_points(
+        altitude_of_ground_level_wgs_84=config.altitude_of_ground_level_wgs_84
+    )
+    simulator.generate_query_bboxes()
+    return simulator
+
+
+def _reference_tracks(
+    simulator: AdjacentCircularFlightsSimulator,
+) -> list[list[FlightPoint]]:
+    """Points of each grid cell's track computed point by point, as they were before generation was vectorized."""
+    tracks = []
+    for grid_cell_flight in simulator.grid_cells_flight_tracks:
+        x = [p.lng for p in grid_cell_flight.track]
+        y = [p.lat for p in grid_cell_flight.track]
+        track = []
+        for coord in range(len(x)):
+            next_coord = coord + 1
+            next_coord = 0 if next_coord == len(x) else next_coord
+            flight_speed, bearing = simulator.generate_flight_speed_bearing(
+                adjacent_points=[
+                    Point(x[coord], y[coord]),
+                    Point(x[next_coord], y[next_coord]),
+                ],
+                delta_time_secs=1,
+            )
+            track.append(
+                FlightPoint(
+                    lat=y[coord],
+                    lng=x[coord],
+                    alt=grid_cell_flight.track[coord].alt,
+                    speed=flight_speed,
+                    bearing=bearing,
+                )
+            )
+        tracks.append(track)
+    return tracks
+
+
+def _reference_states(
+    simulator: AdjacentCircularFlightsSimulator,
+    tracks: list[list[FlightPoint]],
+    duration: int,
+) -> list[list[injection.RIDAircraftState]]:
+    """States of each flight generated second by second, as they were before generation was vectorized."""
+    all_flight_telemetry: list[list[injection.RIDAircraftState]] = [[] for _ in tracks]
+    flight_current_index = [0 for _ in tracks]
+    timestamp = simulator.reference_time
+    for _ in range(duration):
+        timestamp = timestamp.shift(seconds=1)
+        for k, track in enumerate(tracks):
+            if len(track) - flight_current_index[k] != 1:
+                flight_point = track[flight_current_index[k]]
+                all_flight_telemetry[k].append(
+                    injection.RIDAircraftState(
+                        timestamp=timestamp.shift(
+                            seconds=k * simulator.flight_start_shift_time
+                        ).isoformat(),
+                        operational_status="Airborne",
+                        position=injection.RIDAircraftPosition(
+                            lat=flight_point.lat,
+                            lng=flight_point.lng,
+                            alt=flight_point.alt,
+                            accuracy_h=injection.HorizontalAccuracy.HAUnknown,
+                            accuracy_v=injection.VerticalAccuracy.VAUnknown,
+                            extrapolated=False,
+                        ),
+                        height=injection.RIDHeight(
+                            distance=simulator.altitude_agl,
+                            reference="TakeoffLocation",
+                        ),
+                        track=flight_point.bearing,
+                        speed=flight_point.speed,
+                        timestamp_accuracy=0.0,
+                        speed_accuracy="SA3mps",
+                        vertical_speed=0.0,
+                    )
+                )
+                flight_current_index[k] += 1
+            else:
+                flight_current_index[k] = 0
+    return all_flight_telemetry
+
+
+def test_generation_matches_reference():
+    simulator = _make_simulator()
+    reference_simulator = _make_simulator()
+
+    tracks = _reference_tracks(reference_simulator)
+    for grid_cell_flight, expected_track in zip(
+        simulator.grid_cells_flight_tracks, tracks
+    ):
+        assert grid_cell_flight.track == expected_track
+
+    simulator.generate_rid_state(duration=DURATION)
+    expected_flights = _reference_states(reference_simulator, tracks, DURATION)
+    assert len(simulator.flights) == len(expected_flights)
+    for flight, expected_states in zip(simulator.flights, expected_flights):
+        assert len(flight.states) == len(expected_states)
+        assert len(flight.states) < DURATION
+        for state, expected in zip(flight.states, expected_states):
+            assert state.timestamp is not None and expected.timestamp is not None
+            assert (
+                state.timestamp.datetime
+                == StringBasedDateTime(expected.timestamp).datetime
+            )
+            assert {k: v for k, v in state.items() if k != "timestamp"} == {
+                k: v for k, v in expected.items() if k != "timestamp"
+            }
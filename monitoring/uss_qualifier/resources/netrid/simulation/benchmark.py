@@ -0,0 +1,118 @@
+"""Measure the time taken to generate simulated RID flight data at scale.
+
+By default, this generates 300 circular flights lasting one hour each with one
+state per second, converts them to injection objects, and interpolates the
+altitude of every generated position from altitude polygons; for example:
+
+    python -m monitoring.uss_qualifier.resources.netrid.simulation.benchmark --flights 300 --duration 3600
+
+Flight records may also be generated from a KML file to measure that path:
+
+    python -m monitoring.uss_qualifier.resources.netrid.simulation.benchmark \\
+        --kml monitoring/uss_qualifier/test_data/usa/netrid/dcdemo.kml
+"""
+
+import argparse
+import time
+from datetime import UTC, datetime
+
+import numpy as np
+from shapely.geometry import Polygon
+
+from monitoring.uss_qualifier.resources.netrid.flight_data import (
+    AdjacentCircularFlightsSimulatorConfiguration,
+)
+from monitoring.uss_qualifier.resources.netrid.simulation.adjacent_circular_flights_simulator import (
+    AdjacentCircularFlightsSimulator,
+)
+from monitoring.uss_qualifier.resources.netrid.simulation.kml_flights import (
+    get_flight_records,
+    get_interpolated_values,
+)
+
+
+def _timed(description: str, f):
+    t0 = time.perf_counter()
+    result = f()
+    print(f"{description}: {time.perf_counter() - t0:.2f}s")
+    return result
+
+
+def benchmark_circular_flights(n_flights: int, duration: int) -> None:
+    config = AdjacentCircularFlightsSimulatorConfiguration()
+    simulator = AdjacentCircularFlightsSimulator(config)
+    simulator.generate_flight_grid_and_path_points(
+        altitude_of_ground_level_wgs_84=config.altitude_of_ground_level_wgs_84
+    )
+    simulator.generate_query_bboxes()
+
+    # Reuse the tracks of the grid cells for as many flights as requested
+    tracks = simulator.grid_cells_flight_tracks
+    simulator.grid_cells_flight_tracks = [
+        tracks[i % len(tracks)] for i in range(n_flights)
+    ]
+    _timed(
+        f"Generated {n_flights} circular flights of {duration}s",
+        lambda: simulator.generate_rid_state(duration=duration),
+    )
+    n_states = sum(len(f.states) for f in simulator.flights)
+    print(f"  {n_states} states")
+
+    # Interpolate the altitude of every position from altitude polygons around the flights
+    positions = np.array(
+        [
+            (s.position.lng, s.position.lat)
+            for f in simulator.flights
+            for s in f.states
+            if s.position is not None
+        ]
+    )
+    polygons = [
+        Polygon(cell.bounds.exterior.coords).buffer(-0.0002)
+        for cell in simulator.grid_cells_flight_tracks[: len(tracks)]
+    ]
+    altitudes = [100.0 + 10 * i for i in range(len(polygons))]
+    _timed(
+        f"Interpolated altitudes of {len(positions)} positions from {len(polygons)} polygons",
+        lambda: get_interpolated_values(
+            positions, np.array(polygons, dtype=object), altitudes
+        ),
+    )
+
+
+def benchmark_kml(kml_path: str) -> None:
+    with open(kml_path) as f:
+        kml_content = f.read()
+    records = _timed(
+        f"Generated flight records from {kml_path}",
+        lambda: get_flight_records(kml_content, datetime.now(UTC), 12345),
+    )
+    n_states = sum(len(f.states) for f in records.flights)
+    print(f"  {len(records.flights)} flights with {n_states} states")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the time taken to generate simulated RID flight data"
+    )
+    parser.add_argument(
+        "--flights", type=int, default=300, help="Number of circular flights"
+    )
+    parser.add_argument(
+        "--duration",
+        type=int,
+        default=3600,
+        help="Duration of each circular flight, in seconds (one state per second)",
+    )
+    parser.add_argument(
+        "--kml", help="Path to a KML file from which to also generate flight records"
+    )
+    args = parser.parse_args()
+
+    benchmark_circular_flights(args.flights, args.duration)
+    if args.kml:
+        benchmark_kml(args.kml)
+
+
+if __name__ == "__main__":
+    main()
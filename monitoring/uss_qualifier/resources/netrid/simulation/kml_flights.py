@@ -7,13 +7,15 @@ import uuid
 from collections import namedtuple
 from datetime import timedelta
 
+import numpy as np
 import s2sphere
+import shapely
 from implicitdict import StringBasedDateTime
 from shapely.geometry import LineString, Point, Polygon
 from uas_standards.astm.f3411.v22a import constants
 from uas_standards.interuss.automated_testing.rid.v1 import injection
 
-from monitoring.monitorlib.geo import flatten, unflatten
+from monitoring.monitorlib.geo import flatten, flatten_many, unflatten_many
 from monitoring.monitorlib.kml.parsing import get_kml_content, get_polygon_speed
 from monitoring.uss_qualifier.resources.netrid.flight_data import (
     FlightRecordCollection,
@@ -291,18 +293,34 @@ def get_flight_polygons_flattened(reference_point, alt_polygons):
     return alt_polygons_flatten
 
 
+def get_polygons_array(polygons) -> np.ndarray:
+    """Returns an array of Polygon geometries for a list of flattened polygons (or such an array as is)."""
+    if isinstance(polygons, np.ndarray):
+        return polygons
+    return np.array([Polygon(poly) for poly in polygons], dtype=object)
+
+
 def get_polygons_distances_from_point(point, polygons):
     """Returns a list of distances for a point from surrounding polygons.
     Args:
         point: A tuple of x,y coordinates.
-        polygons: A list of flattened polygons.
+        polygons: A list of flattened polygons, or an array of Polygon geometries.
     Returns:
         A list of distances in meters.
     """
-    distances = []
-    for poly in polygons:
-        distances.append(Point(*point).distance(Polygon(poly)))
-    return distances
+    return shapely.distance(Point(*point), get_polygons_array(polygons)).tolist()
+
+
+def get_polygons_distances_from_points(points, polygons) -> np.ndarray:
+    """Returns the distances of many points from surrounding polygons.
+    Args:
+        points: An array of x,y coordinates with shape (n, 2).
+        polygons: A list of flattened polygons, or an array of Polygon geometries.
+    Returns:
+        An array of distances in meters with shape (n, number of polygons).
+    """
+    coordinates = np.asarray(points, dtype=float).reshape(-1, 1, 2)
+    return shapely.distance(shapely.points(coordinates), get_polygons_array(polygons))
 
 
 def get_interpolated_value(point, polygons, all_possible_values, round_value=False):
@@ -328,6 +346,31 @@ def get_interpolated_value(point, polygons, all_possible_values, round_value=Fal
     return round(interpolated_value, 2) if round_value else interpolated_value
 
 
+def get_interpolated_values(
+    points, polygons, all_possible_values, round_value=False
+) -> np.ndarray:
+    """Returns interpolated values for many points at once; see get_interpolated_value.
+    Args:
+        points: An array of flattened x,y points with shape (n, 2).
+        polygons: A list of flattened polygons, or an array of Polygon geometries.
+        all_possible_values: All surrounding polygons' values. Values can be altitude or speed.
+    Returns:
+        An array of n interpolated values for altitude or speed.
+    """
+    distances = get_polygons_distances_from_points(points, polygons)
+    values = np.asarray(all_possible_values, dtype=float)
+    nearest = distances.argmin(axis=1)
+    on_polygon = distances[np.arange(len(distances)), nearest] < 0.1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dividend = np.zeros(len(distances))
+        divisor = np.zeros(len(distances))
+        for value, distance in zip(values, distances.T):
+            dividend += value / distance
+            divisor += 1 / distance
+        interpolated_values = np.where(on_polygon, values[nearest], dividend / divisor)
+    return np.round(interpolated_values, 2) if round_value else interpolated_values
+
+
 def get_speeds_from_speed_polygons(speed_polygons):
     return [get_polygon_speed(n) for n in list(speed_polygons)]
 
@@ -342,22 +385,22 @@ def get_flight_state_coordinates(flight_details):
             a list of speeds at each point,
             a list of angles at each interval.
     """
-    if flight_details.get("input_coordinates"):
-        input_coordinates = get_flight_coordinates(flight_details["input_coordinates"])
+    if not flight_details.get("input_coordinates"):
+        raise ValueError("Flight details do not include input coordinates")
+    input_coordinates = get_flight_coordinates(flight_details["input_coordinates"])
     reference_point = input_coordinates[0]
 
-    flatten_points = []
-    for point in input_coordinates:
-        flatten_points.append(
-            flatten(
-                s2sphere.LatLng.from_degrees(*reference_point[:2]),
-                s2sphere.LatLng.from_degrees(*point[:2]),
-            )
-        )
+    reference = s2sphere.LatLng.from_degrees(*reference_point[:2])
+    xs, ys = flatten_many(
+        reference,
+        np.array([p[0] for p in input_coordinates]),
+        np.array([p[1] for p in input_coordinates]),
+    )
+    flatten_points = list(zip(xs.tolist(), ys.tolist()))
 
     speed_polygons = flight_details["speed_polygons"]
-    flattened_speed_polygons = get_flight_polygons_flattened(
-        reference_point, speed_polygons
+    flattened_speed_polygons = get_polygons_array(
+        get_flight_polygons_flattened(reference_point, speed_polygons)
     )
     all_polygon_speeds = get_speeds_from_speed_polygons(speed_polygons)
     (
@@ -374,22 +417,17 @@ def get_flight_state_coordinates(flight_details):
     )
     all_polygon_alts = [p[0][2] for p in list(alt_polygons.values())]
 
-    flight_state_altitudes = []
-    for point in flight_state_vertices:
-        flight_state_altitudes.append(
-            get_interpolated_value(point, flattened_alt_polygons, all_polygon_alts)
-        )
-    flight_state_vertices_unflatten = [
-        unflatten(s2sphere.LatLng.from_degrees(*reference_point[:2]), v)
-        for v in flight_state_vertices
-    ]
+    vertices = np.array(flight_state_vertices, dtype=float).reshape(-1, 2)
+    flight_state_altitudes = get_interpolated_values(
+        vertices, flattened_alt_polygons, all_polygon_alts
+    ).tolist()
+    lats, lngs = unflatten_many(reference, vertices[:, 0], vertices[:, 1])
 
     # Position Lat, Lng to Lng, Lat order for KML representation.
-    flight_state_coordinates = []
-    for p, alt in zip(flight_state_vertices_unflatten, flight_state_altitudes):
-        flight_state_coordinates.append(
-            Coordinate(p.lng().degrees, p.lat().degrees, alt)
-        )
+    flight_state_coordinates = [
+        Coordinate(lng, lat, alt)
+        for lng, lat, alt in zip(lngs.tolist(), lats.tolist(), flight_state_altitudes)
+    ]
     return flight_state_coordinates, flight_state_speeds, flight_track_angles
 
 
@@ -32,6 +32,22 @@ def test_get_interpolated_value(mocker):
     assert abs(result_alt - 135.84) < 0.1
 
 
+def test_get_interpolated_values():
+    polygons = [
+        [(0, 0), (10, 0), (10, 10), (0, 10)],
+        [(50, 0), (60, 0), (60, 10), (50, 10)],
+        [(0, 100), (10, 100), (10, 110), (0, 110)],
+    ]
+    points = [(5, 5), (30, 5), (5, 60), (55, 10.05)]
+    values = [10, 20, 30]
+
+    result = frk.get_interpolated_values(points, polygons, values)
+    expected = [frk.get_interpolated_value(p, polygons, values) for p in points]
+    assert result[0] == 10
+    assert result[3] == 20
+    assert all(abs(r - e) < 1e-9 for r, e in zip(result, expected))
+
+
 def test_get_track_angle():
     # towards straight north
     point1 = (1, 1)
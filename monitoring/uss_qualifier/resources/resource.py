@@ -127,9 +127,6 @@ def create_resources(
     return resource_pool
 
 
-_resources_module_imported = False
-
-
 def get_resource_types(
     declaration: ResourceDeclaration,
 ) -> tuple[type[Resource], type[ImplicitDict]]:
@@ -142,13 +139,10 @@ def get_resource_types(
         * Concrete Resource subclass type of the declared resource
         * Specification type for the declared resource, or None if the resource type doesn't have a specification
     """
-    global _resources_module_imported
-    if not _resources_module_imported:
-        inspection.import_submodules(resources_module)
-        _resources_module_imported = True
-
-    resource_type = inspection.get_module_object_by_name(
-        uss_qualifier_module, declaration.resource_type
+    resource_type = inspection.get_type_by_name(
+        parent_module=uss_qualifier_module,
+        object_name=declaration.resource_type,
+        search_module=resources_module,
     )
     if not issubclass(resource_type, Resource):
         raise NotImplementedError(
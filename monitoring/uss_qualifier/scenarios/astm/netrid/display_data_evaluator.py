@@ -247,8 +247,9 @@ class RIDObservationEvaluator:
             config, self._test_scenario, rid_version
         )
         self._injected_flights = injected_flights
+        self._injected_flight_collection = InjectedFlightCollection(injected_flights)
         self._virtual_observer = VirtualObserver(
-            injected_flights=InjectedFlightCollection(injected_flights),
+            injected_flights=self._injected_flight_collection,
             repeat_query_rect_period=config.repeat_query_rect_period,
             min_query_diagonal_m=config.min_query_diagonal,
             relevant_past_data_period=rid_version.realtime_period
@@ -529,15 +530,20 @@ class RIDObservationEvaluator:
         t_initiated = query.request.timestamp
         t_response = query.response.reported.datetime
 
-        for expected_flight in self._injected_flights:
-            timestamps = [
-                arrow.get(t.timestamp) for t in expected_flight.flight.telemetry
-            ]
-            t_min = min(timestamps).datetime
-            t_max = max(timestamps).datetime
+        for expected_flight, telemetry in zip(
+            self._injected_flights, self._injected_flight_collection.telemetry
+        ):
+            t_min, t_max = telemetry.get_span()
+            if t_min is None or t_max is None:
+                # No timestamped states, so never in area of interest
+                continue
 
             if (
-                len(expected_flight.flight.select_relevant_states(rect, t_min, t_max))
+                len(
+                    expected_flight.flight.select_relevant_states(
+                        rect, t_min, t_max, telemetry
+                    )
+                )
                 == 0
             ):
                 # Not in area of interest
@@ -1,49 +1,45 @@
 from datetime import datetime
 
-import arrow
+import numpy as np
 from s2sphere import LatLng, LatLngRect
 
-from monitoring.monitorlib import geo
+from monitoring.monitorlib import clock, geo
+from monitoring.monitorlib.rid_automated_testing.telemetry import TelemetryArrays
 from monitoring.uss_qualifier.scenarios.astm.netrid.injection import InjectedFlight
 
 
 class InjectedFlightCollection:
     _injected_flights: list[InjectedFlight]
 
+    telemetry: list[TelemetryArrays]
+    """Columnar telemetry of each injected flight, in the same order as the injected flights"""
+
     def __init__(self, injected_flights: list[InjectedFlight]):
         self._injected_flights = injected_flights
+        self.telemetry = [
+            TelemetryArrays.from_states(f.flight.telemetry) for f in injected_flights
+        ]
 
     def get_query_rect(
         self, t_min: datetime, t_max: datetime, min_query_diagonal_m: float
     ) -> LatLngRect:
         # Find the bounds of all relevant points
-        data_exists = False
-        lat_min = 90
-        lng_min = 360
-        lat_max = -90
-        lng_max = -360
-        for injected_flight in self._injected_flights:
-            for telemetry in injected_flight.flight.telemetry:
-                t = arrow.get(telemetry.timestamp).datetime
-                if t_min <= t <= t_max:
-                    data_exists = True
-                    lat_min = min(lat_min, telemetry.position.lat)
-                    lat_max = max(lat_max, telemetry.position.lat)
-                    lng_min = min(lng_min, telemetry.position.lng)
-                    lng_max = max(lng_max, telemetry.position.lng)
-
-        # If there is no flight data yet, look at the center of where the data will be
-        if not data_exists:
-            lat = 0
-            lng = 0
-            n = 0
-            for injected_flight in self._injected_flights:
-                for telemetry in injected_flight.flight.telemetry:
-                    lat += telemetry.position.lat
-                    lng += telemetry.position.lng
-                    n += 1
-            lat_min = lat_max = lat / n
-            lng_min = lng_max = lng / n
+        relevant = [t.in_time_range(t_min, t_max) for t in self.telemetry]
+        lats = np.concatenate([t.lats[i] for t, i in zip(self.telemetry, relevant)])
+        lngs = np.concatenate([t.lngs[i] for t, i in zip(self.telemetry, relevant)])
+        if len(lats):
+            lat_min = float(lats.min())
+            lat_max = float(lats.max())
+            lng_min = float(lngs.min())
+            lng_max = float(lngs.max())
+        else:
+            # If there is no flight data yet, look at the center of where the data will be
+            lat_min = lat_max = float(
+                np.concatenate([t.lats for t in self.telemetry]).mean()
+            )
+            lng_min = lng_max = float(
+                np.concatenate([t.lngs for t in self.telemetry]).mean()
+            )
 
         # Expand view size to meet minimum, if necessary
         OVERSHOOT = 1.01
@@ -79,9 +75,18 @@ class InjectedFlightCollection:
         return LatLngRect.from_point_pair(p1, p2)
 
     def get_end_of_injected_data(self) -> datetime:
-        t_end = arrow.utcnow()
-        for injected_flight in self._injected_flights:
-            for telemetry in injected_flight.flight.telemetry:
-                t = arrow.get(telemetry.timestamp)
+        t_end = clock.now()
+        for telemetry in self.telemetry:
+            _, t = telemetry.get_span()
+            if t is not None:
                 t_end = max(t_end, t)
         return t_end
+
+    def get_spans(self) -> list[tuple[datetime, datetime]]:
+        """Time range of the data of each injected flight that has timestamped data."""
+        spans = []
+        for injected_flight in self._injected_flights:
+            t0, t1 = injected_flight.flight.get_span()
+            if t0 and t1:
+                spans.append((t0, t1))
+        return spans
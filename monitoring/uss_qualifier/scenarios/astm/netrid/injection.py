@@ -8,7 +8,7 @@ from uas_standards.astm.f3548.v21.constants import (
 )
 from uas_standards.interuss.automated_testing.rid.v1.injection import ChangeTestResponse
 
-from monitoring.monitorlib import geo
+from monitoring.monitorlib import clock, geo
 from monitoring.monitorlib.rid_automated_testing.injection_api import (
     CreateTestParameters,
     TestFlight,
@@ -109,7 +109,7 @@ def inject_flights(
                     end_time = latest_time
 
         if start_time and end_time:
-            now = arrow.utcnow().datetime
+            now = clock.now()
             dt0 = (start_time - now).total_seconds()
             dt1 = (end_time - now).total_seconds()
             test_scenario.record_note(
@@ -1,10 +1,10 @@
 from collections.abc import Callable
 from datetime import datetime, timedelta
 
-import arrow
 from loguru import logger
 from s2sphere import LatLngRect
 
+from monitoring.monitorlib import clock
 from monitoring.monitorlib.delay import sleep
 from monitoring.uss_qualifier.scenarios.astm.netrid.injected_flight_collection import (
     InjectedFlightCollection,
@@ -52,7 +52,7 @@ class VirtualObserver:
     def get_query_rect(self, diagonal_m: float = None) -> LatLngRect:
         if not diagonal_m or diagonal_m < self._min_query_diagonal_m:
             diagonal_m = self._min_query_diagonal_m
-        t_now = arrow.utcnow().datetime
+        t_now = clock.now()
         if (
             self._last_rect
             and self._repeat_query_rect_period > 0
@@ -72,6 +72,29 @@ class VirtualObserver:
             + self._relevant_past_data_period
         )
 
+    def get_observation_windows(
+        self, lead: timedelta
+    ) -> list[tuple[datetime, datetime]]:
+        """Return the periods during which observations of the injected flights may change, in chronological order.
+
+        Each flight may be observed from its first data (which an observer should see appear, so the period starts
+        `lead` before) until its last data is no longer relevant (after which it should have disappeared).  Outside
+        these periods, there is nothing to observe that could differ from the previous observation.  Overlapping
+        periods are merged.
+        """
+        t_end = self.get_last_time_of_interest()
+        spans = sorted(
+            (t0 - lead, min(t1 + self._relevant_past_data_period, t_end))
+            for t0, t1 in self._injected_flights.get_spans()
+        )
+        windows: list[tuple[datetime, datetime]] = []
+        for t0, t1 in spans:
+            if windows and t0 <= windows[-1][1]:
+                windows[-1] = (windows[-1][0], max(windows[-1][1], t1))
+            else:
+                windows.append((t0, t1))
+        return windows
+
     def start_polling(
         self,
         interval: timedelta,
@@ -81,39 +104,50 @@ class VirtualObserver:
         """
         Start polling of the RID system.
 
+        Polling is concentrated in the observation windows of the injected flights (see get_observation_windows):
+        each window is polled every interval starting one interval before its first flight appears, and the time
+        between windows (including before the first flight) is skipped.  Polling ends once the last window is over.
+
         :param interval: polling interval.
         :param diagonals_m: list of the query rectangle diagonals (in meters).
-        :param poll_fct: polling function to invoke. If it returns True, the polling will be immediately interrupted before the end.
+        :param poll_fct: polling function to invoke. If it returns True, the polling will be immediately interrupted before the end, e.g. because all the checks it performs are settled.
         """
         t_end = self.get_last_time_of_interest()
-        t_now = arrow.utcnow()
+        t_now = clock.now()
         if t_now > t_end:
             raise ValueError(
                 f"Cannot poll RID system: instructed to poll until {t_end}, which is before now ({t_now})"
             )
 
-        logger.info(f"Polling from {t_now} until {t_end} every {interval}")
-        t_next = arrow.utcnow()
-        while arrow.utcnow() < t_end:
-            interrupt_polling = False
-            for diagonal_m in diagonals_m:
-                rect = self.get_query_rect(diagonal_m)
-                interrupt_polling = poll_fct(rect)
-                if interrupt_polling:
-                    break
-
-            if interrupt_polling:
-                logger.info(f"Polling ended early at {arrow.utcnow()}.")
-                break
-
-            # Wait until minimum polling interval elapses
-            while t_next < arrow.utcnow():
-                t_next += interval
-            if t_next > t_end:
-                logger.info(f"Polling ended normally at {t_end}.")
-                break
-            delay = t_next - arrow.utcnow()
-            if delay.total_seconds() > 0:
-                sleep(
-                    delay, "RID sytem doesn't need to be polled again until this time"
+        windows = self.get_observation_windows(interval) or [(t_now, t_end)]
+        logger.info(
+            f"Polling from {t_now} until {t_end} every {interval} during {len(windows)} observation window(s)"
+        )
+        t_next = t_now
+        for window_start, window_end in windows:
+            if window_end < t_next:
+                continue
+            if t_next < window_start:
+                logger.debug(
+                    f"Skipping polling until observation window starting at {window_start}"
                 )
+                t_next = window_start
+            while t_next <= window_end:
+                delay = t_next - clock.now()
+                if delay.total_seconds() > 0:
+                    sleep(
+                        delay,
+                        "RID sytem doesn't need to be polled again until this time",
+                    )
+
+                for diagonal_m in diagonals_m:
+                    rect = self.get_query_rect(diagonal_m)
+                    if poll_fct(rect):
+                        logger.info(f"Polling ended early at {clock.now()}.")
+                        return
+
+                # Wait until minimum polling interval elapses
+                t_now = clock.now()
+                while t_next < t_now:
+                    t_next += interval
+        logger.info(f"Polling ended normally at {clock.now()}.")
@@ -0,0 +1,77 @@
+from datetime import UTC, datetime, timedelta
+from typing import cast
+
+from monitoring.monitorlib import clock
+from monitoring.monitorlib.clock import ClockConfiguration
+from monitoring.uss_qualifier.scenarios.astm.netrid.injected_flight_collection import (
+    InjectedFlightCollection,
+)
+from monitoring.uss_qualifier.scenarios.astm.netrid.virtual_observer import (
+    VirtualObserver,
+)
+
+INTERVAL = timedelta(seconds=1)
+RELEVANT_PERIOD = timedelta(seconds=2)
+
+
+class _FakeFlights:
+    """Stand-in for InjectedFlightCollection with flights spanning the specified periods."""
+
+    def __init__(self, spans: list[tuple[datetime, datetime]]):
+        self.spans = spans
+
+    def get_spans(self) -> list[tuple[datetime, datetime]]:
+        return self.spans
+
+    def get_end_of_injected_data(self) -> datetime:
+        return max(t1 for _, t1 in self.spans)
+
+    def get_query_rect(self, t_min, t_max, diagonal_m):
+        return None
+
+
+def _observer(spans: list[tuple[datetime, datetime]]) -> VirtualObserver:
+    return VirtualObserver(
+        cast(InjectedFlightCollection, _FakeFlights(spans)), 0, 100, RELEVANT_PERIOD
+    )
+
+
+def test_observation_windows():
+    t0 = datetime(2024, 1, 1, tzinfo=UTC)
+    s = timedelta(seconds=1)
+    observer = _observer(
+        [(t0 + 20 * s, t0 + 30 * s), (t0, t0 + 10 * s), (t0 + 5 * s, t0 + 12 * s)]
+    )
+    assert observer.get_observation_windows(INTERVAL) == [
+        (t0 - s, t0 + 14 * s),
+        (t0 + 19 * s, t0 + 32 * s),
+    ]
+
+
+def test_polling_skips_gaps_and_ends_early():
+    # Run 20 times faster than the wall clock to keep the test short
+    clock.configure(ClockConfiguration(speed=20))
+    try:
+        t0 = clock.now()
+        s = timedelta(seconds=1)
+        observer = _observer([(t0 + 2 * s, t0 + 3 * s), (t0 + 20 * s, t0 + 21 * s)])
+        polls = []
+
+        def poll(rect) -> bool:
+            polls.append((clock.now() - t0).total_seconds())
+            return False
+
+        observer.start_polling(INTERVAL, [1000], poll)
+
+        # Each window is polled every second from one second before its flight appears until its data is no longer
+        # relevant, and nothing is polled between the windows
+        assert len(polls) == 10
+        assert all(1 <= t < 6 or 19 <= t < 24 for t in polls)
+
+        polls.clear()
+        t0 = clock.now()
+        observer = _observer([(t0, t0 + 10 * s)])
+        observer.start_polling(INTERVAL, [1000, 2000], lambda rect: poll(rect) or True)
+        assert len(polls) == 1
+    finally:
+        clock.configure(ClockConfiguration())
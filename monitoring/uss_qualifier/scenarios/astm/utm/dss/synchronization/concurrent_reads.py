@@ -0,0 +1,39 @@
+"""Concurrent reads of the same information from several DSS instances.
+
+The synchronization scenarios verify that every secondary DSS instance reports
+the same state.  The reads from the different instances are independent of each
+other, so they are issued concurrently up front; the scenario then handles the
+outcome of each read (recording queries and performing checks) one instance
+after another, in the order of the instances, exactly as it would have after
+issuing the reads sequentially.  The resulting report is therefore unchanged,
+while the time spent waiting on the instances is roughly that of the slowest
+instance rather than the sum over all instances.
+"""
+
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+MAX_CONCURRENT_READS = 8
+"""Maximum number of DSS instances read at the same time."""
+
+
+def read_concurrently[D, T](
+    instances: list[D], read: Callable[[D], T]
+) -> list[tuple[D, Future[T]]]:
+    """Perform `read` on each DSS instance concurrently.
+
+    All reads have completed when this function returns.  Calling `result()` on
+    the Future of an instance returns the value returned by `read` for that
+    instance, or raises the exception it raised (e.g., QueryError), so the
+    Future can be used in place of the original read call inside the same
+    check and error handling.
+
+    Returns: Each instance with the outcome of its read, in the order of `instances`.
+    """
+    if not instances:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(len(instances), MAX_CONCURRENT_READS)
+    ) as executor:
+        futures = [executor.submit(read, dss) for dss in instances]
+    return list(zip(instances, futures))
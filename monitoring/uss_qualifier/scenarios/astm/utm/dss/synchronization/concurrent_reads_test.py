@@ -0,0 +1,40 @@
+import threading
+
+import pytest
+
+from monitoring.monitorlib.fetch import QueryError
+from monitoring.uss_qualifier.scenarios.astm.utm.dss.synchronization.concurrent_reads import (
+    read_concurrently,
+)
+
+
+class _FakeDSS:
+    def __init__(self, participant_id: str):
+        self.participant_id = participant_id
+
+
+def test_read_concurrently():
+    instances = [_FakeDSS(f"uss{i}") for i in range(4)]
+    barrier = threading.Barrier(len(instances), timeout=5)
+
+    def read(dss: _FakeDSS) -> str:
+        # Every read must be in progress at the same time to get past the barrier
+        barrier.wait()
+        if dss.participant_id == "uss2":
+            raise QueryError("Read failed")
+        return dss.participant_id
+
+    reads = read_concurrently(instances, read)
+
+    assert [dss for dss, _ in reads] == instances
+    assert [f.result() for dss, f in reads if dss.participant_id != "uss2"] == [
+        "uss0",
+        "uss1",
+        "uss3",
+    ]
+    with pytest.raises(QueryError):
+        reads[2][1].result()
+
+
+def test_read_concurrently_without_instances():
+    assert read_concurrently([], lambda dss: None) == []
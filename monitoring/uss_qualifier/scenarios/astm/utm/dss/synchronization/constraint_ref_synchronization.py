@@ -1,3 +1,4 @@
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 
 from uas_standards.astm.f3548.v21.api import (
@@ -19,6 +20,9 @@ from monitoring.uss_qualifier.resources.astm.f3548.v21.dss import (
 from monitoring.uss_qualifier.resources.communications import ClientIdentityResource
 from monitoring.uss_qualifier.resources.interuss.id_generator import IDGeneratorResource
 from monitoring.uss_qualifier.scenarios.astm.utm.dss import test_step_fragments
+from monitoring.uss_qualifier.scenarios.astm.utm.dss.synchronization.concurrent_reads import (
+    read_concurrently,
+)
 from monitoring.uss_qualifier.scenarios.astm.utm.dss.validators.cr_validator import (
     ConstraintReferenceValidator,
 )
@@ -196,8 +200,13 @@ class CRSynchronization(TestScenario):
 
     def _verify_clean_secondaries_step(self):
         self.begin_test_step("Verify secondary DSS instances are clean")
-        for dss in self._secondary_dss_instances:
-            test_step_fragments.verify_constraint_does_not_exist(self, dss, self._cr_id)
+        for dss, read in read_concurrently(
+            self._secondary_dss_instances,
+            lambda dss: dss.get_constraint_ref(self._cr_id),
+        ):
+            test_step_fragments.verify_constraint_does_not_exist(
+                self, dss, self._cr_id, prefetched=read
+            )
 
         self.end_test_step()
 
@@ -241,13 +250,16 @@ class CRSynchronization(TestScenario):
         main_check_name: str,
         expected_cr_params: PutConstraintReferenceParameters,
     ):
-        for secondary_dss in self._secondary_dss_instances:
+        for secondary_dss, read in read_concurrently(
+            self._secondary_dss_instances,
+            lambda dss: dss.get_constraint_ref(self._cr_id),
+        ):
             with self.check(
                 "Get constraint reference by ID",
                 secondary_dss.participant_id,
             ) as check:
                 try:
-                    oir, q = secondary_dss.get_constraint_ref(self._cr_id)
+                    oir, q = read.result()
                     self.record_query(q)
                 except QueryError as qe:
                     self.record_queries(qe.queries)
@@ -289,15 +301,18 @@ class CRSynchronization(TestScenario):
         Returns:
          True if all checks passed, False otherwise; the participant IDs if the checks did not pass.
         """
-        for secondary_dss in self._secondary_dss_instances:
+        for secondary_dss, read in read_concurrently(
+            self._secondary_dss_instances,
+            lambda dss: dss.find_constraint_ref(
+                self._planning_area_volume4d.to_f3548v21()
+            ),
+        ):
             with self.check(
                 "Successful constraint reference search query",
                 [secondary_dss.participant_id],
             ) as check:
                 try:
-                    crs, q = secondary_dss.find_constraint_ref(
-                        self._planning_area_volume4d
-                    )
+                    crs, q = read.result()
                     self.record_query(q)
                 except QueryError as qe:
                     self.record_queries(qe.queries)
@@ -530,16 +545,31 @@ class CRSynchronization(TestScenario):
         self._current_cr = None
 
     def _test_get_deleted_cr(self):
-        for secondary_dss in self._secondary_dss_instances:
-            self._confirm_secondary_has_no_oir(secondary_dss)
+        gets = read_concurrently(
+            self._secondary_dss_instances,
+            lambda dss: dss.get_constraint_ref(self._cr_id),
+        )
+        searches = read_concurrently(
+            self._secondary_dss_instances,
+            lambda dss: dss.find_constraint_ref(
+                self._planning_area_volume4d.to_f3548v21()
+            ),
+        )
+        for (secondary_dss, get), (_, search) in zip(gets, searches):
+            self._confirm_secondary_has_no_oir(secondary_dss, get, search)
 
-    def _confirm_secondary_has_no_oir(self, secondary_dss: DSSInstance):
+    def _confirm_secondary_has_no_oir(
+        self,
+        secondary_dss: DSSInstance,
+        get: Future[tuple[ConstraintReference, Query]],
+        search: Future[tuple[list[ConstraintReference], Query]],
+    ):
         with self.check(
             "Get constraint reference by ID",
             secondary_dss.participant_id,
         ) as check:
             try:
-                oir, q = secondary_dss.get_constraint_ref(self._cr_id)
+                oir, q = get.result()
                 self.record_query(q)
             except QueryError as qe:
                 q = qe.cause
@@ -567,7 +597,7 @@ class CRSynchronization(TestScenario):
             [secondary_dss.participant_id],
         ) as check:
             try:
-                crs, q = secondary_dss.find_constraint_ref(self._planning_area_volume4d)
+                crs, q = search.result()
                 self.record_query(q)
             except QueryError as qe:
                 self.record_queries(qe.queries)
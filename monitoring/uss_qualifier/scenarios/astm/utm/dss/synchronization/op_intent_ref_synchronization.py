@@ -1,3 +1,4 @@
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 
 from uas_standards.astm.f3548.v21.api import (
@@ -20,6 +21,9 @@ from monitoring.uss_qualifier.resources.astm.f3548.v21.dss import (
 from monitoring.uss_qualifier.resources.communications import ClientIdentityResource
 from monitoring.uss_qualifier.resources.interuss.id_generator import IDGeneratorResource
 from monitoring.uss_qualifier.scenarios.astm.utm.dss import test_step_fragments
+from monitoring.uss_qualifier.scenarios.astm.utm.dss.synchronization.concurrent_reads import (
+    read_concurrently,
+)
 from monitoring.uss_qualifier.scenarios.astm.utm.dss.validators.oir_validator import (
     TIME_TOLERANCE_SEC,
     OIRValidator,
@@ -197,8 +201,13 @@ class OIRSynchronization(TestScenario):
 
     def _verify_clean_secondaries_step(self):
         self.begin_test_step("Verify secondary DSS instances are clean")
-        for dss in self._dss_read_instances:
-            test_step_fragments.verify_op_intent_does_not_exist(self, dss, self._oir_id)
+        for dss, read in read_concurrently(
+            self._dss_read_instances,
+            lambda dss: dss.get_op_intent_reference(self._oir_id),
+        ):
+            test_step_fragments.verify_op_intent_does_not_exist(
+                self, dss, self._oir_id, prefetched=read
+            )
 
         self.end_test_step()
 
@@ -246,13 +255,16 @@ class OIRSynchronization(TestScenario):
         main_check_name: str,
         expected_oir_params: PutOperationalIntentReferenceParameters,
     ):
-        for secondary_dss in self._dss_read_instances:
+        for secondary_dss, read in read_concurrently(
+            self._dss_read_instances,
+            lambda dss: dss.get_op_intent_reference(self._oir_id),
+        ):
             with self.check(
                 "Get operational intent reference by ID",
                 secondary_dss.participant_id,
             ) as check:
                 try:
-                    oir, q = secondary_dss.get_op_intent_reference(self._oir_id)
+                    oir, q = read.result()
                     self.record_query(q)
                 except QueryError as qe:
                     self.record_queries(qe.queries)
@@ -294,13 +306,16 @@ class OIRSynchronization(TestScenario):
         Returns:
          True if all checks passed, False otherwise; the participant IDs if the checks did not pass.
         """
-        for secondary_dss in self._dss_read_instances:
+        for secondary_dss, read in read_concurrently(
+            self._dss_read_instances,
+            lambda dss: dss.find_op_intent(self._planning_area_volume4d.to_f3548v21()),
+        ):
             with self.check(
                 "Successful operational intent reference search query",
                 [secondary_dss.participant_id],
             ) as check:
                 try:
-                    oirs, q = secondary_dss.find_op_intent(self._planning_area_volume4d)
+                    oirs, q = read.result()
                     self.record_query(q)
                 except QueryError as qe:
                     self.record_queries(qe.queries)
@@ -526,16 +541,29 @@ class OIRSynchronization(TestScenario):
         self._current_oir = None
 
     def _test_get_deleted_oir(self):
-        for secondary_dss in self._dss_read_instances:
-            self._confirm_secondary_has_no_oir(secondary_dss)
+        gets = read_concurrently(
+            self._dss_read_instances,
+            lambda dss: dss.get_op_intent_reference(self._oir_id),
+        )
+        searches = read_concurrently(
+            self._dss_read_instances,
+            lambda dss: dss.find_op_intent(self._planning_area_volume4d.to_f3548v21()),
+        )
+        for (secondary_dss, get), (_, search) in zip(gets, searches):
+            self._confirm_secondary_has_no_oir(secondary_dss, get, search)
 
-    def _confirm_secondary_has_no_oir(self, secondary_dss: DSSInstance):
+    def _confirm_secondary_has_no_oir(
+        self,
+        secondary_dss: DSSInstance,
+        get: Future[tuple[OperationalIntentReference, Query]],
+        search: Future[tuple[list[OperationalIntentReference], Query]],
+    ):
         with self.check(
             "Get operational intent reference by ID",
             secondary_dss.participant_id,
         ) as check:
             try:
-                oir, q = secondary_dss.get_op_intent_reference(self._oir_id)
+                oir, q = get.result()
                 self.record_query(q)
             except QueryError as qe:
                 q = qe.cause
@@ -563,7 +591,7 @@ class OIRSynchronization(TestScenario):
             [secondary_dss.participant_id],
         ) as check:
             try:
-                oirs, q = secondary_dss.find_op_intent(self._planning_area_volume4d)
+                oirs, q = search.result()
                 self.record_query(q)
             except QueryError as qe:
                 self.record_queries(qe.queries)
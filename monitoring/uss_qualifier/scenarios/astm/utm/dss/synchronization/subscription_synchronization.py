@@ -1,3 +1,4 @@
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 
 import loguru
@@ -5,6 +6,7 @@ from uas_standards.astm.f3548.v21.api import Subscription, SubscriptionID
 from uas_standards.astm.f3548.v21.constants import Scope
 
 from monitoring.monitorlib import geo, schema_validation
+from monitoring.monitorlib.fetch.scd import FetchedSubscription, FetchedSubscriptions
 from monitoring.monitorlib.geo import Volume3D
 from monitoring.monitorlib.geotemporal import Volume4D
 from monitoring.monitorlib.mutate.scd import MutatedSubscription
@@ -23,6 +25,9 @@ from monitoring.uss_qualifier.scenarios.astm.utm.dss import test_step_fragments
 from monitoring.uss_qualifier.scenarios.astm.utm.dss.fragments.sub.crud import (
     sub_create_query,
 )
+from monitoring.uss_qualifier.scenarios.astm.utm.dss.synchronization.concurrent_reads import (
+    read_concurrently,
+)
 from monitoring.uss_qualifier.scenarios.astm.utm.dss.validators import (
     fail_with_schema_errors,
 )
@@ -258,10 +263,18 @@ class SubscriptionSynchronization(TestScenario):
 
     def _verify_clean_secondaries_step(self):
         self.begin_test_step("Verify secondary DSS instances are clean")
-        for dss in self._dss_read_instances:
-            for sub_id in [self._sub_id] + self._ids_for_deletion:
+        sub_ids = [self._sub_id] + self._ids_for_deletion
+        reads = {
+            sub_id: read_concurrently(
+                self._dss_read_instances,
+                lambda dss, sub_id=sub_id: dss.get_subscription(sub_id),
+            )
+            for sub_id in sub_ids
+        }
+        for i, dss in enumerate(self._dss_read_instances):
+            for sub_id in sub_ids:
                 test_step_fragments.verify_subscription_does_not_exist(
-                    self, dss, sub_id
+                    self, dss, sub_id, prefetched=reads[sub_id][i][1]
                 )
 
         self.end_test_step()
@@ -298,9 +311,23 @@ class SubscriptionSynchronization(TestScenario):
     def _step_query_secondaries_and_compare(
         self, expected_sub_params: SubscriptionParams
     ):
-        for secondary_dss in self._dss_read_instances:
+        gets = read_concurrently(
+            self._dss_read_instances,
+            lambda dss: dss.get_subscription(expected_sub_params.sub_id),
+        )
+        searches = read_concurrently(
+            self._dss_read_instances,
+            lambda dss: (
+                dss.query_subscriptions(
+                    self._enclosing_sub_area_volume4d.to_f3548v21()
+                ),
+                dss.query_subscriptions(self._outside_sub_area_volume4d.to_f3548v21()),
+            ),
+        )
+        for (secondary_dss, get), (_, search) in zip(gets, searches):
             self._validate_get_sub_from_secondary(
                 secondary_dss=secondary_dss,
+                get=get,
                 expected_sub_params=expected_sub_params,
                 involved_participants=list(
                     {self._primary_pid, secondary_dss.participant_id}
@@ -308,6 +335,7 @@ class SubscriptionSynchronization(TestScenario):
             )
             self._validate_sub_area_from_secondary(
                 secondary_dss=secondary_dss,
+                searches=search,
                 expected_sub_id=expected_sub_params.sub_id,
                 involved_participants=list(
                     {self._primary_pid, secondary_dss.participant_id}
@@ -317,17 +345,18 @@ class SubscriptionSynchronization(TestScenario):
     def _validate_sub_area_from_secondary(
         self,
         secondary_dss: DSSInstance,
+        searches: Future[tuple[FetchedSubscriptions, FetchedSubscriptions]],
         expected_sub_id: str,
         involved_participants: list[str],
     ):
         """Checks that the secondary DSS is also aware of the proper subscription's area:
         - searching for the subscription's area should yield the subscription
-        - searching outside the subscription's area should not yield the subscription"""
+        - searching outside the subscription's area should not yield the subscription
 
-        # Query the subscriptions inside the enclosing area
-        sub_included = secondary_dss.query_subscriptions(
-            self._enclosing_sub_area_volume4d.to_f3548v21()
-        )
+        searches holds the outcome of the queries of the subscriptions inside the
+        enclosing area and outside of the subscription's area, respectively."""
+
+        sub_included, sub_not_included = searches.result()
 
         with self.check(
             "Successful subscription search query", secondary_dss.participant_id
@@ -351,10 +380,6 @@ class SubscriptionSynchronization(TestScenario):
                     query_timestamps=[sub_included.request.timestamp],
                 )
 
-        sub_not_included = secondary_dss.query_subscriptions(
-            self._outside_sub_area_volume4d.to_f3548v21()
-        )
-
         with self.check(
             "Successful subscription search query", secondary_dss.participant_id
         ) as check:
@@ -380,15 +405,16 @@ class SubscriptionSynchronization(TestScenario):
     def _validate_get_sub_from_secondary(
         self,
         secondary_dss: DSSInstance,
+        get: Future[FetchedSubscription],
         expected_sub_params: SubscriptionParams,
         involved_participants: list[str],
     ):
-        """Fetches the subscription from the secondary DSS and validates it."""
+        """Validates the subscription fetched from the secondary DSS."""
         with self.check(
             "Get Subscription by ID",
             secondary_dss.participant_id,
         ) as check:
-            fetched_sub = secondary_dss.get_subscription(expected_sub_params.sub_id)
+            fetched_sub = get.result()
             self.record_query(fetched_sub)
             # At this point we just check that the request itself returned successfully.
             if fetched_sub.error_message is not None:
@@ -796,9 +822,11 @@ class SubscriptionSynchronization(TestScenario):
         """Confirm that no secondary DSS has the subscription.
         deleted_on_participant_id specifies the participant_id of the DSS where the subscription was deleted.
         """
-        for secondary_dss in self._dss_read_instances:
+        for secondary_dss, read in read_concurrently(
+            self._dss_read_instances, lambda dss: dss.get_subscription(sub_id)
+        ):
             self._confirm_dss_has_no_sub(
-                secondary_dss, sub_id, deleted_on_participant_id
+                secondary_dss, sub_id, deleted_on_participant_id, prefetched=read
             )
 
     def _confirm_dss_has_no_sub(
@@ -806,13 +834,17 @@ class SubscriptionSynchronization(TestScenario):
         dss_instance: DSSInstance,
         sub_id: str,
         other_participant_id: str | None,
+        prefetched: Future[FetchedSubscription] | None = None,
     ):
         """Confirm that a DSS has no subscription.
-        other_participant_id may be specified if a failed check may be caused by it."""
+        other_participant_id may be specified if a failed check may be caused by it.
+        prefetched may hold the outcome of the query of the subscription if it was already performed."""
         participants = [dss_instance.participant_id]
         if other_participant_id:
             participants.append(other_participant_id)
-        fetched_sub = dss_instance.get_subscription(sub_id)
+        fetched_sub = (
+            prefetched.result() if prefetched else dss_instance.get_subscription(sub_id)
+        )
         with self.check(
             "DSS should not return the deleted subscription",
             participants,
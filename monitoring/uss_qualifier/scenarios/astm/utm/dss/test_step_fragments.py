@@ -1,13 +1,18 @@
+from concurrent.futures import Future
+
 from uas_standards.astm.f3548.v21.api import (
+    ConstraintReference,
     EntityID,
     ExchangeRecord,
+    OperationalIntentReference,
     UssAvailabilityState,
     Volume4D,
 )
 from uas_standards.astm.f3548.v21.constants import Scope
 
 from monitoring.monitorlib import fetch
-from monitoring.monitorlib.fetch import QueryError
+from monitoring.monitorlib.fetch import Query, QueryError
+from monitoring.monitorlib.fetch.scd import FetchedSubscription
 from monitoring.uss_qualifier.resources.astm.f3548.v21.dss import DSSInstance
 from monitoring.uss_qualifier.scenarios.scenario import (
     ScenarioDidNotStopError,
@@ -74,13 +79,15 @@ def cleanup_sub(
     dss: DSSInstance,
     sub_id: EntityID,
     delete_if_exists: bool = True,
+    prefetched: Future[FetchedSubscription] | None = None,
 ) -> bool:
     """Determines if the subscription identified by sub_id exists at the passed DSS, and
     removes it if it was found and delete_if_exists is True (the default).
 
+    :param prefetched: Outcome of `dss.get_subscription(sub_id)` if it was already performed (see concurrent_reads).
     :return: True if the subscription was found to exist, False if no subscription was found.
     """
-    existing_sub = dss.get_subscription(sub_id)
+    existing_sub = prefetched.result() if prefetched else dss.get_subscription(sub_id)
     scenario.record_query(existing_sub)
     with scenario.check(
         "Subscription can be queried by ID", [dss.participant_id]
@@ -126,8 +133,11 @@ def verify_subscription_does_not_exist(
     scenario: TestScenario,
     dss: DSSInstance,
     sub_id: EntityID,
+    prefetched: Future[FetchedSubscription] | None = None,
 ):
-    sub_found = cleanup_sub(scenario, dss, sub_id, delete_if_exists=False)
+    sub_found = cleanup_sub(
+        scenario, dss, sub_id, delete_if_exists=False, prefetched=prefetched
+    )
     with scenario.check(
         "Subscription with test ID does not exist", dss.participant_id
     ) as check:
@@ -225,17 +235,23 @@ def cleanup_op_intent(
     dss: DSSInstance,
     oi_id: EntityID,
     delete_if_exists: bool = True,
+    prefetched: Future[tuple[OperationalIntentReference, Query]] | None = None,
 ) -> bool:
     """Determines if the operational intent reference identified by oi_id exists at the passed DSS, and
     removes it if it was found and delete_if_exists is True (the default).
 
+    :param prefetched: Outcome of `dss.get_op_intent_reference(oi_id)` if it was already performed (see concurrent_reads).
     :return: True if the OIR was found to exist, False if no OIR was found.
     """
     with scenario.check(
         "Operational intent references can be queried by ID", [dss.participant_id]
     ) as check:
         try:
-            oir, q = dss.get_op_intent_reference(oi_id)
+            oir, q = (
+                prefetched.result()
+                if prefetched
+                else dss.get_op_intent_reference(oi_id)
+            )
             scenario.record_query(q)
         except fetch.QueryError as e:
             scenario.record_queries(e.queries)
@@ -261,9 +277,14 @@ def cleanup_op_intent(
 
 
 def verify_op_intent_does_not_exist(
-    scenario: TestScenario, dss: DSSInstance, oi_id: EntityID
+    scenario: TestScenario,
+    dss: DSSInstance,
+    oi_id: EntityID,
+    prefetched: Future[tuple[OperationalIntentReference, Query]] | None = None,
 ):
-    oir_found = cleanup_op_intent(scenario, dss, oi_id, delete_if_exists=False)
+    oir_found = cleanup_op_intent(
+        scenario, dss, oi_id, delete_if_exists=False, prefetched=prefetched
+    )
     with scenario.check(
         "Operational intent reference with test ID does not exist",
         dss.participant_id,
@@ -280,6 +301,7 @@ def cleanup_constraint_ref(
     dss: DSSInstance,
     cr_id: EntityID,
     delete_if_exists: bool = False,
+    prefetched: Future[tuple[ConstraintReference, Query]] | None = None,
 ) -> bool:
     """
     Remove the specified constraint reference from the DSS, if it exists.
@@ -288,6 +310,7 @@ def cleanup_constraint_ref(
         - Constraint references can be queried by ID
         - Constraint reference removed
 
+    :param prefetched: Outcome of `dss.get_constraint_ref(cr_id)` if it was already performed (see concurrent_reads).
     :return: True if the constraint reference was found to exist, False if no constraint reference was found.
     """
 
@@ -295,7 +318,7 @@ def cleanup_constraint_ref(
         "Constraint references can be queried by ID", [dss.participant_id]
     ) as check:
         try:
-            cr, q = dss.get_constraint_ref(cr_id)
+            cr, q = prefetched.result() if prefetched else dss.get_constraint_ref(cr_id)
             scenario.record_query(q)
             if cr.ovn is None:
                 check.record_failed(
@@ -322,9 +345,14 @@ def cleanup_constraint_ref(
 
 
 def verify_constraint_does_not_exist(
-    scenario: TestScenario, dss: DSSInstance, cr_id: EntityID
+    scenario: TestScenario,
+    dss: DSSInstance,
+    cr_id: EntityID,
+    prefetched: Future[tuple[ConstraintReference, Query]] | None = None,
 ):
-    cr_found = cleanup_constraint_ref(scenario, dss, cr_id, delete_if_exists=False)
+    cr_found = cleanup_constraint_ref(
+        scenario, dss, cr_id, delete_if_exists=False, prefetched=prefetched
+    )
     with scenario.check(
         "constraint reference with test ID does not exist",
         dss.participant_id,
@@ -10,7 +10,7 @@ from monitoring import uss_qualifier as uss_qualifier_module
 from monitoring.monitorlib.inspection import fullname, get_module_object_by_name
 from monitoring.monitorlib.versioning import repo_url_of
 from monitoring.uss_qualifier.common_data_definitions import Severity
-from monitoring.uss_qualifier.documentation import text_of
+from monitoring.uss_qualifier.documentation import parse_markdown_file, text_of
 from monitoring.uss_qualifier.requirements.definitions import RequirementID
 from monitoring.uss_qualifier.scenarios.definitions import TestScenarioTypeName
 from monitoring.uss_qualifier.scenarios.documentation.definitions import (
@@ -94,8 +94,7 @@ def _get_linked_test_step_fragment(
             raise ValueError(
                 f'Test step fragment document "{doc_filename}" linked from "{origin_filename}" does not exist at "{absolute_path}"'
             )
-        with open(absolute_path) as f:
-            doc = marko.parse(f.read())
+        doc = parse_markdown_file(absolute_path)
 
         if (
             not isinstance(doc.children[0], marko.block.Heading)
@@ -236,8 +235,7 @@ def _parse_documentation(scenario: type) -> TestScenarioDocumentation:
         raise ValueError(
             f"Test scenario `{fullname(scenario)}` does not have the required documentation file `{doc_filename}`"
         )
-    with open(doc_filename) as f:
-        doc = marko.parse(f.read())
+    doc = parse_markdown_file(doc_filename)
     url = repo_url_of(doc_filename)
     anchors = _get_anchors(doc)
 
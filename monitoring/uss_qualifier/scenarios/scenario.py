@@ -209,9 +209,10 @@ class ScenarioDidNotStopError(ScenarioLogicError):
 
 
 def get_scenario_type_by_name(scenario_type_name: TestScenarioTypeName) -> type:
-    inspection.import_submodules(scenarios_module)
-    scenario_type = inspection.get_module_object_by_name(
-        parent_module=uss_qualifier_module, object_name=scenario_type_name
+    scenario_type = inspection.get_type_by_name(
+        parent_module=uss_qualifier_module,
+        object_name=scenario_type_name,
+        search_module=scenarios_module,
     )
     if not issubclass(scenario_type, TestScenario):
         raise NotImplementedError(
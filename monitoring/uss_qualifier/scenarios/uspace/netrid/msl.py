@@ -1,12 +1,13 @@
-import s2sphere
+import numpy as np
 from implicitdict import ImplicitDict
 from uas_standards.interuss.automated_testing.rid.v1.observation import (
     AltitudeReference,
+    Flight,
     GetDisplayDataResponse,
 )
 
 from monitoring.monitorlib.fetch import Query, QueryType
-from monitoring.monitorlib.geo import egm96_geoid_offset, egm2008_geoid_offset
+from monitoring.monitorlib.geo import egm96_geoid_offsets, egm2008_geoid_offsets
 from monitoring.uss_qualifier.configurations.configuration import ParticipantID
 from monitoring.uss_qualifier.resources.netrid import NetRIDObserversResource
 from monitoring.uss_qualifier.scenarios.astm.netrid.common.nominal_behavior import (
@@ -18,6 +19,43 @@ MAXIMUM_MSL_ERROR_M = 0.5  # meters maximum difference between expected MSL alti
 ACCEPTABLE_DATUMS = {AltitudeReference.EGM96, AltitudeReference.EGM2008}
 
 
+def _geoid_offsets(flights: list[Flight]) -> dict[int, float]:
+    """Estimate the geoid height at the most recent position of each flight reporting both WGS84 and MSL altitudes.
+
+    Offsets are computed in one batch per datum rather than point by point.
+
+    Returns: Meters above the WGS84 ellipsoid of the geoid of the reported MSL
+        altitude datum, keyed by index of the flight in flights.
+    """
+    indices_by_datum: dict[AltitudeReference, list[int]] = {}
+    for i, flight in enumerate(flights):
+        p = flight.most_recent_position if "most_recent_position" in flight else None
+        if (
+            p is None
+            or "alt" not in p
+            or "msl_alt" not in p
+            or p.msl_alt is None
+            or "reference_datum" not in p.msl_alt
+            or p.msl_alt.reference_datum is None
+        ):
+            continue
+        indices_by_datum.setdefault(p.msl_alt.reference_datum, []).append(i)
+
+    offsets: dict[int, float] = {}
+    for datum, indices in indices_by_datum.items():
+        if datum == AltitudeReference.EGM96:
+            geoid_offsets = egm96_geoid_offsets
+        elif datum == AltitudeReference.EGM2008:
+            geoid_offsets = egm2008_geoid_offsets
+        else:
+            continue
+        positions = [flights[i].most_recent_position for i in indices]
+        lats = np.array([p.lat for p in positions if p is not None])
+        lngs = np.array([p.lng for p in positions if p is not None])
+        offsets.update(zip(indices, geoid_offsets(lats, lngs).tolist()))
+    return offsets
+
+
 class MSLAltitude(TestScenario):
     _ussps: list[ParticipantID]
 
@@ -75,7 +113,8 @@ class MSLAltitude(TestScenario):
             self.record_query(query)
             participant_id = query.participant_id if "participant_id" in query else None
             q = query.request.timestamp
-            for flight in resp.flights:
+            geoid_offsets = _geoid_offsets(resp.flights)
+            for i, flight in enumerate(resp.flights):
                 with self.check(
                     "Message contains MSL altitude", participant_id
                 ) as check:
@@ -110,26 +149,8 @@ class MSLAltitude(TestScenario):
                     and flight.most_recent_position is not None
                 ):
                     with self.check("MSL altitude is correct", participant_id) as check:
-                        if (
-                            flight.most_recent_position.msl_alt.reference_datum
-                            == AltitudeReference.EGM96
-                        ):
-                            geoid_offset = egm96_geoid_offset(
-                                s2sphere.LatLng.from_degrees(
-                                    flight.most_recent_position.lat,
-                                    flight.most_recent_position.lng,
-                                )
-                            )
-                        elif (
-                            flight.most_recent_position.msl_alt.reference_datum
-                            == AltitudeReference.EGM2008
-                        ):
-                            geoid_offset = egm2008_geoid_offset(
-                                s2sphere.LatLng.from_degrees(
-                                    flight.most_recent_position.lat,
-                                    flight.most_recent_position.lng,
-                                )
-                            )
+                        if i in geoid_offsets:
+                            geoid_offset = geoid_offsets[i]
                         else:
                             raise Exception(
                                 "Internal error: ACCEPTABLE_DATUMS of netrid/msl.py don't match the datum we can check"
@@ -0,0 +1,36 @@
+from implicitdict import ImplicitDict
+from s2sphere import LatLng
+from uas_standards.interuss.automated_testing.rid.v1.observation import Flight
+
+from monitoring.monitorlib.geo import egm96_geoid_offset
+from monitoring.uss_qualifier.scenarios.uspace.netrid.msl import _geoid_offsets
+
+
+def _flight(lat: float, lng: float, **position) -> Flight:
+    return ImplicitDict.parse(
+        {"id": "f", "most_recent_position": {"lat": lat, "lng": lng, **position}},
+        Flight,
+    )
+
+
+def test_geoid_offsets():
+    msl_alt = {"meters": 100, "reference_datum": "EGM96"}
+    flights = [
+        _flight(46.948, 7.447, alt=150, msl_alt=msl_alt),
+        _flight(46.948, 7.447, msl_alt=msl_alt),
+        _flight(-33.9, -151.2, alt=50),
+        _flight(-33.9, -151.2, alt=50, msl_alt=msl_alt),
+    ]
+
+    offsets = _geoid_offsets(flights)
+
+    # Only flights reporting both WGS84 and MSL altitudes are evaluated
+    assert set(offsets) == {0, 3}
+    for i, offset in offsets.items():
+        p = flights[i].most_recent_position
+        assert p is not None
+        assert (
+            abs(egm96_geoid_offset(LatLng.from_degrees(p.lat, p.lng)) - offset) < 1e-9
+        )
+
+    assert _geoid_offsets([]) == {}
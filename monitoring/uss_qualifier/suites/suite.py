@@ -3,8 +3,10 @@ from __future__ import annotations
 import json
 import os
 import re
-from collections.abc import Iterator
-from dataclasses import dataclass
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
 import arrow
@@ -12,6 +14,7 @@ import yaml
 from implicitdict import StringBasedDateTime
 from loguru import logger
 
+from monitoring.monitorlib import clock
 from monitoring.monitorlib.dicts import JSONAddress
 from monitoring.monitorlib.fetch import Query
 from monitoring.monitorlib.inspection import fullname
@@ -21,6 +24,9 @@ from monitoring.uss_qualifier.action_generators.action_generator import (
     ActionGenerator,
     action_generator_type_from_name,
 )
+from monitoring.uss_qualifier.action_generators.definitions import (
+    ParallelExecutionSpecification,
+)
 from monitoring.uss_qualifier.configurations.configuration import (
     ExecutionConfiguration,
     TestSuiteActionSelectionCondition,
@@ -39,9 +45,11 @@ from monitoring.uss_qualifier.reports.report import (
     TestSuiteActionReport,
     TestSuiteReport,
 )
+from monitoring.uss_qualifier.reports.report_stream import StreamedReportWriter
 from monitoring.uss_qualifier.resources.definitions import ResourceID
 from monitoring.uss_qualifier.resources.resource import (
     MissingResourceError,
+    Resource,
     ResourceType,
     create_resources,
     make_child_resources,
@@ -75,6 +83,8 @@ def _print_failed_check(failed_check: FailedCheck) -> None:
 
 class TestSuiteAction[T: ActionGenerator]:
     declaration: TestSuiteActionDeclaration
+    resources: Mapping[ResourceID, Resource]
+    """Resources from which the resources for this action were selected."""
     test_scenario: TestScenario | None = None
     test_suite: TestSuite | None = None
     action_generator: T | None = None
@@ -85,6 +95,7 @@ class TestSuiteAction[T: ActionGenerator]:
         resources: dict[ResourceID, ResourceType],
     ):
         self.declaration = action
+        self.resources = resources
         resources_for_child = make_child_resources(
             resources,
             action.get_resource_links(),
@@ -155,9 +166,7 @@ class TestSuiteAction[T: ActionGenerator]:
         logger.info(f'Running "{scenario.documentation.name}" scenario...')
         scenario.on_failed_check = _print_failed_check
         scenario.time_context[TimeDuringTest.StartOfTestRun] = Time(context.start_time)
-        scenario.time_context[TimeDuringTest.StartOfScenario] = Time(
-            arrow.utcnow().datetime
-        )
+        scenario.time_context[TimeDuringTest.StartOfScenario] = Time(clock.now())
 
         try:
             try:
@@ -206,7 +215,16 @@ class TestSuiteAction[T: ActionGenerator]:
             start_time=StringBasedDateTime(arrow.utcnow()),
         )
 
-        _run_actions(self.action_generator.actions(), context, report)
+        definition = self.action_generator.definition
+        if "parallel_execution" in definition and definition.parallel_execution:
+            _run_actions_concurrently(
+                self.action_generator.actions(),
+                context,
+                report,
+                definition.parallel_execution,
+            )
+        else:
+            _run_actions(self.action_generator.actions(), context, report)
 
         return report
 
@@ -354,22 +372,129 @@ def _run_actions(
     for a, action in enumerate(actions):
         if isinstance(action, SkippedActionReport):
             action_report = TestSuiteActionReport(skipped_action=action)
+            context.record_action_report(action_report)
         else:
             action_report = action.run(context)
         report.actions.append(action_report)
-        if action_report.has_critical_problem():
+        if action_report.has_critical_problem() or not action_report.successful():
             success = False
+        if _stops_remaining_actions(a, action.declaration, action_report):
             break
-        if not action_report.successful():
-            success = False
-            if action.declaration.on_failure == ReactionToFailure.Abort:
-                break
-            elif action.declaration.on_failure == ReactionToFailure.Continue:
-                continue
+    report.successful = success
+    report.end_time = StringBasedDateTime(datetime.now(UTC))
+
+
+def _stops_remaining_actions(
+    a: int,
+    declaration: TestSuiteActionDeclaration,
+    action_report: TestSuiteActionReport,
+) -> bool:
+    """Determine whether the actions following action `a` must not be run given the report of action `a`."""
+    if action_report.has_critical_problem():
+        return True
+    if not action_report.successful():
+        if declaration.on_failure == ReactionToFailure.Abort:
+            return True
+        elif declaration.on_failure == ReactionToFailure.Continue:
+            return False
+        else:
+            raise ValueError(
+                f"Action {a} indicated an unrecognized reaction to failure: {str(declaration.on_failure)}"
+            )
+    return False
+
+
+def _run_actions_concurrently(
+    actions: Iterator[TestSuiteAction | SkippedActionReport],
+    context: ExecutionContext,
+    report: ActionGeneratorReport,
+    parallel_execution: ParallelExecutionSpecification,
+) -> None:
+    """Run actions like _run_actions, but with up to parallel_execution.max_concurrent_actions actions running at a time.
+
+    Actions are generated as they are needed and started in order, each in its own branch of the execution context,
+    and an action is not started while any running action shares any of its exclusive resources.  Action reports are
+    recorded in the order of the actions as soon as all preceding actions are complete.  The branches are merged back
+    into the execution context, in the order of the actions, once all actions are complete.
+    """
+    declarations: list[TestSuiteActionDeclaration] = []
+    """Declaration of each action started (or skipped) so far."""
+    results: list[Future[TestSuiteActionReport] | TestSuiteActionReport] = []
+    running: dict[Future[TestSuiteActionReport], tuple[int, set[int]]] = {}
+    """Index and exclusive resources of each running action."""
+    branches: list[ExecutionContext] = []
+    success = True
+    stop = False
+
+    def record_completed_actions() -> None:
+        nonlocal success, stop
+        while len(report.actions) < len(results):
+            a = len(report.actions)
+            result = results[a]
+            if isinstance(result, Future):
+                if not result.done():
+                    return
+                action_report = result.result()
+                context.record_action_report(action_report, with_descendants=True)
             else:
-                raise ValueError(
-                    f"Action {a} indicated an unrecognized reaction to failure: {str(action.declaration.on_failure)}"
-                )
+                action_report = result
+                context.record_action_report(action_report)
+            report.actions.append(action_report)
+            if action_report.has_critical_problem() or not action_report.successful():
+                success = False
+            if _stops_remaining_actions(a, declarations[a], action_report):
+                stop = True
+
+    def must_wait(exclusive_resources: set[int]) -> bool:
+        return len(running) >= parallel_execution.max_concurrent_actions or any(
+            exclusive_resources & r for _, r in running.values()
+        )
+
+    logger.info(
+        f"Running generated actions with up to {parallel_execution.max_concurrent_actions} at a time"
+    )
+    try:
+        with ThreadPoolExecutor(
+            max_workers=parallel_execution.max_concurrent_actions
+        ) as executor:
+            for action in actions:
+                if stop:
+                    break
+                if isinstance(action, SkippedActionReport):
+                    declarations.append(action.declaration)
+                    results.append(TestSuiteActionReport(skipped_action=action))
+                    record_completed_actions()
+                    continue
+                exclusive_resources = {
+                    id(action.resources[resource_id])
+                    for resource_id in parallel_execution.exclusive_resources
+                    if resource_id in action.resources
+                }
+                while not stop and must_wait(exclusive_resources):
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        a, _ = running.pop(future)
+                        # Do not wait for preceding actions to finish before reacting to this action's outcome
+                        if _stops_remaining_actions(
+                            a, declarations[a], future.result()
+                        ):
+                            stop = True
+                    record_completed_actions()
+                if stop:
+                    break
+                branch = context.branch(action)
+                branches.append(branch)
+                future = executor.submit(action.run, branch)
+                running[future] = (len(results), exclusive_resources)
+                declarations.append(action.declaration)
+                results.append(future)
+            wait(running)
+            record_completed_actions()
+    finally:
+        # The executor has waited for all running actions, so none of the branches is in use any more
+        for branch in branches:
+            context.merge(branch)
+
     report.successful = success
     report.end_time = StringBasedDateTime(datetime.now(UTC))
 
@@ -380,8 +505,34 @@ class ActionStackFrame:
     parent: ActionStackFrame | None
     children: list[ActionStackFrame]
     report: TestSuiteActionReport | None = None
+    order: int = -1
+    """Position of this frame among all the frames visible to the ExecutionContext in which it was added (see
+    _ActionIndex)."""
+
+    _selected: dict[int, tuple[TestSuiteActionSelectionCondition, bool]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    """Whether this frame is selected by each condition evaluated so far, keyed by id of the condition."""
+
+    _address: JSONAddress | None = field(default=None, init=False, repr=False)
+    _queries: list[Query] | None = field(default=None, init=False, repr=False)
+
+    def queries(self) -> list[Query]:
+        """All queries in the report of this frame's action, which must have finished."""
+        if self._queries is None:
+            if self.report is None:
+                raise RuntimeError(
+                    "Queries of an ActionStackFrame were requested before its action finished"
+                )
+            self._queries = list(self.report.queries())
+        return self._queries
 
     def address(self) -> JSONAddress:
+        if self._address is None:
+            self._address = self._compute_address()
+        return self._address
+
+    def _compute_address(self) -> JSONAddress:
         if self.action.test_scenario is not None:
             addr = "test_scenario"
         elif self.action.test_suite is not None:
@@ -408,36 +559,203 @@ class ActionStackFrame:
         return f"{self.parent.address()}.actions[{index}].{addr}"
 
 
+class _ActionIndex:
+    """Indexes of the frames of an ExecutionContext, updated as actions begin and end.
+
+    The index of a branch of an ExecutionContext builds on the frames that were in the index of the parent context
+    when the branch was created, but the frames added to the branch (and their reports) are not visible to the parent
+    context or any other branch until the branch is merged back into its parent.  As no frames are added to the parent
+    context while its branches run, the frames visible to an action running in a branch do not depend on the progress
+    of the actions running in other branches.
+    """
+
+    lock: threading.RLock
+    base: _ActionIndex | None
+    """Index of the parent context, if this is the index of a branch."""
+
+    base_length: int
+    """Number of frames of the base index that are visible through this index."""
+
+    frames: list[ActionStackFrame]
+    """Frames added to this index, in the order they were added; frames[i].order is base_length + i."""
+
+    selection_counts: dict[int, tuple[TestSuiteActionSelectionCondition, list[int]]]
+    """For each condition evaluated with count_selected (keyed by id of the condition), the number of visible frames
+    selected by that condition up to and including frames[i] for each i evaluated so far."""
+
+    scenario_frames: dict[str, list[ActionStackFrame]]
+    """Frames of completed test scenarios added to this index, by scenario type name."""
+
+    scenario_types: dict[str, type[TestScenario]]
+    """Test scenario type of each scenario type name in scenario_frames."""
+
+    def __init__(self, base: _ActionIndex | None = None):
+        self.lock = threading.RLock()
+        self.base = base
+        self.base_length = 0 if base is None else base.length()
+        self.frames = []
+        self.selection_counts = {}
+        self.scenario_frames = {}
+        self.scenario_types = {}
+
+    def length(self) -> int:
+        with self.lock:
+            return self.base_length + len(self.frames)
+
+    def frame_at(self, order: int) -> ActionStackFrame:
+        if order < self.base_length and self.base is not None:
+            return self.base.frame_at(order)
+        with self.lock:
+            return self.frames[order - self.base_length]
+
+    def add_frame(self, frame: ActionStackFrame) -> None:
+        with self.lock:
+            if frame.parent is not None:
+                frame.parent.children.append(frame)
+            frame.order = self.base_length + len(self.frames)
+            self.frames.append(frame)
+
+    def add_report(self, frame: ActionStackFrame) -> None:
+        if (
+            frame.report is None
+            or "test_scenario" not in frame.report
+            or frame.report.test_scenario is None
+        ):
+            return
+        scenario_type = frame.report.test_scenario.scenario_type
+        with self.lock:
+            if scenario_type not in self.scenario_frames:
+                self.scenario_types[scenario_type] = get_scenario_type_by_name(
+                    scenario_type
+                )
+                self.scenario_frames[scenario_type] = []
+            self.scenario_frames[scenario_type].append(frame)
+
+    def merge(self, branch: _ActionIndex) -> None:
+        """Add the frames and reports of a branch of this index, none of whose actions may still be running."""
+        with self.lock:
+            if branch.base is not self:
+                raise RuntimeError(
+                    "Cannot merge an _ActionIndex into an index it was not branched from"
+                )
+            for frame in branch.frames:
+                frame.order = self.base_length + len(self.frames)
+                self.frames.append(frame)
+            for scenario_type, frames in branch.scenario_frames.items():
+                if scenario_type not in self.scenario_frames:
+                    self.scenario_types[scenario_type] = branch.scenario_types[
+                        scenario_type
+                    ]
+                    self.scenario_frames[scenario_type] = []
+                self.scenario_frames[scenario_type].extend(frames)
+
+    def count_selected(
+        self,
+        order: int,
+        condition: TestSuiteActionSelectionCondition,
+        is_selected: Callable[[ActionStackFrame], bool],
+    ) -> int:
+        """Count the visible frames up to and including the frame at `order` for which is_selected is True."""
+        if order < self.base_length and self.base is not None:
+            return self.base.count_selected(order, condition, is_selected)
+        with self.lock:
+            entry = self.selection_counts.get(id(condition))
+            if entry is None or entry[0] is not condition:
+                entry = (condition, [])
+                self.selection_counts[id(condition)] = entry
+            counts = entry[1]
+            while len(counts) <= order - self.base_length:
+                if counts:
+                    n = counts[-1]
+                elif self.base is not None and self.base_length > 0:
+                    n = self.base.count_selected(
+                        self.base_length - 1, condition, is_selected
+                    )
+                else:
+                    n = 0
+                if is_selected(self.frames[len(counts)]):
+                    n += 1
+                counts.append(n)
+            return counts[order - self.base_length]
+
+    def scenario_reports(
+        self, scenario_type: type[TestScenario]
+    ) -> list[tuple[int, TestScenarioReport]]:
+        """Reports of the visible completed instances of the specified test scenario type, with the order of their
+        frames."""
+        reports = [] if self.base is None else self.base.scenario_reports(scenario_type)
+        with self.lock:
+            for scenario_type_name, frames in self.scenario_frames.items():
+                if issubclass(self.scenario_types[scenario_type_name], scenario_type):
+                    for frame in frames:
+                        if frame.report is not None and frame.report.test_scenario:
+                            reports.append((frame.order, frame.report.test_scenario))
+        return reports
+
+
 class ExecutionContext:
     start_time: datetime
     config: ExecutionConfiguration | None
     top_frame: ActionStackFrame | None
     current_frame: ActionStackFrame | None
+    report_writer: StreamedReportWriter | None
+    _reserved_frame: ActionStackFrame | None
+    _index: _ActionIndex
 
-    def __init__(self, config: ExecutionConfiguration | None):
+    def __init__(
+        self,
+        config: ExecutionConfiguration | None,
+        report_writer: StreamedReportWriter | None = None,
+    ):
         self.config = config
         self.top_frame = None
         self.current_frame = None
-        self.start_time = arrow.utcnow().datetime
+        self.report_writer = report_writer
+        self.start_time = clock.now()
+        self._reserved_frame = None
+        self._index = _ActionIndex()
+
+    def branch(self, action: TestSuiteAction) -> ExecutionContext:
+        """Create a context in which the specified child of the current action may run concurrently with its siblings.
+
+        The child's frame is added to the current frame immediately so that children are ordered as they were branched
+        rather than as they begin.  The frames and reports of the actions run in the branch are visible to this context
+        (and the actions it runs) only once the branch is merged back into it; in the meantime, no actions may begin in
+        this context.  The reports of the actions run in the branch are not recorded to the streamed report; the caller
+        must record the child's report with its descendants instead.
+        """
+        if self.current_frame is None:
+            raise RuntimeError(
+                "Cannot branch an ExecutionContext with no current frame"
+            )
+        branch = ExecutionContext(self.config)
+        branch.start_time = self.start_time
+        branch.top_frame = self.top_frame
+        branch.current_frame = self.current_frame
+        branch._index = _ActionIndex(self._index)
+        frame = ActionStackFrame(action=action, parent=self.current_frame, children=[])
+        branch._index.add_frame(frame)
+        branch._reserved_frame = frame
+        return branch
+
+    def merge(self, branch: ExecutionContext) -> None:
+        """Make the frames and reports of a branch of this context, whose action must have ended, visible to this
+        context."""
+        self._index.merge(branch._index)
 
     def sibling_queries(self) -> Iterator[Query]:
         if self.current_frame is None or self.current_frame.parent is None:
             return
         for child in self.current_frame.parent.children:
             if child.report is not None:
-                yield from child.report.queries()
+                yield from child.queries()
 
     def find_test_scenario_reports(
         self, scenario_type: type[TestScenario]
     ) -> list[TestScenarioReport]:
         """Find reports for all currently-completed instances of the specified test scenario type."""
-        return [
-            report
-            for report in self.test_scenario_reports()
-            if issubclass(
-                get_scenario_type_by_name(report.scenario_type), scenario_type
-            )
-        ]
+        reports = self._index.scenario_reports(scenario_type)
+        return [report for _, report in sorted(reports, key=lambda r: r[0])]
 
     def test_scenario_reports(
         self, frame: ActionStackFrame | None = None
@@ -466,24 +784,20 @@ class ExecutionContext:
         return False
 
     def _compute_n_of(
-        self, target: TestSuiteAction, condition: TestSuiteActionSelectionCondition
+        self, target: ActionStackFrame, condition: TestSuiteActionSelectionCondition
     ) -> int:
-        n = 0
-        queue: list[ActionStackFrame] = []
-
-        if self.top_frame:
-            queue.append(self.top_frame)
-
-        while queue:
-            frame = queue.pop(0)
-            if self._is_selected_by(frame, condition):
-                n += 1
-            if frame.action is target:
-                return n
-            for c, child in enumerate(frame.children):
-                queue.insert(c, child)
-        raise RuntimeError(
-            f"Could not find target action '{target.get_name()}' anywhere in ExecutionContext"
+        """Count the frames up to and including target that are selected by condition."""
+        index = self._index
+        if (
+            target.order < 0
+            or target.order >= index.length()
+            or index.frame_at(target.order) is not target
+        ):
+            raise RuntimeError(
+                f"Could not find target action '{target.action.get_name()}' anywhere in ExecutionContext"
+            )
+        return index.count_selected(
+            target.order, condition, lambda f: self._is_selected_by(f, condition)
         )
 
     def _ancestor_selected_by(
@@ -509,6 +823,16 @@ class ExecutionContext:
 
     def _is_selected_by(
         self, frame: ActionStackFrame, f: TestSuiteActionSelectionCondition
+    ) -> bool:
+        # Whether a frame is selected by a condition does not change once the frame has been added
+        entry = frame._selected.get(id(f))
+        if entry is None or entry[0] is not f:
+            entry = (f, self._evaluate_selection(frame, f))
+            frame._selected[id(f)] = entry
+        return entry[1]
+
+    def _evaluate_selection(
+        self, frame: ActionStackFrame, f: TestSuiteActionSelectionCondition
     ) -> bool:
         action = frame.action
         result = False
@@ -568,7 +892,7 @@ class ExecutionContext:
 
         if "nth_instance" in f and f.nth_instance is not None:
             if self._is_selected_by(frame, f.nth_instance.where_action):
-                n = self._compute_n_of(frame.action, f.nth_instance.where_action)
+                n = self._compute_n_of(frame, f.nth_instance.where_action)
                 if not any(r.includes(n) for r in f.nth_instance.n):
                     return False
                 result = True
@@ -649,15 +973,18 @@ class ExecutionContext:
         return None
 
     def begin_action(self, action: TestSuiteAction) -> None:
-        if self.top_frame is None:
+        if self._reserved_frame is not None and self._reserved_frame.action is action:
+            self.current_frame = self._reserved_frame
+            self._reserved_frame = None
+        elif self.top_frame is None:
             self.top_frame = ActionStackFrame(action=action, parent=None, children=[])
+            self._index.add_frame(self.top_frame)
             self.current_frame = self.top_frame
         else:
             self.current_frame = ActionStackFrame(
                 action=action, parent=self.current_frame, children=[]
             )
-            if self.current_frame.parent:
-                self.current_frame.parent.children.append(self.current_frame)
+            self._index.add_frame(self.current_frame)
 
     def end_action(
         self, action: TestSuiteAction, report: TestSuiteActionReport
@@ -672,4 +999,22 @@ class ExecutionContext:
                 f"Action {self.current_frame.action.declaration.get_action_type()} {self.current_frame.action.declaration.get_child_type()} was started, but a different action {action.declaration.get_action_type()} {action.declaration.get_child_type()} was ended"
             )
         self.current_frame.report = report
+        self._index.add_report(self.current_frame)
         self.current_frame = self.current_frame.parent
+        self.record_action_report(report)
+
+    def record_action_report(
+        self, report: TestSuiteActionReport, with_descendants: bool = False
+    ) -> None:
+        """Record the report of an action that just finished (or was skipped) to the streamed report, if any.
+
+        Args:
+            report: Report of the action to record.
+            with_descendants: If True, also record the reports of all of the action's descendants (which must not have
+                been recorded already, e.g. because the action ran in a branch of this context).
+        """
+        if self.report_writer is not None:
+            if with_descendants:
+                self.report_writer.write_action_tree(report)
+            else:
+                self.report_writer.write_action(report)
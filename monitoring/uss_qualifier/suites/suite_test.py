@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable, Iterator
+
+import pytest
+from implicitdict import ImplicitDict, StringBasedDateTime
+
+from monitoring.uss_qualifier.action_generators.definitions import (
+    ParallelExecutionSpecification,
+)
+from monitoring.uss_qualifier.configurations.configuration import (
+    TestSuiteActionSelectionCondition as _TestSuiteActionSelectionCondition,
+)
+from monitoring.uss_qualifier.reports.report import ActionGeneratorReport
+from monitoring.uss_qualifier.reports.report import (
+    TestScenarioReport as _TestScenarioReport,
+)
+from monitoring.uss_qualifier.reports.report import (
+    TestSuiteActionReport as _TestSuiteActionReport,
+)
+from monitoring.uss_qualifier.reports.report_stream import StreamedReportWriter
+from monitoring.uss_qualifier.resources.definitions import ResourceID
+from monitoring.uss_qualifier.resources.resource import Resource
+from monitoring.uss_qualifier.scenarios.astm.utm import FlightIntentValidation
+from monitoring.uss_qualifier.scenarios.dev import NoOp
+from monitoring.uss_qualifier.scenarios.scenario import TestScenario as _TestScenario
+from monitoring.uss_qualifier.suites.definitions import (
+    TestSuiteActionDeclaration as _TestSuiteActionDeclaration,
+)
+from monitoring.uss_qualifier.suites.suite import (
+    ExecutionContext,
+    _run_actions_concurrently,
+)
+from monitoring.uss_qualifier.suites.suite import (
+    TestSuiteAction as _TestSuiteAction,
+)
+
+TIMESTAMP = "2024-01-01T00:00:00Z"
+
+
+class _Activity:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running: list[_FakeAction] = []
+        self.max_running = 0
+        self.overlapping_resources = False
+        self.started: list[str] = []
+        self.finished: list[str] = []
+
+
+class _FakeResource(Resource[ImplicitDict]):
+    def __init__(self):
+        super().__init__(ImplicitDict(), "suite_test")
+
+
+class _FakeAction(_TestSuiteAction):
+    """Stand-in for TestSuiteAction running a scenario that takes `duration` seconds."""
+
+    def __init__(
+        self,
+        name: str,
+        activity: _Activity,
+        resources: dict[ResourceID, Resource],
+        duration: float,
+        successful: bool = True,
+        on_failure: str = "Continue",
+        scenario_type: str = "scenarios.dev.NoOp",
+        children: list[_FakeAction] | None = None,
+        counted_instances: _TestSuiteActionSelectionCondition | None = None,
+    ):
+        self.name = name
+        self.children = children or []
+        self.counted_instances = counted_instances
+        self.n: int | None = None
+        """Number of the actions selected by counted_instances up to and including this action, when it began."""
+        self.scenario_type = scenario_type
+        self.activity = activity
+        self.resources = resources
+        self.duration = duration
+        self.successful = successful
+        self.declaration = ImplicitDict.parse(
+            {
+                "test_scenario": {"scenario_type": scenario_type},
+                "on_failure": on_failure,
+            },
+            _TestSuiteActionDeclaration,
+        )
+
+    def get_name(self) -> str:
+        return self.name
+
+    def run(self, context: ExecutionContext) -> _TestSuiteActionReport:
+        context.begin_action(self)
+        if self.counted_instances is not None:
+            assert context.current_frame is not None
+            self.n = context._compute_n_of(
+                context.current_frame, self.counted_instances
+            )
+        with self.activity.lock:
+            for other in self.activity.running:
+                if any(r in other.resources.values() for r in self.resources.values()):
+                    self.activity.overlapping_resources = True
+            self.activity.running.append(self)
+            self.activity.max_running = max(
+                self.activity.max_running, len(self.activity.running)
+            )
+            self.activity.started.append(self.name)
+        time.sleep(self.duration)
+        for child in self.children:
+            child.run(context)
+        with self.activity.lock:
+            self.activity.running.remove(self)
+            self.activity.finished.append(self.name)
+        report = _TestSuiteActionReport(
+            test_scenario=ImplicitDict.parse(
+                {
+                    "name": self.name,
+                    "scenario_type": self.scenario_type,
+                    "documentation_url": "",
+                    "start_time": TIMESTAMP,
+                    "successful": self.successful,
+                    "notes": {},
+                    "cases": [],
+                },
+                _TestScenarioReport,
+            )
+        )
+        context.end_action(self, report)
+        return report
+
+
+class _RecordingWriter(StreamedReportWriter):
+    """Stand-in for StreamedReportWriter recording the names of the scenarios written with their descendants."""
+
+    def __init__(self):
+        self.names: list[str] = []
+
+    def write_action_tree(self, report: _TestSuiteActionReport) -> None:
+        assert report.test_scenario is not None
+        self.names.append(report.test_scenario.name)
+
+
+def _run(
+    actions: Iterable[_FakeAction], spec: dict
+) -> tuple[ActionGeneratorReport, list[str], list[str]]:
+    """Run actions as generated actions, returning the report, the names of the child frames and the names of the
+    actions written to the streamed report."""
+    writer = _RecordingWriter()
+    context = ExecutionContext(None, writer)
+    generator = _FakeAction("Generator", _Activity(), {}, 0)
+    context.begin_action(generator)
+    report = ActionGeneratorReport(
+        actions=[],
+        generator_type="action_generators.dev.Fake",
+        start_time=StringBasedDateTime(TIMESTAMP),
+    )
+    _run_actions_concurrently(
+        iter(actions),
+        context,
+        report,
+        ImplicitDict.parse(spec, ParallelExecutionSpecification),
+    )
+    assert context.current_frame is not None
+    frames = [frame.action.get_name() for frame in context.current_frame.children]
+    return report, frames, writer.names
+
+
+def _names(report: ActionGeneratorReport) -> list[str]:
+    return [
+        a.test_scenario.name
+        if "test_scenario" in a and a.test_scenario is not None
+        else "<skipped>"
+        for a in report.actions
+    ]
+
+
+def test_concurrent_actions_are_recorded_in_order():
+    activity = _Activity()
+    planners = [_FakeResource() for _ in range(3)]
+    actions = [
+        _FakeAction(f"A{i}", activity, {"tested_uss": planners[i % 3]}, 0.05 * (6 - i))
+        for i in range(6)
+    ]
+
+    report, frames, written = _run(
+        actions, {"max_concurrent_actions": 3, "exclusive_resources": ["tested_uss"]}
+    )
+
+    names = [f"A{i}" for i in range(6)]
+    assert _names(report) == names
+    assert frames == names
+    assert written == names
+    assert sorted(activity.started) == names
+    assert activity.max_running == 3
+    assert not activity.overlapping_resources
+    assert report.successful
+
+
+def test_concurrent_actions_abort():
+    activity = _Activity()
+    actions = [
+        _FakeAction("A0", activity, {}, 0.1),
+        _FakeAction("A1", activity, {}, 0.01, successful=False, on_failure="Abort"),
+        _FakeAction("A2", activity, {}, 0.01),
+        _FakeAction("A3", activity, {}, 0.01),
+        _FakeAction("A4", activity, {}, 0.01),
+    ]
+
+    report, _, _ = _run(actions, {"max_concurrent_actions": 2})
+
+    # A1 fails while A0 is still running, so no further actions are started
+    assert sorted(activity.started) == ["A0", "A1"]
+    assert _names(report) == ["A0", "A1"]
+    assert not report.successful
+
+
+def test_selection_and_lookup():
+    activity = _Activity()
+    context = ExecutionContext(None)
+    generator = _FakeAction("Generator", activity, {}, 0)
+    context.begin_action(generator)
+    for i in range(6):
+        scenario_type = (
+            "scenarios.dev.NoOp"
+            if i % 2 == 0
+            else "scenarios.astm.utm.FlightIntentValidation"
+        )
+        _FakeAction(
+            f"{'AB'[i % 2]}{i}", activity, {}, 0, scenario_type=scenario_type
+        ).run(context)
+    assert context.current_frame is not None
+    frames = context.current_frame.children
+
+    third_a_onwards = ImplicitDict.parse(
+        {
+            "nth_instance": {
+                "n": [{"lo": 3}],
+                "where_action": {"regex_matches_name": "^A"},
+            }
+        },
+        _TestSuiteActionSelectionCondition,
+    )
+    assert [context._is_selected_by(f, third_a_onwards) for f in frames] == [
+        False,
+        False,
+        False,
+        False,
+        True,
+        False,
+    ]
+    under_generator = ImplicitDict.parse(
+        {"has_ancestor": {"which": [{"regex_matches_name": "Generator"}]}},
+        _TestSuiteActionSelectionCondition,
+    )
+    assert all(context._is_selected_by(f, under_generator) for f in frames)
+
+    assert [r.name for r in context.find_test_scenario_reports(NoOp)] == [
+        "A0",
+        "A2",
+        "A4",
+    ]
+    assert [
+        r.name for r in context.find_test_scenario_reports(FlightIntentValidation)
+    ] == ["B1", "B3", "B5"]
+    assert [r.name for r in context.find_test_scenario_reports(_TestScenario)] == [
+        f"{'AB'[i % 2]}{i}" for i in range(6)
+    ]
+
+
+def test_max_concurrent_actions_must_be_positive():
+    with pytest.raises(ValueError):
+        ImplicitDict.parse(
+            {"max_concurrent_actions": 0}, ParallelExecutionSpecification
+        )
+
+
+def test_concurrent_actions_are_generated_as_needed():
+    activity = _Activity()
+    generated_after: list[list[str]] = []
+
+    def actions() -> Iterator[_FakeAction]:
+        for i in range(4):
+            with activity.lock:
+                generated_after.append(list(activity.finished))
+            yield _FakeAction(f"A{i}", activity, {}, 0.01)
+
+    report, _, _ = _run(actions(), {"max_concurrent_actions": 1})
+
+    assert _names(report) == ["A0", "A1", "A2", "A3"]
+    # Each action is generated only once the action before it could be started
+    assert generated_after == [[], [], ["A0"], ["A0", "A1"]]
+
+
+def test_concurrent_actions_do_not_see_each_other():
+    activity = _Activity()
+    counted_instances = ImplicitDict.parse(
+        {"regex_matches_name": "^C"}, _TestSuiteActionSelectionCondition
+    )
+
+    def child(name: str) -> _FakeAction:
+        return _FakeAction(name, activity, {}, 0, counted_instances=counted_instances)
+
+    # A1's children begin well before A0's children
+    children = [[child("C0a"), child("C0b")], [child("C1a"), child("C1b")]]
+    actions = [
+        _FakeAction("A0", activity, {}, 0.2, children=children[0]),
+        _FakeAction("A1", activity, {}, 0, children=children[1]),
+    ]
+
+    context = ExecutionContext(None)
+    context.begin_action(_FakeAction("Suite", activity, {}, 0))
+    before = child("C_before")
+    before.run(context)
+    context.begin_action(_FakeAction("Generator", activity, {}, 0))
+    report = ActionGeneratorReport(
+        actions=[],
+        generator_type="action_generators.dev.Fake",
+        start_time=StringBasedDateTime(TIMESTAMP),
+    )
+    _run_actions_concurrently(
+        iter(actions),
+        context,
+        report,
+        ImplicitDict.parse(
+            {"max_concurrent_actions": 2}, ParallelExecutionSpecification
+        ),
+    )
+    assert context.current_frame is not None
+    context.current_frame = context.current_frame.parent
+    after = child("C_after")
+    after.run(context)
+
+    # Each generated action only sees the instance preceding the action generator and its own children
+    assert before.n == 1
+    assert [c.n for c in children[0]] == [2, 3]
+    assert [c.n for c in children[1]] == [2, 3]
+    # All instances are visible once the generated actions are complete
+    assert after.n == 6
+    assert [r.name for r in context.find_test_scenario_reports(NoOp)] == [
+        "C_before",
+        "A0",
+        "C0a",
+        "C0b",
+        "A1",
+        "C1a",
+        "C1b",
+        "C_after",
+    ]